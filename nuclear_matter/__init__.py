@@ -13,6 +13,10 @@ from .matter import compute_slope_cov
 from .matter import compute_compressibility
 from .matter import compute_compressibility_cov
 from .matter import compute_speed_of_sound
+from .matter import compute_speed_of_sound_cov
+from .matter import compute_eos_jacobian
+from .matter import compute_eos_joint_mean_cov
+from .matter import DensityGrid
 from .matter import kf_derivative_wrt_density
 from .matter import kf_2nd_derivative_wrt_density
 
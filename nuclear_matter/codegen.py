@@ -0,0 +1,99 @@
+"""Generates `kernel_derivatives_generated.py`, which holds the derivatives of the convergence part of the GP kernel
+as plain NumPy functions so that sympy is not needed when building kernels.
+
+Run this whenever `kernel_scale_sympy` changes::
+
+    python -m nuclear_matter.codegen
+"""
+from os import path
+
+#: The ratio between the neutron and symmetric matter Fermi momenta at the same density
+KF_CONVERSION = 2 ** (1 / 3.)
+
+#: The kf scales used by `ObservableContainer` and `SymmetryEnergyContainer`
+STANDARD_KF_SCALES = ((1., 1.), (1., 1. / KF_CONVERSION), (1. / KF_CONVERSION, 1.))
+
+
+def standard_kernel_configs(max_order=4, max_deriv=2):
+    """The settings of `kernel_scale_function` needed by the containers for EFT orders up to `max_order`
+
+    Yields
+    ------
+    config : tuple
+        (lowest_order, highest_order, include_3bf, k_f1_scale, k_f2_scale, off_diag, ni, nj)
+    """
+    orders = [(0, n) for n in range(max_order + 1)]  # The interpolating kernels
+    orders += [(n, None) for n in range(2, max_order + 2)]  # The truncation kernels
+    orders.append((0, None))  # The full series
+    for lowest_order, highest_order in orders:
+        for include_3bf in (False, True):
+            for k_f1_scale, k_f2_scale in STANDARD_KF_SCALES:
+                for ni in range(max_deriv + 1):
+                    for nj in range(max_deriv + 1):
+                        yield lowest_order, highest_order, include_3bf, k_f1_scale, k_f2_scale, False, ni, nj
+
+
+def kernel_scale_source(name, config):
+    """Writes the source of a function for one derivative of the kernel scale, after eliminating common
+    subexpressions"""
+    from sympy import cse, diff
+    from sympy.printing.numpy import NumPyPrinter
+    from .derivatives import kernel_scale_sympy
+
+    lowest_order, highest_order, include_3bf, k_f1_scale, k_f2_scale, off_diag, ni, nj = config
+    k_f1, k_f2, Lambda_b, y_ref, kernel_scale = kernel_scale_sympy(
+        lowest_order=lowest_order, highest_order=highest_order, include_3bf=include_3bf,
+        k_f1_scale=k_f1_scale, k_f2_scale=k_f2_scale, off_diag=off_diag
+    )
+    expr = diff(kernel_scale, k_f1, ni, k_f2, nj)
+    replacements, (reduced,) = cse(expr)
+    printer = NumPyPrinter({'fully_qualified_modules': True})
+    lines = [f'def {name}({k_f1}, {k_f2}, {Lambda_b}, {y_ref}):']
+    for symbol, sub_expr in replacements:
+        lines.append(f'    {symbol} = {printer.doprint(sub_expr)}')
+    lines.append(f'    return {printer.doprint(reduced)}')
+    return '\n'.join(lines)
+
+
+def generate_kernel_scale_module(filename=None, configs=None):
+    """Writes the module of generated kernel derivatives
+
+    Parameters
+    ----------
+    filename : str, optional
+        Defaults to `kernel_derivatives_generated.py` next to this file.
+    configs : Iterable, optional
+        The settings to generate. Defaults to `standard_kernel_configs()`.
+    """
+    if filename is None:
+        filename = path.join(path.dirname(path.abspath(__file__)), 'kernel_derivatives_generated.py')
+    if configs is None:
+        configs = standard_kernel_configs()
+    configs = list(configs)
+
+    sources = []
+    table = []
+    for i, config in enumerate(configs):
+        name = f'_kernel_scale_{i}'
+        sources.append(kernel_scale_source(name, config))
+        table.append(f'    {config!r}: {name},')
+
+    header = [
+        '"""The derivatives of the convergence part of the GP kernel',
+        '',
+        'Generated by `nuclear_matter.codegen`. Do not edit.',
+        '"""',
+        'import numpy',
+    ]
+    footer = [
+        '#: Keyed by (lowest_order, highest_order, include_3bf, k_f1_scale, k_f2_scale, off_diag, ni, nj)',
+        'KERNEL_SCALE_FUNCTIONS = {',
+        *table,
+        '}',
+    ]
+    with open(filename, 'w') as f:
+        f.write('\n'.join(header) + '\n\n\n' + '\n\n\n'.join(sources) + '\n\n\n' + '\n'.join(footer) + '\n')
+
+
+if __name__ == '__main__':
+    generate_kernel_scale_module()
@@ -1,9 +1,55 @@
 import gptools
 import numpy as np
-from sympy import symbols, diff, lambdify
+from functools import lru_cache
 from findiff import FinDiff
 from scipy import stats
-from .matter import fermi_momentum
+from .matter import fermi_momentum, compute_eos_joint_mean_cov
+
+try:
+    from .kernel_derivatives_generated import KERNEL_SCALE_FUNCTIONS
+except ImportError:  # Not generated yet. See codegen.py
+    KERNEL_SCALE_FUNCTIONS = {}
+
+
+def symmetric_pair_layout(Xi, Xj, ni, nj):
+    """Finds the pairs on and above the diagonal if the pairs are laid out as by `gp.compute_Kij` for K(X, X)
+
+    `gp.compute_Kij` passes every pair of the M points (with their derivative orders) in row-major order. In that
+    case, the pair (j, i) holds the same points as (i, j) but swapped, so a symmetric kernel only needs to be
+    evaluated on the pairs with i <= j.
+
+    Parameters
+    ----------
+    Xi, Xj : array, shape = (M**2, D)
+    ni, nj : array, shape = (M**2, D)
+
+    Returns
+    -------
+    layout : tuple or None
+        The indices of the pairs with i <= j and of their mirror images, or `None` if the pairs do not have
+        this layout.
+    """
+    M = int(round(np.sqrt(Xi.shape[0])))
+    if M * M != Xi.shape[0]:
+        return None
+    rows, cols = np.divmod(np.arange(M * M), M)
+    mirror = cols * M + rows
+    if not (np.array_equal(Xi[mirror], Xj) and np.array_equal(ni[mirror], nj)):
+        return None
+    upper = np.flatnonzero(rows <= cols)
+    return upper, mirror[upper]
+
+
+def _call_upper_triangle(kernel, Xi, Xj, ni, nj, hyper_deriv=None):
+    """Evaluates a symmetric kernel only on the pairs with i <= j, if possible, and mirrors the rest"""
+    layout = symmetric_pair_layout(Xi, Xj, ni, nj)
+    if layout is None:
+        return None
+    upper, lower = layout
+    value = np.empty(Xi.shape[0])
+    value[upper] = kernel(Xi[upper], Xj[upper], ni[upper], nj[upper], hyper_deriv=hyper_deriv, symmetric=False)
+    value[lower] = value[upper]
+    return value
 
 
 class CustomKernel(gptools.Kernel):
@@ -31,6 +77,11 @@ class CustomKernel(gptools.Kernel):
 
     def __call__(self, Xi, Xj, ni, nj, hyper_deriv=None, symmetric=False):
         #         return self.f(Xi, Xj, int(np.unique(ni)[0]), int(np.unique(nj)[0]))
+        if symmetric:
+            value = _call_upper_triangle(self, Xi, Xj, ni, nj, hyper_deriv=hyper_deriv)
+            if value is not None:
+                return value
+
         dmasks = {}
         coverage = np.zeros(ni.shape[0], dtype=bool)
         n_derivs = 2
@@ -47,11 +98,48 @@ class CustomKernel(gptools.Kernel):
             Xi = self.transform(Xi)
             Xj = self.transform(Xj)
 
-        value = np.NaN * np.ones(Xi.shape[0])
+        value = np.empty(Xi.shape[0])
         for (i, j), mask in dmasks.items():
-            value[mask] = self.f(Xi[mask], Xj[mask], i, j)
+            if np.any(mask):
+                value[mask] = self.f(Xi[mask], Xj[mask], i, j)
         return value
 
+    def block(self, xi, xj, ni, nj):
+        """Evaluates the (ni, nj) derivative at the broadcast pairs of xi and xj
+
+        Parameters
+        ----------
+        xi : array
+        xj : array
+            Must broadcast with `xi`, e.g., shapes (Ni, 1) and (1, Nj) for every pair of points
+        ni : int
+        nj : int
+
+        Returns
+        -------
+        K : array
+            The broadcast shape of `xi` and `xj`
+        """
+        if self.transform is not None:
+            xi = self.transform(xi)
+            xj = self.transform(xj)
+        # Some derivatives only depend on one of xi or xj, and f may squeeze its output
+        xi, xj = np.broadcast_arrays(xi, xj)
+        K = self.f(xi, xj, ni, nj)
+        if np.ndim(K) == 0:
+            return np.broadcast_to(K, xi.shape)
+        return np.reshape(K, xi.shape)
+
+
+def _split_product_kernel(kernel):
+    """The (`CustomKernel`, 1d `gptools.SquaredExponentialKernel`) factors of a product kernel, or `None`"""
+    if not isinstance(kernel, gptools.ProductKernel):
+        return None
+    for k1, k2 in ((kernel.k1, kernel.k2), (kernel.k2, kernel.k1)):
+        if isinstance(k1, CustomKernel) and isinstance(k2, gptools.SquaredExponentialKernel) and k2.num_dim == 1:
+            return k1, k2
+    return None
+
 
 class SymmetryEnergyKernel(gptools.Kernel):
 
@@ -65,6 +153,20 @@ class SymmetryEnergyKernel(gptools.Kernel):
         # self.kernel_ns_trunc = kernel_ns_trunc
 
     def __call__(self, Xi, Xj, ni, nj, hyper_deriv=None, symmetric=False):
+        if symmetric:
+            # The sum of all four kernels is symmetric, even though kernel_ns and kernel_sn are not
+            value = _call_upper_triangle(self, Xi, Xj, ni, nj, hyper_deriv=hyper_deriv)
+            if value is not None:
+                return value
+
+        if np.any(ni > 1) or np.any(nj > 1):
+            raise ValueError('SymmetryEnergyKernel can currently only one derivative wrt density')
+
+        if hyper_deriv is None:
+            value = self._fused_call(Xi, Xj, ni, nj)
+            if value is not None:
+                return value
+
         # Assume density is passed in as X
         Kf_n_i = fermi_momentum(Xi, degeneracy=2)
         Kf_n_j = fermi_momentum(Xj, degeneracy=2)
@@ -78,8 +180,6 @@ class SymmetryEnergyKernel(gptools.Kernel):
         # Kf_s_i = Kf_n_i
         # Kf_s_j = Kf_n_j
 
-        if np.any(ni > 1) or np.any(nj > 1):
-            raise ValueError('SymmetryEnergyKernel can currently only one derivative wrt density')
         from .matter import kf_derivative_wrt_density
 
         # Take derivatives with respect to density, not kf
@@ -117,6 +217,63 @@ class SymmetryEnergyKernel(gptools.Kernel):
         cov_sn *= factor_n_i * factor_n_j
         return cov_n + cov_s - cov_ns - cov_sn
 
+    def _fused_call(self, Xi, Xj, ni, nj):
+        """Evaluates all four kernels in one pass, sharing the Fermi momenta, their distances, and the squared
+        exponential factors between them.
+
+        Only possible if every kernel is a `CustomKernel` times a 1d `gptools.SquaredExponentialKernel`, as built by
+        `SymmetryEnergyContainer`. Returns `None` otherwise.
+        """
+        kernels = [_split_product_kernel(k) for k in (self.kernel_n, self.kernel_s, self.kernel_ns, self.kernel_sn)]
+        if any(k is None for k in kernels) or Xi.shape[1] != 1:
+            return None
+        (conv_n, se_n), (conv_s, se_s), (conv_ns, se_ns), (conv_sn, se_sn) = kernels
+        from .codegen import KF_CONVERSION
+
+        ni, nj = ni.ravel(), nj.ravel()
+        density_i, density_j = Xi.ravel(), Xj.ravel()
+        # Assume density is passed in as X. The symmetric matter kf is always a fixed ratio of the neutron matter kf
+        kf_n_i = fermi_momentum(density_i, degeneracy=2)
+        kf_n_j = fermi_momentum(density_j, degeneracy=2)
+        # Take derivatives with respect to density, not kf: d kf / dn = kf / (3 n)
+        factor_n_i = np.where(ni == 1, kf_n_i / (3 * density_i), 1.)
+        factor_n_j = np.where(nj == 1, kf_n_j / (3 * density_j), 1.)
+        factor_s_i = np.where(ni == 1, factor_n_i / KF_CONVERSION, 1.)
+        factor_s_j = np.where(nj == 1, factor_n_j / KF_CONVERSION, 1.)
+
+        value = np.empty(ni.shape[0])
+        for di in (0, 1):
+            for dj in (0, 1):
+                mask = (ni == di) & (nj == dj)
+                if not np.any(mask):
+                    continue
+                x_n_i, x_n_j = kf_n_i[mask], kf_n_j[mask]
+                x_s_i, x_s_j = x_n_i / KF_CONVERSION, x_n_j / KF_CONVERSION
+                diffs = {'n': x_n_i - x_n_j, 's': x_s_i - x_s_j}
+                coeff_blocks = {}
+
+                def product_block(conv, se, x_i, x_j, which):
+                    std, ls = se.params
+                    K = 0.
+                    for a in range(di + 1):
+                        for b in range(dj + 1):
+                            # Only depends on x_i - x_j, so the ns and sn kernels share these
+                            n = di - a + dj - b
+                            key = std, ls, which, n
+                            if key not in coeff_blocks:
+                                coeff_blocks[key] = squared_exponential_block(diffs[which], 0., 0, n, std, ls)
+                            K = K + (-1) ** (di - a) * conv.block(x_i, x_j, a, b) * coeff_blocks[key]
+                    return K
+
+                cov_n = product_block(conv_n, se_n, x_n_i, x_n_j, 'n')
+                cov_s = product_block(conv_s, se_s, x_s_i, x_s_j, 's')
+                # Assumes these take kf_n
+                cov_ns = product_block(conv_ns, se_ns, x_n_i, x_n_j, 'n')
+                cov_sn = product_block(conv_sn, se_sn, x_n_i, x_n_j, 'n')
+                value[mask] = factor_n_i[mask] * factor_n_j[mask] * (cov_n - cov_ns - cov_sn) + \
+                    factor_s_i[mask] * factor_s_j[mask] * cov_s
+        return value
+
 
 #         print(ni, nj, flush=True)
 # Only works for 1d X.
@@ -126,11 +283,14 @@ class SymmetryEnergyKernel(gptools.Kernel):
 #         ])
 
 
+@lru_cache(maxsize=None)
 def kernel_scale_sympy(
         lowest_order=4, highest_order=None, include_3bf=False, k_f1_scale=1., k_f2_scale=1., off_diag=False
 ):
     """Creates a sympy object that is the convergence part of the GP kernel
 
+    The result is cached, since sympy expressions are immutable and can be shared.
+
     Parameters
     ----------
     lowest_order
@@ -140,7 +300,7 @@ def kernel_scale_sympy(
     k_f2_scale
     off_diag
     """
-    from sympy import sqrt
+    from sympy import symbols
     k_f1_orig, k_f2_orig, y_ref, Lambda_b, = symbols('k_f1 k_f2 y_ref Lambda_b')
     k_f1 = k_f1_orig * k_f1_scale
     k_f2 = k_f2_orig * k_f2_scale
@@ -178,11 +338,56 @@ def kernel_scale_sympy(
     return k_f1_orig, k_f2_orig, Lambda_b, y_ref, kernel_scale
 
 
+@lru_cache(maxsize=None)
+def kernel_scale_function(
+        ni=0, nj=0, lowest_order=4, highest_order=None, include_3bf=False, k_f1_scale=1., k_f2_scale=1.,
+        off_diag=False
+):
+    """Compiles the derivatives of the convergence part of the GP kernel
+
+    The functions are stored in a process-wide registry, keyed by all of the arguments, so each derivative is
+    only differentiated and lambdified once no matter how many kernels use it. The standard settings are
+    generated ahead of time by `codegen.py`, so sympy is only needed for unusual ones.
+
+    Parameters
+    ----------
+    ni : int
+        The number of derivatives with respect to k_f1
+    nj : int
+        The number of derivatives with respect to k_f2
+    lowest_order
+    highest_order
+    include_3bf
+    k_f1_scale
+    k_f2_scale
+    off_diag
+
+    Returns
+    -------
+    f : callable
+        The function f(k_f1, k_f2, Lambda_b, y_ref)
+    """
+    key = (lowest_order, highest_order, bool(include_3bf), float(k_f1_scale), float(k_f2_scale), bool(off_diag),
+           ni, nj)
+    if key in KERNEL_SCALE_FUNCTIONS:
+        return KERNEL_SCALE_FUNCTIONS[key]
+
+    from sympy import diff, lambdify
+    k_f1, k_f2, Lambda_b, y_ref, kernel_scale = kernel_scale_sympy(
+        lowest_order=lowest_order, highest_order=highest_order, include_3bf=include_3bf,
+        k_f1_scale=k_f1_scale, k_f2_scale=k_f2_scale, off_diag=off_diag
+    )
+    expr = diff(kernel_scale, k_f1, ni, k_f2, nj)
+    return lambdify((k_f1, k_f2, Lambda_b, y_ref), expr, "numpy")
+
+
 def eval_kernel_scale(Xi, Xj=None, ni=None, nj=None, breakdown=600, ref=16, lowest_order=4,
                       highest_order=None, include_3bf=False):
     """Creates a matrix for the convergence part of the GP kernel.
     Compatible with the CustomKernel class signature.
 
+    The compiled derivative comes from `kernel_scale_function`, so repeated calls do no symbolic math.
+
     Parameters
     -----------
     Xi
@@ -199,18 +404,57 @@ def eval_kernel_scale(Xi, Xj=None, ni=None, nj=None, breakdown=600, ref=16, lowe
         ni = 0
     if nj is None:
         nj = 0
-    k_f1, k_f2, Lambda_b, y_ref, kernel_scale = kernel_scale_sympy(
-        lowest_order=lowest_order, highest_order=highest_order, include_3bf=include_3bf
+    f = kernel_scale_function(
+        ni=int(ni), nj=int(nj), lowest_order=lowest_order, highest_order=highest_order, include_3bf=include_3bf
     )
-    expr = diff(kernel_scale, k_f1, ni, k_f2, nj)
-    f = lambdify((k_f1, k_f2, Lambda_b, y_ref), expr, "numpy")
     if Xj is None:
         Xj = Xi
     K = f(Xi, Xj, breakdown, ref)
-    K = K.astype('float')
+    K = np.asarray(K, dtype=float)
     return np.squeeze(K)
 
 
+def eval_kernel_scale_blocks(Xi, Xj=None, derivs=(0, 1, 2), derivs2=None, breakdown=600, ref=16, lowest_order=4,
+                             highest_order=None, include_3bf=False):
+    """Evaluates the convergence part of the GP kernel and its derivatives for all pairs of points at once
+
+    Parameters
+    ----------
+    Xi : array, shape = (Ni,) or (Ni, 1)
+    Xj : array, shape = (Nj,) or (Nj, 1), optional
+        Defaults to `Xi`
+    derivs : Iterable[int]
+        The numbers of derivatives with respect to Xi
+    derivs2 : Iterable[int], optional
+        The numbers of derivatives with respect to Xj. Defaults to `derivs`.
+    breakdown
+    ref
+    lowest_order
+    highest_order
+    include_3bf
+
+    Returns
+    -------
+    K : array, shape = (len(derivs), len(derivs2), Ni, Nj)
+        The block `K[a, b]` holds the derivative (derivs[a], derivs2[b]) for every pair of points
+    """
+    if Xj is None:
+        Xj = Xi
+    if derivs2 is None:
+        derivs2 = derivs
+    Xi = np.ravel(Xi).astype(float)[:, None]
+    Xj = np.ravel(Xj).astype(float)[None, :]
+    K = np.empty((len(derivs), len(derivs2), Xi.shape[0], Xj.shape[1]))
+    for a, ni in enumerate(derivs):
+        for b, nj in enumerate(derivs2):
+            f = kernel_scale_function(
+                ni=int(ni), nj=int(nj), lowest_order=lowest_order, highest_order=highest_order,
+                include_3bf=include_3bf
+            )
+            K[a, b] = f(Xi, Xj, breakdown, ref)
+    return K
+
+
 class ConvergenceKernel:
 
     def __init__(
@@ -225,32 +469,34 @@ class ConvergenceKernel:
         self.ref = ref
         self.lowest_order = lowest_order
         self.highest_order = highest_order
-
-        k_f1, k_f2, Lambda_b, y_ref, kernel_scale = kernel_scale_sympy(
-            lowest_order=lowest_order, highest_order=highest_order, include_3bf=include_3bf,
-            k_f1_scale=k_f1_scale, k_f2_scale=k_f2_scale, off_diag=off_diag
-        )
-        self.k_f1 = k_f1
-        self.k_f2 = k_f2
-        self.Lambda_b = Lambda_b
-        self.y_ref = y_ref
-        self.kernel_scale = kernel_scale
+        self.include_3bf = include_3bf
+        self.k_f1_scale = k_f1_scale
+        self.k_f2_scale = k_f2_scale
+        self.off_diag = off_diag
         self._funcs = {}
 
-        self.ni_symbol, self.nj_symbol = symbols('n_i, n_j')
+    def sympy_kernel_scale(self):
+        """The sympy symbols and expression for the kernel scale. See `kernel_scale_sympy`.
+
+        Returns
+        -------
+        k_f1, k_f2, Lambda_b, y_ref, kernel_scale
+        """
+        return kernel_scale_sympy(
+            lowest_order=self.lowest_order, highest_order=self.highest_order, include_3bf=self.include_3bf,
+            k_f1_scale=self.k_f1_scale, k_f2_scale=self.k_f2_scale, off_diag=self.off_diag
+        )
 
     def compute_func(self, ni, nj):
         if (ni, nj) in self._funcs:
             return self._funcs[ni, nj]
         else:
-            k_f1 = self.k_f1
-            k_f2 = self.k_f2
-            Lambda_b = self.Lambda_b
-            y_ref = self.y_ref
-            kernel_scale = self.kernel_scale
-
-            expr = diff(kernel_scale, k_f1, ni, k_f2, nj)
-            f = lambdify((k_f1, k_f2, Lambda_b, y_ref), expr, "numpy")
+            # Shared by all kernels with the same settings
+            f = kernel_scale_function(
+                ni=ni, nj=nj, lowest_order=self.lowest_order, highest_order=self.highest_order,
+                include_3bf=self.include_3bf, k_f1_scale=self.k_f1_scale, k_f2_scale=self.k_f2_scale,
+                off_diag=self.off_diag
+            )
             self._funcs[ni, nj] = f
             return f
 
@@ -274,15 +520,231 @@ class ConvergenceKernel:
         return np.squeeze(K)
 
 
+def squared_exponential_block(xi, xj, ni, nj, std, ls, cache=None):
+    R"""The (ni, nj) derivative of :math:`\sigma^2 \exp(-(x_i - x_j)^2 / 2\ell^2)` at the broadcast pairs of xi and xj
+
+    Uses :math:`\partial_{x_i}^{n_i} \partial_{x_j}^{n_j} k = (-1)^{n_i} \sigma^2 \ell^{-n} He_n(u) e^{-u^2/2}`,
+    where :math:`n = n_i + n_j`, :math:`u = (x_i - x_j) / \ell` and :math:`He_n` are the probabilists' Hermite
+    polynomials.
+
+    Parameters
+    ----------
+    xi : array
+    xj : array
+        Must broadcast with `xi`
+    ni : int
+    nj : int
+    std : float
+    ls : float
+    cache : dict, optional
+        Stores the result up to the sign, which only depends on `n`, `std`, and `ls`. It can be shared by every
+        kernel evaluated at the same `xi` and `xj`, but must not be reused for other inputs.
+
+    Returns
+    -------
+    K : array
+    """
+    from numpy.polynomial.hermite_e import hermeval
+    n = ni + nj
+    key = std, ls, n, np.shape(xi), np.shape(xj)
+    if cache is not None and key in cache:
+        return (-1) ** ni * cache[key]
+    u = (xi - xj) / ls
+    coeffs = np.zeros(n + 1)
+    coeffs[n] = 1.
+    K = std ** 2 * ls ** (-n) * hermeval(u, coeffs) * np.exp(-0.5 * u ** 2)
+    if cache is not None:
+        cache[key] = K
+    return (-1) ** ni * K
+
+
+def kernel_block(kernel, xi, xj, ni, nj, cache=None):
+    """Evaluates the (ni, nj) derivative of a gptools kernel at the broadcast pairs of xi and xj
+
+    `CustomKernel`, 1d `gptools.SquaredExponentialKernel`, and products of these are evaluated directly with
+    broadcasting, with the product rule for derivatives. Other kernels are called with the flattened pairs.
+
+    Parameters
+    ----------
+    kernel : gptools.Kernel
+    xi : array
+    xj : array
+        Must broadcast with `xi`, e.g., shapes (Ni, 1) and (1, Nj) for every pair of points
+    ni : int
+    nj : int
+    cache : dict, optional
+        Passed to `squared_exponential_block`
+
+    Returns
+    -------
+    K : array
+        The broadcast shape of `xi` and `xj`
+    """
+    from scipy.special import comb
+    if isinstance(kernel, CustomKernel):
+        return kernel.block(xi, xj, ni, nj)
+    if isinstance(kernel, gptools.SquaredExponentialKernel) and kernel.num_dim == 1:
+        std, ls = kernel.params
+        return squared_exponential_block(xi, xj, ni, nj, std=std, ls=ls, cache=cache)
+    if isinstance(kernel, gptools.ProductKernel):
+        K = np.zeros(np.broadcast(xi, xj).shape)
+        for a in range(ni + 1):
+            for b in range(nj + 1):
+                K += comb(ni, a) * comb(nj, b) * \
+                    kernel_block(kernel.k1, xi, xj, a, b, cache=cache) * \
+                    kernel_block(kernel.k2, xi, xj, ni - a, nj - b, cache=cache)
+        return K
+    xi_pairs, xj_pairs = np.broadcast_arrays(xi, xj)
+    shape = xi_pairs.shape
+    xi_pairs, xj_pairs = xi_pairs.reshape(-1, 1), xj_pairs.reshape(-1, 1)
+    ni_pairs = np.full(xi_pairs.shape, ni, dtype=int)
+    nj_pairs = np.full(xj_pairs.shape, nj, dtype=int)
+    return np.reshape(kernel(xi_pairs, xj_pairs, ni_pairs, nj_pairs), shape)
+
+
+def compute_derivative_cov(kernel, Xi, Xj=None, derivs=(0, 1, 2), derivs2=None, out=None, cache=None):
+    """Assembles the covariance between derivatives of a GP one block at a time
+
+    The result has the same layout as `gp.compute_Kij` on the inputs tiled by `predict_with_derivatives`,
+    i.e., block (a, b) holds the covariance between derivative derivs[a] at Xi and derivs2[b] at Xj.
+    If `Xj` is `None`, the covariance is symmetric, so only the blocks on and above the diagonal, and only the
+    upper triangles of the diagonal blocks, are evaluated.
+
+    Parameters
+    ----------
+    kernel : gptools.Kernel
+    Xi : array, shape = (Ni, 1)
+    Xj : array, shape = (Nj, 1), optional
+        Defaults to `Xi`
+    derivs : Iterable[int]
+    derivs2 : Iterable[int], optional
+        Defaults to `derivs`
+    out : array, shape = (len(derivs) * Ni, len(derivs2) * Nj), optional
+        The array in which to store the result
+    cache : dict, optional
+        Shares the squared exponential factors between kernels with the same coefficient kernel, such as those of
+        different EFT orders. Only reuse it for the same `Xi` and `Xj`.
+
+    Returns
+    -------
+    cov : array, shape = (len(derivs) * Ni, len(derivs2) * Nj)
+    """
+    symmetric = Xj is None and derivs2 is None
+    if Xj is None:
+        Xj = Xi
+    if derivs2 is None:
+        derivs2 = derivs
+    Ni, Nj = Xi.shape[0], Xj.shape[0]
+    if out is None:
+        out = np.empty((len(derivs) * Ni, len(derivs2) * Nj))
+    if symmetric:
+        iu, ju = np.triu_indices(Ni)
+        x = Xi[:, 0]
+    for a, ni in enumerate(derivs):
+        for b, nj in enumerate(derivs2):
+            block = out[a * Ni:(a + 1) * Ni, b * Nj:(b + 1) * Nj]
+            if not symmetric:
+                block[:] = kernel_block(kernel, Xi, Xj.T, int(ni), int(nj), cache=cache)
+            elif a == b:
+                block[iu, ju] = block[ju, iu] = kernel_block(kernel, x[iu], x[ju], int(ni), int(nj), cache=cache)
+            elif a < b:
+                block[:] = kernel_block(kernel, Xi, Xj.T, int(ni), int(nj), cache=cache)
+                out[b * Ni:(b + 1) * Ni, a * Nj:(a + 1) * Nj] = block.T
+    return out
+
+
 def predict_with_derivatives(gp, X, n=0, only_cov=False, **kwargs):
     n = np.atleast_1d(n)
+    if only_cov:
+        return compute_derivative_cov(gp.k, X, derivs=n)
     X_tiled = np.concatenate([X for _ in n], axis=0)
     n_tiled = np.concatenate([n_i * np.ones(X.shape[0], dtype=int) for n_i in n])[:, None]
-    if only_cov:
-        return gp.compute_Kij(X_tiled, None, ni=n_tiled, nj=None)
     return gp.predict(X_tiled, n=n_tiled, **kwargs)
 
 
+def fit_derivative_gp(kernel, X, y, err_y=0, diag_factor=1e2, cache=None):
+    R"""Conditions a zero-mean GP on the data y at X without going through `gptools.GaussianProcess`
+
+    Factors :math:`K(X, X) + \mathrm{diag}(\sigma_y^2) + \epsilon I` with `scipy.linalg.cho_factor`, with the same
+    jitter as `gptools`.
+
+    Parameters
+    ----------
+    kernel : gptools.Kernel
+    X : array, shape = (N, 1)
+    y : array, shape = (N,)
+    err_y : float or array, shape = (N,)
+    diag_factor : float
+        The multiple of machine epsilon added to the diagonal
+    cache : dict, optional
+        Passed to `compute_derivative_cov` for K(X, X)
+
+    Returns
+    -------
+    fit : tuple
+        The Cholesky factor and :math:`K^{-1} y`, as needed by `predict_derivative_gp`
+    """
+    from scipy.linalg import cho_factor, cho_solve
+    K = compute_derivative_cov(kernel, X, derivs=(0,), cache=cache)
+    K[np.diag_indices_from(K)] += np.broadcast_to(err_y, y.shape) ** 2 + diag_factor * np.finfo(float).eps
+    chol = cho_factor(K, lower=True)
+    return chol, cho_solve(chol, y)
+
+
+def predict_derivative_gp(kernel, X, fit, Xstar, derivs=(0, 1, 2), cross_cache=None, star_cache=None, prior_cov=None):
+    """Predicts the derivatives of a GP conditioned by `fit_derivative_gp`
+
+    Parameters
+    ----------
+    kernel : gptools.Kernel
+    X : array, shape = (N, 1)
+        The training inputs
+    fit : tuple
+        The output of `fit_derivative_gp`
+    Xstar : array, shape = (M, 1)
+    derivs : Iterable[int]
+    cross_cache : dict, optional
+        Passed to `compute_derivative_cov` for K(X, Xstar)
+    star_cache : dict, optional
+        Passed to `compute_derivative_cov` for K(Xstar, Xstar)
+    prior_cov : array, shape = (len(derivs) * M, len(derivs) * M), optional
+        K(Xstar, Xstar), if it has already been computed
+
+    Returns
+    -------
+    mean : array, shape = (len(derivs) * M,)
+    cov : array, shape = (len(derivs) * M, len(derivs) * M)
+        In the same layout as `predict_with_derivatives`
+    """
+    from scipy.linalg import cho_solve
+    chol, alpha = fit
+    K_cross = compute_derivative_cov(kernel, X, Xstar, derivs=(0,), derivs2=derivs, cache=cross_cache)
+    mean = K_cross.T @ alpha
+    if prior_cov is None:
+        prior_cov = compute_derivative_cov(kernel, Xstar, derivs=derivs, cache=star_cache)
+    cov = prior_cov - K_cross.T @ cho_solve(chol, K_cross)
+    return mean, cov
+
+
+def compute_cov_sqrt(cov):
+    R"""Computes a matrix :math:`A` with :math:`A A^T = \Sigma`, to draw samples as :math:`\mu + A z`
+
+    The covariances of derivatives are often singular to machine precision, where a Cholesky decomposition would
+    fail, so this uses the eigendecomposition with the negative eigenvalues from round-off set to zero, as does
+    `np.random.multivariate_normal`.
+
+    Parameters
+    ----------
+    cov : array, shape = (N, N)
+
+    Returns
+    -------
+    A : array, shape = (N, N)
+    """
+    eigvals, eigvecs = np.linalg.eigh(cov)
+    return eigvecs * np.sqrt(np.clip(eigvals, 0, None))
+
+
 def extract_blocks(a, blocksize, keep_as_view=False):
     M, N = a.shape
     b0, b1 = blocksize
@@ -321,6 +783,99 @@ def get_std_map(cov_map):
     return d
 
 
+def compute_mean_cov_log_evidence_blm(X, y, Sigma_y, mean0=0, cov0=0, rcond=None):
+    R"""Fits the Bayesian Linear Model to one or more data vectors that share the features and noise
+
+    The data are whitened once with the Cholesky factor of `Sigma_y`, or with its standard deviations if it is
+    diagonal. The whitened features, stacked on a square root of the prior precision, then get a single SVD,
+    which gives the posterior mean and covariance without forming the normal equations. Those square the condition
+    number, which for the fractional power features can be beyond double precision. Singular values below
+    `rcond` times the largest are dropped, like in `np.linalg.lstsq`, so nearly degenerate directions in parameter
+    space are left at the prior, or pinned to zero if the prior is uninformative, rather than amplifying round-off.
+    The evidence uses the determinant lemma and the Woodbury identity in the basis of the SVD, where the only
+    remaining system has eigenvalues between one and two.
+
+    Parameters
+    ----------
+    X : array-like, shape = (N, n_params)
+        The feature matrix
+    y : array-like, shape = (N,) or (N, K)
+        The data, with K data vectors as columns
+    Sigma_y : int or array-like, shape = (N,) or (N, N)
+        The data covariance, or its diagonal
+    mean0 : int or array-like, shape = (n_params,)
+        The prior mean on the polynomial coefficients
+    cov0 : int or array-like, shape = (n_params, n_params)
+        The prior covariance on the polynomial coefficients. If zero, the prior is uninformative
+    rcond : float, optional
+        The relative cutoff for small singular values. Defaults to machine precision times the larger dimension
+        of the stacked features.
+
+    Returns
+    -------
+    mean : array-like, shape = (n_params,) or (n_params, K)
+    cov : array-like, shape = (n_params, n_params)
+    log_evidence : float or array-like, shape = (K,)
+        The log pdf of the data under the posterior predictive distribution
+    """
+    from scipy.linalg import cho_factor, cho_solve, solve_triangular
+    y = np.asarray(y, dtype=float)
+    Y = y.reshape(y.shape[0], -1)
+    N, n_params = X.shape
+    ones_n_params = np.ones(n_params, dtype=float)
+    mean0 = mean0 * ones_n_params
+
+    Sigma_y = np.asarray(Sigma_y, dtype=float)
+    if Sigma_y.ndim == 2 and not np.any(Sigma_y - np.diag(np.diagonal(Sigma_y))):
+        Sigma_y = np.diagonal(Sigma_y)
+    if Sigma_y.ndim < 2:
+        std_y = np.sqrt(Sigma_y * np.ones(N))
+        X_w = X / std_y[:, None]
+        Y_w = Y / std_y[:, None]
+        logdet_Sigma_y = 2 * np.sum(np.log(std_y))
+    else:
+        chol_y = np.linalg.cholesky(Sigma_y)
+        X_w = solve_triangular(chol_y, X, lower=True)
+        Y_w = solve_triangular(chol_y, Y, lower=True)
+        logdet_Sigma_y = 2 * np.sum(np.log(np.diag(chol_y)))
+
+    # The prior enters as extra rows R0 with R0^T R0 = prec0, with data R0 @ mean0
+    if np.all(cov0 == 0):
+        A, B = X_w, Y_w
+    else:
+        cov0 = cov0 * ones_n_params
+        if cov0.ndim == 1:
+            R0 = np.diag(1 / np.sqrt(cov0))
+        else:
+            R0 = solve_triangular(np.linalg.cholesky(cov0), np.eye(n_params), lower=True)
+        A = np.concatenate([X_w, R0])
+        B = np.concatenate([Y_w, np.broadcast_to((R0 @ mean0)[:, None], (n_params, Y.shape[1]))])
+
+    # The posterior precision is A^T A = V S^2 V^T
+    U, S, Vt = np.linalg.svd(A, full_matrices=False)
+    if rcond is None:
+        rcond = np.finfo(float).eps * max(A.shape)
+    keep = S > rcond * S[0]
+    U, S, Vt = U[:, keep], S[keep], Vt[keep]
+    V_scaled = Vt.T / S
+    cov = V_scaled @ V_scaled.T
+    mean = V_scaled @ (U.T @ B)
+
+    # The whitened predictive covariance is I + M M^T, with M = X_w V S^-1. The eigenvalues of M^T M lie in [0, 1],
+    # so the (n_kept, n_kept) factorization below is always well conditioned.
+    resid = Y_w - X_w @ mean
+    M = X_w @ V_scaled
+    proj = M.T @ resid
+    chol_pred = cho_factor(np.eye(len(S)) + M.T @ M, lower=True)
+    quad = np.sum(resid ** 2, axis=0) - np.sum(proj * cho_solve(chol_pred, proj), axis=0)
+    logdet = logdet_Sigma_y + 2 * np.sum(np.log(np.diag(chol_pred[0])))
+    log_evidence = - 0.5 * quad - 0.5 * (N * np.log(2 * np.pi) + logdet)
+
+    if y.ndim == 1:
+        return mean[:, 0], cov, log_evidence[0]
+    return mean, cov, log_evidence
+
+
 def compute_mean_cov_blm(X, y, Sigma_y=0, mean0=0, cov0=0):
     R"""Estimate parameters of the Bayesian Linear Model
 
@@ -328,7 +883,7 @@ def compute_mean_cov_blm(X, y, Sigma_y=0, mean0=0, cov0=0):
     ----------
     X : array-like, shape = (N, n_params)
         The feature matrix
-    y : array-like, shape = (N,)
+    y : array-like, shape = (N,) or (N, K)
         The data
     Sigma_y : int or array-like, shape = (N, N)
         The data covariance
@@ -342,54 +897,36 @@ def compute_mean_cov_blm(X, y, Sigma_y=0, mean0=0, cov0=0):
     mean : array-like
     cov : array-like
     """
-    ones_y = np.ones(y.shape[0], dtype=float)
-    ones_n_params = np.ones(X.shape[-1], dtype=float)
-    Sigma_y = Sigma_y * ones_y
-    mean0 = mean0 * ones_n_params
-    if Sigma_y.ndim == 1:
-        Sigma_y = np.diag(Sigma_y)
-
-    if cov0 == 0:
-        prec0 = 0 * np.diag(ones_n_params)
-    else:
-        cov0 = cov0 * ones_n_params
-        if cov0.ndim == 1:
-            cov0 = np.diag(cov0)
-        prec0 = np.linalg.inv(cov0)
-
-    cov = np.linalg.inv(prec0 + X.T @ np.linalg.solve(Sigma_y, X))
-    mean = cov @ (prec0 @ mean0 + X.T @ np.linalg.solve(Sigma_y, y))
+    mean, cov, _ = compute_mean_cov_log_evidence_blm(X, y, Sigma_y, mean0=mean0, cov0=cov0)
     return mean, cov
 
 
 def compute_log_evidence_blm(X, y, Sigma_y, mean0=0, cov0=0):
-    mean, cov = compute_mean_cov_blm(X, y, Sigma_y, mean0, cov0)
-    mean_y = X @ mean
-    cov_y = X @ cov @ X.T + Sigma_y
-
-    logdet = np.linalg.slogdet(2 * np.pi * cov_y)[1]
-    logpdf = - 0.5 * (y - mean_y) @ np.linalg.solve(cov_y, y - mean_y) - 0.5 * logdet
-
-    # try:
-    #     y_dist = stats.multivariate_normal(mean=mean_y, cov=cov_y, allow_singular=True)
-    #     logpdf2 = y_dist.logpdf(y)
-    #     # print(np.allclose(logpdf2, logpdf))
-    #     if not np.allclose(logpdf2, logpdf):
-    #         print('stats', logpdf2)
-    #         print('mine', logpdf)
-    #         print('diff', np.abs(logpdf - logpdf2))
-    #     else:
-    #         print('hooray!')
-    # except (np.linalg.LinAlgError, ValueError):
-    #     print('Singular, skipping..')
-    return logpdf
+    return compute_mean_cov_log_evidence_blm(X, y, Sigma_y, mean0=mean0, cov0=cov0)[2]
+
+
+class _LazyDict(dict):
+    """A dict that computes missing values with `factory(key)` and stores them the first time they are requested"""
+
+    def __init__(self, factory):
+        super().__init__()
+        self.factory = factory
+
+    def __missing__(self, key):
+        value = self[key] = self.factory(key)
+        return value
 
 
 class ObservableContainer:
+    """Interpolates an observable and its derivatives at each EFT order with a GP, including truncation errors
+
+    If `lazy`, the predictions, interpolators, and finite differences for each order are only computed, and then
+    stored, the first time they are requested. Otherwise, they are all computed when the container is created.
+    """
 
     def __init__(
             self, density, kf, y, orders, density_interp, kf_interp,
-            std, ls, ref, breakdown, err_y=0, derivs=(0, 1, 2), include_3bf=True, verbose=False
+            std, ls, ref, breakdown, err_y=0, derivs=(0, 1, 2), include_3bf=True, verbose=False, lazy=False
     ):
 
         self.density = density
@@ -401,124 +938,154 @@ class ObservableContainer:
         self.Kf_interp = Kf_interp = kf_interp[:, None]
         self.X_interp = Kf_interp
 
-        self.y = y
-        self.N_interp = N_interp = len(kf_interp)
-        err_y = np.broadcast_to(err_y, y.shape[0])  # Turn to vector if not already
-        self.err_y = err_y
-        self.Sigma_y = np.diag(err_y**2)  # Make a diagonal covariance matrix
-        self.derivs = derivs
-
-        self.gps_interp = {}
-        self.gps_trunc = {}
-
-        self._y_interp_all_derivs = {}
-        self._cov_interp_all_derivs = {}
-        self._y_interp_vecs = {}
-        self._std_interp_vecs = {}
-        self._cov_interp_blocks = {}
-
-        self._dy_dn = {}
-        self._d2y_dn2 = {}
-        self._dy_dk = {}
-        self._d2y_dk2 = {}
-        self._y_dict = {}
-
-        d_dn = FinDiff(0, density, 1)
-        d2_dn2 = FinDiff(0, density, 2, acc=2)
-        d_dk = FinDiff(0, kf, 1)
-        d2_dk2 = FinDiff(0, kf, 2, acc=2)
-
-        self._cov_total_all_derivs = {}
-        self._cov_total_blocks = {}
-        self._std_total_vecs = {}
-
-        # The priors on the interpolator parameters
-        self.mean0 = 0
-        self.cov0 = 0
-        self._best_max_orders = {}
-        self._start_poly_order = 2
-
-        # from scipy.interpolate import splrep
-        from scipy.interpolate import UnivariateSpline
-        self.splines = {}
-
         self.coeff_kernel = gptools.SquaredExponentialKernel(
             initial_params=[std, ls], fixed_params=[True, True])
-        for i, n in enumerate(orders):
+        self._first_omitted = {}
+        self._kernels_interp = {}
+        self._kernels_trunc = {}
+        for n in orders:
             first_omitted = n + 1
             if first_omitted == 1:
                 first_omitted += 1  # the Q^1 contribution is zero, so bump to Q^2
+            self._first_omitted[n] = first_omitted
             _kern_lower = CustomKernel(ConvergenceKernel(
                 breakdown=breakdown, ref=ref, lowest_order=0, highest_order=n, include_3bf=include_3bf
             ))
-            kern_interp = _kern_lower * self.coeff_kernel
+            self._kernels_interp[n] = _kern_lower * self.coeff_kernel
             _kern_upper = CustomKernel(ConvergenceKernel(
                 breakdown=breakdown, ref=ref, lowest_order=first_omitted, include_3bf=include_3bf
             ))
-            kern_trunc = _kern_upper * self.coeff_kernel
-
-            # try:
-            #     err_y_i = err_y[i]
-            # except TypeError:
-            #     err_y_i = err_y
-
-            y_n = y[:, i]
-            self._y_dict[n] = y_n
-
-            # Interpolating processes
-            # mu_n = gptools.ConstantMeanFunction(initial_params=[np.mean(y_n)])
-            # mu_n = gptools.ConstantMeanFunction(initial_params=[np.max(y_n)+20])
-            mu_n = gptools.ConstantMeanFunction(initial_params=[0])
-            gp_interp = gptools.GaussianProcess(kern_interp, mu=mu_n)
-            gp_interp.add_data(Kf, y_n, err_y=err_y)
-            # gp_interp.optimize_hyperparameters(max_tries=10)  # For the mean
-            self.gps_interp[n] = gp_interp
-
-            # Finite difference:
-            self._dy_dn[n] = d_dn(y_n)
-            self._d2y_dn2[n] = d2_dn2(y_n)
-            self._dy_dk[n] = d_dk(y_n)
-            self._d2y_dk2[n] = d2_dk2(y_n)
-
-            # Fractional interpolator polynomials
-            self._best_max_orders[n] = self.compute_best_interpolator(
-                density, y=y_n, start_order=self._start_poly_order, max_order=10
-            )
-            self.splines[n] = UnivariateSpline(density, y_n, s=np.max(err_y))
-            if verbose:
-                print(f'For EFT order {n}, the best polynomial has max nu = {self._best_max_orders[n]}')
+            self._kernels_trunc[n] = _kern_upper * self.coeff_kernel
+        # Each truncation kernel is the full series minus an interpolating kernel, so only sum the series once
+        self._kernel_full = CustomKernel(ConvergenceKernel(
+            breakdown=breakdown, ref=ref, lowest_order=0, include_3bf=include_3bf
+        )) * self.coeff_kernel
+
+        self._setup_predictions(
+            X=Kf, y=y, orders=orders, err_y=err_y, derivs=derivs, verbose=verbose, lazy=lazy
+        )
 
-            # Back to GPs:
+    def _setup_predictions(self, X, y, orders, err_y, derivs, verbose, lazy):
+        """Creates the lazily computed predictions for every order, and computes them now unless `lazy`
 
-            y_interp_all_derivs_n, cov_interp_all_derivs_n = predict_with_derivatives(
-                gp=gp_interp, X=Kf_interp, n=derivs, return_cov=True
-            )
+        Assumes that the kernels for each order have already been set up.
+        """
+        from scipy.interpolate import UnivariateSpline
 
-            y_interp_vecs_n = get_means_map(y_interp_all_derivs_n, N_interp)
-            cov_interp_blocks_n = get_blocks_map(cov_interp_all_derivs_n, (N_interp, N_interp))
-            std_interp_vecs_n = get_std_map(cov_interp_blocks_n)
+        self.X = X
+        self.y = y
+        self.orders = orders
+        self.N_interp = N_interp = len(self.X_interp)
+        err_y = np.broadcast_to(err_y, y.shape[0])  # Turn to vector if not already
+        self.err_y = err_y
+        self.Sigma_y = np.diag(err_y**2)  # Make a diagonal covariance matrix
+        self.derivs = derivs
+        self.verbose = verbose
 
-            self._y_interp_all_derivs[n] = y_interp_all_derivs_n
-            self._cov_interp_all_derivs[n] = cov_interp_all_derivs_n
-            self._y_interp_vecs[n] = y_interp_vecs_n
-            self._cov_interp_blocks[n] = cov_interp_blocks_n
-            self._std_interp_vecs[n] = std_interp_vecs_n
+        # The priors on the interpolator parameters
+        self.mean0 = 0
+        self.cov0 = 0
+        self._start_poly_order = 2
 
-            # Truncation Processes
-            gp_trunc = gptools.GaussianProcess(kern_trunc)
-            self.gps_trunc[n] = gp_trunc
+        self._y_dict = {n: y[:, i] for i, n in enumerate(orders)}
+
+        # Every order shares the coefficient kernel, so its derivative blocks are only computed once per set of inputs
+        self._train_cache, self._cross_cache, self._interp_cache = {}, {}, {}
+        self._cov_full_all_derivs = None
+
+        # Interpolating processes
+        self.gps_interp = _LazyDict(self._create_gp_interp)
+        self._gp_fits = _LazyDict(lambda n: fit_derivative_gp(
+            self._kernels_interp[n], self.X, self._y_dict[n], err_y=self.err_y, cache=self._train_cache
+        ))
+        self._cov_prior_interp = _LazyDict(lambda n: compute_derivative_cov(
+            self._kernels_interp[n], self.X_interp, derivs=self.derivs, cache=self._interp_cache
+        ))
+        self._interp_predictions = _LazyDict(lambda n: predict_derivative_gp(
+            self._kernels_interp[n], self.X, self._gp_fits[n], self.X_interp, derivs=self.derivs,
+            cross_cache=self._cross_cache, prior_cov=self._cov_prior_interp[n]
+        ))
+        self._y_interp_all_derivs = _LazyDict(lambda n: self._interp_predictions[n][0])
+        self._cov_interp_all_derivs = _LazyDict(lambda n: self._interp_predictions[n][1])
+        self._y_interp_vecs = _LazyDict(lambda n: get_means_map(self._y_interp_all_derivs[n], N_interp))
+        self._cov_interp_blocks = _LazyDict(
+            lambda n: get_blocks_map(self._cov_interp_all_derivs[n], (N_interp, N_interp))
+        )
+        self._std_interp_vecs = _LazyDict(lambda n: get_std_map(self._cov_interp_blocks[n]))
 
-            cov_trunc_all_derivs_n = predict_with_derivatives(
-                gp=gp_trunc, X=Kf_interp, n=derivs, only_cov=True
+        # Truncation Processes
+        self.gps_trunc = _LazyDict(lambda n: gptools.GaussianProcess(self._kernels_trunc[n]))
+        self._cov_total_all_derivs = _LazyDict(
+            lambda n: self._cov_interp_all_derivs[n] + self._compute_cov_trunc(n)
+        )
+        self._cov_total_blocks = _LazyDict(
+            lambda n: get_blocks_map(self._cov_total_all_derivs[n], (N_interp, N_interp))
+        )
+        self._std_total_vecs = _LazyDict(lambda n: get_std_map(self._cov_total_blocks[n]))
+
+        # Only factored when sampling
+        self._cov_interp_sqrt = _LazyDict(lambda n: compute_cov_sqrt(self._cov_interp_all_derivs[n]))
+        self._cov_total_sqrt = _LazyDict(lambda n: compute_cov_sqrt(self._cov_total_all_derivs[n]))
+
+        # Finite difference:
+        d_dn = FinDiff(0, self.density, 1)
+        d2_dn2 = FinDiff(0, self.density, 2, acc=2)
+        self._dy_dn = _LazyDict(lambda n: d_dn(self._y_dict[n]))
+        self._d2y_dn2 = _LazyDict(lambda n: d2_dn2(self._y_dict[n]))
+        if self.kf is not None:
+            d_dk = FinDiff(0, self.kf, 1)
+            d2_dk2 = FinDiff(0, self.kf, 2, acc=2)
+            self._dy_dk = _LazyDict(lambda n: d_dk(self._y_dict[n]))
+            self._d2y_dk2 = _LazyDict(lambda n: d2_dk2(self._y_dict[n]))
+        else:
+            self._dy_dk = {}
+            self._d2y_dk2 = {}
+
+        # Fractional interpolator polynomials
+        self._best_max_orders = _LazyDict(self._find_best_max_order)
+        self.splines = _LazyDict(lambda n: UnivariateSpline(self.density, self._y_dict[n], s=np.max(self.err_y)))
+
+        if not lazy:
+            lazy_dicts = [
+                self.gps_interp, self.gps_trunc, self._dy_dn, self._d2y_dn2, self._dy_dk, self._d2y_dk2,
+                self._best_max_orders, self.splines, self._y_interp_vecs, self._std_interp_vecs, self._std_total_vecs,
+            ]
+            for n in orders:
+                for lazy_dict in lazy_dicts:
+                    if isinstance(lazy_dict, _LazyDict):
+                        lazy_dict[n]
+
+    def _create_gp_interp(self, order):
+        # mu_n = gptools.ConstantMeanFunction(initial_params=[np.mean(y_n)])
+        # mu_n = gptools.ConstantMeanFunction(initial_params=[np.max(y_n)+20])
+        mu_n = gptools.ConstantMeanFunction(initial_params=[0])
+        gp_interp = gptools.GaussianProcess(self._kernels_interp[order], mu=mu_n)
+        gp_interp.add_data(self.X, self._y_dict[order], err_y=self.err_y)
+        # gp_interp.optimize_hyperparameters(max_tries=10)  # For the mean
+        return gp_interp
+
+    def _compute_cov_trunc(self, order):
+        if self._first_omitted[order] != order + 1:  # The Q^1 term is in neither kernel
+            return compute_derivative_cov(
+                self._kernels_trunc[order], self.X_interp, derivs=self.derivs, cache=self._interp_cache
             )
-            cov_total_all_derivs_n = cov_interp_all_derivs_n + cov_trunc_all_derivs_n
-
-            cov_total_blocks_n = get_blocks_map(cov_total_all_derivs_n, (N_interp, N_interp))
-            std_total_vecs_n = get_std_map(cov_total_blocks_n)
+        if self._cov_full_all_derivs is None:
+            self._cov_full_all_derivs = compute_derivative_cov(
+                self._kernel_full, self.X_interp, derivs=self.derivs, cache=self._interp_cache
+            )
+        return self._cov_full_all_derivs - self._cov_prior_interp[order]
 
-            self._cov_total_all_derivs[n] = cov_total_all_derivs_n
-            self._cov_total_blocks[n] = cov_total_blocks_n
-            self._std_total_vecs[n] = std_total_vecs_n
+    def _find_best_max_order(self, order):
+        # Fitting every order at once is barely more expensive than fitting one, so store them all
+        best_max_orders = self.compute_best_interpolator(
+            self.density, y=self.y[:, :len(self.orders)], start_order=self._start_poly_order, max_order=10
+        )
+        for n, best_max_order in zip(self.orders, best_max_orders):
+            if n not in self._best_max_orders:
+                self._best_max_orders[n] = best_max_order
+                if self.verbose:
+                    print(f'For EFT order {n}, the best polynomial has max nu = {best_max_order}')
+        return self._best_max_orders[order]
 
     def get_cov(self, order, deriv1, deriv2=None, include_trunc=True):
         if deriv2 is None:
@@ -555,23 +1122,62 @@ class ObservableContainer:
             std = self._std_interp_vecs[order]
         return std[deriv]
 
-    def draw_sample(self, order, num_samp=1, include_trunc=True):
-        gp = gptools.GaussianProcess(k=self.gps_trunc[order].k)  # Kernel won't matter
+    def draw_sample(self, order, num_samp=1, include_trunc=True, random_state=None):
+        """Draws samples of the observable and its derivatives at `X_interp`
+
+        Parameters
+        ----------
+        order
+        num_samp : int
+        include_trunc : bool
+        random_state : None, int, or np.random.Generator
+            If None, uses the global NumPy random state
+
+        Returns
+        -------
+        samples : dict
+            The samples of shape (N_interp, num_samp) for each derivative
+        """
+        return next(self.iter_samples(
+            order, num_samp=num_samp, chunk_size=max(num_samp, 1), include_trunc=include_trunc,
+            random_state=random_state
+        ))
+
+    def iter_samples(self, order, num_samp, chunk_size=1000, include_trunc=True, random_state=None):
+        """Generates samples in chunks, so that very many samples never need to be held in memory at once
+
+        The covariance is factored once per order and reused by every chunk and by later calls.
+
+        Parameters
+        ----------
+        order
+        num_samp : int
+            The total number of samples
+        chunk_size : int
+            The number of samples in each chunk. The last chunk may be smaller.
+        include_trunc : bool
+        random_state : None, int, or np.random.Generator
+            If None, uses the global NumPy random state
+
+        Yields
+        ------
+        samples : dict
+            The samples of shape (N_interp, chunk_size) for each derivative
+        """
         mean = self._y_interp_all_derivs[order]
         if include_trunc:
-            cov = self._cov_total_all_derivs[order]
+            cov_sqrt = self._cov_total_sqrt[order]
         else:
-            cov = self._cov_interp_all_derivs[order]
-        # samples shape: n_derivs * N_interp, num_samp
-        samples = gp.draw_sample(Xstar=self.X_interp, num_samp=num_samp, mean=mean, cov=cov)
-        # change it to: n_derivs, N_interp, num_samp
-        sample_blocks = extract_blocks(samples, blocksize=(self.N_interp, samples.shape[-1]))
-        sample_dict = {}
-        # self.derivs = [0, 1, 2]
-        # Put into dict for access via derivative value
-        for i, d in enumerate(self.derivs):
-            sample_dict[d] = sample_blocks[i]
-        return sample_dict
+            cov_sqrt = self._cov_interp_sqrt[order]
+        rng = np.random if random_state is None else np.random.default_rng(random_state)
+        for start in range(0, num_samp, chunk_size):
+            n_chunk = min(chunk_size, num_samp - start)
+            # samples shape: n_derivs * N_interp, n_chunk
+            samples = mean[:, None] + cov_sqrt @ rng.standard_normal((cov_sqrt.shape[1], n_chunk))
+            # change it to: n_derivs, N_interp, n_chunk
+            sample_blocks = samples.reshape(len(self.derivs), self.N_interp, n_chunk)
+            # Put into dict for access via derivative value
+            yield {d: sample_blocks[i] for i, d in enumerate(self.derivs)}
 
     def predict(self, X, order, derivs=None, include_trunc=True):
         """Predict from the GP
@@ -590,15 +1196,41 @@ class ObservableContainer:
         """
         if derivs is None:
             derivs = self.derivs
-        y_interp, cov = predict_with_derivatives(
-            self.gps_interp[order], X=X, n=derivs, return_cov=True
+        y_interp, cov = predict_derivative_gp(
+            self._kernels_interp[order], self.X, self._gp_fits[order], X, derivs=derivs
         )
         if include_trunc:
-            cov += predict_with_derivatives(
-                self.gps_trunc[order], X=X, n=derivs, only_cov=True
-            )
+            cov += compute_derivative_cov(self._kernels_trunc[order], X, derivs=derivs)
         return y_interp, cov
 
+    def predict_eos(self, order, quantities, include_trunc=True):
+        """The joint mean and covariance of EOS quantities at `density_interp`, including their cross-covariances
+
+        Parameters
+        ----------
+        order
+        quantities : Iterable[str]
+            Some of 'E', 'P', 'dP/dn', 'K', and 'L'. For a `SymmetryEnergyContainer`, 'E' and 'L' are the symmetry
+            energy and its slope.
+        include_trunc : bool
+
+        Returns
+        -------
+        mean : array, shape = (len(quantities) * N_interp,)
+        cov : array, shape = (len(quantities) * N_interp, len(quantities) * N_interp)
+            Stacked in the order of `quantities`. Use `get_blocks_map` to split it into blocks.
+        """
+        if include_trunc:
+            cov = self._cov_total_all_derivs[order]
+        else:
+            cov = self._cov_interp_all_derivs[order]
+        # The symmetry energy container works directly with density
+        wrt_kf = self.kf_interp is not None
+        return compute_eos_joint_mean_cov(
+            self.density_interp, self.kf_interp, self._y_interp_all_derivs[order], cov, quantities,
+            derivs=self.derivs, wrt_kf=wrt_kf
+        )
+
     def finite_difference(self, order, deriv=1, wrt_kf=True):
         y = self._y_dict
         if wrt_kf:
@@ -636,9 +1268,10 @@ class ObservableContainer:
 
     def compute_functional_coefficients_df(self):
         density = self.density
-        functional_orders = np.arange(self._start_poly_order, max(self._best_max_orders.values()) + 1)
+        best_max_orders = {order: self._best_max_orders[order] for order in self.orders}
+        functional_orders = np.arange(self._start_poly_order, max(best_max_orders.values()) + 1)
         coeffs = {}
-        for order, poly_order in self._best_max_orders.items():
+        for order, poly_order in best_max_orders.items():
             X = self.compute_feature_matrix_fractional_interpolator(
                 density, start_order=self._start_poly_order, end_order=poly_order, deriv=0
             )
@@ -679,10 +1312,9 @@ class ObservableContainer:
             log_evidences.append(compute_log_evidence_blm(
                 X_i, y=y, Sigma_y=self.Sigma_y, mean0=self.mean0, cov0=self.cov0
             ))
+        # y can hold several data vectors as columns, in which case each gets its own best order
         log_evidences = np.array(log_evidences)
-        log_evidences -= np.max(log_evidences)
-        evidences = np.exp(log_evidences)
-        return fit_orders[np.argmax(evidences)]
+        return fit_orders[np.argmax(log_evidences, axis=0)]
 
 
 class SymmetryEnergyContainer(ObservableContainer):
@@ -690,7 +1322,7 @@ class SymmetryEnergyContainer(ObservableContainer):
     def __init__(
             self, density, y, orders, density_interp,
             std_n, ls_n, std_s, ls_s, ref_n, ref_s, breakdown, err_y=0, derivs=(0, 1, 2), include_3bf=True,
-            verbose=False, rho=None
+            verbose=False, rho=None, lazy=False
     ):
         self.density = density
         self.Density = Density = density[:, None]
@@ -703,43 +1335,6 @@ class SymmetryEnergyContainer(ObservableContainer):
         self.Kf_interp = None
         self.X_interp = Density_interp
 
-        self.y = y
-        self.N_interp = N_interp = len(density_interp)
-        err_y = np.broadcast_to(err_y, y.shape[0])  # Turn to vector if not already
-        self.err_y = err_y
-        self.Sigma_y = np.diag(err_y ** 2)  # Make a diagonal covariance matrix
-        self.derivs = derivs
-
-        self.gps_interp = {}
-        self.gps_trunc = {}
-
-        self._y_interp_all_derivs = {}
-        self._cov_interp_all_derivs = {}
-        self._y_interp_vecs = {}
-        self._std_interp_vecs = {}
-        self._cov_interp_blocks = {}
-
-        self._dy_dn = {}
-        self._d2y_dn2 = {}
-        self._dy_dk = {}
-        self._d2y_dk2 = {}
-        self._y_dict = {}
-
-        d_dn = FinDiff(0, density, 1)
-        d2_dn2 = FinDiff(0, density, 2, acc=2)
-        # d_dk = FinDiff(0, kf, 1)
-        # d2_dk2 = FinDiff(0, kf, 2, acc=2)
-
-        self._cov_total_all_derivs = {}
-        self._cov_total_blocks = {}
-        self._std_total_vecs = {}
-
-        # The priors on the interpolator parameters
-        self.mean0 = 0
-        self.cov0 = 0
-        self._best_max_orders = {}
-        self._start_poly_order = 2
-
         self.ref_n = ref_n
         self.ref_s = ref_s
 
@@ -774,10 +1369,32 @@ class SymmetryEnergyContainer(ObservableContainer):
 
         print(ls_n, ls_s, ls_off)
 
-        for i, n in enumerate(orders):
+        # Each truncation kernel is the full series minus an interpolating kernel, so only sum the series once
+        self._kernel_full = SymmetryEnergyKernel(
+            kernel_n=CustomKernel(ConvergenceKernel(
+                breakdown=breakdown, ref=ref_n, lowest_order=0, include_3bf=include_3bf
+            )) * self.coeff_kernel_n,
+            kernel_s=CustomKernel(ConvergenceKernel(
+                breakdown=breakdown, ref=ref_s, lowest_order=0, include_3bf=include_3bf
+            )) * self.coeff_kernel_s,
+            kernel_ns=CustomKernel(ConvergenceKernel(
+                breakdown=breakdown, ref=ref_off, lowest_order=0, include_3bf=include_3bf,
+                k_f1_scale=1, k_f2_scale=1/kf_conversion,
+            )) * self.coeff_kernel_off,
+            kernel_sn=CustomKernel(ConvergenceKernel(
+                breakdown=breakdown, ref=ref_off, lowest_order=0, include_3bf=include_3bf,
+                k_f1_scale=1/kf_conversion, k_f2_scale=1,
+            )) * self.coeff_kernel_off,
+        )
+
+        self._first_omitted = {}
+        self._kernels_interp = {}
+        self._kernels_trunc = {}
+        for n in orders:
             first_omitted = n + 1
             if first_omitted == 1:
                 first_omitted += 1  # the Q^1 contribution is zero, so bump to Q^2
+            self._first_omitted[n] = first_omitted
             _kern_lower_n = CustomKernel(ConvergenceKernel(
                 breakdown=breakdown, ref=ref_n, lowest_order=0, highest_order=n, include_3bf=include_3bf
             ))
@@ -800,7 +1417,7 @@ class SymmetryEnergyContainer(ObservableContainer):
             kern_interp_s = _kern_lower_s * self.coeff_kernel_s
             kern_interp_ns = _kern_lower_ns * self.coeff_kernel_off
             kern_interp_sn = _kern_lower_sn * self.coeff_kernel_off
-            kern_interp = SymmetryEnergyKernel(
+            self._kernels_interp[n] = SymmetryEnergyKernel(
                 kernel_n=kern_interp_n,
                 kernel_s=kern_interp_s,
                 kernel_ns=kern_interp_ns,
@@ -827,70 +1444,13 @@ class SymmetryEnergyContainer(ObservableContainer):
             kern_trunc_s = _kern_upper_s * self.coeff_kernel_s
             kern_trunc_ns = _kern_upper_ns * self.coeff_kernel_off
             kern_trunc_sn = _kern_upper_sn * self.coeff_kernel_off
-            kern_trunc = SymmetryEnergyKernel(
+            self._kernels_trunc[n] = SymmetryEnergyKernel(
                 kernel_n=kern_trunc_n,
                 kernel_s=kern_trunc_s,
                 kernel_ns=kern_trunc_ns,
                 kernel_sn=kern_trunc_sn,
             )
 
-            y_n = y[:, i]
-            self._y_dict[n] = y_n
-
-            # Interpolating processes
-            # mu_n = gptools.ConstantMeanFunction(initial_params=[np.mean(y_n)])
-            # mu_n = gptools.ConstantMeanFunction(initial_params=[np.max(y_n)+20])
-            mu_n = gptools.ConstantMeanFunction(initial_params=[0])
-            gp_interp = gptools.GaussianProcess(kern_interp, mu=mu_n)
-            gp_interp.add_data(Density, y_n, err_y=err_y)
-            # gp_interp.optimize_hyperparameters(max_tries=10)  # For the mean
-            self.gps_interp[n] = gp_interp
-
-            # Finite difference:
-            self._dy_dn[n] = d_dn(y_n)
-            self._d2y_dn2[n] = d2_dn2(y_n)
-            # self._dy_dk[n] = d_dk(y_n)
-            # self._d2y_dk2[n] = d2_dk2(y_n)
-
-            # Fractional interpolator polynomials
-            self._best_max_orders[n] = self.compute_best_interpolator(
-                density, y=y_n, start_order=self._start_poly_order, max_order=10
-            )
-            if verbose:
-                print(f'For EFT order {n}, the best polynomial has max nu = {self._best_max_orders[n]}')
-
-            # Back to GPs:
-
-            y_interp_all_derivs_n, cov_interp_all_derivs_n = predict_with_derivatives(
-                gp=gp_interp, X=Density_interp, n=derivs, return_cov=True
-            )
-
-            y_interp_vecs_n = get_means_map(y_interp_all_derivs_n, N_interp)
-            cov_interp_blocks_n = get_blocks_map(cov_interp_all_derivs_n, (N_interp, N_interp))
-            # for (ii, jj), cov_ij in cov_interp_blocks_n.items():
-            #     cov_interp_blocks_n[ii, jj] += 1e-12 * np.eye(cov_ij.shape[0])
-            std_interp_vecs_n = get_std_map(cov_interp_blocks_n)
-
-            self._y_interp_all_derivs[n] = y_interp_all_derivs_n
-            self._cov_interp_all_derivs[n] = cov_interp_all_derivs_n
-            self._y_interp_vecs[n] = y_interp_vecs_n
-            self._cov_interp_blocks[n] = cov_interp_blocks_n
-            self._std_interp_vecs[n] = std_interp_vecs_n
-
-            # Truncation Processes
-            gp_trunc = gptools.GaussianProcess(kern_trunc)
-            self.gps_trunc[n] = gp_trunc
-
-            cov_trunc_all_derivs_n = predict_with_derivatives(
-                gp=gp_trunc, X=Density_interp, n=derivs, only_cov=True
-            )
-            cov_total_all_derivs_n = cov_interp_all_derivs_n + cov_trunc_all_derivs_n
-
-            cov_total_blocks_n = get_blocks_map(cov_total_all_derivs_n, (N_interp, N_interp))
-            # for (ii, jj), cov_ij in cov_total_blocks_n.items():
-            #     cov_total_blocks_n[ii, jj] += 1e-12 * np.eye(cov_ij.shape[0])
-            std_total_vecs_n = get_std_map(cov_total_blocks_n)
-
-            self._cov_total_all_derivs[n] = cov_total_all_derivs_n
-            self._cov_total_blocks[n] = cov_total_blocks_n
-            self._std_total_vecs[n] = std_total_vecs_n
+        self._setup_predictions(
+            X=Density, y=y, orders=orders, err_y=err_y, derivs=derivs, verbose=verbose, lazy=lazy
+        )
@@ -0,0 +1,5996 @@
+"""The derivatives of the convergence part of the GP kernel
+
+Generated by `nuclear_matter.codegen`. Do not edit.
+"""
+import numpy
+
+
+def _kernel_scale_0(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.0*k_f1**2*k_f2**2*y_ref**2
+
+
+def _kernel_scale_1(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.0*k_f1**2*k_f2*y_ref**2
+
+
+def _kernel_scale_2(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.0*k_f1**2*y_ref**2
+
+
+def _kernel_scale_3(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.0*k_f1*k_f2**2*y_ref**2
+
+
+def _kernel_scale_4(k_f1, k_f2, Lambda_b, y_ref):
+    return 4.0*k_f1*k_f2*y_ref**2
+
+
+def _kernel_scale_5(k_f1, k_f2, Lambda_b, y_ref):
+    return 4.0*k_f1*y_ref**2
+
+
+def _kernel_scale_6(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.0*k_f2**2*y_ref**2
+
+
+def _kernel_scale_7(k_f1, k_f2, Lambda_b, y_ref):
+    return 4.0*k_f2*y_ref**2
+
+
+def _kernel_scale_8(k_f1, k_f2, Lambda_b, y_ref):
+    return 4.0*y_ref**2
+
+
+def _kernel_scale_9(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.629960524947436*k_f1**2*k_f2**2*y_ref**2
+
+
+def _kernel_scale_10(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.25992104989487*k_f1**2*k_f2*y_ref**2
+
+
+def _kernel_scale_11(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.25992104989487*k_f1**2*y_ref**2
+
+
+def _kernel_scale_12(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.25992104989487*k_f1*k_f2**2*y_ref**2
+
+
+def _kernel_scale_13(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.51984209978975*k_f1*k_f2*y_ref**2
+
+
+def _kernel_scale_14(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.51984209978975*k_f1*y_ref**2
+
+
+def _kernel_scale_15(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.25992104989487*k_f2**2*y_ref**2
+
+
+def _kernel_scale_16(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.51984209978975*k_f2*y_ref**2
+
+
+def _kernel_scale_17(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.51984209978975*y_ref**2
+
+
+def _kernel_scale_18(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.629960524947436*k_f1**2*k_f2**2*y_ref**2
+
+
+def _kernel_scale_19(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.25992104989487*k_f1**2*k_f2*y_ref**2
+
+
+def _kernel_scale_20(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.25992104989487*k_f1**2*y_ref**2
+
+
+def _kernel_scale_21(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.25992104989487*k_f1*k_f2**2*y_ref**2
+
+
+def _kernel_scale_22(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.51984209978975*k_f1*k_f2*y_ref**2
+
+
+def _kernel_scale_23(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.51984209978975*k_f1*y_ref**2
+
+
+def _kernel_scale_24(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.25992104989487*k_f2**2*y_ref**2
+
+
+def _kernel_scale_25(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.51984209978975*k_f2*y_ref**2
+
+
+def _kernel_scale_26(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.51984209978975*y_ref**2
+
+
+def _kernel_scale_27(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.0*k_f1**2*k_f2**2*y_ref**2
+
+
+def _kernel_scale_28(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.0*k_f1**2*k_f2*y_ref**2
+
+
+def _kernel_scale_29(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.0*k_f1**2*y_ref**2
+
+
+def _kernel_scale_30(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.0*k_f1*k_f2**2*y_ref**2
+
+
+def _kernel_scale_31(k_f1, k_f2, Lambda_b, y_ref):
+    return 4.0*k_f1*k_f2*y_ref**2
+
+
+def _kernel_scale_32(k_f1, k_f2, Lambda_b, y_ref):
+    return 4.0*k_f1*y_ref**2
+
+
+def _kernel_scale_33(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.0*k_f2**2*y_ref**2
+
+
+def _kernel_scale_34(k_f1, k_f2, Lambda_b, y_ref):
+    return 4.0*k_f2*y_ref**2
+
+
+def _kernel_scale_35(k_f1, k_f2, Lambda_b, y_ref):
+    return 4.0*y_ref**2
+
+
+def _kernel_scale_36(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.629960524947436*k_f1**2*k_f2**2*y_ref**2
+
+
+def _kernel_scale_37(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.25992104989487*k_f1**2*k_f2*y_ref**2
+
+
+def _kernel_scale_38(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.25992104989487*k_f1**2*y_ref**2
+
+
+def _kernel_scale_39(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.25992104989487*k_f1*k_f2**2*y_ref**2
+
+
+def _kernel_scale_40(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.51984209978975*k_f1*k_f2*y_ref**2
+
+
+def _kernel_scale_41(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.51984209978975*k_f1*y_ref**2
+
+
+def _kernel_scale_42(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.25992104989487*k_f2**2*y_ref**2
+
+
+def _kernel_scale_43(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.51984209978975*k_f2*y_ref**2
+
+
+def _kernel_scale_44(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.51984209978975*y_ref**2
+
+
+def _kernel_scale_45(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.629960524947436*k_f1**2*k_f2**2*y_ref**2
+
+
+def _kernel_scale_46(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.25992104989487*k_f1**2*k_f2*y_ref**2
+
+
+def _kernel_scale_47(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.25992104989487*k_f1**2*y_ref**2
+
+
+def _kernel_scale_48(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.25992104989487*k_f1*k_f2**2*y_ref**2
+
+
+def _kernel_scale_49(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.51984209978975*k_f1*k_f2*y_ref**2
+
+
+def _kernel_scale_50(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.51984209978975*k_f1*y_ref**2
+
+
+def _kernel_scale_51(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.25992104989487*k_f2**2*y_ref**2
+
+
+def _kernel_scale_52(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.51984209978975*k_f2*y_ref**2
+
+
+def _kernel_scale_53(k_f1, k_f2, Lambda_b, y_ref):
+    return 2.51984209978975*y_ref**2
+
+
+def _kernel_scale_54(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = 1.0*k_f1**2*k_f2**2
+    return x0*y_ref**2*(1 - x0/Lambda_b**4)/(1 - 1.0*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_55(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = y_ref**2
+    x2 = 1.0/Lambda_b**2
+    x3 = -k_f1*k_f2*x2 + 1
+    x4 = 2.0/x3
+    x5 = k_f1**2
+    x6 = k_f2**2
+    x7 = x1*(-1.0*x0*x5*x6 + 1)
+    return -k_f1**4*k_f2**3*x0*x1*x4 + k_f1**3*x2*x6*x7/x3**2 + k_f2*x4*x5*x7
+
+
+def _kernel_scale_56(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f2**2*x0/Lambda_b**4
+    x5 = 4.0*x3
+    x6 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(x1*x5*x6 - 12.0*x4 + 2.0 + 2.0*x4*x6/x2**2 - k_f1**3*k_f2**3*x5/Lambda_b**6)
+
+
+def _kernel_scale_57(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = y_ref**2
+    x2 = 1.0/Lambda_b**2
+    x3 = -k_f1*k_f2*x2 + 1
+    x4 = 2.0/x3
+    x5 = k_f2**2
+    x6 = k_f1**2
+    x7 = x1*(-1.0*x0*x5*x6 + 1)
+    return -k_f1**3*k_f2**4*x0*x1*x4 + k_f1*x4*x5*x7 + k_f2**3*x2*x6*x7/x3**2
+
+
+def _kernel_scale_58(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*k_f2**2/Lambda_b**4
+    x5 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(5.0*x1*x3*x5 - 16.0*x4 + 4.0 + 2.0*x4*x5/x2**2 - 4.0*k_f1**3*k_f2**3*x3/Lambda_b**6)
+
+
+def _kernel_scale_59(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-2.0)
+    x5 = k_f1**3*k_f2**3/Lambda_b**6
+    x6 = 1 - 1.0*x3
+    return k_f1*x2*y_ref**2*(14.0*x0*x2*x6 - 38.0*x2*x5 + 16.0*x3*x4*x6 - 48.0*x3 + 4.0 + 6.0*x5*x6/x1**3 - 12.0*k_f1**4*k_f2**4*x4/Lambda_b**8)
+
+
+def _kernel_scale_60(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*x0/Lambda_b**4
+    x5 = 4.0*x3
+    x6 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(x1*x5*x6 - 12.0*x4 + 2.0 + 2.0*x4*x6/x2**2 - k_f1**3*k_f2**3*x5/Lambda_b**6)
+
+
+def _kernel_scale_61(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-2.0)
+    x5 = k_f1**3*k_f2**3/Lambda_b**6
+    x6 = 1 - 1.0*x3
+    return k_f2*x2*y_ref**2*(14.0*x0*x2*x6 - 38.0*x2*x5 + 16.0*x3*x4*x6 - 48.0*x3 + 4.0 + 6.0*x5*x6/x1**3 - 12.0*k_f1**4*k_f2**4*x4/Lambda_b**8)
+
+
+def _kernel_scale_62(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-3.0)
+    x5 = x1**(-2.0)
+    x6 = k_f1**4*k_f2**4/Lambda_b**8
+    x7 = k_f1**3*k_f2**3/Lambda_b**6
+    x8 = 1 - 1.0*x3
+    return x2*y_ref**2*(32.0*x0*x2*x8 - 224.0*x2*x7 + 76.0*x3*x5*x8 - 144.0*x3 + 72.0*x4*x7*x8 - 168.0*x5*x6 + 4.0 + 24.0*x6*x8/x1**4 - 48.0*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_63(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = 0.629960524947436*k_f1**2*k_f2**2
+    return x0*y_ref**2*(1 - x0/Lambda_b**4)/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_64(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = k_f1**2
+    x6 = k_f2**2
+    x7 = -0.629960524947436*x0*x5*x6 + 1
+    return -0.793700525984099*k_f1**4*k_f2**3*x0*x4 + 0.5*k_f1**3*x1*x2*x6*x7/x3**2 + 1.25992104989487*k_f2*x4*x5*x7
+
+
+def _kernel_scale_65(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f2**2*x0/Lambda_b**4
+    x5 = 1 - 0.629960524947436*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 4.7622031559046*x4 + 1.25992104989487 + 0.793700525984099*x4*x5/x2**2 - 1.25992104989487*k_f1**3*k_f2**3*x3/Lambda_b**6)
+
+
+def _kernel_scale_66(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = k_f2**2
+    x6 = k_f1**2
+    x7 = -0.629960524947436*x0*x5*x6 + 1
+    return -0.793700525984099*k_f1**3*k_f2**4*x0*x4 + 1.25992104989487*k_f1*x4*x5*x7 + 0.5*k_f2**3*x1*x2*x6*x7/x3**2
+
+
+def _kernel_scale_67(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*k_f2**2/Lambda_b**4
+    x5 = 1 - 0.629960524947436*x4
+    return x0*x3*y_ref**2*(2.5*x1*x3*x5 - 6.3496042078728*x4 + 2.51984209978975 + 0.793700525984099*x4*x5/x2**2 - 1.25992104989487*k_f1**3*k_f2**3*x3/Lambda_b**6)
+
+
+def _kernel_scale_68(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-2.0)
+    x5 = k_f1**3*k_f2**3/Lambda_b**6
+    x6 = 1 - 0.629960524947436*x3
+    return k_f1*x2*y_ref**2*(7.0*x0*x2*x6 - 11.9692499740013*x2*x5 + 6.3496042078728*x3*x4*x6 - 19.0488126236184*x3 + 2.51984209978975 + 1.88988157484231*x5*x6/x1**3 - 3.0*k_f1**4*k_f2**4*x4/Lambda_b**8)
+
+
+def _kernel_scale_69(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*x0/Lambda_b**4
+    x5 = 1 - 0.629960524947436*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 4.7622031559046*x4 + 1.25992104989487 + 0.793700525984099*x4*x5/x2**2 - 1.25992104989487*k_f1**3*k_f2**3*x3/Lambda_b**6)
+
+
+def _kernel_scale_70(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-2.0)
+    x5 = k_f1**3*k_f2**3/Lambda_b**6
+    x6 = 1 - 0.629960524947436*x3
+    return k_f2*x2*y_ref**2*(7.0*x0*x2*x6 - 11.9692499740013*x2*x5 + 6.3496042078728*x3*x4*x6 - 19.0488126236184*x3 + 2.51984209978975 + 1.88988157484231*x5*x6/x1**3 - 3.0*k_f1**4*k_f2**4*x4/Lambda_b**8)
+
+
+def _kernel_scale_71(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-3.0)
+    x5 = x1**(-2.0)
+    x6 = k_f1**4*k_f2**4/Lambda_b**8
+    x7 = k_f1**3*k_f2**3/Lambda_b**6
+    x8 = 1 - 0.629960524947436*x3
+    return x2*y_ref**2*(16.0*x0*x2*x8 - 70.5555787941129*x2*x7 + 30.1606199873958*x3*x5*x8 - 57.1464378708552*x3 + 22.6785788981077*x4*x7*x8 - 42.0*x5*x6 + 2.51984209978975 + 6.0*x6*x8/x1**4 - 9.52440631180919*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_72(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = 0.629960524947436*k_f1**2*k_f2**2
+    return x0*y_ref**2*(1 - x0/Lambda_b**4)/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_73(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = k_f1**2
+    x6 = k_f2**2
+    x7 = -0.629960524947436*x0*x5*x6 + 1
+    return -0.793700525984099*k_f1**4*k_f2**3*x0*x4 + 0.5*k_f1**3*x1*x2*x6*x7/x3**2 + 1.25992104989487*k_f2*x4*x5*x7
+
+
+def _kernel_scale_74(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f2**2*x0/Lambda_b**4
+    x5 = 1 - 0.629960524947436*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 4.7622031559046*x4 + 1.25992104989487 + 0.793700525984099*x4*x5/x2**2 - 1.25992104989487*k_f1**3*k_f2**3*x3/Lambda_b**6)
+
+
+def _kernel_scale_75(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = k_f2**2
+    x6 = k_f1**2
+    x7 = -0.629960524947436*x0*x5*x6 + 1
+    return -0.793700525984099*k_f1**3*k_f2**4*x0*x4 + 1.25992104989487*k_f1*x4*x5*x7 + 0.5*k_f2**3*x1*x2*x6*x7/x3**2
+
+
+def _kernel_scale_76(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*k_f2**2/Lambda_b**4
+    x5 = 1 - 0.629960524947436*x4
+    return x0*x3*y_ref**2*(2.5*x1*x3*x5 - 6.3496042078728*x4 + 2.51984209978975 + 0.793700525984099*x4*x5/x2**2 - 1.25992104989487*k_f1**3*k_f2**3*x3/Lambda_b**6)
+
+
+def _kernel_scale_77(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-2.0)
+    x5 = k_f1**3*k_f2**3/Lambda_b**6
+    x6 = 1 - 0.629960524947436*x3
+    return k_f1*x2*y_ref**2*(7.0*x0*x2*x6 - 11.9692499740013*x2*x5 + 6.3496042078728*x3*x4*x6 - 19.0488126236184*x3 + 2.51984209978975 + 1.88988157484231*x5*x6/x1**3 - 3.0*k_f1**4*k_f2**4*x4/Lambda_b**8)
+
+
+def _kernel_scale_78(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*x0/Lambda_b**4
+    x5 = 1 - 0.629960524947436*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 4.7622031559046*x4 + 1.25992104989487 + 0.793700525984099*x4*x5/x2**2 - 1.25992104989487*k_f1**3*k_f2**3*x3/Lambda_b**6)
+
+
+def _kernel_scale_79(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-2.0)
+    x5 = k_f1**3*k_f2**3/Lambda_b**6
+    x6 = 1 - 0.629960524947436*x3
+    return k_f2*x2*y_ref**2*(7.0*x0*x2*x6 - 11.9692499740013*x2*x5 + 6.3496042078728*x3*x4*x6 - 19.0488126236184*x3 + 2.51984209978975 + 1.88988157484231*x5*x6/x1**3 - 3.0*k_f1**4*k_f2**4*x4/Lambda_b**8)
+
+
+def _kernel_scale_80(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-3.0)
+    x5 = x1**(-2.0)
+    x6 = k_f1**4*k_f2**4/Lambda_b**8
+    x7 = k_f1**3*k_f2**3/Lambda_b**6
+    x8 = 1 - 0.629960524947436*x3
+    return x2*y_ref**2*(16.0*x0*x2*x8 - 70.5555787941129*x2*x7 + 30.1606199873958*x3*x5*x8 - 57.1464378708552*x3 + 22.6785788981077*x4*x7*x8 - 42.0*x5*x6 + 2.51984209978975 + 6.0*x6*x8/x1**4 - 9.52440631180919*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_81(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = 1.0*k_f1**2*k_f2**2
+    return x0*y_ref**2*(1 - x0/Lambda_b**4)/(1 - 1.0*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_82(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = y_ref**2
+    x2 = 1.0/Lambda_b**2
+    x3 = -k_f1*k_f2*x2 + 1
+    x4 = 2.0/x3
+    x5 = k_f1**2
+    x6 = k_f2**2
+    x7 = x1*(-1.0*x0*x5*x6 + 1)
+    return -k_f1**4*k_f2**3*x0*x1*x4 + k_f1**3*x2*x6*x7/x3**2 + k_f2*x4*x5*x7
+
+
+def _kernel_scale_83(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f2**2*x0/Lambda_b**4
+    x5 = 4.0*x3
+    x6 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(x1*x5*x6 - 12.0*x4 + 2.0 + 2.0*x4*x6/x2**2 - k_f1**3*k_f2**3*x5/Lambda_b**6)
+
+
+def _kernel_scale_84(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = y_ref**2
+    x2 = 1.0/Lambda_b**2
+    x3 = -k_f1*k_f2*x2 + 1
+    x4 = 2.0/x3
+    x5 = k_f2**2
+    x6 = k_f1**2
+    x7 = x1*(-1.0*x0*x5*x6 + 1)
+    return -k_f1**3*k_f2**4*x0*x1*x4 + k_f1*x4*x5*x7 + k_f2**3*x2*x6*x7/x3**2
+
+
+def _kernel_scale_85(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*k_f2**2/Lambda_b**4
+    x5 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(5.0*x1*x3*x5 - 16.0*x4 + 4.0 + 2.0*x4*x5/x2**2 - 4.0*k_f1**3*k_f2**3*x3/Lambda_b**6)
+
+
+def _kernel_scale_86(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-2.0)
+    x5 = k_f1**3*k_f2**3/Lambda_b**6
+    x6 = 1 - 1.0*x3
+    return k_f1*x2*y_ref**2*(14.0*x0*x2*x6 - 38.0*x2*x5 + 16.0*x3*x4*x6 - 48.0*x3 + 4.0 + 6.0*x5*x6/x1**3 - 12.0*k_f1**4*k_f2**4*x4/Lambda_b**8)
+
+
+def _kernel_scale_87(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*x0/Lambda_b**4
+    x5 = 4.0*x3
+    x6 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(x1*x5*x6 - 12.0*x4 + 2.0 + 2.0*x4*x6/x2**2 - k_f1**3*k_f2**3*x5/Lambda_b**6)
+
+
+def _kernel_scale_88(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-2.0)
+    x5 = k_f1**3*k_f2**3/Lambda_b**6
+    x6 = 1 - 1.0*x3
+    return k_f2*x2*y_ref**2*(14.0*x0*x2*x6 - 38.0*x2*x5 + 16.0*x3*x4*x6 - 48.0*x3 + 4.0 + 6.0*x5*x6/x1**3 - 12.0*k_f1**4*k_f2**4*x4/Lambda_b**8)
+
+
+def _kernel_scale_89(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-3.0)
+    x5 = x1**(-2.0)
+    x6 = k_f1**4*k_f2**4/Lambda_b**8
+    x7 = k_f1**3*k_f2**3/Lambda_b**6
+    x8 = 1 - 1.0*x3
+    return x2*y_ref**2*(32.0*x0*x2*x8 - 224.0*x2*x7 + 76.0*x3*x5*x8 - 144.0*x3 + 72.0*x4*x7*x8 - 168.0*x5*x6 + 4.0 + 24.0*x6*x8/x1**4 - 48.0*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_90(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = 0.629960524947436*k_f1**2*k_f2**2
+    return x0*y_ref**2*(1 - x0/Lambda_b**4)/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_91(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = k_f1**2
+    x6 = k_f2**2
+    x7 = -0.629960524947436*x0*x5*x6 + 1
+    return -0.793700525984099*k_f1**4*k_f2**3*x0*x4 + 0.5*k_f1**3*x1*x2*x6*x7/x3**2 + 1.25992104989487*k_f2*x4*x5*x7
+
+
+def _kernel_scale_92(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f2**2*x0/Lambda_b**4
+    x5 = 1 - 0.629960524947436*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 4.7622031559046*x4 + 1.25992104989487 + 0.793700525984099*x4*x5/x2**2 - 1.25992104989487*k_f1**3*k_f2**3*x3/Lambda_b**6)
+
+
+def _kernel_scale_93(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = k_f2**2
+    x6 = k_f1**2
+    x7 = -0.629960524947436*x0*x5*x6 + 1
+    return -0.793700525984099*k_f1**3*k_f2**4*x0*x4 + 1.25992104989487*k_f1*x4*x5*x7 + 0.5*k_f2**3*x1*x2*x6*x7/x3**2
+
+
+def _kernel_scale_94(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*k_f2**2/Lambda_b**4
+    x5 = 1 - 0.629960524947436*x4
+    return x0*x3*y_ref**2*(2.5*x1*x3*x5 - 6.3496042078728*x4 + 2.51984209978975 + 0.793700525984099*x4*x5/x2**2 - 1.25992104989487*k_f1**3*k_f2**3*x3/Lambda_b**6)
+
+
+def _kernel_scale_95(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-2.0)
+    x5 = k_f1**3*k_f2**3/Lambda_b**6
+    x6 = 1 - 0.629960524947436*x3
+    return k_f1*x2*y_ref**2*(7.0*x0*x2*x6 - 11.9692499740013*x2*x5 + 6.3496042078728*x3*x4*x6 - 19.0488126236184*x3 + 2.51984209978975 + 1.88988157484231*x5*x6/x1**3 - 3.0*k_f1**4*k_f2**4*x4/Lambda_b**8)
+
+
+def _kernel_scale_96(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*x0/Lambda_b**4
+    x5 = 1 - 0.629960524947436*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 4.7622031559046*x4 + 1.25992104989487 + 0.793700525984099*x4*x5/x2**2 - 1.25992104989487*k_f1**3*k_f2**3*x3/Lambda_b**6)
+
+
+def _kernel_scale_97(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-2.0)
+    x5 = k_f1**3*k_f2**3/Lambda_b**6
+    x6 = 1 - 0.629960524947436*x3
+    return k_f2*x2*y_ref**2*(7.0*x0*x2*x6 - 11.9692499740013*x2*x5 + 6.3496042078728*x3*x4*x6 - 19.0488126236184*x3 + 2.51984209978975 + 1.88988157484231*x5*x6/x1**3 - 3.0*k_f1**4*k_f2**4*x4/Lambda_b**8)
+
+
+def _kernel_scale_98(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-3.0)
+    x5 = x1**(-2.0)
+    x6 = k_f1**4*k_f2**4/Lambda_b**8
+    x7 = k_f1**3*k_f2**3/Lambda_b**6
+    x8 = 1 - 0.629960524947436*x3
+    return x2*y_ref**2*(16.0*x0*x2*x8 - 70.5555787941129*x2*x7 + 30.1606199873958*x3*x5*x8 - 57.1464378708552*x3 + 22.6785788981077*x4*x7*x8 - 42.0*x5*x6 + 2.51984209978975 + 6.0*x6*x8/x1**4 - 9.52440631180919*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_99(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = 0.629960524947436*k_f1**2*k_f2**2
+    return x0*y_ref**2*(1 - x0/Lambda_b**4)/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_100(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = k_f1**2
+    x6 = k_f2**2
+    x7 = -0.629960524947436*x0*x5*x6 + 1
+    return -0.793700525984099*k_f1**4*k_f2**3*x0*x4 + 0.5*k_f1**3*x1*x2*x6*x7/x3**2 + 1.25992104989487*k_f2*x4*x5*x7
+
+
+def _kernel_scale_101(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f2**2*x0/Lambda_b**4
+    x5 = 1 - 0.629960524947436*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 4.7622031559046*x4 + 1.25992104989487 + 0.793700525984099*x4*x5/x2**2 - 1.25992104989487*k_f1**3*k_f2**3*x3/Lambda_b**6)
+
+
+def _kernel_scale_102(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = k_f2**2
+    x6 = k_f1**2
+    x7 = -0.629960524947436*x0*x5*x6 + 1
+    return -0.793700525984099*k_f1**3*k_f2**4*x0*x4 + 1.25992104989487*k_f1*x4*x5*x7 + 0.5*k_f2**3*x1*x2*x6*x7/x3**2
+
+
+def _kernel_scale_103(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*k_f2**2/Lambda_b**4
+    x5 = 1 - 0.629960524947436*x4
+    return x0*x3*y_ref**2*(2.5*x1*x3*x5 - 6.3496042078728*x4 + 2.51984209978975 + 0.793700525984099*x4*x5/x2**2 - 1.25992104989487*k_f1**3*k_f2**3*x3/Lambda_b**6)
+
+
+def _kernel_scale_104(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-2.0)
+    x5 = k_f1**3*k_f2**3/Lambda_b**6
+    x6 = 1 - 0.629960524947436*x3
+    return k_f1*x2*y_ref**2*(7.0*x0*x2*x6 - 11.9692499740013*x2*x5 + 6.3496042078728*x3*x4*x6 - 19.0488126236184*x3 + 2.51984209978975 + 1.88988157484231*x5*x6/x1**3 - 3.0*k_f1**4*k_f2**4*x4/Lambda_b**8)
+
+
+def _kernel_scale_105(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*x0/Lambda_b**4
+    x5 = 1 - 0.629960524947436*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 4.7622031559046*x4 + 1.25992104989487 + 0.793700525984099*x4*x5/x2**2 - 1.25992104989487*k_f1**3*k_f2**3*x3/Lambda_b**6)
+
+
+def _kernel_scale_106(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-2.0)
+    x5 = k_f1**3*k_f2**3/Lambda_b**6
+    x6 = 1 - 0.629960524947436*x3
+    return k_f2*x2*y_ref**2*(7.0*x0*x2*x6 - 11.9692499740013*x2*x5 + 6.3496042078728*x3*x4*x6 - 19.0488126236184*x3 + 2.51984209978975 + 1.88988157484231*x5*x6/x1**3 - 3.0*k_f1**4*k_f2**4*x4/Lambda_b**8)
+
+
+def _kernel_scale_107(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    x4 = x1**(-3.0)
+    x5 = x1**(-2.0)
+    x6 = k_f1**4*k_f2**4/Lambda_b**8
+    x7 = k_f1**3*k_f2**3/Lambda_b**6
+    x8 = 1 - 0.629960524947436*x3
+    return x2*y_ref**2*(16.0*x0*x2*x8 - 70.5555787941129*x2*x7 + 30.1606199873958*x3*x5*x8 - 57.1464378708552*x3 + 22.6785788981077*x4*x7*x8 - 42.0*x5*x6 + 2.51984209978975 + 6.0*x6*x8/x1**4 - 9.52440631180919*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_108(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.0*k_f1**2*k_f2**2*y_ref**2*(1 - 1.0*k_f1**3*k_f2**3/Lambda_b**6)/(1 - 1.0*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_109(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = y_ref**2
+    x2 = 1.0/Lambda_b**2
+    x3 = -k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = k_f1**3
+    x6 = -1.0*k_f2**3*x0*x5 + 1
+    return -3.0*k_f1**5*k_f2**4*x0*x4 + 2.0*k_f1**2*k_f2*x4*x6 + k_f2**2*x1*x2*x5*x6/x3**2
+
+
+def _kernel_scale_110(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(4.0*x1*x3*x5 - 20.0*x4 + 2.0 + 2.0*k_f2**2*x0*x5/(Lambda_b**4*x2**2) - 6.0*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_111(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = y_ref**2
+    x2 = 1.0/Lambda_b**2
+    x3 = -k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = k_f2**3
+    x6 = -1.0*k_f1**3*x0*x5 + 1
+    return -3.0*k_f1**4*k_f2**5*x0*x4 + k_f1**2*x1*x2*x5*x6/x3**2 + 2.0*k_f1*k_f2**2*x4*x6
+
+
+def _kernel_scale_112(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(5.0*x1*x3*x5 - 25.0*x4 + 4.0 + 2.0*k_f1**2*k_f2**2*x5/(Lambda_b**4*x2**2) - 6.0*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_113(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = x1**(-2.0)
+    x5 = 1 - 1.0*x3
+    return k_f1*x2*y_ref**2*(14.0*x0*x2*x5 - 100.0*x3 + 4.0 + 6.0*x3*x5/x1**3 + 16.0*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 - 66.0*k_f1**4*k_f2**4*x2/Lambda_b**8 - 18.0*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_114(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(4.0*x1*x3*x5 - 20.0*x4 + 2.0 + 2.0*k_f1**2*x0*x5/(Lambda_b**4*x2**2) - 6.0*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_115(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = x1**(-2.0)
+    x5 = 1 - 1.0*x3
+    return k_f2*x2*y_ref**2*(14.0*x0*x2*x5 - 100.0*x3 + 4.0 + 6.0*x3*x5/x1**3 + 16.0*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 - 66.0*k_f1**4*k_f2**4*x2/Lambda_b**8 - 18.0*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_116(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = 72.0/x1**3
+    x5 = x1**(-2.0)
+    x6 = k_f1**4*k_f2**4/Lambda_b**8
+    x7 = 1 - 1.0*x3
+    return x2*y_ref**2*(32.0*x0*x2*x7 - 468.0*x2*x6 + x3*x4*x7 - 400.0*x3 + 4.0 + 24.0*x6*x7/x1**4 + 76.0*k_f1**2*k_f2**2*x5*x7/Lambda_b**4 - 288.0*k_f1**5*k_f2**5*x5/Lambda_b**10 - k_f1**6*k_f2**6*x4/Lambda_b**12)
+
+
+def _kernel_scale_117(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.629960524947436*k_f1**2*k_f2**2*y_ref**2*(1 - 0.5*k_f1**3*k_f2**3/Lambda_b**6)/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_118(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = 0.5*k_f1**3
+    x6 = -k_f2**3*x0*x5 + 1
+    return -0.944940787421154*k_f1**5*k_f2**4*x0*x4 + 1.25992104989487*k_f1**2*k_f2*x4*x6 + k_f2**2*x1*x2*x5*x6/x3**2
+
+
+def _kernel_scale_119(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 0.5*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 6.29960524947436*x4 + 1.25992104989487 + 0.793700525984099*k_f2**2*x0*x5/(Lambda_b**4*x2**2) - 1.5*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_120(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = 0.5*k_f2**3
+    x6 = -k_f1**3*x0*x5 + 1
+    return -0.944940787421154*k_f1**4*k_f2**5*x0*x4 + k_f1**2*x1*x2*x5*x6/x3**2 + 1.25992104989487*k_f1*k_f2**2*x4*x6
+
+
+def _kernel_scale_121(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 0.5*x4
+    return x0*x3*y_ref**2*(2.5*x1*x3*x5 - 7.87450656184295*x4 + 2.51984209978975 + 0.793700525984099*k_f1**2*k_f2**2*x5/(Lambda_b**4*x2**2) - 1.5*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_122(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = x1**(-2.0)
+    x5 = 1 - 0.5*x3
+    return k_f1*x2*y_ref**2*(7.0*x0*x2*x5 - 31.4980262473718*x3 + 2.51984209978975 + 1.88988157484231*x3*x5/x1**3 + 6.3496042078728*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 - 16.5*k_f1**4*k_f2**4*x2/Lambda_b**8 - 3.57165236692845*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_123(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 0.5*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 6.29960524947436*x4 + 1.25992104989487 + 0.793700525984099*k_f1**2*x0*x5/(Lambda_b**4*x2**2) - 1.5*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_124(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = x1**(-2.0)
+    x5 = 1 - 0.5*x3
+    return k_f2*x2*y_ref**2*(7.0*x0*x2*x5 - 31.4980262473718*x3 + 2.51984209978975 + 1.88988157484231*x3*x5/x1**3 + 6.3496042078728*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 - 16.5*k_f1**4*k_f2**4*x2/Lambda_b**8 - 3.57165236692845*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_125(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = x1**(-3.0)
+    x5 = x1**(-2.0)
+    x6 = k_f1**4*k_f2**4/Lambda_b**8
+    x7 = 1 - 0.5*x3
+    return x2*y_ref**2*(16.0*x0*x2*x7 - 117.0*x2*x6 + 22.6785788981077*x3*x4*x7 - 125.992104989487*x3 + 2.51984209978975 + 6.0*x6*x7/x1**4 + 30.1606199873958*k_f1**2*k_f2**2*x5*x7/Lambda_b**4 - 57.1464378708552*k_f1**5*k_f2**5*x5/Lambda_b**10 - 11.3392894490539*k_f1**6*k_f2**6*x4/Lambda_b**12)
+
+
+def _kernel_scale_126(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.629960524947436*k_f1**2*k_f2**2*y_ref**2*(1 - 0.5*k_f1**3*k_f2**3/Lambda_b**6)/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_127(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = 0.5*k_f1**3
+    x6 = -k_f2**3*x0*x5 + 1
+    return -0.944940787421154*k_f1**5*k_f2**4*x0*x4 + 1.25992104989487*k_f1**2*k_f2*x4*x6 + k_f2**2*x1*x2*x5*x6/x3**2
+
+
+def _kernel_scale_128(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 0.5*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 6.29960524947436*x4 + 1.25992104989487 + 0.793700525984099*k_f2**2*x0*x5/(Lambda_b**4*x2**2) - 1.5*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_129(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = 0.5*k_f2**3
+    x6 = -k_f1**3*x0*x5 + 1
+    return -0.944940787421154*k_f1**4*k_f2**5*x0*x4 + k_f1**2*x1*x2*x5*x6/x3**2 + 1.25992104989487*k_f1*k_f2**2*x4*x6
+
+
+def _kernel_scale_130(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 0.5*x4
+    return x0*x3*y_ref**2*(2.5*x1*x3*x5 - 7.87450656184295*x4 + 2.51984209978975 + 0.793700525984099*k_f1**2*k_f2**2*x5/(Lambda_b**4*x2**2) - 1.5*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_131(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = x1**(-2.0)
+    x5 = 1 - 0.5*x3
+    return k_f1*x2*y_ref**2*(7.0*x0*x2*x5 - 31.4980262473718*x3 + 2.51984209978975 + 1.88988157484231*x3*x5/x1**3 + 6.3496042078728*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 - 16.5*k_f1**4*k_f2**4*x2/Lambda_b**8 - 3.57165236692845*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_132(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 0.5*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 6.29960524947436*x4 + 1.25992104989487 + 0.793700525984099*k_f1**2*x0*x5/(Lambda_b**4*x2**2) - 1.5*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_133(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = x1**(-2.0)
+    x5 = 1 - 0.5*x3
+    return k_f2*x2*y_ref**2*(7.0*x0*x2*x5 - 31.4980262473718*x3 + 2.51984209978975 + 1.88988157484231*x3*x5/x1**3 + 6.3496042078728*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 - 16.5*k_f1**4*k_f2**4*x2/Lambda_b**8 - 3.57165236692845*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_134(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = x1**(-3.0)
+    x5 = x1**(-2.0)
+    x6 = k_f1**4*k_f2**4/Lambda_b**8
+    x7 = 1 - 0.5*x3
+    return x2*y_ref**2*(16.0*x0*x2*x7 - 117.0*x2*x6 + 22.6785788981077*x3*x4*x7 - 125.992104989487*x3 + 2.51984209978975 + 6.0*x6*x7/x1**4 + 30.1606199873958*k_f1**2*k_f2**2*x5*x7/Lambda_b**4 - 57.1464378708552*k_f1**5*k_f2**5*x5/Lambda_b**10 - 11.3392894490539*k_f1**6*k_f2**6*x4/Lambda_b**12)
+
+
+def _kernel_scale_135(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.0*k_f1**2*k_f2**2*y_ref**2*(1 - 1.0*k_f1**3*k_f2**3/Lambda_b**6)/(1 - 1.0*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_136(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = y_ref**2
+    x2 = 1.0/Lambda_b**2
+    x3 = -k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = k_f1**3
+    x6 = -1.0*k_f2**3*x0*x5 + 1
+    return -3.0*k_f1**5*k_f2**4*x0*x4 + 2.0*k_f1**2*k_f2*x4*x6 + k_f2**2*x1*x2*x5*x6/x3**2
+
+
+def _kernel_scale_137(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(4.0*x1*x3*x5 - 20.0*x4 + 2.0 + 2.0*k_f2**2*x0*x5/(Lambda_b**4*x2**2) - 6.0*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_138(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = y_ref**2
+    x2 = 1.0/Lambda_b**2
+    x3 = -k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = k_f2**3
+    x6 = -1.0*k_f1**3*x0*x5 + 1
+    return -3.0*k_f1**4*k_f2**5*x0*x4 + k_f1**2*x1*x2*x5*x6/x3**2 + 2.0*k_f1*k_f2**2*x4*x6
+
+
+def _kernel_scale_139(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(5.0*x1*x3*x5 - 25.0*x4 + 4.0 + 2.0*k_f1**2*k_f2**2*x5/(Lambda_b**4*x2**2) - 6.0*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_140(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = x1**(-2.0)
+    x5 = 1 - 1.0*x3
+    return k_f1*x2*y_ref**2*(14.0*x0*x2*x5 - 100.0*x3 + 4.0 + 6.0*x3*x5/x1**3 + 16.0*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 - 66.0*k_f1**4*k_f2**4*x2/Lambda_b**8 - 18.0*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_141(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(4.0*x1*x3*x5 - 20.0*x4 + 2.0 + 2.0*k_f1**2*x0*x5/(Lambda_b**4*x2**2) - 6.0*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_142(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = x1**(-2.0)
+    x5 = 1 - 1.0*x3
+    return k_f2*x2*y_ref**2*(14.0*x0*x2*x5 - 100.0*x3 + 4.0 + 6.0*x3*x5/x1**3 + 16.0*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 - 66.0*k_f1**4*k_f2**4*x2/Lambda_b**8 - 18.0*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_143(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = 72.0/x1**3
+    x5 = x1**(-2.0)
+    x6 = k_f1**4*k_f2**4/Lambda_b**8
+    x7 = 1 - 1.0*x3
+    return x2*y_ref**2*(32.0*x0*x2*x7 - 468.0*x2*x6 + x3*x4*x7 - 400.0*x3 + 4.0 + 24.0*x6*x7/x1**4 + 76.0*k_f1**2*k_f2**2*x5*x7/Lambda_b**4 - 288.0*k_f1**5*k_f2**5*x5/Lambda_b**10 - k_f1**6*k_f2**6*x4/Lambda_b**12)
+
+
+def _kernel_scale_144(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.629960524947436*k_f1**2*k_f2**2*y_ref**2*(1 - 0.5*k_f1**3*k_f2**3/Lambda_b**6)/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_145(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = 0.5*k_f1**3
+    x6 = -k_f2**3*x0*x5 + 1
+    return -0.944940787421154*k_f1**5*k_f2**4*x0*x4 + 1.25992104989487*k_f1**2*k_f2*x4*x6 + k_f2**2*x1*x2*x5*x6/x3**2
+
+
+def _kernel_scale_146(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 0.5*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 6.29960524947436*x4 + 1.25992104989487 + 0.793700525984099*k_f2**2*x0*x5/(Lambda_b**4*x2**2) - 1.5*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_147(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = 0.5*k_f2**3
+    x6 = -k_f1**3*x0*x5 + 1
+    return -0.944940787421154*k_f1**4*k_f2**5*x0*x4 + k_f1**2*x1*x2*x5*x6/x3**2 + 1.25992104989487*k_f1*k_f2**2*x4*x6
+
+
+def _kernel_scale_148(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 0.5*x4
+    return x0*x3*y_ref**2*(2.5*x1*x3*x5 - 7.87450656184295*x4 + 2.51984209978975 + 0.793700525984099*k_f1**2*k_f2**2*x5/(Lambda_b**4*x2**2) - 1.5*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_149(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = x1**(-2.0)
+    x5 = 1 - 0.5*x3
+    return k_f1*x2*y_ref**2*(7.0*x0*x2*x5 - 31.4980262473718*x3 + 2.51984209978975 + 1.88988157484231*x3*x5/x1**3 + 6.3496042078728*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 - 16.5*k_f1**4*k_f2**4*x2/Lambda_b**8 - 3.57165236692845*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_150(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 0.5*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 6.29960524947436*x4 + 1.25992104989487 + 0.793700525984099*k_f1**2*x0*x5/(Lambda_b**4*x2**2) - 1.5*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_151(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = x1**(-2.0)
+    x5 = 1 - 0.5*x3
+    return k_f2*x2*y_ref**2*(7.0*x0*x2*x5 - 31.4980262473718*x3 + 2.51984209978975 + 1.88988157484231*x3*x5/x1**3 + 6.3496042078728*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 - 16.5*k_f1**4*k_f2**4*x2/Lambda_b**8 - 3.57165236692845*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_152(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = x1**(-3.0)
+    x5 = x1**(-2.0)
+    x6 = k_f1**4*k_f2**4/Lambda_b**8
+    x7 = 1 - 0.5*x3
+    return x2*y_ref**2*(16.0*x0*x2*x7 - 117.0*x2*x6 + 22.6785788981077*x3*x4*x7 - 125.992104989487*x3 + 2.51984209978975 + 6.0*x6*x7/x1**4 + 30.1606199873958*k_f1**2*k_f2**2*x5*x7/Lambda_b**4 - 57.1464378708552*k_f1**5*k_f2**5*x5/Lambda_b**10 - 11.3392894490539*k_f1**6*k_f2**6*x4/Lambda_b**12)
+
+
+def _kernel_scale_153(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.629960524947436*k_f1**2*k_f2**2*y_ref**2*(1 - 0.5*k_f1**3*k_f2**3/Lambda_b**6)/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_154(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = 0.5*k_f1**3
+    x6 = -k_f2**3*x0*x5 + 1
+    return -0.944940787421154*k_f1**5*k_f2**4*x0*x4 + 1.25992104989487*k_f1**2*k_f2*x4*x6 + k_f2**2*x1*x2*x5*x6/x3**2
+
+
+def _kernel_scale_155(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 0.5*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 6.29960524947436*x4 + 1.25992104989487 + 0.793700525984099*k_f2**2*x0*x5/(Lambda_b**4*x2**2) - 1.5*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_156(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = 0.5*k_f2**3
+    x6 = -k_f1**3*x0*x5 + 1
+    return -0.944940787421154*k_f1**4*k_f2**5*x0*x4 + k_f1**2*x1*x2*x5*x6/x3**2 + 1.25992104989487*k_f1*k_f2**2*x4*x6
+
+
+def _kernel_scale_157(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 0.5*x4
+    return x0*x3*y_ref**2*(2.5*x1*x3*x5 - 7.87450656184295*x4 + 2.51984209978975 + 0.793700525984099*k_f1**2*k_f2**2*x5/(Lambda_b**4*x2**2) - 1.5*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_158(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = x1**(-2.0)
+    x5 = 1 - 0.5*x3
+    return k_f1*x2*y_ref**2*(7.0*x0*x2*x5 - 31.4980262473718*x3 + 2.51984209978975 + 1.88988157484231*x3*x5/x1**3 + 6.3496042078728*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 - 16.5*k_f1**4*k_f2**4*x2/Lambda_b**8 - 3.57165236692845*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_159(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**3*k_f2**3/Lambda_b**6
+    x5 = 1 - 0.5*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 6.29960524947436*x4 + 1.25992104989487 + 0.793700525984099*k_f1**2*x0*x5/(Lambda_b**4*x2**2) - 1.5*k_f1**4*k_f2**4*x3/Lambda_b**8)
+
+
+def _kernel_scale_160(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = x1**(-2.0)
+    x5 = 1 - 0.5*x3
+    return k_f2*x2*y_ref**2*(7.0*x0*x2*x5 - 31.4980262473718*x3 + 2.51984209978975 + 1.88988157484231*x3*x5/x1**3 + 6.3496042078728*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 - 16.5*k_f1**4*k_f2**4*x2/Lambda_b**8 - 3.57165236692845*k_f1**5*k_f2**5*x4/Lambda_b**10)
+
+
+def _kernel_scale_161(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    x4 = x1**(-3.0)
+    x5 = x1**(-2.0)
+    x6 = k_f1**4*k_f2**4/Lambda_b**8
+    x7 = 1 - 0.5*x3
+    return x2*y_ref**2*(16.0*x0*x2*x7 - 117.0*x2*x6 + 22.6785788981077*x3*x4*x7 - 125.992104989487*x3 + 2.51984209978975 + 6.0*x6*x7/x1**4 + 30.1606199873958*k_f1**2*k_f2**2*x5*x7/Lambda_b**4 - 57.1464378708552*k_f1**5*k_f2**5*x5/Lambda_b**10 - 11.3392894490539*k_f1**6*k_f2**6*x4/Lambda_b**12)
+
+
+def _kernel_scale_162(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.0*k_f1**2*k_f2**2*y_ref**2*(1 - 1.0*k_f1**4*k_f2**4/Lambda_b**8)/(1 - 1.0*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_163(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-8.0)
+    x1 = y_ref**2
+    x2 = 1.0/Lambda_b**2
+    x3 = -k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = -1.0*k_f1**4*k_f2**4*x0 + 1
+    return -4.0*k_f1**6*k_f2**5*x0*x4 + k_f1**3*k_f2**2*x1*x2*x5/x3**2 + 2.0*k_f1**2*k_f2*x4*x5
+
+
+def _kernel_scale_164(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**4*k_f2**4/Lambda_b**8
+    x5 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(4.0*x1*x3*x5 - 30.0*x4 + 2.0 + 2.0*k_f2**2*x0*x5/(Lambda_b**4*x2**2) - 8.0*k_f1**5*k_f2**5*x3/Lambda_b**10)
+
+
+def _kernel_scale_165(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-8.0)
+    x1 = y_ref**2
+    x2 = 1.0/Lambda_b**2
+    x3 = -k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = -1.0*k_f1**4*k_f2**4*x0 + 1
+    return -4.0*k_f1**5*k_f2**6*x0*x4 + k_f1**2*k_f2**3*x1*x2*x5/x3**2 + 2.0*k_f1*k_f2**2*x4*x5
+
+
+def _kernel_scale_166(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**4*k_f2**4/Lambda_b**8
+    x5 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(5.0*x1*x3*x5 - 36.0*x4 + 4.0 + 2.0*k_f1**2*k_f2**2*x5/(Lambda_b**4*x2**2) - 8.0*k_f1**5*k_f2**5*x3/Lambda_b**10)
+
+
+def _kernel_scale_167(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**4*k_f2**4/Lambda_b**8
+    x4 = x1**(-2.0)
+    x5 = 1 - 1.0*x3
+    return k_f1*x2*y_ref**2*(14.0*x0*x2*x5 - 180.0*x3 + 4.0 + 16.0*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 + 6.0*k_f1**3*k_f2**3*x5/(Lambda_b**6*x1**3) - 100.0*k_f1**5*k_f2**5*x2/Lambda_b**10 - 24.0*k_f1**6*k_f2**6*x4/Lambda_b**12)
+
+
+def _kernel_scale_168(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**4*k_f2**4/Lambda_b**8
+    x5 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(4.0*x1*x3*x5 - 30.0*x4 + 2.0 + 2.0*k_f1**2*x0*x5/(Lambda_b**4*x2**2) - 8.0*k_f1**5*k_f2**5*x3/Lambda_b**10)
+
+
+def _kernel_scale_169(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**4*k_f2**4/Lambda_b**8
+    x4 = x1**(-2.0)
+    x5 = 1 - 1.0*x3
+    return k_f2*x2*y_ref**2*(14.0*x0*x2*x5 - 180.0*x3 + 4.0 + 16.0*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 + 6.0*k_f1**3*k_f2**3*x5/(Lambda_b**6*x1**3) - 100.0*k_f1**5*k_f2**5*x2/Lambda_b**10 - 24.0*k_f1**6*k_f2**6*x4/Lambda_b**12)
+
+
+def _kernel_scale_170(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**4*k_f2**4/Lambda_b**8
+    x4 = x1**(-3.0)
+    x5 = x1**(-2.0)
+    x6 = 1 - 1.0*x3
+    return x2*y_ref**2*(32.0*x0*x2*x6 - 900.0*x3 + 4.0 + 24.0*x3*x6/x1**4 + 76.0*k_f1**2*k_f2**2*x5*x6/Lambda_b**4 + 72.0*k_f1**3*k_f2**3*x4*x6/Lambda_b**6 - 832.0*k_f1**5*k_f2**5*x2/Lambda_b**10 - 432.0*k_f1**6*k_f2**6*x5/Lambda_b**12 - 96.0*k_f1**7*k_f2**7*x4/Lambda_b**14)
+
+
+def _kernel_scale_171(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.629960524947436*k_f1**2*k_f2**2*y_ref**2*(1 - 0.39685026299205*k_f1**4*k_f2**4/Lambda_b**8)/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_172(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-8.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = -0.39685026299205*k_f1**4*k_f2**4*x0 + 1
+    return -0.999999999999999*k_f1**6*k_f2**5*x0*x4 + 0.5*k_f1**3*k_f2**2*x1*x2*x5/x3**2 + 1.25992104989487*k_f1**2*k_f2*x4*x5
+
+
+def _kernel_scale_173(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**4*k_f2**4/Lambda_b**8
+    x5 = 1 - 0.39685026299205*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 7.5*x4 + 1.25992104989487 + 0.793700525984099*k_f2**2*x0*x5/(Lambda_b**4*x2**2) - 1.5874010519682*k_f1**5*k_f2**5*x3/Lambda_b**10)
+
+
+def _kernel_scale_174(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-8.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = -0.39685026299205*k_f1**4*k_f2**4*x0 + 1
+    return -0.999999999999999*k_f1**5*k_f2**6*x0*x4 + 0.5*k_f1**2*k_f2**3*x1*x2*x5/x3**2 + 1.25992104989487*k_f1*k_f2**2*x4*x5
+
+
+def _kernel_scale_175(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**4*k_f2**4/Lambda_b**8
+    x5 = 1 - 0.39685026299205*x4
+    return x0*x3*y_ref**2*(2.5*x1*x3*x5 - 8.99999999999999*x4 + 2.51984209978975 + 0.793700525984099*k_f1**2*k_f2**2*x5/(Lambda_b**4*x2**2) - 1.5874010519682*k_f1**5*k_f2**5*x3/Lambda_b**10)
+
+
+def _kernel_scale_176(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**4*k_f2**4/Lambda_b**8
+    x4 = x1**(-2.0)
+    x5 = 1 - 0.39685026299205*x3
+    return k_f1*x2*y_ref**2*(7.0*x0*x2*x5 - 45.0*x3 + 2.51984209978975 + 6.3496042078728*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 + 1.88988157484231*k_f1**3*k_f2**3*x5/(Lambda_b**6*x1**3) - 19.8425131496025*k_f1**5*k_f2**5*x2/Lambda_b**10 - 3.77976314968462*k_f1**6*k_f2**6*x4/Lambda_b**12)
+
+
+def _kernel_scale_177(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**4*k_f2**4/Lambda_b**8
+    x5 = 1 - 0.39685026299205*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 7.5*x4 + 1.25992104989487 + 0.793700525984099*k_f1**2*x0*x5/(Lambda_b**4*x2**2) - 1.5874010519682*k_f1**5*k_f2**5*x3/Lambda_b**10)
+
+
+def _kernel_scale_178(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**4*k_f2**4/Lambda_b**8
+    x4 = x1**(-2.0)
+    x5 = 1 - 0.39685026299205*x3
+    return k_f2*x2*y_ref**2*(7.0*x0*x2*x5 - 45.0*x3 + 2.51984209978975 + 6.3496042078728*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 + 1.88988157484231*k_f1**3*k_f2**3*x5/(Lambda_b**6*x1**3) - 19.8425131496025*k_f1**5*k_f2**5*x2/Lambda_b**10 - 3.77976314968462*k_f1**6*k_f2**6*x4/Lambda_b**12)
+
+
+def _kernel_scale_179(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**4*k_f2**4/Lambda_b**8
+    x4 = x1**(-3.0)
+    x5 = x1**(-2.0)
+    x6 = 1 - 0.39685026299205*x3
+    return x2*y_ref**2*(16.0*x0*x2*x6 - 225.0*x3 + 2.51984209978975 + 6.0*x3*x6/x1**4 + 30.1606199873958*k_f1**2*k_f2**2*x5*x6/Lambda_b**4 + 22.6785788981077*k_f1**3*k_f2**3*x4*x6/Lambda_b**6 - 165.089709404693*k_f1**5*k_f2**5*x2/Lambda_b**10 - 68.0357366943231*k_f1**6*k_f2**6*x5/Lambda_b**12 - 12.0*k_f1**7*k_f2**7*x4/Lambda_b**14)
+
+
+def _kernel_scale_180(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.629960524947436*k_f1**2*k_f2**2*y_ref**2*(1 - 0.39685026299205*k_f1**4*k_f2**4/Lambda_b**8)/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_181(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-8.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = -0.39685026299205*k_f1**4*k_f2**4*x0 + 1
+    return -0.999999999999999*k_f1**6*k_f2**5*x0*x4 + 0.5*k_f1**3*k_f2**2*x1*x2*x5/x3**2 + 1.25992104989487*k_f1**2*k_f2*x4*x5
+
+
+def _kernel_scale_182(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**4*k_f2**4/Lambda_b**8
+    x5 = 1 - 0.39685026299205*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 7.5*x4 + 1.25992104989487 + 0.793700525984099*k_f2**2*x0*x5/(Lambda_b**4*x2**2) - 1.5874010519682*k_f1**5*k_f2**5*x3/Lambda_b**10)
+
+
+def _kernel_scale_183(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-8.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = -0.39685026299205*k_f1**4*k_f2**4*x0 + 1
+    return -0.999999999999999*k_f1**5*k_f2**6*x0*x4 + 0.5*k_f1**2*k_f2**3*x1*x2*x5/x3**2 + 1.25992104989487*k_f1*k_f2**2*x4*x5
+
+
+def _kernel_scale_184(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**4*k_f2**4/Lambda_b**8
+    x5 = 1 - 0.39685026299205*x4
+    return x0*x3*y_ref**2*(2.5*x1*x3*x5 - 8.99999999999999*x4 + 2.51984209978975 + 0.793700525984099*k_f1**2*k_f2**2*x5/(Lambda_b**4*x2**2) - 1.5874010519682*k_f1**5*k_f2**5*x3/Lambda_b**10)
+
+
+def _kernel_scale_185(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**4*k_f2**4/Lambda_b**8
+    x4 = x1**(-2.0)
+    x5 = 1 - 0.39685026299205*x3
+    return k_f1*x2*y_ref**2*(7.0*x0*x2*x5 - 45.0*x3 + 2.51984209978975 + 6.3496042078728*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 + 1.88988157484231*k_f1**3*k_f2**3*x5/(Lambda_b**6*x1**3) - 19.8425131496025*k_f1**5*k_f2**5*x2/Lambda_b**10 - 3.77976314968462*k_f1**6*k_f2**6*x4/Lambda_b**12)
+
+
+def _kernel_scale_186(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**4*k_f2**4/Lambda_b**8
+    x5 = 1 - 0.39685026299205*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 7.5*x4 + 1.25992104989487 + 0.793700525984099*k_f1**2*x0*x5/(Lambda_b**4*x2**2) - 1.5874010519682*k_f1**5*k_f2**5*x3/Lambda_b**10)
+
+
+def _kernel_scale_187(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**4*k_f2**4/Lambda_b**8
+    x4 = x1**(-2.0)
+    x5 = 1 - 0.39685026299205*x3
+    return k_f2*x2*y_ref**2*(7.0*x0*x2*x5 - 45.0*x3 + 2.51984209978975 + 6.3496042078728*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 + 1.88988157484231*k_f1**3*k_f2**3*x5/(Lambda_b**6*x1**3) - 19.8425131496025*k_f1**5*k_f2**5*x2/Lambda_b**10 - 3.77976314968462*k_f1**6*k_f2**6*x4/Lambda_b**12)
+
+
+def _kernel_scale_188(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**4*k_f2**4/Lambda_b**8
+    x4 = x1**(-3.0)
+    x5 = x1**(-2.0)
+    x6 = 1 - 0.39685026299205*x3
+    return x2*y_ref**2*(16.0*x0*x2*x6 - 225.0*x3 + 2.51984209978975 + 6.0*x3*x6/x1**4 + 30.1606199873958*k_f1**2*k_f2**2*x5*x6/Lambda_b**4 + 22.6785788981077*k_f1**3*k_f2**3*x4*x6/Lambda_b**6 - 165.089709404693*k_f1**5*k_f2**5*x2/Lambda_b**10 - 68.0357366943231*k_f1**6*k_f2**6*x5/Lambda_b**12 - 12.0*k_f1**7*k_f2**7*x4/Lambda_b**14)
+
+
+def _kernel_scale_189(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = -1.0*k_f1**4*k_f2**4/Lambda_b**8
+    x1 = 1.0*k_f1*k_f2
+    x2 = y_ref**2/(1 - x1/Lambda_b**2)
+    return 1.0*k_f1**2*k_f2**2*x2*(x0 + 1) + x1*x2*(x0 + 1.0*k_f1**3*k_f2**3/Lambda_b**6)
+
+
+def _kernel_scale_190(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-8.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = 1.0*k_f1
+    x4 = k_f2*x3
+    x5 = -x2*x4 + 1
+    x6 = x1/x5
+    x7 = k_f1**4*x0
+    x8 = -1.0*k_f2**4*x7
+    x9 = x8 + 1
+    x10 = k_f1**2*k_f2
+    x11 = k_f1**3
+    x12 = k_f2**2
+    x13 = 1.0*x1*x2/x5**2
+    x14 = k_f2**3
+    x15 = x11/Lambda_b**6
+    x16 = 1.0*x14*x15 + x8
+    return -4.0*k_f1**6*k_f2**5*x0*x6 + x10*x13*x16 + 2.0*x10*x6*x9 + x11*x12*x13*x9 + x16*x3*x6 + x4*x6*(3.0*x12*x15 - 4.0*x14*x7)
+
+
+def _kernel_scale_191(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-8.0)
+    x5 = k_f1**4*k_f2**4
+    x6 = x4*x5
+    x7 = k_f2**2*x0
+    x8 = x7/Lambda_b**6
+    x9 = 4.0*x1
+    x10 = 6.0 - 2.0*x9
+    x11 = Lambda_b**(-10.0)
+    x12 = k_f1**3*k_f2**3*x3*x4
+    x13 = 1 - 1.0*x6
+    x14 = x2**(-2.0)
+    x15 = 2.0 - 2.0*x1
+    return x0*x3*y_ref**2*(-8.0*k_f1**5*k_f2**5*x11*x3 + x10*x12 + x10*x8 + x11*x14*x15*x5 + x12*x15 + x13*x3*x9 - 30.0*x6 + 1.0*x8*(6.0 - 12.0*x1) + 2.0 + 2.0*x13*x14*x7/Lambda_b**4)
+
+
+def _kernel_scale_192(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-8.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = 1.0*k_f2
+    x4 = k_f1*x3
+    x5 = -x2*x4 + 1
+    x6 = x1/x5
+    x7 = k_f2**4*x0
+    x8 = -1.0*k_f1**4*x7
+    x9 = x8 + 1
+    x10 = k_f1*k_f2**2
+    x11 = k_f2**3
+    x12 = k_f1**2
+    x13 = 1.0*x1*x2/x5**2
+    x14 = k_f1**3
+    x15 = x11/Lambda_b**6
+    x16 = 1.0*x14*x15 + x8
+    return -4.0*k_f1**5*k_f2**6*x0*x6 + x10*x13*x16 + 2.0*x10*x6*x9 + x11*x12*x13*x9 + x16*x3*x6 + x4*x6*(3.0*x12*x15 - 4.0*x14*x7)
+
+
+def _kernel_scale_193(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-8.0)
+    x5 = k_f1**4*k_f2**4
+    x6 = x4*x5
+    x7 = k_f1**2*k_f2**2
+    x8 = x7/Lambda_b**6
+    x9 = 6.0 - 8.0*x1
+    x10 = 1.0*x8
+    x11 = 1 - x1
+    x12 = Lambda_b**(-10.0)
+    x13 = k_f1**3*k_f2**3*x3*x4
+    x14 = 1 - 1.0*x6
+    x15 = 2.0/x2**2
+    return x0*x3*y_ref**2*(-8.0*k_f1**5*k_f2**5*x12*x3 + 5.0*x1*x14*x3 + x10*x11 + x10*(9.0 - 16.0*x1) + x11*x12*x15*x5 + 3.0*x11*x13 + x13*x9 - 36.0*x6 + x8*x9 + 4.0 + x14*x15*x7/Lambda_b**4)
+
+
+def _kernel_scale_194(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-8.0)
+    x4 = k_f1**4*k_f2**4
+    x5 = x3*x4
+    x6 = 3.0 - 4.0*x0
+    x7 = Lambda_b**(-6.0)
+    x8 = k_f1**2*k_f2**2
+    x9 = x7*x8
+    x10 = 2.0*x9
+    x11 = 6.0 - 12.0*x0
+    x12 = 9.0 - 16.0*x0
+    x13 = Lambda_b**(-12.0)
+    x14 = x1**(-2.0)
+    x15 = Lambda_b**(-10.0)
+    x16 = k_f1**5*k_f2**5
+    x17 = x14*x15*x4
+    x18 = k_f1**3*k_f2**3
+    x19 = x18*x2*x3
+    x20 = 1 - 1.0*x5
+    x21 = 1 - x0
+    x22 = 6.0/x1**3
+    return k_f1*x2*y_ref**2*(-24.0*k_f1**6*k_f2**6*x13*x14 + 14.0*x0*x2*x20 + x10*x12 + x10*x6 + x11*x19 + x11*x9 + 2.0*x12*x19 + x13*x16*x21*x22 - 100.0*x15*x16*x2 + 10.0*x17*x21 + 6.0*x17*x6 + x18*x20*x22*x7 + 4.0*x19*x21 + 8.0*x19*x6 - 180.0*x5 + 1.0*x9*(18.0 - 48.0*x0) + 4.0 + 16.0*x14*x20*x8/Lambda_b**4)
+
+
+def _kernel_scale_195(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-8.0)
+    x5 = k_f1**4*k_f2**4
+    x6 = x4*x5
+    x7 = k_f1**2*x0
+    x8 = x7/Lambda_b**6
+    x9 = 4.0*x1
+    x10 = 6.0 - 2.0*x9
+    x11 = Lambda_b**(-10.0)
+    x12 = k_f1**3*k_f2**3*x3*x4
+    x13 = 1 - 1.0*x6
+    x14 = x2**(-2.0)
+    x15 = 2.0 - 2.0*x1
+    return x0*x3*y_ref**2*(-8.0*k_f1**5*k_f2**5*x11*x3 + x10*x12 + x10*x8 + x11*x14*x15*x5 + x12*x15 + x13*x3*x9 - 30.0*x6 + 1.0*x8*(6.0 - 12.0*x1) + 2.0 + 2.0*x13*x14*x7/Lambda_b**4)
+
+
+def _kernel_scale_196(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-8.0)
+    x4 = k_f1**4*k_f2**4
+    x5 = x3*x4
+    x6 = 3.0 - 4.0*x0
+    x7 = Lambda_b**(-6.0)
+    x8 = k_f1**2*k_f2**2
+    x9 = x7*x8
+    x10 = 2.0*x9
+    x11 = 6.0 - 12.0*x0
+    x12 = 9.0 - 16.0*x0
+    x13 = Lambda_b**(-12.0)
+    x14 = x1**(-2.0)
+    x15 = Lambda_b**(-10.0)
+    x16 = k_f1**5*k_f2**5
+    x17 = x14*x15*x4
+    x18 = k_f1**3*k_f2**3
+    x19 = x18*x2*x3
+    x20 = 1 - 1.0*x5
+    x21 = 1 - x0
+    x22 = 6.0/x1**3
+    return k_f2*x2*y_ref**2*(-24.0*k_f1**6*k_f2**6*x13*x14 + 14.0*x0*x2*x20 + x10*x12 + x10*x6 + x11*x19 + x11*x9 + 2.0*x12*x19 + x13*x16*x21*x22 - 100.0*x15*x16*x2 + 10.0*x17*x21 + 6.0*x17*x6 + x18*x20*x22*x7 + 4.0*x19*x21 + 8.0*x19*x6 - 180.0*x5 + 1.0*x9*(18.0 - 48.0*x0) + 4.0 + 16.0*x14*x20*x8/Lambda_b**4)
+
+
+def _kernel_scale_197(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-8.0)
+    x4 = k_f1**4*k_f2**4
+    x5 = x3*x4
+    x6 = 9.0 - 16.0*x0
+    x7 = Lambda_b**(-6.0)
+    x8 = k_f1**2*k_f2**2
+    x9 = x7*x8
+    x10 = 4.0*x9
+    x11 = 18.0 - 48.0*x0
+    x12 = Lambda_b**(-14.0)
+    x13 = x1**(-3.0)
+    x14 = Lambda_b**(-12.0)
+    x15 = x1**(-2.0)
+    x16 = k_f1**6*k_f2**6
+    x17 = Lambda_b**(-10.0)
+    x18 = k_f1**5*k_f2**5
+    x19 = 3.0 - 4.0*x0
+    x20 = x13*x14*x18
+    x21 = x15*x17*x4
+    x22 = 24.0 - 48.0*x0
+    x23 = k_f1**3*k_f2**3
+    x24 = x2*x23*x3
+    x25 = 4.0*x24
+    x26 = 1 - 1.0*x5
+    x27 = 1 - x0
+    x28 = 24.0/x1**4
+    return x2*y_ref**2*(-96.0*k_f1**7*k_f2**7*x12*x13 + 32.0*x0*x2*x26 + x10*x11 + x10*x6 + x11*x25 + x12*x16*x27*x28 + 72.0*x13*x23*x26*x7 - 432.0*x14*x15*x16 - 832.0*x17*x18*x2 + 24.0*x19*x20 + 40.0*x19*x21 + 16.0*x19*x24 + 48.0*x20*x27 + x21*x22 + 28.0*x21*x27 + 8.0*x21*x6 + x22*x24 + 12.0*x24*x6 + x25*x27 + x26*x28*x5 - 900.0*x5 + 1.0*x9*(36.0 - 144.0*x0) + 4.0 + 76.0*x15*x26*x8/Lambda_b**4)
+
+
+def _kernel_scale_198(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = -0.39685026299205*k_f1**4*k_f2**4/Lambda_b**8
+    x1 = 0.7937005259841*k_f1*k_f2
+    x2 = y_ref**2/(1 - x1/Lambda_b**2)
+    return 0.629960524947436*k_f1**2*k_f2**2*x2*(x0 + 1) + x1*x2*(x0 + 0.5*k_f1**3*k_f2**3/Lambda_b**6)
+
+
+def _kernel_scale_199(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-8.0)
+    x1 = y_ref**2
+    x2 = 0.7937005259841*k_f1
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f2*x3
+    x5 = -x2*x4 + 1
+    x6 = x1/x5
+    x7 = k_f1**2
+    x8 = k_f1**4*x0
+    x9 = -0.39685026299205*k_f2**4*x8
+    x10 = x9 + 1
+    x11 = k_f1**3
+    x12 = k_f2**2
+    x13 = x1/x5**2
+    x14 = k_f2**3
+    x15 = x11/Lambda_b**6
+    x16 = 0.5*x14*x15 + x9
+    x17 = x2*x6
+    return -0.999999999999999*k_f1**6*k_f2**5*x0*x6 + 1.25992104989487*k_f2*x10*x6*x7 + k_f2*x17*(1.5*x12*x15 - 1.5874010519682*x14*x8) + 0.5*x10*x11*x12*x13*x3 + 0.629960524947436*x13*x16*x4*x7 + x16*x17
+
+
+def _kernel_scale_200(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-8.0)
+    x5 = k_f1**4*k_f2**4
+    x6 = x4*x5
+    x7 = 1.5 - 1.5874010519682*x1
+    x8 = k_f2**2*x0
+    x9 = x8/Lambda_b**6
+    x10 = Lambda_b**(-10.0)
+    x11 = 0.5 - 0.39685026299205*x1
+    x12 = x2**(-2.0)
+    x13 = 1.25992104989487*k_f1**3*k_f2**3*x3*x4
+    x14 = 1 - 0.39685026299205*x6
+    return x0*x3*y_ref**2*(-1.5874010519682*k_f1**5*k_f2**5*x10*x3 + 2.0*x1*x14*x3 + 1.0*x10*x11*x12*x5 + x11*x13 + x13*x7 - 7.5*x6 + 1.5874010519682*x7*x9 + 0.7937005259841*x9*(3.0 - 4.7622031559046*x1) + 1.25992104989487 + 0.793700525984099*x12*x14*x8/Lambda_b**4)
+
+
+def _kernel_scale_201(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-8.0)
+    x1 = y_ref**2
+    x2 = 0.7937005259841*k_f2
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f1*x3
+    x5 = -x2*x4 + 1
+    x6 = x1/x5
+    x7 = k_f2**2
+    x8 = k_f2**4*x0
+    x9 = -0.39685026299205*k_f1**4*x8
+    x10 = x9 + 1
+    x11 = k_f2**3
+    x12 = k_f1**2
+    x13 = x1/x5**2
+    x14 = k_f1**3
+    x15 = x11/Lambda_b**6
+    x16 = 0.5*x14*x15 + x9
+    x17 = x2*x6
+    return -0.999999999999999*k_f1**5*k_f2**6*x0*x6 + 1.25992104989487*k_f1*x10*x6*x7 + k_f1*x17*(1.5*x12*x15 - 1.5874010519682*x14*x8) + 0.5*x10*x11*x12*x13*x3 + 0.629960524947436*x13*x16*x4*x7 + x16*x17
+
+
+def _kernel_scale_202(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-8.0)
+    x5 = k_f1**4*k_f2**4
+    x6 = x4*x5
+    x7 = 0.5 - 0.39685026299205*x1
+    x8 = k_f1**2*k_f2**2
+    x9 = x8/Lambda_b**6
+    x10 = 0.7937005259841*x9
+    x11 = 1.5 - 1.5874010519682*x1
+    x12 = Lambda_b**(-10.0)
+    x13 = x2**(-2.0)
+    x14 = k_f1**3*k_f2**3*x3*x4
+    x15 = 1 - 0.39685026299205*x6
+    return x0*x3*y_ref**2*(-1.5874010519682*k_f1**5*k_f2**5*x12*x3 + 2.5*x1*x15*x3 + x10*x7 + x10*(4.5 - 6.3496042078728*x1) + 1.25992104989487*x11*x14 + 1.5874010519682*x11*x9 + 1.0*x12*x13*x5*x7 + 1.88988157484231*x14*x7 - 8.99999999999999*x6 + 2.51984209978975 + 0.793700525984099*x13*x15*x8/Lambda_b**4)
+
+
+def _kernel_scale_203(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-8.0)
+    x4 = k_f1**4*k_f2**4
+    x5 = x3*x4
+    x6 = 1.5 - 1.5874010519682*x0
+    x7 = Lambda_b**(-6.0)
+    x8 = k_f1**2*k_f2**2
+    x9 = x7*x8
+    x10 = 1.5874010519682*x9
+    x11 = 3.0 - 4.7622031559046*x0
+    x12 = 0.7937005259841*x9
+    x13 = 4.5 - 6.3496042078728*x0
+    x14 = Lambda_b**(-12.0)
+    x15 = x1**(-2.0)
+    x16 = Lambda_b**(-10.0)
+    x17 = k_f1**5*k_f2**5
+    x18 = x1**(-3.0)
+    x19 = 0.5 - 0.39685026299205*x0
+    x20 = x15*x16*x4
+    x21 = k_f1**3*k_f2**3
+    x22 = x2*x21*x3
+    x23 = 1 - 0.39685026299205*x5
+    return k_f1*x2*y_ref**2*(-3.77976314968462*k_f1**6*k_f2**6*x14*x15 + 7.0*x0*x2*x23 + x10*x13 + x10*x6 + x11*x12 + 0.629960524947436*x11*x22 + x12*(9.0 - 19.0488126236184*x0) + 1.25992104989487*x13*x22 + 2.3811015779523*x14*x17*x18*x19 - 19.8425131496025*x16*x17*x2 + 1.88988157484231*x18*x21*x23*x7 + 5.0*x19*x20 + 2.51984209978975*x19*x22 + 3.0*x20*x6 + 5.03968419957949*x22*x6 - 45.0*x5 + 2.51984209978975 + 6.3496042078728*x15*x23*x8/Lambda_b**4)
+
+
+def _kernel_scale_204(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-8.0)
+    x5 = k_f1**4*k_f2**4
+    x6 = x4*x5
+    x7 = 1.5 - 1.5874010519682*x1
+    x8 = k_f1**2*x0
+    x9 = x8/Lambda_b**6
+    x10 = Lambda_b**(-10.0)
+    x11 = 0.5 - 0.39685026299205*x1
+    x12 = x2**(-2.0)
+    x13 = 1.25992104989487*k_f1**3*k_f2**3*x3*x4
+    x14 = 1 - 0.39685026299205*x6
+    return x0*x3*y_ref**2*(-1.5874010519682*k_f1**5*k_f2**5*x10*x3 + 2.0*x1*x14*x3 + 1.0*x10*x11*x12*x5 + x11*x13 + x13*x7 - 7.5*x6 + 1.5874010519682*x7*x9 + 0.7937005259841*x9*(3.0 - 4.7622031559046*x1) + 1.25992104989487 + 0.793700525984099*x12*x14*x8/Lambda_b**4)
+
+
+def _kernel_scale_205(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-8.0)
+    x4 = k_f1**4*k_f2**4
+    x5 = x3*x4
+    x6 = 1.5 - 1.5874010519682*x0
+    x7 = Lambda_b**(-6.0)
+    x8 = k_f1**2*k_f2**2
+    x9 = x7*x8
+    x10 = 1.5874010519682*x9
+    x11 = 3.0 - 4.7622031559046*x0
+    x12 = 0.7937005259841*x9
+    x13 = 4.5 - 6.3496042078728*x0
+    x14 = Lambda_b**(-12.0)
+    x15 = x1**(-2.0)
+    x16 = Lambda_b**(-10.0)
+    x17 = k_f1**5*k_f2**5
+    x18 = x1**(-3.0)
+    x19 = 0.5 - 0.39685026299205*x0
+    x20 = x15*x16*x4
+    x21 = k_f1**3*k_f2**3
+    x22 = x2*x21*x3
+    x23 = 1 - 0.39685026299205*x5
+    return k_f2*x2*y_ref**2*(-3.77976314968462*k_f1**6*k_f2**6*x14*x15 + 7.0*x0*x2*x23 + x10*x13 + x10*x6 + x11*x12 + 0.629960524947436*x11*x22 + x12*(9.0 - 19.0488126236184*x0) + 1.25992104989487*x13*x22 + 2.3811015779523*x14*x17*x18*x19 - 19.8425131496025*x16*x17*x2 + 1.88988157484231*x18*x21*x23*x7 + 5.0*x19*x20 + 2.51984209978975*x19*x22 + 3.0*x20*x6 + 5.03968419957949*x22*x6 - 45.0*x5 + 2.51984209978975 + 6.3496042078728*x15*x23*x8/Lambda_b**4)
+
+
+def _kernel_scale_206(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-8.0)
+    x4 = k_f1**4*k_f2**4
+    x5 = x3*x4
+    x6 = 4.5 - 6.3496042078728*x0
+    x7 = Lambda_b**(-6.0)
+    x8 = k_f1**2*k_f2**2
+    x9 = x7*x8
+    x10 = 3.1748021039364*x9
+    x11 = 9.0 - 19.0488126236184*x0
+    x12 = Lambda_b**(-14.0)
+    x13 = x1**(-3.0)
+    x14 = Lambda_b**(-12.0)
+    x15 = x1**(-2.0)
+    x16 = k_f1**6*k_f2**6
+    x17 = Lambda_b**(-10.0)
+    x18 = k_f1**5*k_f2**5
+    x19 = 0.5 - 0.39685026299205*x0
+    x20 = x1**(-4.0)
+    x21 = x13*x14*x18
+    x22 = 1.5 - 1.5874010519682*x0
+    x23 = x15*x17*x4
+    x24 = 3.0 - 4.7622031559046*x0
+    x25 = k_f1**3*k_f2**3
+    x26 = x2*x25*x3
+    x27 = 2.51984209978975*x26
+    x28 = 1 - 0.39685026299205*x5
+    return x2*y_ref**2*(-12.0*k_f1**7*k_f2**7*x12*x13 + 16.0*x0*x2*x28 + x10*x11 + x10*x6 + x11*x27 + 7.55952629936924*x12*x16*x19*x20 + 22.6785788981077*x13*x25*x28*x7 - 68.0357366943231*x14*x15*x16 - 165.089709404693*x17*x18*x2 + 19.0488126236184*x19*x21 + 14.0*x19*x23 + x19*x27 + 6.0*x20*x28*x5 + 9.52440631180919*x21*x22 + 20.0*x22*x23 + 10.079368399159*x22*x26 + 2.0*x23*x24 + 4.0*x23*x6 + x24*x27 + 7.55952629936924*x26*x6 - 225.0*x5 + 0.7937005259841*x9*(18.0 - 57.1464378708552*x0) + 2.51984209978975 + 30.1606199873958*x15*x28*x8/Lambda_b**4)
+
+
+def _kernel_scale_207(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = -0.39685026299205*k_f1**4*k_f2**4/Lambda_b**8
+    x1 = 0.7937005259841*k_f1*k_f2
+    x2 = y_ref**2/(1 - x1/Lambda_b**2)
+    return 0.629960524947436*k_f1**2*k_f2**2*x2*(x0 + 1) + x1*x2*(x0 + 0.5*k_f1**3*k_f2**3/Lambda_b**6)
+
+
+def _kernel_scale_208(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-8.0)
+    x1 = y_ref**2
+    x2 = 0.7937005259841*k_f1
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f2*x3
+    x5 = -x2*x4 + 1
+    x6 = x1/x5
+    x7 = k_f1**2
+    x8 = k_f1**4*x0
+    x9 = -0.39685026299205*k_f2**4*x8
+    x10 = x9 + 1
+    x11 = k_f1**3
+    x12 = k_f2**2
+    x13 = x1/x5**2
+    x14 = k_f2**3
+    x15 = x11/Lambda_b**6
+    x16 = 0.5*x14*x15 + x9
+    x17 = x2*x6
+    return -0.999999999999999*k_f1**6*k_f2**5*x0*x6 + 1.25992104989487*k_f2*x10*x6*x7 + k_f2*x17*(1.5*x12*x15 - 1.5874010519682*x14*x8) + 0.5*x10*x11*x12*x13*x3 + 0.629960524947436*x13*x16*x4*x7 + x16*x17
+
+
+def _kernel_scale_209(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-8.0)
+    x5 = k_f1**4*k_f2**4
+    x6 = x4*x5
+    x7 = 1.5 - 1.5874010519682*x1
+    x8 = k_f2**2*x0
+    x9 = x8/Lambda_b**6
+    x10 = Lambda_b**(-10.0)
+    x11 = 0.5 - 0.39685026299205*x1
+    x12 = x2**(-2.0)
+    x13 = 1.25992104989487*k_f1**3*k_f2**3*x3*x4
+    x14 = 1 - 0.39685026299205*x6
+    return x0*x3*y_ref**2*(-1.5874010519682*k_f1**5*k_f2**5*x10*x3 + 2.0*x1*x14*x3 + 1.0*x10*x11*x12*x5 + x11*x13 + x13*x7 - 7.5*x6 + 1.5874010519682*x7*x9 + 0.7937005259841*x9*(3.0 - 4.7622031559046*x1) + 1.25992104989487 + 0.793700525984099*x12*x14*x8/Lambda_b**4)
+
+
+def _kernel_scale_210(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-8.0)
+    x1 = y_ref**2
+    x2 = 0.7937005259841*k_f2
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f1*x3
+    x5 = -x2*x4 + 1
+    x6 = x1/x5
+    x7 = k_f2**2
+    x8 = k_f2**4*x0
+    x9 = -0.39685026299205*k_f1**4*x8
+    x10 = x9 + 1
+    x11 = k_f2**3
+    x12 = k_f1**2
+    x13 = x1/x5**2
+    x14 = k_f1**3
+    x15 = x11/Lambda_b**6
+    x16 = 0.5*x14*x15 + x9
+    x17 = x2*x6
+    return -0.999999999999999*k_f1**5*k_f2**6*x0*x6 + 1.25992104989487*k_f1*x10*x6*x7 + k_f1*x17*(1.5*x12*x15 - 1.5874010519682*x14*x8) + 0.5*x10*x11*x12*x13*x3 + 0.629960524947436*x13*x16*x4*x7 + x16*x17
+
+
+def _kernel_scale_211(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-8.0)
+    x5 = k_f1**4*k_f2**4
+    x6 = x4*x5
+    x7 = 0.5 - 0.39685026299205*x1
+    x8 = k_f1**2*k_f2**2
+    x9 = x8/Lambda_b**6
+    x10 = 0.7937005259841*x9
+    x11 = 1.5 - 1.5874010519682*x1
+    x12 = Lambda_b**(-10.0)
+    x13 = x2**(-2.0)
+    x14 = k_f1**3*k_f2**3*x3*x4
+    x15 = 1 - 0.39685026299205*x6
+    return x0*x3*y_ref**2*(-1.5874010519682*k_f1**5*k_f2**5*x12*x3 + 2.5*x1*x15*x3 + x10*x7 + x10*(4.5 - 6.3496042078728*x1) + 1.25992104989487*x11*x14 + 1.5874010519682*x11*x9 + 1.0*x12*x13*x5*x7 + 1.88988157484231*x14*x7 - 8.99999999999999*x6 + 2.51984209978975 + 0.793700525984099*x13*x15*x8/Lambda_b**4)
+
+
+def _kernel_scale_212(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-8.0)
+    x4 = k_f1**4*k_f2**4
+    x5 = x3*x4
+    x6 = 1.5 - 1.5874010519682*x0
+    x7 = Lambda_b**(-6.0)
+    x8 = k_f1**2*k_f2**2
+    x9 = x7*x8
+    x10 = 1.5874010519682*x9
+    x11 = 3.0 - 4.7622031559046*x0
+    x12 = 0.7937005259841*x9
+    x13 = 4.5 - 6.3496042078728*x0
+    x14 = Lambda_b**(-12.0)
+    x15 = x1**(-2.0)
+    x16 = Lambda_b**(-10.0)
+    x17 = k_f1**5*k_f2**5
+    x18 = x1**(-3.0)
+    x19 = 0.5 - 0.39685026299205*x0
+    x20 = x15*x16*x4
+    x21 = k_f1**3*k_f2**3
+    x22 = x2*x21*x3
+    x23 = 1 - 0.39685026299205*x5
+    return k_f1*x2*y_ref**2*(-3.77976314968462*k_f1**6*k_f2**6*x14*x15 + 7.0*x0*x2*x23 + x10*x13 + x10*x6 + x11*x12 + 0.629960524947436*x11*x22 + x12*(9.0 - 19.0488126236184*x0) + 1.25992104989487*x13*x22 + 2.3811015779523*x14*x17*x18*x19 - 19.8425131496025*x16*x17*x2 + 1.88988157484231*x18*x21*x23*x7 + 5.0*x19*x20 + 2.51984209978975*x19*x22 + 3.0*x20*x6 + 5.03968419957949*x22*x6 - 45.0*x5 + 2.51984209978975 + 6.3496042078728*x15*x23*x8/Lambda_b**4)
+
+
+def _kernel_scale_213(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-8.0)
+    x5 = k_f1**4*k_f2**4
+    x6 = x4*x5
+    x7 = 1.5 - 1.5874010519682*x1
+    x8 = k_f1**2*x0
+    x9 = x8/Lambda_b**6
+    x10 = Lambda_b**(-10.0)
+    x11 = 0.5 - 0.39685026299205*x1
+    x12 = x2**(-2.0)
+    x13 = 1.25992104989487*k_f1**3*k_f2**3*x3*x4
+    x14 = 1 - 0.39685026299205*x6
+    return x0*x3*y_ref**2*(-1.5874010519682*k_f1**5*k_f2**5*x10*x3 + 2.0*x1*x14*x3 + 1.0*x10*x11*x12*x5 + x11*x13 + x13*x7 - 7.5*x6 + 1.5874010519682*x7*x9 + 0.7937005259841*x9*(3.0 - 4.7622031559046*x1) + 1.25992104989487 + 0.793700525984099*x12*x14*x8/Lambda_b**4)
+
+
+def _kernel_scale_214(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-8.0)
+    x4 = k_f1**4*k_f2**4
+    x5 = x3*x4
+    x6 = 1.5 - 1.5874010519682*x0
+    x7 = Lambda_b**(-6.0)
+    x8 = k_f1**2*k_f2**2
+    x9 = x7*x8
+    x10 = 1.5874010519682*x9
+    x11 = 3.0 - 4.7622031559046*x0
+    x12 = 0.7937005259841*x9
+    x13 = 4.5 - 6.3496042078728*x0
+    x14 = Lambda_b**(-12.0)
+    x15 = x1**(-2.0)
+    x16 = Lambda_b**(-10.0)
+    x17 = k_f1**5*k_f2**5
+    x18 = x1**(-3.0)
+    x19 = 0.5 - 0.39685026299205*x0
+    x20 = x15*x16*x4
+    x21 = k_f1**3*k_f2**3
+    x22 = x2*x21*x3
+    x23 = 1 - 0.39685026299205*x5
+    return k_f2*x2*y_ref**2*(-3.77976314968462*k_f1**6*k_f2**6*x14*x15 + 7.0*x0*x2*x23 + x10*x13 + x10*x6 + x11*x12 + 0.629960524947436*x11*x22 + x12*(9.0 - 19.0488126236184*x0) + 1.25992104989487*x13*x22 + 2.3811015779523*x14*x17*x18*x19 - 19.8425131496025*x16*x17*x2 + 1.88988157484231*x18*x21*x23*x7 + 5.0*x19*x20 + 2.51984209978975*x19*x22 + 3.0*x20*x6 + 5.03968419957949*x22*x6 - 45.0*x5 + 2.51984209978975 + 6.3496042078728*x15*x23*x8/Lambda_b**4)
+
+
+def _kernel_scale_215(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-8.0)
+    x4 = k_f1**4*k_f2**4
+    x5 = x3*x4
+    x6 = 4.5 - 6.3496042078728*x0
+    x7 = Lambda_b**(-6.0)
+    x8 = k_f1**2*k_f2**2
+    x9 = x7*x8
+    x10 = 3.1748021039364*x9
+    x11 = 9.0 - 19.0488126236184*x0
+    x12 = Lambda_b**(-14.0)
+    x13 = x1**(-3.0)
+    x14 = Lambda_b**(-12.0)
+    x15 = x1**(-2.0)
+    x16 = k_f1**6*k_f2**6
+    x17 = Lambda_b**(-10.0)
+    x18 = k_f1**5*k_f2**5
+    x19 = 0.5 - 0.39685026299205*x0
+    x20 = x1**(-4.0)
+    x21 = x13*x14*x18
+    x22 = 1.5 - 1.5874010519682*x0
+    x23 = x15*x17*x4
+    x24 = 3.0 - 4.7622031559046*x0
+    x25 = k_f1**3*k_f2**3
+    x26 = x2*x25*x3
+    x27 = 2.51984209978975*x26
+    x28 = 1 - 0.39685026299205*x5
+    return x2*y_ref**2*(-12.0*k_f1**7*k_f2**7*x12*x13 + 16.0*x0*x2*x28 + x10*x11 + x10*x6 + x11*x27 + 7.55952629936924*x12*x16*x19*x20 + 22.6785788981077*x13*x25*x28*x7 - 68.0357366943231*x14*x15*x16 - 165.089709404693*x17*x18*x2 + 19.0488126236184*x19*x21 + 14.0*x19*x23 + x19*x27 + 6.0*x20*x28*x5 + 9.52440631180919*x21*x22 + 20.0*x22*x23 + 10.079368399159*x22*x26 + 2.0*x23*x24 + 4.0*x23*x6 + x24*x27 + 7.55952629936924*x26*x6 - 225.0*x5 + 0.7937005259841*x9*(18.0 - 57.1464378708552*x0) + 2.51984209978975 + 30.1606199873958*x15*x28*x8/Lambda_b**4)
+
+
+def _kernel_scale_216(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.0*k_f1**2*k_f2**2*y_ref**2*(1 - 1.0*k_f1**5*k_f2**5/Lambda_b**10)/(1 - 1.0*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_217(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-10.0)
+    x1 = y_ref**2
+    x2 = 1.0/Lambda_b**2
+    x3 = -k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = -1.0*k_f1**5*k_f2**5*x0 + 1
+    return -5.0*k_f1**7*k_f2**6*x0*x4 + k_f1**3*k_f2**2*x1*x2*x5/x3**2 + 2.0*k_f1**2*k_f2*x4*x5
+
+
+def _kernel_scale_218(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**5*k_f2**5/Lambda_b**10
+    x5 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(4.0*x1*x3*x5 - 42.0*x4 + 2.0 + 2.0*k_f2**2*x0*x5/(Lambda_b**4*x2**2) - 10.0*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_219(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-10.0)
+    x1 = y_ref**2
+    x2 = 1.0/Lambda_b**2
+    x3 = -k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = -1.0*k_f1**5*k_f2**5*x0 + 1
+    return -5.0*k_f1**6*k_f2**7*x0*x4 + k_f1**2*k_f2**3*x1*x2*x5/x3**2 + 2.0*k_f1*k_f2**2*x4*x5
+
+
+def _kernel_scale_220(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**5*k_f2**5/Lambda_b**10
+    x5 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(5.0*x1*x3*x5 - 49.0*x4 + 4.0 + 2.0*k_f1**2*k_f2**2*x5/(Lambda_b**4*x2**2) - 10.0*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_221(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**5*k_f2**5/Lambda_b**10
+    x4 = x1**(-2.0)
+    x5 = 1 - 1.0*x3
+    return k_f1*x2*y_ref**2*(14.0*x0*x2*x5 - 294.0*x3 + 4.0 + 16.0*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 + 6.0*k_f1**3*k_f2**3*x5/(Lambda_b**6*x1**3) - 140.0*k_f1**6*k_f2**6*x2/Lambda_b**12 - 30.0*k_f1**7*k_f2**7*x4/Lambda_b**14)
+
+
+def _kernel_scale_222(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**5*k_f2**5/Lambda_b**10
+    x5 = 1 - 1.0*x4
+    return x0*x3*y_ref**2*(4.0*x1*x3*x5 - 42.0*x4 + 2.0 + 2.0*k_f1**2*x0*x5/(Lambda_b**4*x2**2) - 10.0*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_223(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**5*k_f2**5/Lambda_b**10
+    x4 = x1**(-2.0)
+    x5 = 1 - 1.0*x3
+    return k_f2*x2*y_ref**2*(14.0*x0*x2*x5 - 294.0*x3 + 4.0 + 16.0*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 + 6.0*k_f1**3*k_f2**3*x5/(Lambda_b**6*x1**3) - 140.0*k_f1**6*k_f2**6*x2/Lambda_b**12 - 30.0*k_f1**7*k_f2**7*x4/Lambda_b**14)
+
+
+def _kernel_scale_224(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**5*k_f2**5/Lambda_b**10
+    x4 = x1**(-3.0)
+    x5 = x1**(-2.0)
+    x6 = 1 - 1.0*x3
+    return x2*y_ref**2*(32.0*x0*x2*x6 - 1764.0*x3 + 4.0 + 76.0*k_f1**2*k_f2**2*x5*x6/Lambda_b**4 + 72.0*k_f1**3*k_f2**3*x4*x6/Lambda_b**6 + 24.0*k_f1**4*k_f2**4*x6/(Lambda_b**8*x1**4) - 1340.0*k_f1**6*k_f2**6*x2/Lambda_b**12 - 600.0*k_f1**7*k_f2**7*x5/Lambda_b**14 - 120.0*k_f1**8*k_f2**8*x4/Lambda_b**16)
+
+
+def _kernel_scale_225(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.629960524947436*k_f1**2*k_f2**2*y_ref**2*(1 - 0.314980262473718*k_f1**5*k_f2**5/Lambda_b**10)/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_226(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-10.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = -0.314980262473718*k_f1**5*k_f2**5*x0 + 1
+    return -0.992125657480124*k_f1**7*k_f2**6*x0*x4 + 0.5*k_f1**3*k_f2**2*x1*x2*x5/x3**2 + 1.25992104989487*k_f1**2*k_f2*x4*x5
+
+
+def _kernel_scale_227(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**5*k_f2**5/Lambda_b**10
+    x5 = 1 - 0.314980262473718*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 8.33385552283304*x4 + 1.25992104989487 + 0.793700525984099*k_f2**2*x0*x5/(Lambda_b**4*x2**2) - 1.57490131236859*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_228(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-10.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = -0.314980262473718*k_f1**5*k_f2**5*x0 + 1
+    return -0.992125657480124*k_f1**6*k_f2**7*x0*x4 + 0.5*k_f1**2*k_f2**3*x1*x2*x5/x3**2 + 1.25992104989487*k_f1*k_f2**2*x4*x5
+
+
+def _kernel_scale_229(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**5*k_f2**5/Lambda_b**10
+    x5 = 1 - 0.314980262473718*x4
+    return x0*x3*y_ref**2*(2.5*x1*x3*x5 - 9.72283144330522*x4 + 2.51984209978975 + 0.793700525984099*k_f1**2*k_f2**2*x5/(Lambda_b**4*x2**2) - 1.57490131236859*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_230(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**5*k_f2**5/Lambda_b**10
+    x4 = x1**(-2.0)
+    x5 = 1 - 0.314980262473718*x3
+    return k_f1*x2*y_ref**2*(7.0*x0*x2*x5 - 58.3369886598313*x3 + 2.51984209978975 + 6.3496042078728*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 + 1.88988157484231*k_f1**3*k_f2**3*x5/(Lambda_b**6*x1**3) - 22.0486183731603*k_f1**6*k_f2**6*x2/Lambda_b**12 - 3.75*k_f1**7*k_f2**7*x4/Lambda_b**14)
+
+
+def _kernel_scale_231(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**5*k_f2**5/Lambda_b**10
+    x5 = 1 - 0.314980262473718*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 8.33385552283304*x4 + 1.25992104989487 + 0.793700525984099*k_f1**2*x0*x5/(Lambda_b**4*x2**2) - 1.57490131236859*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_232(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**5*k_f2**5/Lambda_b**10
+    x4 = x1**(-2.0)
+    x5 = 1 - 0.314980262473718*x3
+    return k_f2*x2*y_ref**2*(7.0*x0*x2*x5 - 58.3369886598313*x3 + 2.51984209978975 + 6.3496042078728*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 + 1.88988157484231*k_f1**3*k_f2**3*x5/(Lambda_b**6*x1**3) - 22.0486183731603*k_f1**6*k_f2**6*x2/Lambda_b**12 - 3.75*k_f1**7*k_f2**7*x4/Lambda_b**14)
+
+
+def _kernel_scale_233(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**5*k_f2**5/Lambda_b**10
+    x4 = x1**(-3.0)
+    x5 = x1**(-2.0)
+    x6 = 1 - 0.314980262473718*x3
+    return x2*y_ref**2*(16.0*x0*x2*x6 - 350.021931958988*x3 + 2.51984209978975 + 30.1606199873958*k_f1**2*k_f2**2*x5*x6/Lambda_b**4 + 22.6785788981077*k_f1**3*k_f2**3*x4*x6/Lambda_b**6 + 6.0*k_f1**4*k_f2**4*x6/(Lambda_b**8*x1**4) - 211.036775857391*k_f1**6*k_f2**6*x2/Lambda_b**12 - 74.9999999999999*k_f1**7*k_f2**7*x5/Lambda_b**14 - 11.9055078897615*k_f1**8*k_f2**8*x4/Lambda_b**16)
+
+
+def _kernel_scale_234(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.629960524947436*k_f1**2*k_f2**2*y_ref**2*(1 - 0.314980262473718*k_f1**5*k_f2**5/Lambda_b**10)/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_235(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-10.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = -0.314980262473718*k_f1**5*k_f2**5*x0 + 1
+    return -0.992125657480124*k_f1**7*k_f2**6*x0*x4 + 0.5*k_f1**3*k_f2**2*x1*x2*x5/x3**2 + 1.25992104989487*k_f1**2*k_f2*x4*x5
+
+
+def _kernel_scale_236(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**5*k_f2**5/Lambda_b**10
+    x5 = 1 - 0.314980262473718*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 8.33385552283304*x4 + 1.25992104989487 + 0.793700525984099*k_f2**2*x0*x5/(Lambda_b**4*x2**2) - 1.57490131236859*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_237(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-10.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = -0.7937005259841*k_f1*k_f2*x2 + 1
+    x4 = x1/x3
+    x5 = -0.314980262473718*k_f1**5*k_f2**5*x0 + 1
+    return -0.992125657480124*k_f1**6*k_f2**7*x0*x4 + 0.5*k_f1**2*k_f2**3*x1*x2*x5/x3**2 + 1.25992104989487*k_f1*k_f2**2*x4*x5
+
+
+def _kernel_scale_238(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**5*k_f2**5/Lambda_b**10
+    x5 = 1 - 0.314980262473718*x4
+    return x0*x3*y_ref**2*(2.5*x1*x3*x5 - 9.72283144330522*x4 + 2.51984209978975 + 0.793700525984099*k_f1**2*k_f2**2*x5/(Lambda_b**4*x2**2) - 1.57490131236859*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_239(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**5*k_f2**5/Lambda_b**10
+    x4 = x1**(-2.0)
+    x5 = 1 - 0.314980262473718*x3
+    return k_f1*x2*y_ref**2*(7.0*x0*x2*x5 - 58.3369886598313*x3 + 2.51984209978975 + 6.3496042078728*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 + 1.88988157484231*k_f1**3*k_f2**3*x5/(Lambda_b**6*x1**3) - 22.0486183731603*k_f1**6*k_f2**6*x2/Lambda_b**12 - 3.75*k_f1**7*k_f2**7*x4/Lambda_b**14)
+
+
+def _kernel_scale_240(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**5*k_f2**5/Lambda_b**10
+    x5 = 1 - 0.314980262473718*x4
+    return x0*x3*y_ref**2*(2.0*x1*x3*x5 - 8.33385552283304*x4 + 1.25992104989487 + 0.793700525984099*k_f1**2*x0*x5/(Lambda_b**4*x2**2) - 1.57490131236859*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_241(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**5*k_f2**5/Lambda_b**10
+    x4 = x1**(-2.0)
+    x5 = 1 - 0.314980262473718*x3
+    return k_f2*x2*y_ref**2*(7.0*x0*x2*x5 - 58.3369886598313*x3 + 2.51984209978975 + 6.3496042078728*k_f1**2*k_f2**2*x4*x5/Lambda_b**4 + 1.88988157484231*k_f1**3*k_f2**3*x5/(Lambda_b**6*x1**3) - 22.0486183731603*k_f1**6*k_f2**6*x2/Lambda_b**12 - 3.75*k_f1**7*k_f2**7*x4/Lambda_b**14)
+
+
+def _kernel_scale_242(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**5*k_f2**5/Lambda_b**10
+    x4 = x1**(-3.0)
+    x5 = x1**(-2.0)
+    x6 = 1 - 0.314980262473718*x3
+    return x2*y_ref**2*(16.0*x0*x2*x6 - 350.021931958988*x3 + 2.51984209978975 + 30.1606199873958*k_f1**2*k_f2**2*x5*x6/Lambda_b**4 + 22.6785788981077*k_f1**3*k_f2**3*x4*x6/Lambda_b**6 + 6.0*k_f1**4*k_f2**4*x6/(Lambda_b**8*x1**4) - 211.036775857391*k_f1**6*k_f2**6*x2/Lambda_b**12 - 74.9999999999999*k_f1**7*k_f2**7*x5/Lambda_b**14 - 11.9055078897615*k_f1**8*k_f2**8*x4/Lambda_b**16)
+
+
+def _kernel_scale_243(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = -1.0*k_f1**5*k_f2**5/Lambda_b**10
+    x1 = 1.0*k_f1*k_f2
+    x2 = y_ref**2/(1 - x1/Lambda_b**2)
+    return 1.0*k_f1**2*k_f2**2*x2*(x0 + 1) + x1*x2*(x0 + 1.0*k_f1**3*k_f2**3/Lambda_b**6)
+
+
+def _kernel_scale_244(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-10.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = 1.0*k_f1
+    x4 = k_f2*x3
+    x5 = -x2*x4 + 1
+    x6 = x1/x5
+    x7 = k_f1**5*x0
+    x8 = -1.0*k_f2**5*x7
+    x9 = x8 + 1
+    x10 = k_f1**2*k_f2
+    x11 = k_f1**3
+    x12 = k_f2**2
+    x13 = 1.0*x1*x2/x5**2
+    x14 = x11/Lambda_b**6
+    x15 = 1.0*k_f2**3*x14 + x8
+    return -5.0*k_f1**7*k_f2**6*x0*x6 + x10*x13*x15 + 2.0*x10*x6*x9 + x11*x12*x13*x9 + x15*x3*x6 + x4*x6*(-5.0*k_f2**4*x7 + 3.0*x12*x14)
+
+
+def _kernel_scale_245(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-10.0)
+    x5 = k_f1**5*k_f2**5*x4
+    x6 = k_f2**2*x0
+    x7 = x6/Lambda_b**6
+    x8 = x6/Lambda_b**4
+    x9 = 6.0 - 10.0*x8
+    x10 = 1 - 1.0*x5
+    x11 = k_f1**3*k_f2**3*x3/Lambda_b**8
+    x12 = x2**(-2.0)
+    x13 = 2.0 - 2.0*x8
+    return x0*x3*y_ref**2*(k_f1**4*k_f2**4*x12*x13*x4 + 4.0*x1*x10*x3 + 2.0*x10*x12*x8 + x11*x13 + x11*x9 - 42.0*x5 + x7*x9 + 1.0*x7*(6.0 - 20.0*x8) + 2.0 - 10.0*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_246(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-10.0)
+    x1 = y_ref**2
+    x2 = Lambda_b**(-2.0)
+    x3 = 1.0*k_f2
+    x4 = k_f1*x3
+    x5 = -x2*x4 + 1
+    x6 = x1/x5
+    x7 = k_f2**5*x0
+    x8 = -1.0*k_f1**5*x7
+    x9 = x8 + 1
+    x10 = k_f1*k_f2**2
+    x11 = k_f2**3
+    x12 = k_f1**2
+    x13 = 1.0*x1*x2/x5**2
+    x14 = x11/Lambda_b**6
+    x15 = 1.0*k_f1**3*x14 + x8
+    return -5.0*k_f1**6*k_f2**7*x0*x6 + x10*x13*x15 + 2.0*x10*x6*x9 + x11*x12*x13*x9 + x15*x3*x6 + x4*x6*(-5.0*k_f1**4*x7 + 3.0*x12*x14)
+
+
+def _kernel_scale_247(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-10.0)
+    x5 = k_f1**5*k_f2**5*x4
+    x6 = k_f1**2*k_f2**2
+    x7 = x6/Lambda_b**6
+    x8 = x6/Lambda_b**4
+    x9 = 6.0 - 10.0*x8
+    x10 = 1.0*x7
+    x11 = 1 - x8
+    x12 = 1 - 1.0*x5
+    x13 = k_f1**3*k_f2**3*x3/Lambda_b**8
+    x14 = 2.0/x2**2
+    return x0*x3*y_ref**2*(k_f1**4*k_f2**4*x11*x14*x4 + 5.0*x1*x12*x3 + x10*x11 + x10*(9.0 - 25.0*x8) + 3.0*x11*x13 + x12*x14*x8 + x13*x9 - 49.0*x5 + x7*x9 + 4.0 - 10.0*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_248(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-10.0)
+    x4 = k_f1**5*k_f2**5
+    x5 = x3*x4
+    x6 = x1**(-2.0)
+    x7 = Lambda_b**(-12.0)
+    x8 = k_f1**2*k_f2**2
+    x9 = x8/Lambda_b**4
+    x10 = 3.0 - 5.0*x9
+    x11 = Lambda_b**(-6.0)
+    x12 = x11*x8
+    x13 = 2.0*x12
+    x14 = 6.0 - 20.0*x9
+    x15 = 9.0 - 25.0*x9
+    x16 = 1 - 1.0*x5
+    x17 = k_f1**4*k_f2**4*x3*x6
+    x18 = k_f1**3*k_f2**3
+    x19 = x18*x2/Lambda_b**8
+    x20 = 6.0/x1**3
+    x21 = 1 - x9
+    return k_f1*x2*y_ref**2*(-140.0*k_f1**6*k_f2**6*x2*x7 + 14.0*x0*x16*x2 + x10*x13 + 6.0*x10*x17 + 8.0*x10*x19 + x11*x16*x18*x20 + x12*x14 + 1.0*x12*(18.0 - 100.0*x9) + x13*x15 + x14*x19 + 2.0*x15*x19 + 16.0*x16*x6*x9 + 10.0*x17*x21 + 4.0*x19*x21 + x20*x21*x4*x7 - 294.0*x5 + 4.0 - 30.0*k_f1**7*k_f2**7*x6/Lambda_b**14)
+
+
+def _kernel_scale_249(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-10.0)
+    x5 = k_f1**5*k_f2**5*x4
+    x6 = k_f1**2*x0
+    x7 = x6/Lambda_b**6
+    x8 = x6/Lambda_b**4
+    x9 = 6.0 - 10.0*x8
+    x10 = 1 - 1.0*x5
+    x11 = k_f1**3*k_f2**3*x3/Lambda_b**8
+    x12 = x2**(-2.0)
+    x13 = 2.0 - 2.0*x8
+    return x0*x3*y_ref**2*(k_f1**4*k_f2**4*x12*x13*x4 + 4.0*x1*x10*x3 + 2.0*x10*x12*x8 + x11*x13 + x11*x9 - 42.0*x5 + x7*x9 + 1.0*x7*(6.0 - 20.0*x8) + 2.0 - 10.0*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_250(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-10.0)
+    x4 = k_f1**5*k_f2**5
+    x5 = x3*x4
+    x6 = x1**(-2.0)
+    x7 = Lambda_b**(-12.0)
+    x8 = k_f1**2*k_f2**2
+    x9 = x8/Lambda_b**4
+    x10 = 3.0 - 5.0*x9
+    x11 = Lambda_b**(-6.0)
+    x12 = x11*x8
+    x13 = 2.0*x12
+    x14 = 6.0 - 20.0*x9
+    x15 = 9.0 - 25.0*x9
+    x16 = 1 - 1.0*x5
+    x17 = k_f1**4*k_f2**4*x3*x6
+    x18 = k_f1**3*k_f2**3
+    x19 = x18*x2/Lambda_b**8
+    x20 = 6.0/x1**3
+    x21 = 1 - x9
+    return k_f2*x2*y_ref**2*(-140.0*k_f1**6*k_f2**6*x2*x7 + 14.0*x0*x16*x2 + x10*x13 + 6.0*x10*x17 + 8.0*x10*x19 + x11*x16*x18*x20 + x12*x14 + 1.0*x12*(18.0 - 100.0*x9) + x13*x15 + x14*x19 + 2.0*x15*x19 + 16.0*x16*x6*x9 + 10.0*x17*x21 + 4.0*x19*x21 + x20*x21*x4*x7 - 294.0*x5 + 4.0 - 30.0*k_f1**7*k_f2**7*x6/Lambda_b**14)
+
+
+def _kernel_scale_251(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-10.0)
+    x4 = k_f1**5*k_f2**5
+    x5 = x3*x4
+    x6 = x1**(-3.0)
+    x7 = Lambda_b**(-14.0)
+    x8 = x1**(-2.0)
+    x9 = Lambda_b**(-12.0)
+    x10 = k_f1**6*k_f2**6
+    x11 = k_f1**2*k_f2**2
+    x12 = x11/Lambda_b**4
+    x13 = 9.0 - 25.0*x12
+    x14 = Lambda_b**(-6.0)
+    x15 = x11*x14
+    x16 = 4.0*x15
+    x17 = 18.0 - 100.0*x12
+    x18 = 1 - 1.0*x5
+    x19 = 3.0 - 5.0*x12
+    x20 = x4*x6*x9
+    x21 = k_f1**4*k_f2**4
+    x22 = x21*x3*x8
+    x23 = 24.0 - 80.0*x12
+    x24 = Lambda_b**(-8.0)
+    x25 = k_f1**3*k_f2**3
+    x26 = x2*x24*x25
+    x27 = 4.0*x26
+    x28 = 24.0/x1**4
+    x29 = 1 - x12
+    return x2*y_ref**2*(-600.0*k_f1**7*k_f2**7*x7*x8 + 32.0*x0*x18*x2 - 1340.0*x10*x2*x9 + x10*x28*x29*x7 + 76.0*x12*x18*x8 + x13*x16 + 8.0*x13*x22 + 12.0*x13*x26 + 72.0*x14*x18*x25*x6 + 1.0*x15*(36.0 - 400.0*x12) + x16*x17 + x17*x27 + x18*x21*x24*x28 + 24.0*x19*x20 + 40.0*x19*x22 + 16.0*x19*x26 + 48.0*x20*x29 + x22*x23 + 28.0*x22*x29 + x23*x26 + x27*x29 - 1764.0*x5 + 4.0 - 120.0*k_f1**8*k_f2**8*x6/Lambda_b**16)
+
+
+def _kernel_scale_252(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = -0.314980262473718*k_f1**5*k_f2**5/Lambda_b**10
+    x1 = 0.7937005259841*k_f1*k_f2
+    x2 = y_ref**2/(1 - x1/Lambda_b**2)
+    return 0.629960524947436*k_f1**2*k_f2**2*x2*(x0 + 1) + x1*x2*(x0 + 0.5*k_f1**3*k_f2**3/Lambda_b**6)
+
+
+def _kernel_scale_253(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-10.0)
+    x1 = y_ref**2
+    x2 = 0.7937005259841*k_f1
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f2*x3
+    x5 = -x2*x4 + 1
+    x6 = x1/x5
+    x7 = k_f1**2
+    x8 = k_f1**5*x0
+    x9 = -0.314980262473718*k_f2**5*x8
+    x10 = x9 + 1
+    x11 = k_f1**3
+    x12 = k_f2**2
+    x13 = x1/x5**2
+    x14 = x11/Lambda_b**6
+    x15 = 0.5*k_f2**3*x14 + x9
+    x16 = x2*x6
+    return -0.992125657480124*k_f1**7*k_f2**6*x0*x6 + 1.25992104989487*k_f2*x10*x6*x7 + k_f2*x16*(-1.57490131236859*k_f2**4*x8 + 1.5*x12*x14) + 0.5*x10*x11*x12*x13*x3 + 0.629960524947436*x13*x15*x4*x7 + x15*x16
+
+
+def _kernel_scale_254(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-10.0)
+    x5 = k_f1**5*k_f2**5*x4
+    x6 = k_f2**2*x0
+    x7 = x6/Lambda_b**4
+    x8 = 1.5 - 1.57490131236859*x7
+    x9 = x6/Lambda_b**6
+    x10 = 1 - 0.314980262473718*x5
+    x11 = x2**(-2.0)
+    x12 = 0.5 - 0.314980262473718*x7
+    x13 = 1.25992104989487*k_f1**3*k_f2**3*x3/Lambda_b**8
+    return x0*x3*y_ref**2*(1.0*k_f1**4*k_f2**4*x11*x12*x4 + 2.0*x1*x10*x3 + 0.793700525984099*x10*x11*x7 + x12*x13 + x13*x8 - 8.33385552283304*x5 + 1.5874010519682*x8*x9 + 0.7937005259841*x9*(3.0 - 6.29960524947436*x7) + 1.25992104989487 - 1.57490131236859*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_255(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-10.0)
+    x1 = y_ref**2
+    x2 = 0.7937005259841*k_f2
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f1*x3
+    x5 = -x2*x4 + 1
+    x6 = x1/x5
+    x7 = k_f2**2
+    x8 = k_f2**5*x0
+    x9 = -0.314980262473718*k_f1**5*x8
+    x10 = x9 + 1
+    x11 = k_f2**3
+    x12 = k_f1**2
+    x13 = x1/x5**2
+    x14 = x11/Lambda_b**6
+    x15 = 0.5*k_f1**3*x14 + x9
+    x16 = x2*x6
+    return -0.992125657480124*k_f1**6*k_f2**7*x0*x6 + 1.25992104989487*k_f1*x10*x6*x7 + k_f1*x16*(-1.57490131236859*k_f1**4*x8 + 1.5*x12*x14) + 0.5*x10*x11*x12*x13*x3 + 0.629960524947436*x13*x15*x4*x7 + x15*x16
+
+
+def _kernel_scale_256(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-10.0)
+    x5 = k_f1**5*k_f2**5*x4
+    x6 = k_f1**2*k_f2**2
+    x7 = x6/Lambda_b**4
+    x8 = 0.5 - 0.314980262473718*x7
+    x9 = x6/Lambda_b**6
+    x10 = 0.7937005259841*x9
+    x11 = 1.5 - 1.57490131236859*x7
+    x12 = 1 - 0.314980262473718*x5
+    x13 = x2**(-2.0)
+    x14 = k_f1**3*k_f2**3*x3/Lambda_b**8
+    return x0*x3*y_ref**2*(1.0*k_f1**4*k_f2**4*x13*x4*x8 + 2.5*x1*x12*x3 + x10*x8 + x10*(4.5 - 7.87450656184295*x7) + 1.25992104989487*x11*x14 + 1.5874010519682*x11*x9 + 0.793700525984099*x12*x13*x7 + 1.88988157484231*x14*x8 - 9.72283144330522*x5 + 2.51984209978975 - 1.57490131236859*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_257(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-10.0)
+    x4 = k_f1**5*k_f2**5
+    x5 = x3*x4
+    x6 = x1**(-2.0)
+    x7 = Lambda_b**(-12.0)
+    x8 = k_f1**2*k_f2**2
+    x9 = x8/Lambda_b**4
+    x10 = 1.5 - 1.57490131236859*x9
+    x11 = Lambda_b**(-6.0)
+    x12 = x11*x8
+    x13 = 1.5874010519682*x12
+    x14 = 3.0 - 6.29960524947436*x9
+    x15 = 0.7937005259841*x12
+    x16 = 4.5 - 7.87450656184295*x9
+    x17 = 1 - 0.314980262473718*x5
+    x18 = x1**(-3.0)
+    x19 = 0.5 - 0.314980262473718*x9
+    x20 = k_f1**4*k_f2**4*x3*x6
+    x21 = k_f1**3*k_f2**3
+    x22 = x2*x21/Lambda_b**8
+    return k_f1*x2*y_ref**2*(-22.0486183731603*k_f1**6*k_f2**6*x2*x7 + 7.0*x0*x17*x2 + x10*x13 + 3.0*x10*x20 + 5.03968419957949*x10*x22 + 1.88988157484231*x11*x17*x18*x21 + x13*x16 + x14*x15 + 0.629960524947436*x14*x22 + x15*(9.0 - 31.4980262473718*x9) + 1.25992104989487*x16*x22 + 6.3496042078728*x17*x6*x9 + 2.3811015779523*x18*x19*x4*x7 + 5.0*x19*x20 + 2.51984209978975*x19*x22 - 58.3369886598313*x5 + 2.51984209978975 - 3.75*k_f1**7*k_f2**7*x6/Lambda_b**14)
+
+
+def _kernel_scale_258(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-10.0)
+    x5 = k_f1**5*k_f2**5*x4
+    x6 = k_f1**2*x0
+    x7 = x6/Lambda_b**4
+    x8 = 1.5 - 1.57490131236859*x7
+    x9 = x6/Lambda_b**6
+    x10 = 1 - 0.314980262473718*x5
+    x11 = x2**(-2.0)
+    x12 = 0.5 - 0.314980262473718*x7
+    x13 = 1.25992104989487*k_f1**3*k_f2**3*x3/Lambda_b**8
+    return x0*x3*y_ref**2*(1.0*k_f1**4*k_f2**4*x11*x12*x4 + 2.0*x1*x10*x3 + 0.793700525984099*x10*x11*x7 + x12*x13 + x13*x8 - 8.33385552283304*x5 + 1.5874010519682*x8*x9 + 0.7937005259841*x9*(3.0 - 6.29960524947436*x7) + 1.25992104989487 - 1.57490131236859*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_259(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-10.0)
+    x4 = k_f1**5*k_f2**5
+    x5 = x3*x4
+    x6 = x1**(-2.0)
+    x7 = Lambda_b**(-12.0)
+    x8 = k_f1**2*k_f2**2
+    x9 = x8/Lambda_b**4
+    x10 = 1.5 - 1.57490131236859*x9
+    x11 = Lambda_b**(-6.0)
+    x12 = x11*x8
+    x13 = 1.5874010519682*x12
+    x14 = 3.0 - 6.29960524947436*x9
+    x15 = 0.7937005259841*x12
+    x16 = 4.5 - 7.87450656184295*x9
+    x17 = 1 - 0.314980262473718*x5
+    x18 = x1**(-3.0)
+    x19 = 0.5 - 0.314980262473718*x9
+    x20 = k_f1**4*k_f2**4*x3*x6
+    x21 = k_f1**3*k_f2**3
+    x22 = x2*x21/Lambda_b**8
+    return k_f2*x2*y_ref**2*(-22.0486183731603*k_f1**6*k_f2**6*x2*x7 + 7.0*x0*x17*x2 + x10*x13 + 3.0*x10*x20 + 5.03968419957949*x10*x22 + 1.88988157484231*x11*x17*x18*x21 + x13*x16 + x14*x15 + 0.629960524947436*x14*x22 + x15*(9.0 - 31.4980262473718*x9) + 1.25992104989487*x16*x22 + 6.3496042078728*x17*x6*x9 + 2.3811015779523*x18*x19*x4*x7 + 5.0*x19*x20 + 2.51984209978975*x19*x22 - 58.3369886598313*x5 + 2.51984209978975 - 3.75*k_f1**7*k_f2**7*x6/Lambda_b**14)
+
+
+def _kernel_scale_260(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-10.0)
+    x4 = k_f1**5*k_f2**5
+    x5 = x3*x4
+    x6 = x1**(-3.0)
+    x7 = Lambda_b**(-14.0)
+    x8 = x1**(-2.0)
+    x9 = Lambda_b**(-12.0)
+    x10 = k_f1**6*k_f2**6
+    x11 = k_f1**2*k_f2**2
+    x12 = x11/Lambda_b**4
+    x13 = 4.5 - 7.87450656184295*x12
+    x14 = Lambda_b**(-6.0)
+    x15 = x11*x14
+    x16 = 3.1748021039364*x15
+    x17 = 9.0 - 31.4980262473718*x12
+    x18 = 1 - 0.314980262473718*x5
+    x19 = 0.5 - 0.314980262473718*x12
+    x20 = x1**(-4.0)
+    x21 = x4*x6*x9
+    x22 = 1.5 - 1.57490131236859*x12
+    x23 = k_f1**4*k_f2**4
+    x24 = x23*x3*x8
+    x25 = 3.0 - 6.29960524947436*x12
+    x26 = Lambda_b**(-8.0)
+    x27 = k_f1**3*k_f2**3
+    x28 = x2*x26*x27
+    x29 = 2.51984209978975*x28
+    return x2*y_ref**2*(-74.9999999999999*k_f1**7*k_f2**7*x7*x8 + 16.0*x0*x18*x2 + 7.55952629936924*x10*x19*x20*x7 - 211.036775857391*x10*x2*x9 + 30.1606199873958*x12*x18*x8 + x13*x16 + 4.0*x13*x24 + 7.55952629936924*x13*x28 + 22.6785788981077*x14*x18*x27*x6 + 0.7937005259841*x15*(18.0 - 125.992104989487*x12) + x16*x17 + x17*x29 + 6.0*x18*x20*x23*x26 + 19.0488126236184*x19*x21 + 14.0*x19*x24 + x19*x29 + 9.52440631180919*x21*x22 + 20.0*x22*x24 + 10.079368399159*x22*x28 + 2.0*x24*x25 + x25*x29 - 350.021931958988*x5 + 2.51984209978975 - 11.9055078897615*k_f1**8*k_f2**8*x6/Lambda_b**16)
+
+
+def _kernel_scale_261(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = -0.314980262473718*k_f1**5*k_f2**5/Lambda_b**10
+    x1 = 0.7937005259841*k_f1*k_f2
+    x2 = y_ref**2/(1 - x1/Lambda_b**2)
+    return 0.629960524947436*k_f1**2*k_f2**2*x2*(x0 + 1) + x1*x2*(x0 + 0.5*k_f1**3*k_f2**3/Lambda_b**6)
+
+
+def _kernel_scale_262(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-10.0)
+    x1 = y_ref**2
+    x2 = 0.7937005259841*k_f1
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f2*x3
+    x5 = -x2*x4 + 1
+    x6 = x1/x5
+    x7 = k_f1**2
+    x8 = k_f1**5*x0
+    x9 = -0.314980262473718*k_f2**5*x8
+    x10 = x9 + 1
+    x11 = k_f1**3
+    x12 = k_f2**2
+    x13 = x1/x5**2
+    x14 = x11/Lambda_b**6
+    x15 = 0.5*k_f2**3*x14 + x9
+    x16 = x2*x6
+    return -0.992125657480124*k_f1**7*k_f2**6*x0*x6 + 1.25992104989487*k_f2*x10*x6*x7 + k_f2*x16*(-1.57490131236859*k_f2**4*x8 + 1.5*x12*x14) + 0.5*x10*x11*x12*x13*x3 + 0.629960524947436*x13*x15*x4*x7 + x15*x16
+
+
+def _kernel_scale_263(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-10.0)
+    x5 = k_f1**5*k_f2**5*x4
+    x6 = k_f2**2*x0
+    x7 = x6/Lambda_b**4
+    x8 = 1.5 - 1.57490131236859*x7
+    x9 = x6/Lambda_b**6
+    x10 = 1 - 0.314980262473718*x5
+    x11 = x2**(-2.0)
+    x12 = 0.5 - 0.314980262473718*x7
+    x13 = 1.25992104989487*k_f1**3*k_f2**3*x3/Lambda_b**8
+    return x0*x3*y_ref**2*(1.0*k_f1**4*k_f2**4*x11*x12*x4 + 2.0*x1*x10*x3 + 0.793700525984099*x10*x11*x7 + x12*x13 + x13*x8 - 8.33385552283304*x5 + 1.5874010519682*x8*x9 + 0.7937005259841*x9*(3.0 - 6.29960524947436*x7) + 1.25992104989487 - 1.57490131236859*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_264(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-10.0)
+    x1 = y_ref**2
+    x2 = 0.7937005259841*k_f2
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f1*x3
+    x5 = -x2*x4 + 1
+    x6 = x1/x5
+    x7 = k_f2**2
+    x8 = k_f2**5*x0
+    x9 = -0.314980262473718*k_f1**5*x8
+    x10 = x9 + 1
+    x11 = k_f2**3
+    x12 = k_f1**2
+    x13 = x1/x5**2
+    x14 = x11/Lambda_b**6
+    x15 = 0.5*k_f1**3*x14 + x9
+    x16 = x2*x6
+    return -0.992125657480124*k_f1**6*k_f2**7*x0*x6 + 1.25992104989487*k_f1*x10*x6*x7 + k_f1*x16*(-1.57490131236859*k_f1**4*x8 + 1.5*x12*x14) + 0.5*x10*x11*x12*x13*x3 + 0.629960524947436*x13*x15*x4*x7 + x15*x16
+
+
+def _kernel_scale_265(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-10.0)
+    x5 = k_f1**5*k_f2**5*x4
+    x6 = k_f1**2*k_f2**2
+    x7 = x6/Lambda_b**4
+    x8 = 0.5 - 0.314980262473718*x7
+    x9 = x6/Lambda_b**6
+    x10 = 0.7937005259841*x9
+    x11 = 1.5 - 1.57490131236859*x7
+    x12 = 1 - 0.314980262473718*x5
+    x13 = x2**(-2.0)
+    x14 = k_f1**3*k_f2**3*x3/Lambda_b**8
+    return x0*x3*y_ref**2*(1.0*k_f1**4*k_f2**4*x13*x4*x8 + 2.5*x1*x12*x3 + x10*x8 + x10*(4.5 - 7.87450656184295*x7) + 1.25992104989487*x11*x14 + 1.5874010519682*x11*x9 + 0.793700525984099*x12*x13*x7 + 1.88988157484231*x14*x8 - 9.72283144330522*x5 + 2.51984209978975 - 1.57490131236859*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_266(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-10.0)
+    x4 = k_f1**5*k_f2**5
+    x5 = x3*x4
+    x6 = x1**(-2.0)
+    x7 = Lambda_b**(-12.0)
+    x8 = k_f1**2*k_f2**2
+    x9 = x8/Lambda_b**4
+    x10 = 1.5 - 1.57490131236859*x9
+    x11 = Lambda_b**(-6.0)
+    x12 = x11*x8
+    x13 = 1.5874010519682*x12
+    x14 = 3.0 - 6.29960524947436*x9
+    x15 = 0.7937005259841*x12
+    x16 = 4.5 - 7.87450656184295*x9
+    x17 = 1 - 0.314980262473718*x5
+    x18 = x1**(-3.0)
+    x19 = 0.5 - 0.314980262473718*x9
+    x20 = k_f1**4*k_f2**4*x3*x6
+    x21 = k_f1**3*k_f2**3
+    x22 = x2*x21/Lambda_b**8
+    return k_f1*x2*y_ref**2*(-22.0486183731603*k_f1**6*k_f2**6*x2*x7 + 7.0*x0*x17*x2 + x10*x13 + 3.0*x10*x20 + 5.03968419957949*x10*x22 + 1.88988157484231*x11*x17*x18*x21 + x13*x16 + x14*x15 + 0.629960524947436*x14*x22 + x15*(9.0 - 31.4980262473718*x9) + 1.25992104989487*x16*x22 + 6.3496042078728*x17*x6*x9 + 2.3811015779523*x18*x19*x4*x7 + 5.0*x19*x20 + 2.51984209978975*x19*x22 - 58.3369886598313*x5 + 2.51984209978975 - 3.75*k_f1**7*k_f2**7*x6/Lambda_b**14)
+
+
+def _kernel_scale_267(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = Lambda_b**(-10.0)
+    x5 = k_f1**5*k_f2**5*x4
+    x6 = k_f1**2*x0
+    x7 = x6/Lambda_b**4
+    x8 = 1.5 - 1.57490131236859*x7
+    x9 = x6/Lambda_b**6
+    x10 = 1 - 0.314980262473718*x5
+    x11 = x2**(-2.0)
+    x12 = 0.5 - 0.314980262473718*x7
+    x13 = 1.25992104989487*k_f1**3*k_f2**3*x3/Lambda_b**8
+    return x0*x3*y_ref**2*(1.0*k_f1**4*k_f2**4*x11*x12*x4 + 2.0*x1*x10*x3 + 0.793700525984099*x10*x11*x7 + x12*x13 + x13*x8 - 8.33385552283304*x5 + 1.5874010519682*x8*x9 + 0.7937005259841*x9*(3.0 - 6.29960524947436*x7) + 1.25992104989487 - 1.57490131236859*k_f1**6*k_f2**6*x3/Lambda_b**12)
+
+
+def _kernel_scale_268(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-10.0)
+    x4 = k_f1**5*k_f2**5
+    x5 = x3*x4
+    x6 = x1**(-2.0)
+    x7 = Lambda_b**(-12.0)
+    x8 = k_f1**2*k_f2**2
+    x9 = x8/Lambda_b**4
+    x10 = 1.5 - 1.57490131236859*x9
+    x11 = Lambda_b**(-6.0)
+    x12 = x11*x8
+    x13 = 1.5874010519682*x12
+    x14 = 3.0 - 6.29960524947436*x9
+    x15 = 0.7937005259841*x12
+    x16 = 4.5 - 7.87450656184295*x9
+    x17 = 1 - 0.314980262473718*x5
+    x18 = x1**(-3.0)
+    x19 = 0.5 - 0.314980262473718*x9
+    x20 = k_f1**4*k_f2**4*x3*x6
+    x21 = k_f1**3*k_f2**3
+    x22 = x2*x21/Lambda_b**8
+    return k_f2*x2*y_ref**2*(-22.0486183731603*k_f1**6*k_f2**6*x2*x7 + 7.0*x0*x17*x2 + x10*x13 + 3.0*x10*x20 + 5.03968419957949*x10*x22 + 1.88988157484231*x11*x17*x18*x21 + x13*x16 + x14*x15 + 0.629960524947436*x14*x22 + x15*(9.0 - 31.4980262473718*x9) + 1.25992104989487*x16*x22 + 6.3496042078728*x17*x6*x9 + 2.3811015779523*x18*x19*x4*x7 + 5.0*x19*x20 + 2.51984209978975*x19*x22 - 58.3369886598313*x5 + 2.51984209978975 - 3.75*k_f1**7*k_f2**7*x6/Lambda_b**14)
+
+
+def _kernel_scale_269(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-10.0)
+    x4 = k_f1**5*k_f2**5
+    x5 = x3*x4
+    x6 = x1**(-3.0)
+    x7 = Lambda_b**(-14.0)
+    x8 = x1**(-2.0)
+    x9 = Lambda_b**(-12.0)
+    x10 = k_f1**6*k_f2**6
+    x11 = k_f1**2*k_f2**2
+    x12 = x11/Lambda_b**4
+    x13 = 4.5 - 7.87450656184295*x12
+    x14 = Lambda_b**(-6.0)
+    x15 = x11*x14
+    x16 = 3.1748021039364*x15
+    x17 = 9.0 - 31.4980262473718*x12
+    x18 = 1 - 0.314980262473718*x5
+    x19 = 0.5 - 0.314980262473718*x12
+    x20 = x1**(-4.0)
+    x21 = x4*x6*x9
+    x22 = 1.5 - 1.57490131236859*x12
+    x23 = k_f1**4*k_f2**4
+    x24 = x23*x3*x8
+    x25 = 3.0 - 6.29960524947436*x12
+    x26 = Lambda_b**(-8.0)
+    x27 = k_f1**3*k_f2**3
+    x28 = x2*x26*x27
+    x29 = 2.51984209978975*x28
+    return x2*y_ref**2*(-74.9999999999999*k_f1**7*k_f2**7*x7*x8 + 16.0*x0*x18*x2 + 7.55952629936924*x10*x19*x20*x7 - 211.036775857391*x10*x2*x9 + 30.1606199873958*x12*x18*x8 + x13*x16 + 4.0*x13*x24 + 7.55952629936924*x13*x28 + 22.6785788981077*x14*x18*x27*x6 + 0.7937005259841*x15*(18.0 - 125.992104989487*x12) + x16*x17 + x17*x29 + 6.0*x18*x20*x23*x26 + 19.0488126236184*x19*x21 + 14.0*x19*x24 + x19*x29 + 9.52440631180919*x21*x22 + 20.0*x22*x24 + 10.079368399159*x22*x28 + 2.0*x24*x25 + x25*x29 - 350.021931958988*x5 + 2.51984209978975 - 11.9055078897615*k_f1**8*k_f2**8*x6/Lambda_b**16)
+
+
+def _kernel_scale_270(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.0*k_f1**4*k_f2**4*y_ref**2/(Lambda_b**4*(1 - 1.0*k_f1*k_f2/Lambda_b**2))
+
+
+def _kernel_scale_271(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 1.0*k_f1*k_f2/Lambda_b**2
+    return 4.0*k_f1**4*k_f2**3*x0/(Lambda_b**4*x1) + 1.0*k_f1**5*k_f2**4*x0/(Lambda_b**6*x1**2)
+
+
+def _kernel_scale_272(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f2**2/Lambda_b**4
+    return k_f1**4*x2*x3*y_ref**2*(2.0*k_f1**2*x3/x1**2 + 8.0*x0*x2 + 12.0)
+
+
+def _kernel_scale_273(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 1.0*k_f1*k_f2/Lambda_b**2
+    return 4.0*k_f1**3*k_f2**4*x0/(Lambda_b**4*x1) + 1.0*k_f1**4*k_f2**5*x0/(Lambda_b**6*x1**2)
+
+
+def _kernel_scale_274(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    return k_f1**3*k_f2**3*x0*x3*y_ref**2*(2.0*k_f1**2*k_f2**2*x0/x2**2 + 9.0*x1*x3 + 16.0)
+
+
+def _kernel_scale_275(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**3
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f2**2/Lambda_b**4
+    return x0*x3*x4*y_ref**2*(28.0*k_f1**2*x4/x2**2 + 52.0*x1*x3 + 48.0 + 6.0*k_f2**3*x0/(Lambda_b**6*x2**3))
+
+
+def _kernel_scale_276(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2/Lambda_b**4
+    return k_f2**4*x2*x3*y_ref**2*(2.0*k_f2**2*x3/x1**2 + 8.0*x0*x2 + 12.0)
+
+
+def _kernel_scale_277(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**3
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2/Lambda_b**4
+    return x0*x3*x4*y_ref**2*(28.0*k_f2**2*x4/x2**2 + 52.0*x1*x3 + 48.0 + 6.0*k_f1**3*x0/(Lambda_b**6*x2**3))
+
+
+def _kernel_scale_278(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    return x2*x3*y_ref**2*(256.0*x0*x2 + 144.0 + 244.0*x3/x1**2 + 120.0*k_f1**3*k_f2**3/(Lambda_b**6*x1**3) + 24.0*k_f1**4*k_f2**4/(Lambda_b**8*x1**4))
+
+
+def _kernel_scale_279(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.39685026299205*k_f1**4*k_f2**4*y_ref**2/(Lambda_b**4*(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2))
+
+
+def _kernel_scale_280(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    return 1.5874010519682*k_f1**4*k_f2**3*x0/(Lambda_b**4*x1) + 0.314980262473718*k_f1**5*k_f2**4*x0/(Lambda_b**6*x1**2)
+
+
+def _kernel_scale_281(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f2**2/Lambda_b**4
+    return k_f1**4*x2*x3*y_ref**2*(0.5*k_f1**2*x3/x1**2 + 2.51984209978975*x0*x2 + 4.7622031559046)
+
+
+def _kernel_scale_282(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    return 1.5874010519682*k_f1**3*k_f2**4*x0/(Lambda_b**4*x1) + 0.314980262473718*k_f1**4*k_f2**5*x0/(Lambda_b**6*x1**2)
+
+
+def _kernel_scale_283(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    return k_f1**3*k_f2**3*x0*x3*y_ref**2*(0.5*k_f1**2*k_f2**2*x0/x2**2 + 2.83482236226346*x1*x3 + 6.3496042078728)
+
+
+def _kernel_scale_284(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3
+    x4 = k_f2**2/Lambda_b**4
+    return x2*x3*x4*y_ref**2*(7.0*k_f1**2*x4/x1**2 + 16.3789736486333*x0*x2 + 19.0488126236184 + 1.19055078897615*k_f2**3*x3/(Lambda_b**6*x1**3))
+
+
+def _kernel_scale_285(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2/Lambda_b**4
+    return k_f2**4*x2*x3*y_ref**2*(0.5*k_f2**2*x3/x1**2 + 2.51984209978975*x0*x2 + 4.7622031559046)
+
+
+def _kernel_scale_286(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**3
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2/Lambda_b**4
+    return x0*x3*x4*y_ref**2*(7.0*k_f2**2*x4/x2**2 + 16.3789736486333*x1*x3 + 19.0488126236184 + 1.19055078897615*k_f1**3*x0/(Lambda_b**6*x2**3))
+
+
+def _kernel_scale_287(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    return x2*x3*y_ref**2*(80.6349471932719*x0*x2 + 57.1464378708552 + 61.0*x3/x1**2 + 23.811015779523*k_f1**3*k_f2**3/(Lambda_b**6*x1**3) + 3.77976314968462*k_f1**4*k_f2**4/(Lambda_b**8*x1**4))
+
+
+def _kernel_scale_288(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.39685026299205*k_f1**4*k_f2**4*y_ref**2/(Lambda_b**4*(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2))
+
+
+def _kernel_scale_289(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    return 1.5874010519682*k_f1**4*k_f2**3*x0/(Lambda_b**4*x1) + 0.314980262473718*k_f1**5*k_f2**4*x0/(Lambda_b**6*x1**2)
+
+
+def _kernel_scale_290(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f2**2/Lambda_b**4
+    return k_f1**4*x2*x3*y_ref**2*(0.5*k_f1**2*x3/x1**2 + 2.51984209978975*x0*x2 + 4.7622031559046)
+
+
+def _kernel_scale_291(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    return 1.5874010519682*k_f1**3*k_f2**4*x0/(Lambda_b**4*x1) + 0.314980262473718*k_f1**4*k_f2**5*x0/(Lambda_b**6*x1**2)
+
+
+def _kernel_scale_292(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    return k_f1**3*k_f2**3*x0*x3*y_ref**2*(0.5*k_f1**2*k_f2**2*x0/x2**2 + 2.83482236226346*x1*x3 + 6.3496042078728)
+
+
+def _kernel_scale_293(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3
+    x4 = k_f2**2/Lambda_b**4
+    return x2*x3*x4*y_ref**2*(7.0*k_f1**2*x4/x1**2 + 16.3789736486333*x0*x2 + 19.0488126236184 + 1.19055078897615*k_f2**3*x3/(Lambda_b**6*x1**3))
+
+
+def _kernel_scale_294(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2/Lambda_b**4
+    return k_f2**4*x2*x3*y_ref**2*(0.5*k_f2**2*x3/x1**2 + 2.51984209978975*x0*x2 + 4.7622031559046)
+
+
+def _kernel_scale_295(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**3
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2/Lambda_b**4
+    return x0*x3*x4*y_ref**2*(7.0*k_f2**2*x4/x2**2 + 16.3789736486333*x1*x3 + 19.0488126236184 + 1.19055078897615*k_f1**3*x0/(Lambda_b**6*x2**3))
+
+
+def _kernel_scale_296(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**2*k_f2**2/Lambda_b**4
+    return x2*x3*y_ref**2*(80.6349471932719*x0*x2 + 57.1464378708552 + 61.0*x3/x1**2 + 23.811015779523*k_f1**3*k_f2**3/(Lambda_b**6*x1**3) + 3.77976314968462*k_f1**4*k_f2**4/(Lambda_b**8*x1**4))
+
+
+def _kernel_scale_297(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = 1.0*k_f1**4*k_f2**4*y_ref**2/(1 - 1.0*k_f1*k_f2/Lambda_b**2)
+    return x0/Lambda_b**4 + x0/Lambda_b**6
+
+
+def _kernel_scale_298(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 1.0*k_f1*k_f2/Lambda_b**2
+    x2 = 1.0*k_f1**5*k_f2**4*x0/x1**2
+    x3 = Lambda_b**(-6.0)
+    x4 = 4.0*k_f1**4*k_f2**3*x0/x1
+    return x2*x3 + x3*x4 + x4/Lambda_b**4 + x2/Lambda_b**8
+
+
+def _kernel_scale_299(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = k_f2**2
+    x2 = Lambda_b**(-2.0)
+    x3 = k_f1*k_f2
+    x4 = x2*x3
+    x5 = 1 - 1.0*x4
+    x6 = x5**(-1.0)
+    x7 = 8.0*x6
+    x8 = 2.0*k_f1**2*x1/x5**2
+    return k_f1**4*x0*x1*x6*y_ref**2*(x0*x3*x7 + x0*x8 + 12.0*x2 + x4*x7 + 12.0 + x8/Lambda_b**6)
+
+
+def _kernel_scale_300(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 1.0*k_f1*k_f2/Lambda_b**2
+    x2 = 1.0*k_f1**4*k_f2**5*x0/x1**2
+    x3 = Lambda_b**(-6.0)
+    x4 = 4.0*k_f1**3*k_f2**4*x0/x1
+    return x2*x3 + x3*x4 + x4/Lambda_b**4 + x2/Lambda_b**8
+
+
+def _kernel_scale_301(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 1.0*x3
+    x5 = x4**(-1.0)
+    x6 = 9.0*x5
+    x7 = 2.0*k_f1**2*k_f2**2/x4**2
+    return k_f1**3*k_f2**3*x0*x5*y_ref**2*(x0*x2*x6 + x0*x7 + 16.0*x1 + x3*x6 + 16.0 + x7/Lambda_b**6)
+
+
+def _kernel_scale_302(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = k_f1**3
+    x2 = k_f2**2
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f1*k_f2
+    x5 = x3*x4
+    x6 = 1 - 1.0*x5
+    x7 = x6**(-1.0)
+    x8 = 52.0*x7
+    x9 = 6.0*k_f2**3*x1/x6**3
+    x10 = Lambda_b**(-6.0)
+    x11 = 28.0*k_f1**2*x2/x6**2
+    return x0*x1*x2*x7*y_ref**2*(x0*x11 + x0*x4*x8 + x10*x11 + x10*x9 + 48.0*x3 + x5*x8 + 48.0 + x9/Lambda_b**8)
+
+
+def _kernel_scale_303(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = k_f1**2
+    x2 = Lambda_b**(-2.0)
+    x3 = k_f1*k_f2
+    x4 = x2*x3
+    x5 = 1 - 1.0*x4
+    x6 = x5**(-1.0)
+    x7 = 8.0*x6
+    x8 = 2.0*k_f2**2*x1/x5**2
+    return k_f2**4*x0*x1*x6*y_ref**2*(x0*x3*x7 + x0*x8 + 12.0*x2 + x4*x7 + 12.0 + x8/Lambda_b**6)
+
+
+def _kernel_scale_304(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = k_f1**2
+    x2 = k_f2**3
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f1*k_f2
+    x5 = x3*x4
+    x6 = 1 - 1.0*x5
+    x7 = x6**(-1.0)
+    x8 = 52.0*x7
+    x9 = 6.0*k_f1**3*x2/x6**3
+    x10 = Lambda_b**(-6.0)
+    x11 = 28.0*k_f2**2*x1/x6**2
+    return x0*x1*x2*x7*y_ref**2*(x0*x11 + x0*x4*x8 + x10*x11 + x10*x9 + 48.0*x3 + x5*x8 + 48.0 + x9/Lambda_b**8)
+
+
+def _kernel_scale_305(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 1.0*x3
+    x5 = x4**(-1.0)
+    x6 = 256.0*x5
+    x7 = 24.0*k_f1**4*k_f2**4/x4**4
+    x8 = Lambda_b**(-8.0)
+    x9 = 120.0*k_f1**3*k_f2**3/x4**3
+    x10 = Lambda_b**(-6.0)
+    x11 = k_f1**2*k_f2**2
+    x12 = 244.0*x11/x4**2
+    return x0*x11*x5*y_ref**2*(x0*x12 + x0*x2*x6 + 144.0*x1 + x10*x12 + x10*x9 + x3*x6 + x7*x8 + x8*x9 + 144.0 + x7/Lambda_b**10)
+
+
+def _kernel_scale_306(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = 0.39685026299205*k_f1**4*k_f2**4*y_ref**2/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+    return x0/Lambda_b**4 + x0/Lambda_b**6
+
+
+def _kernel_scale_307(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    x2 = 0.314980262473718*k_f1**5*k_f2**4*x0/x1**2
+    x3 = Lambda_b**(-6.0)
+    x4 = 1.5874010519682*k_f1**4*k_f2**3*x0/x1
+    return x2*x3 + x3*x4 + x4/Lambda_b**4 + x2/Lambda_b**8
+
+
+def _kernel_scale_308(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = k_f2**2
+    x2 = Lambda_b**(-2.0)
+    x3 = k_f1*k_f2
+    x4 = x2*x3
+    x5 = 1 - 0.7937005259841*x4
+    x6 = x5**(-1.0)
+    x7 = 2.51984209978975*x6
+    x8 = 0.5*k_f1**2*x1/x5**2
+    return k_f1**4*x0*x1*x6*y_ref**2*(x0*x3*x7 + x0*x8 + 4.7622031559046*x2 + x4*x7 + 4.7622031559046 + x8/Lambda_b**6)
+
+
+def _kernel_scale_309(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    x2 = 0.314980262473718*k_f1**4*k_f2**5*x0/x1**2
+    x3 = Lambda_b**(-6.0)
+    x4 = 1.5874010519682*k_f1**3*k_f2**4*x0/x1
+    return x2*x3 + x3*x4 + x4/Lambda_b**4 + x2/Lambda_b**8
+
+
+def _kernel_scale_310(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = 2.83482236226346*x5
+    x7 = 0.5*k_f1**2*k_f2**2/x4**2
+    return k_f1**3*k_f2**3*x0*x5*y_ref**2*(x0*x2*x6 + x0*x7 + 6.3496042078728*x1 + x3*x6 + 6.3496042078728 + x7/Lambda_b**6)
+
+
+def _kernel_scale_311(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = k_f1**3
+    x2 = k_f2**2
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f1*k_f2
+    x5 = x3*x4
+    x6 = 1 - 0.7937005259841*x5
+    x7 = x6**(-1.0)
+    x8 = 16.3789736486333*x7
+    x9 = 1.19055078897615*k_f2**3*x1/x6**3
+    x10 = Lambda_b**(-6.0)
+    x11 = 7.0*k_f1**2*x2/x6**2
+    return x0*x1*x2*x7*y_ref**2*(x0*x11 + x0*x4*x8 + x10*x11 + x10*x9 + 19.0488126236184*x3 + x5*x8 + 19.0488126236184 + x9/Lambda_b**8)
+
+
+def _kernel_scale_312(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = k_f1**2
+    x2 = Lambda_b**(-2.0)
+    x3 = k_f1*k_f2
+    x4 = x2*x3
+    x5 = 1 - 0.7937005259841*x4
+    x6 = x5**(-1.0)
+    x7 = 2.51984209978975*x6
+    x8 = 0.5*k_f2**2*x1/x5**2
+    return k_f2**4*x0*x1*x6*y_ref**2*(x0*x3*x7 + x0*x8 + 4.7622031559046*x2 + x4*x7 + 4.7622031559046 + x8/Lambda_b**6)
+
+
+def _kernel_scale_313(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = k_f1**2
+    x2 = k_f2**3
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f1*k_f2
+    x5 = x3*x4
+    x6 = 1 - 0.7937005259841*x5
+    x7 = x6**(-1.0)
+    x8 = 16.3789736486333*x7
+    x9 = 1.19055078897615*k_f1**3*x2/x6**3
+    x10 = Lambda_b**(-6.0)
+    x11 = 7.0*k_f2**2*x1/x6**2
+    return x0*x1*x2*x7*y_ref**2*(x0*x11 + x0*x4*x8 + x10*x11 + x10*x9 + 19.0488126236184*x3 + x5*x8 + 19.0488126236184 + x9/Lambda_b**8)
+
+
+def _kernel_scale_314(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = 80.6349471932719*x5
+    x7 = 3.77976314968462*k_f1**4*k_f2**4/x4**4
+    x8 = Lambda_b**(-8.0)
+    x9 = 23.811015779523*k_f1**3*k_f2**3/x4**3
+    x10 = Lambda_b**(-6.0)
+    x11 = k_f1**2*k_f2**2
+    x12 = 61.0*x11/x4**2
+    return x0*x11*x5*y_ref**2*(x0*x12 + x0*x2*x6 + 57.1464378708552*x1 + x10*x12 + x10*x9 + x3*x6 + x7*x8 + x8*x9 + 57.1464378708552 + x7/Lambda_b**10)
+
+
+def _kernel_scale_315(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = 0.39685026299205*k_f1**4*k_f2**4*y_ref**2/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+    return x0/Lambda_b**4 + x0/Lambda_b**6
+
+
+def _kernel_scale_316(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    x2 = 0.314980262473718*k_f1**5*k_f2**4*x0/x1**2
+    x3 = Lambda_b**(-6.0)
+    x4 = 1.5874010519682*k_f1**4*k_f2**3*x0/x1
+    return x2*x3 + x3*x4 + x4/Lambda_b**4 + x2/Lambda_b**8
+
+
+def _kernel_scale_317(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = k_f2**2
+    x2 = Lambda_b**(-2.0)
+    x3 = k_f1*k_f2
+    x4 = x2*x3
+    x5 = 1 - 0.7937005259841*x4
+    x6 = x5**(-1.0)
+    x7 = 2.51984209978975*x6
+    x8 = 0.5*k_f1**2*x1/x5**2
+    return k_f1**4*x0*x1*x6*y_ref**2*(x0*x3*x7 + x0*x8 + 4.7622031559046*x2 + x4*x7 + 4.7622031559046 + x8/Lambda_b**6)
+
+
+def _kernel_scale_318(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    x2 = 0.314980262473718*k_f1**4*k_f2**5*x0/x1**2
+    x3 = Lambda_b**(-6.0)
+    x4 = 1.5874010519682*k_f1**3*k_f2**4*x0/x1
+    return x2*x3 + x3*x4 + x4/Lambda_b**4 + x2/Lambda_b**8
+
+
+def _kernel_scale_319(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = 2.83482236226346*x5
+    x7 = 0.5*k_f1**2*k_f2**2/x4**2
+    return k_f1**3*k_f2**3*x0*x5*y_ref**2*(x0*x2*x6 + x0*x7 + 6.3496042078728*x1 + x3*x6 + 6.3496042078728 + x7/Lambda_b**6)
+
+
+def _kernel_scale_320(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = k_f1**3
+    x2 = k_f2**2
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f1*k_f2
+    x5 = x3*x4
+    x6 = 1 - 0.7937005259841*x5
+    x7 = x6**(-1.0)
+    x8 = 16.3789736486333*x7
+    x9 = 1.19055078897615*k_f2**3*x1/x6**3
+    x10 = Lambda_b**(-6.0)
+    x11 = 7.0*k_f1**2*x2/x6**2
+    return x0*x1*x2*x7*y_ref**2*(x0*x11 + x0*x4*x8 + x10*x11 + x10*x9 + 19.0488126236184*x3 + x5*x8 + 19.0488126236184 + x9/Lambda_b**8)
+
+
+def _kernel_scale_321(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = k_f1**2
+    x2 = Lambda_b**(-2.0)
+    x3 = k_f1*k_f2
+    x4 = x2*x3
+    x5 = 1 - 0.7937005259841*x4
+    x6 = x5**(-1.0)
+    x7 = 2.51984209978975*x6
+    x8 = 0.5*k_f2**2*x1/x5**2
+    return k_f2**4*x0*x1*x6*y_ref**2*(x0*x3*x7 + x0*x8 + 4.7622031559046*x2 + x4*x7 + 4.7622031559046 + x8/Lambda_b**6)
+
+
+def _kernel_scale_322(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = k_f1**2
+    x2 = k_f2**3
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f1*k_f2
+    x5 = x3*x4
+    x6 = 1 - 0.7937005259841*x5
+    x7 = x6**(-1.0)
+    x8 = 16.3789736486333*x7
+    x9 = 1.19055078897615*k_f1**3*x2/x6**3
+    x10 = Lambda_b**(-6.0)
+    x11 = 7.0*k_f2**2*x1/x6**2
+    return x0*x1*x2*x7*y_ref**2*(x0*x11 + x0*x4*x8 + x10*x11 + x10*x9 + 19.0488126236184*x3 + x5*x8 + 19.0488126236184 + x9/Lambda_b**8)
+
+
+def _kernel_scale_323(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-4.0)
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = 80.6349471932719*x5
+    x7 = 3.77976314968462*k_f1**4*k_f2**4/x4**4
+    x8 = Lambda_b**(-8.0)
+    x9 = 23.811015779523*k_f1**3*k_f2**3/x4**3
+    x10 = Lambda_b**(-6.0)
+    x11 = k_f1**2*k_f2**2
+    x12 = 61.0*x11/x4**2
+    return x0*x11*x5*y_ref**2*(x0*x12 + x0*x2*x6 + 57.1464378708552*x1 + x10*x12 + x10*x9 + x3*x6 + x7*x8 + x8*x9 + 57.1464378708552 + x7/Lambda_b**10)
+
+
+def _kernel_scale_324(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.0*k_f1**5*k_f2**5*y_ref**2/(Lambda_b**6*(1 - 1.0*k_f1*k_f2/Lambda_b**2))
+
+
+def _kernel_scale_325(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 1.0*k_f1*k_f2/Lambda_b**2
+    return 5.0*k_f1**5*k_f2**4*x0/(Lambda_b**6*x1) + 1.0*k_f1**6*k_f2**5*x0/(Lambda_b**8*x1**2)
+
+
+def _kernel_scale_326(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**3*x2*y_ref**2*(10.0*x0*x2 + 20.0 + 2.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**6
+
+
+def _kernel_scale_327(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 1.0*k_f1*k_f2/Lambda_b**2
+    return 5.0*k_f1**4*k_f2**5*x0/(Lambda_b**6*x1) + 1.0*k_f1**5*k_f2**6*x0/(Lambda_b**8*x1**2)
+
+
+def _kernel_scale_328(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return k_f1**4*k_f2**4*x2*y_ref**2*(11.0*x0*x2 + 25.0 + 2.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**6
+
+
+def _kernel_scale_329(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f2**3/Lambda_b**6
+    return k_f1**4*x2*x3*y_ref**2*(6.0*k_f1**3*x3/x1**3 + 80.0*x0*x2 + 100.0 + 34.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))
+
+
+def _kernel_scale_330(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return k_f1**3*k_f2**5*x2*y_ref**2*(10.0*x0*x2 + 20.0 + 2.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**6
+
+
+def _kernel_scale_331(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3/Lambda_b**6
+    return k_f2**4*x2*x3*y_ref**2*(6.0*k_f2**3*x3/x1**3 + 80.0*x0*x2 + 100.0 + 34.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))
+
+
+def _kernel_scale_332(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    return x2*x3*y_ref**2*(500.0*x0*x2 + 400.0 + 144.0*x3/x1**3 + 364.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 24.0*k_f1**4*k_f2**4/(Lambda_b**8*x1**4))
+
+
+def _kernel_scale_333(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.314980262473718*k_f1**5*k_f2**5*y_ref**2/(Lambda_b**6*(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2))
+
+
+def _kernel_scale_334(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    return 1.57490131236859*k_f1**5*k_f2**4*x0/(Lambda_b**6*x1) + 0.25*k_f1**6*k_f2**5*x0/(Lambda_b**8*x1**2)
+
+
+def _kernel_scale_335(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**3*x2*y_ref**2*(2.5*x0*x2 + 6.29960524947436 + 0.39685026299205*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**6
+
+
+def _kernel_scale_336(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    return 1.57490131236859*k_f1**4*k_f2**5*x0/(Lambda_b**6*x1) + 0.25*k_f1**5*k_f2**6*x0/(Lambda_b**8*x1**2)
+
+
+def _kernel_scale_337(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**4*k_f2**4*x2*y_ref**2*(2.75*x0*x2 + 7.87450656184295 + 0.39685026299205*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**6
+
+
+def _kernel_scale_338(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f2**3/Lambda_b**6
+    return k_f1**4*x2*x3*y_ref**2*(0.944940787421154*k_f1**3*x3/x1**3 + 20.0*x0*x2 + 31.4980262473718 + 6.74645447086485*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))
+
+
+def _kernel_scale_339(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**3*k_f2**5*x2*y_ref**2*(2.5*x0*x2 + 6.29960524947436 + 0.39685026299205*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**6
+
+
+def _kernel_scale_340(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3/Lambda_b**6
+    return k_f2**4*x2*x3*y_ref**2*(0.944940787421154*k_f2**3*x3/x1**3 + 20.0*x0*x2 + 31.4980262473718 + 6.74645447086484*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))
+
+
+def _kernel_scale_341(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    return x2*x3*y_ref**2*(125.0*x0*x2 + 125.992104989487 + 22.6785788981077*x3/x1**3 + 72.226747864553*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 3.0*k_f1**4*k_f2**4/(Lambda_b**8*x1**4))
+
+
+def _kernel_scale_342(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.314980262473718*k_f1**5*k_f2**5*y_ref**2/(Lambda_b**6*(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2))
+
+
+def _kernel_scale_343(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    return 1.57490131236859*k_f1**5*k_f2**4*x0/(Lambda_b**6*x1) + 0.25*k_f1**6*k_f2**5*x0/(Lambda_b**8*x1**2)
+
+
+def _kernel_scale_344(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**3*x2*y_ref**2*(2.5*x0*x2 + 6.29960524947436 + 0.39685026299205*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**6
+
+
+def _kernel_scale_345(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    return 1.57490131236859*k_f1**4*k_f2**5*x0/(Lambda_b**6*x1) + 0.25*k_f1**5*k_f2**6*x0/(Lambda_b**8*x1**2)
+
+
+def _kernel_scale_346(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**4*k_f2**4*x2*y_ref**2*(2.75*x0*x2 + 7.87450656184295 + 0.39685026299205*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**6
+
+
+def _kernel_scale_347(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f2**3/Lambda_b**6
+    return k_f1**4*x2*x3*y_ref**2*(0.944940787421154*k_f1**3*x3/x1**3 + 20.0*x0*x2 + 31.4980262473718 + 6.74645447086485*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))
+
+
+def _kernel_scale_348(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**3*k_f2**5*x2*y_ref**2*(2.5*x0*x2 + 6.29960524947436 + 0.39685026299205*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**6
+
+
+def _kernel_scale_349(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3/Lambda_b**6
+    return k_f2**4*x2*x3*y_ref**2*(0.944940787421154*k_f2**3*x3/x1**3 + 20.0*x0*x2 + 31.4980262473718 + 6.74645447086484*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))
+
+
+def _kernel_scale_350(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**3*k_f2**3/Lambda_b**6
+    return x2*x3*y_ref**2*(125.0*x0*x2 + 125.992104989487 + 22.6785788981077*x3/x1**3 + 72.226747864553*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 3.0*k_f1**4*k_f2**4/(Lambda_b**8*x1**4))
+
+
+def _kernel_scale_351(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = 1.0*y_ref**2/(Lambda_b**6*(1 - 1.0*k_f1*k_f2/Lambda_b**2))
+    return k_f1**5*k_f2**5*x0 + k_f1**4*k_f2**4*x0
+
+
+def _kernel_scale_352(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = k_f1**5*k_f2**4*x0
+    x2 = 1 - 1.0*k_f1*k_f2/Lambda_b**2
+    x3 = 1.0/(Lambda_b**8*x2**2)
+    x4 = 1/(Lambda_b**6*x2)
+    return k_f1**6*k_f2**5*x0*x3 + 4.0*k_f1**4*k_f2**3*x0*x4 + x1*x3 + 5.0*x1*x4
+
+
+def _kernel_scale_353(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 1.0*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**2*x0
+    x7 = 2.0/(Lambda_b**4*x4**2)
+    return k_f1**4*x0*x5*y_ref**2*(k_f1**3*k_f2**3*x7 + 10.0*x1*x5*x6 + 20.0*x2 + 8.0*x3*x5 + x6*x7 + 12.0)/Lambda_b**6
+
+
+def _kernel_scale_354(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = k_f1**4*k_f2**5*x0
+    x2 = 1 - 1.0*k_f1*k_f2/Lambda_b**2
+    x3 = 1.0/(Lambda_b**8*x2**2)
+    x4 = 1/(Lambda_b**6*x2)
+    return k_f1**5*k_f2**6*x0*x3 + 4.0*k_f1**3*k_f2**4*x0*x4 + x1*x3 + 5.0*x1*x4
+
+
+def _kernel_scale_355(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 1.0*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**2*k_f2**2
+    x6 = 2.0/(Lambda_b**4*x3**2)
+    x7 = k_f1**3*k_f2**3
+    return x4*x7*y_ref**2*(11.0*x0*x4*x5 + 25.0*x1 + 9.0*x2*x4 + x5*x6 + x6*x7 + 16.0)/Lambda_b**6
+
+
+def _kernel_scale_356(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = k_f1**3
+    x2 = k_f2**2
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f1*k_f2
+    x5 = x3*x4
+    x6 = 1 - 1.0*x5
+    x7 = x6**(-1.0)
+    x8 = k_f2**3*x1
+    x9 = 6.0*x0/x6**3
+    x10 = k_f1**2*x2
+    x11 = 1/(Lambda_b**4*x6**2)
+    return x0*x1*x2*x7*y_ref**2*(k_f1**4*k_f2**4*x9 + 28.0*x10*x11 + 80.0*x10*x3*x7 + 34.0*x11*x8 + 100.0*x4 + 52.0*x5*x7 + x8*x9 + 48.0)
+
+
+def _kernel_scale_357(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 1.0*x3
+    x5 = x4**(-1.0)
+    x6 = k_f2**2*x0
+    x7 = 2.0/(Lambda_b**4*x4**2)
+    return k_f2**4*x0*x5*y_ref**2*(k_f1**3*k_f2**3*x7 + 10.0*x1*x5*x6 + 20.0*x2 + 8.0*x3*x5 + x6*x7 + 12.0)/Lambda_b**6
+
+
+def _kernel_scale_358(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = k_f1**2
+    x2 = k_f2**3
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f1*k_f2
+    x5 = x3*x4
+    x6 = 1 - 1.0*x5
+    x7 = x6**(-1.0)
+    x8 = k_f1**3*x2
+    x9 = 6.0*x0/x6**3
+    x10 = k_f2**2*x1
+    x11 = 1/(Lambda_b**4*x6**2)
+    return x0*x1*x2*x7*y_ref**2*(k_f1**4*k_f2**4*x9 + 28.0*x10*x11 + 80.0*x10*x3*x7 + 34.0*x11*x8 + 100.0*x4 + 52.0*x5*x7 + x8*x9 + 48.0)
+
+
+def _kernel_scale_359(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = k_f1*k_f2
+    x2 = Lambda_b**(-2.0)
+    x3 = x1*x2
+    x4 = 1 - 1.0*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**4*k_f2**4
+    x7 = 24.0/(Lambda_b**8*x4**4)
+    x8 = x0/x4**3
+    x9 = k_f1**3*k_f2**3
+    x10 = 1/(Lambda_b**4*x4**2)
+    x11 = k_f1**2*k_f2**2
+    x12 = x11*x5
+    return x0*x12*y_ref**2*(k_f1**5*k_f2**5*x7 + 400.0*x1 + 244.0*x10*x11 + 364.0*x10*x9 + 500.0*x12*x2 + 256.0*x3*x5 + x6*x7 + 144.0*x6*x8 + 120.0*x8*x9 + 144.0)
+
+
+def _kernel_scale_360(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2/(Lambda_b**6*(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2))
+    return 0.314980262473718*k_f1**5*k_f2**5*x0 + 0.39685026299205*k_f1**4*k_f2**4*x0
+
+
+def _kernel_scale_361(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    x2 = x0/(Lambda_b**8*x1**2)
+    x3 = k_f1**5*k_f2**4
+    x4 = x0/(Lambda_b**6*x1)
+    return 0.25*k_f1**6*k_f2**5*x2 + 1.5874010519682*k_f1**4*k_f2**3*x4 + 0.314980262473718*x2*x3 + 1.57490131236859*x3*x4
+
+
+def _kernel_scale_362(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**2*x0
+    x7 = 1/(Lambda_b**4*x4**2)
+    return k_f1**4*x0*x5*y_ref**2*(0.39685026299205*k_f1**3*k_f2**3*x7 + 2.5*x1*x5*x6 + 6.29960524947436*x2 + 2.51984209978975*x3*x5 + 0.5*x6*x7 + 4.7622031559046)/Lambda_b**6
+
+
+def _kernel_scale_363(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    x2 = x0/(Lambda_b**8*x1**2)
+    x3 = k_f1**4*k_f2**5
+    x4 = x0/(Lambda_b**6*x1)
+    return 0.25*k_f1**5*k_f2**6*x2 + 1.5874010519682*k_f1**3*k_f2**4*x4 + 0.314980262473718*x2*x3 + 1.57490131236859*x3*x4
+
+
+def _kernel_scale_364(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 0.7937005259841*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**2*k_f2**2
+    x6 = 1/(Lambda_b**4*x3**2)
+    x7 = k_f1**3*k_f2**3
+    return x4*x7*y_ref**2*(2.75*x0*x4*x5 + 7.87450656184295*x1 + 2.83482236226346*x2*x4 + 0.5*x5*x6 + 0.39685026299205*x6*x7 + 6.3496042078728)/Lambda_b**6
+
+
+def _kernel_scale_365(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = k_f1**3
+    x2 = k_f2**2
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f1*k_f2
+    x5 = x3*x4
+    x6 = 1 - 0.7937005259841*x5
+    x7 = x6**(-1.0)
+    x8 = x0/x6**3
+    x9 = k_f2**3*x1
+    x10 = k_f1**2*x2
+    x11 = 1/(Lambda_b**4*x6**2)
+    return x0*x1*x2*x7*y_ref**2*(0.944940787421154*k_f1**4*k_f2**4*x8 + 7.0*x10*x11 + 20.0*x10*x3*x7 + 6.74645447086485*x11*x9 + 31.4980262473718*x4 + 16.3789736486333*x5*x7 + 1.19055078897615*x8*x9 + 19.0488126236184)
+
+
+def _kernel_scale_366(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = k_f2**2*x0
+    x7 = 1/(Lambda_b**4*x4**2)
+    return k_f2**4*x0*x5*y_ref**2*(0.39685026299205*k_f1**3*k_f2**3*x7 + 2.5*x1*x5*x6 + 6.29960524947436*x2 + 2.51984209978975*x3*x5 + 0.5*x6*x7 + 4.7622031559046)/Lambda_b**6
+
+
+def _kernel_scale_367(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = k_f1**2
+    x2 = k_f2**3
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f1*k_f2
+    x5 = x3*x4
+    x6 = 1 - 0.7937005259841*x5
+    x7 = x6**(-1.0)
+    x8 = x0/x6**3
+    x9 = k_f1**3*x2
+    x10 = k_f2**2*x1
+    x11 = 1/(Lambda_b**4*x6**2)
+    return x0*x1*x2*x7*y_ref**2*(0.944940787421154*k_f1**4*k_f2**4*x8 + 7.0*x10*x11 + 20.0*x10*x3*x7 + 6.74645447086484*x11*x9 + 31.4980262473718*x4 + 16.3789736486333*x5*x7 + 1.19055078897615*x8*x9 + 19.0488126236184)
+
+
+def _kernel_scale_368(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = k_f1*k_f2
+    x2 = Lambda_b**(-2.0)
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**4*k_f2**4
+    x7 = 1/(Lambda_b**8*x4**4)
+    x8 = x0/x4**3
+    x9 = k_f1**3*k_f2**3
+    x10 = 1/(Lambda_b**4*x4**2)
+    x11 = k_f1**2*k_f2**2
+    x12 = x11*x5
+    return x0*x12*y_ref**2*(3.0*k_f1**5*k_f2**5*x7 + 125.992104989487*x1 + 61.0*x10*x11 + 72.226747864553*x10*x9 + 125.0*x12*x2 + 80.6349471932719*x3*x5 + 3.77976314968462*x6*x7 + 22.6785788981077*x6*x8 + 23.811015779523*x8*x9 + 57.1464378708552)
+
+
+def _kernel_scale_369(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2/(Lambda_b**6*(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2))
+    return 0.314980262473718*k_f1**5*k_f2**5*x0 + 0.39685026299205*k_f1**4*k_f2**4*x0
+
+
+def _kernel_scale_370(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    x2 = x0/(Lambda_b**8*x1**2)
+    x3 = k_f1**5*k_f2**4
+    x4 = x0/(Lambda_b**6*x1)
+    return 0.25*k_f1**6*k_f2**5*x2 + 1.5874010519682*k_f1**4*k_f2**3*x4 + 0.314980262473718*x2*x3 + 1.57490131236859*x3*x4
+
+
+def _kernel_scale_371(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**2*x0
+    x7 = 1/(Lambda_b**4*x4**2)
+    return k_f1**4*x0*x5*y_ref**2*(0.39685026299205*k_f1**3*k_f2**3*x7 + 2.5*x1*x5*x6 + 6.29960524947436*x2 + 2.51984209978975*x3*x5 + 0.5*x6*x7 + 4.7622031559046)/Lambda_b**6
+
+
+def _kernel_scale_372(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    x2 = x0/(Lambda_b**8*x1**2)
+    x3 = k_f1**4*k_f2**5
+    x4 = x0/(Lambda_b**6*x1)
+    return 0.25*k_f1**5*k_f2**6*x2 + 1.5874010519682*k_f1**3*k_f2**4*x4 + 0.314980262473718*x2*x3 + 1.57490131236859*x3*x4
+
+
+def _kernel_scale_373(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 0.7937005259841*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**2*k_f2**2
+    x6 = 1/(Lambda_b**4*x3**2)
+    x7 = k_f1**3*k_f2**3
+    return x4*x7*y_ref**2*(2.75*x0*x4*x5 + 7.87450656184295*x1 + 2.83482236226346*x2*x4 + 0.5*x5*x6 + 0.39685026299205*x6*x7 + 6.3496042078728)/Lambda_b**6
+
+
+def _kernel_scale_374(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = k_f1**3
+    x2 = k_f2**2
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f1*k_f2
+    x5 = x3*x4
+    x6 = 1 - 0.7937005259841*x5
+    x7 = x6**(-1.0)
+    x8 = x0/x6**3
+    x9 = k_f2**3*x1
+    x10 = k_f1**2*x2
+    x11 = 1/(Lambda_b**4*x6**2)
+    return x0*x1*x2*x7*y_ref**2*(0.944940787421154*k_f1**4*k_f2**4*x8 + 7.0*x10*x11 + 20.0*x10*x3*x7 + 6.74645447086485*x11*x9 + 31.4980262473718*x4 + 16.3789736486333*x5*x7 + 1.19055078897615*x8*x9 + 19.0488126236184)
+
+
+def _kernel_scale_375(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = k_f2**2*x0
+    x7 = 1/(Lambda_b**4*x4**2)
+    return k_f2**4*x0*x5*y_ref**2*(0.39685026299205*k_f1**3*k_f2**3*x7 + 2.5*x1*x5*x6 + 6.29960524947436*x2 + 2.51984209978975*x3*x5 + 0.5*x6*x7 + 4.7622031559046)/Lambda_b**6
+
+
+def _kernel_scale_376(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = k_f1**2
+    x2 = k_f2**3
+    x3 = Lambda_b**(-2.0)
+    x4 = k_f1*k_f2
+    x5 = x3*x4
+    x6 = 1 - 0.7937005259841*x5
+    x7 = x6**(-1.0)
+    x8 = x0/x6**3
+    x9 = k_f1**3*x2
+    x10 = k_f2**2*x1
+    x11 = 1/(Lambda_b**4*x6**2)
+    return x0*x1*x2*x7*y_ref**2*(0.944940787421154*k_f1**4*k_f2**4*x8 + 7.0*x10*x11 + 20.0*x10*x3*x7 + 6.74645447086484*x11*x9 + 31.4980262473718*x4 + 16.3789736486333*x5*x7 + 1.19055078897615*x8*x9 + 19.0488126236184)
+
+
+def _kernel_scale_377(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-6.0)
+    x1 = k_f1*k_f2
+    x2 = Lambda_b**(-2.0)
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**4*k_f2**4
+    x7 = 1/(Lambda_b**8*x4**4)
+    x8 = x0/x4**3
+    x9 = k_f1**3*k_f2**3
+    x10 = 1/(Lambda_b**4*x4**2)
+    x11 = k_f1**2*k_f2**2
+    x12 = x11*x5
+    return x0*x12*y_ref**2*(3.0*k_f1**5*k_f2**5*x7 + 125.992104989487*x1 + 61.0*x10*x11 + 72.226747864553*x10*x9 + 125.0*x12*x2 + 80.6349471932719*x3*x5 + 3.77976314968462*x6*x7 + 22.6785788981077*x6*x8 + 23.811015779523*x8*x9 + 57.1464378708552)
+
+
+def _kernel_scale_378(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.0*k_f1**6*k_f2**6*y_ref**2/(Lambda_b**8*(1 - 1.0*k_f1*k_f2/Lambda_b**2))
+
+
+def _kernel_scale_379(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 1.0*k_f1*k_f2/Lambda_b**2
+    return 6.0*k_f1**6*k_f2**5*x0/(Lambda_b**8*x1) + 1.0*k_f1**7*k_f2**6*x0/(Lambda_b**10*x1**2)
+
+
+def _kernel_scale_380(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return k_f1**6*k_f2**4*x2*y_ref**2*(12.0*x0*x2 + 30.0 + 2.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**8
+
+
+def _kernel_scale_381(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 1.0*k_f1*k_f2/Lambda_b**2
+    return 6.0*k_f1**5*k_f2**6*x0/(Lambda_b**8*x1) + 1.0*k_f1**6*k_f2**7*x0/(Lambda_b**10*x1**2)
+
+
+def _kernel_scale_382(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**5*x2*y_ref**2*(13.0*x0*x2 + 36.0 + 2.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**8
+
+
+def _kernel_scale_383(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**4*x2*y_ref**2*(114.0*x0*x2 + 180.0 + 40.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 6.0*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))/Lambda_b**8
+
+
+def _kernel_scale_384(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return k_f1**4*k_f2**6*x2*y_ref**2*(12.0*x0*x2 + 30.0 + 2.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**8
+
+
+def _kernel_scale_385(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return k_f1**4*k_f2**5*x2*y_ref**2*(114.0*x0*x2 + 180.0 + 40.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 6.0*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))/Lambda_b**8
+
+
+def _kernel_scale_386(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**4*k_f2**4/Lambda_b**8
+    return x2*x3*y_ref**2*(864.0*x0*x2 + 900.0 + 24.0*x3/x1**4 + 508.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 168.0*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))
+
+
+def _kernel_scale_387(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.25*k_f1**6*k_f2**6*y_ref**2/(Lambda_b**8*(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2))
+
+
+def _kernel_scale_388(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    return 1.5*k_f1**6*k_f2**5*x0/(Lambda_b**8*x1) + 0.198425131496025*k_f1**7*k_f2**6*x0/(Lambda_b**10*x1**2)
+
+
+def _kernel_scale_389(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**6*k_f2**4*x2*y_ref**2*(2.3811015779523*x0*x2 + 7.5 + 0.314980262473718*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**8
+
+
+def _kernel_scale_390(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    return 1.5*k_f1**5*k_f2**6*x0/(Lambda_b**8*x1) + 0.198425131496025*k_f1**6*k_f2**7*x0/(Lambda_b**10*x1**2)
+
+
+def _kernel_scale_391(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**5*x2*y_ref**2*(2.57952670944832*x0*x2 + 8.99999999999999 + 0.314980262473718*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**8
+
+
+def _kernel_scale_392(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**4*x2*y_ref**2*(22.6204649905468*x0*x2 + 45.0 + 6.29960524947436*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 0.749999999999999*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))/Lambda_b**8
+
+
+def _kernel_scale_393(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**4*k_f2**6*x2*y_ref**2*(2.3811015779523*x0*x2 + 7.5 + 0.314980262473718*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**8
+
+
+def _kernel_scale_394(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**4*k_f2**5*x2*y_ref**2*(22.6204649905468*x0*x2 + 45.0 + 6.29960524947436*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 0.749999999999999*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))/Lambda_b**8
+
+
+def _kernel_scale_395(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**4*k_f2**4/Lambda_b**8
+    return x2*x3*y_ref**2*(171.439313612565*x0*x2 + 225.0 + 2.3811015779523*x3/x1**4 + 80.0049866683244*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 21.0*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))
+
+
+def _kernel_scale_396(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.25*k_f1**6*k_f2**6*y_ref**2/(Lambda_b**8*(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2))
+
+
+def _kernel_scale_397(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    return 1.5*k_f1**6*k_f2**5*x0/(Lambda_b**8*x1) + 0.198425131496025*k_f1**7*k_f2**6*x0/(Lambda_b**10*x1**2)
+
+
+def _kernel_scale_398(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**6*k_f2**4*x2*y_ref**2*(2.3811015779523*x0*x2 + 7.5 + 0.314980262473718*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**8
+
+
+def _kernel_scale_399(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    return 1.5*k_f1**5*k_f2**6*x0/(Lambda_b**8*x1) + 0.198425131496025*k_f1**6*k_f2**7*x0/(Lambda_b**10*x1**2)
+
+
+def _kernel_scale_400(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**5*x2*y_ref**2*(2.57952670944832*x0*x2 + 8.99999999999999 + 0.314980262473718*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**8
+
+
+def _kernel_scale_401(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**4*x2*y_ref**2*(22.6204649905468*x0*x2 + 45.0 + 6.29960524947436*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 0.749999999999999*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))/Lambda_b**8
+
+
+def _kernel_scale_402(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**4*k_f2**6*x2*y_ref**2*(2.3811015779523*x0*x2 + 7.5 + 0.314980262473718*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**8
+
+
+def _kernel_scale_403(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**4*k_f2**5*x2*y_ref**2*(22.6204649905468*x0*x2 + 45.0 + 6.29960524947436*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 0.749999999999999*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))/Lambda_b**8
+
+
+def _kernel_scale_404(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = k_f1**4*k_f2**4/Lambda_b**8
+    return x2*x3*y_ref**2*(171.439313612565*x0*x2 + 225.0 + 2.3811015779523*x3/x1**4 + 80.0049866683244*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 21.0*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))
+
+
+def _kernel_scale_405(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = 1.0*y_ref**2/(Lambda_b**8*(1 - 1.0*k_f1*k_f2/Lambda_b**2))
+    return k_f1**6*k_f2**6*x0 + k_f1**5*k_f2**5*x0
+
+
+def _kernel_scale_406(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = k_f1**6*k_f2**5*x0
+    x2 = 1 - 1.0*k_f1*k_f2/Lambda_b**2
+    x3 = 1.0/(Lambda_b**10*x2**2)
+    x4 = 1/(Lambda_b**8*x2)
+    return k_f1**7*k_f2**6*x0*x3 + 5.0*k_f1**5*k_f2**4*x0*x4 + x1*x3 + 6.0*x1*x4
+
+
+def _kernel_scale_407(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**3
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 1.0*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**2*k_f2**2
+    x7 = 2.0/(Lambda_b**4*x4**2)
+    return k_f1**5*x0*x5*y_ref**2*(k_f1**3*x0*x7 + 12.0*x1*x5*x6 + 30.0*x2 + 10.0*x3*x5 + x6*x7 + 20.0)/Lambda_b**8
+
+
+def _kernel_scale_408(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = k_f1**5*k_f2**6*x0
+    x2 = 1 - 1.0*k_f1*k_f2/Lambda_b**2
+    x3 = 1.0/(Lambda_b**10*x2**2)
+    x4 = 1/(Lambda_b**8*x2)
+    return k_f1**6*k_f2**7*x0*x3 + 5.0*k_f1**4*k_f2**5*x0*x4 + x1*x3 + 6.0*x1*x4
+
+
+def _kernel_scale_409(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 1.0*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**2*k_f2**2
+    x6 = 2.0/(Lambda_b**4*x3**2)
+    return k_f1**4*k_f2**4*x4*y_ref**2*(k_f1**3*k_f2**3*x6 + 13.0*x0*x4*x5 + 36.0*x1 + 11.0*x2*x4 + x5*x6 + 25.0)/Lambda_b**8
+
+
+def _kernel_scale_410(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**4
+    x1 = k_f2**3
+    x2 = Lambda_b**(-2.0)
+    x3 = k_f1*k_f2
+    x4 = x2*x3
+    x5 = 1 - 1.0*x4
+    x6 = x5**(-1.0)
+    x7 = k_f1**3*x1
+    x8 = 6.0/(Lambda_b**6*x5**3)
+    x9 = 1/(Lambda_b**4*x5**2)
+    x10 = k_f1**2*k_f2**2
+    return x0*x1*x6*y_ref**2*(k_f2**4*x0*x8 + 114.0*x10*x2*x6 + 34.0*x10*x9 + 180.0*x3 + 80.0*x4*x6 + x7*x8 + 40.0*x7*x9 + 100.0)/Lambda_b**8
+
+
+def _kernel_scale_411(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**3
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 1.0*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**2*k_f2**2
+    x7 = 2.0/(Lambda_b**4*x4**2)
+    return k_f2**5*x0*x5*y_ref**2*(k_f2**3*x0*x7 + 12.0*x1*x5*x6 + 30.0*x2 + 10.0*x3*x5 + x6*x7 + 20.0)/Lambda_b**8
+
+
+def _kernel_scale_412(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**3
+    x1 = k_f2**4
+    x2 = Lambda_b**(-2.0)
+    x3 = k_f1*k_f2
+    x4 = x2*x3
+    x5 = 1 - 1.0*x4
+    x6 = x5**(-1.0)
+    x7 = k_f2**3*x0
+    x8 = 6.0/(Lambda_b**6*x5**3)
+    x9 = 1/(Lambda_b**4*x5**2)
+    x10 = k_f1**2*k_f2**2
+    return x0*x1*x6*y_ref**2*(k_f1**4*x1*x8 + 114.0*x10*x2*x6 + 34.0*x10*x9 + 180.0*x3 + 80.0*x4*x6 + x7*x8 + 40.0*x7*x9 + 100.0)/Lambda_b**8
+
+
+def _kernel_scale_413(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-8.0)
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 1.0*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**4*k_f2**4
+    x7 = 24.0*x0/x4**4
+    x8 = 1/(Lambda_b**6*x4**3)
+    x9 = k_f1**3*k_f2**3
+    x10 = k_f1**2*k_f2**2
+    x11 = 1/(Lambda_b**4*x4**2)
+    return x0*x5*x9*y_ref**2*(k_f1**5*k_f2**5*x7 + 864.0*x1*x10*x5 + 364.0*x10*x11 + 508.0*x11*x9 + 900.0*x2 + 500.0*x3*x5 + x6*x7 + 168.0*x6*x8 + 144.0*x8*x9 + 400.0)
+
+
+def _kernel_scale_414(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2/(Lambda_b**8*(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2))
+    return 0.25*k_f1**6*k_f2**6*x0 + 0.314980262473718*k_f1**5*k_f2**5*x0
+
+
+def _kernel_scale_415(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    x2 = x0/(Lambda_b**10*x1**2)
+    x3 = k_f1**6*k_f2**5
+    x4 = x0/(Lambda_b**8*x1)
+    return 0.198425131496025*k_f1**7*k_f2**6*x2 + 1.57490131236859*k_f1**5*k_f2**4*x4 + 0.25*x2*x3 + 1.5*x3*x4
+
+
+def _kernel_scale_416(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**3
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**2*k_f2**2
+    x7 = 1/(Lambda_b**4*x4**2)
+    return k_f1**5*x0*x5*y_ref**2*(0.314980262473718*k_f1**3*x0*x7 + 2.3811015779523*x1*x5*x6 + 7.5*x2 + 2.5*x3*x5 + 0.39685026299205*x6*x7 + 6.29960524947436)/Lambda_b**8
+
+
+def _kernel_scale_417(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    x2 = x0/(Lambda_b**10*x1**2)
+    x3 = k_f1**5*k_f2**6
+    x4 = x0/(Lambda_b**8*x1)
+    return 0.198425131496025*k_f1**6*k_f2**7*x2 + 1.57490131236859*k_f1**4*k_f2**5*x4 + 0.25*x2*x3 + 1.5*x3*x4
+
+
+def _kernel_scale_418(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 0.7937005259841*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**2*k_f2**2
+    x6 = 1/(Lambda_b**4*x3**2)
+    return k_f1**4*k_f2**4*x4*y_ref**2*(0.314980262473718*k_f1**3*k_f2**3*x6 + 2.57952670944832*x0*x4*x5 + 8.99999999999999*x1 + 2.75*x2*x4 + 0.39685026299205*x5*x6 + 7.87450656184295)/Lambda_b**8
+
+
+def _kernel_scale_419(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**4
+    x1 = k_f2**3
+    x2 = Lambda_b**(-2.0)
+    x3 = k_f1*k_f2
+    x4 = x2*x3
+    x5 = 1 - 0.7937005259841*x4
+    x6 = x5**(-1.0)
+    x7 = 1/(Lambda_b**6*x5**3)
+    x8 = k_f1**3*x1
+    x9 = k_f1**2*k_f2**2
+    x10 = 1/(Lambda_b**4*x5**2)
+    return x0*x1*x6*y_ref**2*(0.749999999999999*k_f2**4*x0*x7 + 6.29960524947436*x10*x8 + 6.74645447086484*x10*x9 + 22.6204649905468*x2*x6*x9 + 45.0*x3 + 20.0*x4*x6 + 0.944940787421154*x7*x8 + 31.4980262473718)/Lambda_b**8
+
+
+def _kernel_scale_420(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**3
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**2*k_f2**2
+    x7 = 1/(Lambda_b**4*x4**2)
+    return k_f2**5*x0*x5*y_ref**2*(0.314980262473718*k_f2**3*x0*x7 + 2.3811015779523*x1*x5*x6 + 7.5*x2 + 2.5*x3*x5 + 0.39685026299205*x6*x7 + 6.29960524947436)/Lambda_b**8
+
+
+def _kernel_scale_421(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**3
+    x1 = k_f2**4
+    x2 = Lambda_b**(-2.0)
+    x3 = k_f1*k_f2
+    x4 = x2*x3
+    x5 = 1 - 0.7937005259841*x4
+    x6 = x5**(-1.0)
+    x7 = k_f2**3*x0
+    x8 = 1/(Lambda_b**6*x5**3)
+    x9 = 1/(Lambda_b**4*x5**2)
+    x10 = k_f1**2*k_f2**2
+    return x0*x1*x6*y_ref**2*(0.749999999999999*k_f1**4*x1*x8 + 22.6204649905468*x10*x2*x6 + 6.74645447086484*x10*x9 + 45.0*x3 + 20.0*x4*x6 + 0.944940787421154*x7*x8 + 6.29960524947436*x7*x9 + 31.4980262473718)/Lambda_b**8
+
+
+def _kernel_scale_422(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 0.7937005259841*x2
+    x4 = x3**(-1.0)
+    x5 = Lambda_b**(-8.0)
+    x6 = x5/x3**4
+    x7 = k_f1**4*k_f2**4
+    x8 = k_f1**3*k_f2**3
+    x9 = 1/(Lambda_b**6*x3**3)
+    x10 = k_f1**2*k_f2**2
+    x11 = 1/(Lambda_b**4*x3**2)
+    return x4*x5*x8*y_ref**2*(2.3811015779523*k_f1**5*k_f2**5*x6 + 171.439313612565*x0*x10*x4 + 225.0*x1 + 72.226747864553*x10*x11 + 80.0049866683244*x11*x8 + 125.0*x2*x4 + 3.0*x6*x7 + 21.0*x7*x9 + 22.6785788981077*x8*x9 + 125.992104989487)
+
+
+def _kernel_scale_423(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2/(Lambda_b**8*(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2))
+    return 0.25*k_f1**6*k_f2**6*x0 + 0.314980262473718*k_f1**5*k_f2**5*x0
+
+
+def _kernel_scale_424(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    x2 = x0/(Lambda_b**10*x1**2)
+    x3 = k_f1**6*k_f2**5
+    x4 = x0/(Lambda_b**8*x1)
+    return 0.198425131496025*k_f1**7*k_f2**6*x2 + 1.57490131236859*k_f1**5*k_f2**4*x4 + 0.25*x2*x3 + 1.5*x3*x4
+
+
+def _kernel_scale_425(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**3
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**2*k_f2**2
+    x7 = 1/(Lambda_b**4*x4**2)
+    return k_f1**5*x0*x5*y_ref**2*(0.314980262473718*k_f1**3*x0*x7 + 2.3811015779523*x1*x5*x6 + 7.5*x2 + 2.5*x3*x5 + 0.39685026299205*x6*x7 + 6.29960524947436)/Lambda_b**8
+
+
+def _kernel_scale_426(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    x2 = x0/(Lambda_b**10*x1**2)
+    x3 = k_f1**5*k_f2**6
+    x4 = x0/(Lambda_b**8*x1)
+    return 0.198425131496025*k_f1**6*k_f2**7*x2 + 1.57490131236859*k_f1**4*k_f2**5*x4 + 0.25*x2*x3 + 1.5*x3*x4
+
+
+def _kernel_scale_427(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 0.7937005259841*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**2*k_f2**2
+    x6 = 1/(Lambda_b**4*x3**2)
+    return k_f1**4*k_f2**4*x4*y_ref**2*(0.314980262473718*k_f1**3*k_f2**3*x6 + 2.57952670944832*x0*x4*x5 + 8.99999999999999*x1 + 2.75*x2*x4 + 0.39685026299205*x5*x6 + 7.87450656184295)/Lambda_b**8
+
+
+def _kernel_scale_428(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**4
+    x1 = k_f2**3
+    x2 = Lambda_b**(-2.0)
+    x3 = k_f1*k_f2
+    x4 = x2*x3
+    x5 = 1 - 0.7937005259841*x4
+    x6 = x5**(-1.0)
+    x7 = 1/(Lambda_b**6*x5**3)
+    x8 = k_f1**3*x1
+    x9 = k_f1**2*k_f2**2
+    x10 = 1/(Lambda_b**4*x5**2)
+    return x0*x1*x6*y_ref**2*(0.749999999999999*k_f2**4*x0*x7 + 6.29960524947436*x10*x8 + 6.74645447086484*x10*x9 + 22.6204649905468*x2*x6*x9 + 45.0*x3 + 20.0*x4*x6 + 0.944940787421154*x7*x8 + 31.4980262473718)/Lambda_b**8
+
+
+def _kernel_scale_429(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**3
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**2*k_f2**2
+    x7 = 1/(Lambda_b**4*x4**2)
+    return k_f2**5*x0*x5*y_ref**2*(0.314980262473718*k_f2**3*x0*x7 + 2.3811015779523*x1*x5*x6 + 7.5*x2 + 2.5*x3*x5 + 0.39685026299205*x6*x7 + 6.29960524947436)/Lambda_b**8
+
+
+def _kernel_scale_430(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**3
+    x1 = k_f2**4
+    x2 = Lambda_b**(-2.0)
+    x3 = k_f1*k_f2
+    x4 = x2*x3
+    x5 = 1 - 0.7937005259841*x4
+    x6 = x5**(-1.0)
+    x7 = k_f2**3*x0
+    x8 = 1/(Lambda_b**6*x5**3)
+    x9 = 1/(Lambda_b**4*x5**2)
+    x10 = k_f1**2*k_f2**2
+    return x0*x1*x6*y_ref**2*(0.749999999999999*k_f1**4*x1*x8 + 22.6204649905468*x10*x2*x6 + 6.74645447086484*x10*x9 + 45.0*x3 + 20.0*x4*x6 + 0.944940787421154*x7*x8 + 6.29960524947436*x7*x9 + 31.4980262473718)/Lambda_b**8
+
+
+def _kernel_scale_431(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 0.7937005259841*x2
+    x4 = x3**(-1.0)
+    x5 = Lambda_b**(-8.0)
+    x6 = x5/x3**4
+    x7 = k_f1**4*k_f2**4
+    x8 = k_f1**3*k_f2**3
+    x9 = 1/(Lambda_b**6*x3**3)
+    x10 = k_f1**2*k_f2**2
+    x11 = 1/(Lambda_b**4*x3**2)
+    return x4*x5*x8*y_ref**2*(2.3811015779523*k_f1**5*k_f2**5*x6 + 171.439313612565*x0*x10*x4 + 225.0*x1 + 72.226747864553*x10*x11 + 80.0049866683244*x11*x8 + 125.0*x2*x4 + 3.0*x6*x7 + 21.0*x7*x9 + 22.6785788981077*x8*x9 + 125.992104989487)
+
+
+def _kernel_scale_432(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.0*k_f1**7*k_f2**7*y_ref**2/(Lambda_b**10*(1 - 1.0*k_f1*k_f2/Lambda_b**2))
+
+
+def _kernel_scale_433(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 1.0*k_f1*k_f2/Lambda_b**2
+    return 7.0*k_f1**7*k_f2**6*x0/(Lambda_b**10*x1) + 1.0*k_f1**8*k_f2**7*x0/(Lambda_b**12*x1**2)
+
+
+def _kernel_scale_434(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return k_f1**7*k_f2**5*x2*y_ref**2*(14.0*x0*x2 + 42.0 + 2.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**10
+
+
+def _kernel_scale_435(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 1.0*k_f1*k_f2/Lambda_b**2
+    return 7.0*k_f1**6*k_f2**7*x0/(Lambda_b**10*x1) + 1.0*k_f1**7*k_f2**8*x0/(Lambda_b**12*x1**2)
+
+
+def _kernel_scale_436(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return k_f1**6*k_f2**6*x2*y_ref**2*(15.0*x0*x2 + 49.0 + 2.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**10
+
+
+def _kernel_scale_437(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return k_f1**6*k_f2**5*x2*y_ref**2*(154.0*x0*x2 + 294.0 + 46.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 6.0*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))/Lambda_b**10
+
+
+def _kernel_scale_438(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**7*x2*y_ref**2*(14.0*x0*x2 + 42.0 + 2.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**10
+
+
+def _kernel_scale_439(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**6*x2*y_ref**2*(154.0*x0*x2 + 294.0 + 46.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 6.0*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))/Lambda_b**10
+
+
+def _kernel_scale_440(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**5*x2*y_ref**2*(1372.0*x0*x2 + 1764.0 + 676.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 192.0*k_f1**3*k_f2**3/(Lambda_b**6*x1**3) + 24.0*k_f1**4*k_f2**4/(Lambda_b**8*x1**4))/Lambda_b**10
+
+
+def _kernel_scale_441(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.198425131496025*k_f1**7*k_f2**7*y_ref**2/(Lambda_b**10*(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2))
+
+
+def _kernel_scale_442(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    return 1.38897592047217*k_f1**7*k_f2**6*x0/(Lambda_b**10*x1) + 0.157490131236859*k_f1**8*k_f2**7*x0/(Lambda_b**12*x1**2)
+
+
+def _kernel_scale_443(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**7*k_f2**5*x2*y_ref**2*(2.20486183731603*x0*x2 + 8.33385552283304 + 0.25*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**10
+
+
+def _kernel_scale_444(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    return 1.38897592047217*k_f1**6*k_f2**7*x0/(Lambda_b**10*x1) + 0.157490131236859*k_f1**7*k_f2**8*x0/(Lambda_b**12*x1**2)
+
+
+def _kernel_scale_445(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**6*k_f2**6*x2*y_ref**2*(2.36235196855289*x0*x2 + 9.72283144330522 + 0.25*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**10
+
+
+def _kernel_scale_446(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**6*k_f2**5*x2*y_ref**2*(24.2534802104763*x0*x2 + 58.3369886598313 + 5.75*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 0.595275394488074*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))/Lambda_b**10
+
+
+def _kernel_scale_447(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**7*x2*y_ref**2*(2.20486183731603*x0*x2 + 8.33385552283304 + 0.25*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**10
+
+
+def _kernel_scale_448(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**6*x2*y_ref**2*(24.2534802104763*x0*x2 + 58.3369886598313 + 5.75*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 0.595275394488074*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))/Lambda_b**10
+
+
+def _kernel_scale_449(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**5*x2*y_ref**2*(216.076460056971*x0*x2 + 350.021931958988 + 84.4999999999999*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 19.0488126236184*k_f1**3*k_f2**3/(Lambda_b**6*x1**3) + 1.88988157484231*k_f1**4*k_f2**4/(Lambda_b**8*x1**4))/Lambda_b**10
+
+
+def _kernel_scale_450(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.198425131496025*k_f1**7*k_f2**7*y_ref**2/(Lambda_b**10*(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2))
+
+
+def _kernel_scale_451(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    return 1.38897592047217*k_f1**7*k_f2**6*x0/(Lambda_b**10*x1) + 0.157490131236859*k_f1**8*k_f2**7*x0/(Lambda_b**12*x1**2)
+
+
+def _kernel_scale_452(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**7*k_f2**5*x2*y_ref**2*(2.20486183731603*x0*x2 + 8.33385552283304 + 0.25*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**10
+
+
+def _kernel_scale_453(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    return 1.38897592047217*k_f1**6*k_f2**7*x0/(Lambda_b**10*x1) + 0.157490131236859*k_f1**7*k_f2**8*x0/(Lambda_b**12*x1**2)
+
+
+def _kernel_scale_454(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**6*k_f2**6*x2*y_ref**2*(2.36235196855289*x0*x2 + 9.72283144330522 + 0.25*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**10
+
+
+def _kernel_scale_455(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**6*k_f2**5*x2*y_ref**2*(24.2534802104763*x0*x2 + 58.3369886598313 + 5.75*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 0.595275394488074*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))/Lambda_b**10
+
+
+def _kernel_scale_456(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**7*x2*y_ref**2*(2.20486183731603*x0*x2 + 8.33385552283304 + 0.25*k_f1**2*k_f2**2/(Lambda_b**4*x1**2))/Lambda_b**10
+
+
+def _kernel_scale_457(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**6*x2*y_ref**2*(24.2534802104763*x0*x2 + 58.3369886598313 + 5.75*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 0.595275394488074*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))/Lambda_b**10
+
+
+def _kernel_scale_458(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1**5*k_f2**5*x2*y_ref**2*(216.076460056971*x0*x2 + 350.021931958988 + 84.4999999999999*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 19.0488126236184*k_f1**3*k_f2**3/(Lambda_b**6*x1**3) + 1.88988157484231*k_f1**4*k_f2**4/(Lambda_b**8*x1**4))/Lambda_b**10
+
+
+def _kernel_scale_459(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = 1.0*y_ref**2/(Lambda_b**10*(1 - 1.0*k_f1*k_f2/Lambda_b**2))
+    return k_f1**7*k_f2**7*x0 + k_f1**6*k_f2**6*x0
+
+
+def _kernel_scale_460(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = k_f1**7*k_f2**6*x0
+    x2 = 1 - 1.0*k_f1*k_f2/Lambda_b**2
+    x3 = 1.0/(Lambda_b**12*x2**2)
+    x4 = 1/(Lambda_b**10*x2)
+    return k_f1**8*k_f2**7*x0*x3 + 6.0*k_f1**6*k_f2**5*x0*x4 + x1*x3 + 7.0*x1*x4
+
+
+def _kernel_scale_461(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 1.0*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**2*k_f2**2
+    x6 = 2.0/(Lambda_b**4*x3**2)
+    return k_f1**6*k_f2**4*x4*y_ref**2*(k_f1**3*k_f2**3*x6 + 14.0*x0*x4*x5 + 42.0*x1 + 12.0*x2*x4 + x5*x6 + 30.0)/Lambda_b**10
+
+
+def _kernel_scale_462(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = k_f1**6*k_f2**7*x0
+    x2 = 1 - 1.0*k_f1*k_f2/Lambda_b**2
+    x3 = 1.0/(Lambda_b**12*x2**2)
+    x4 = 1/(Lambda_b**10*x2)
+    return k_f1**7*k_f2**8*x0*x3 + 6.0*k_f1**5*k_f2**6*x0*x4 + x1*x3 + 7.0*x1*x4
+
+
+def _kernel_scale_463(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 1.0*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**2*k_f2**2
+    x6 = 2.0/(Lambda_b**4*x3**2)
+    return k_f1**5*k_f2**5*x4*y_ref**2*(k_f1**3*k_f2**3*x6 + 15.0*x0*x4*x5 + 49.0*x1 + 13.0*x2*x4 + x5*x6 + 36.0)/Lambda_b**10
+
+
+def _kernel_scale_464(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**4
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 1.0*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**3*k_f2**3
+    x7 = 6.0/(Lambda_b**6*x4**3)
+    x8 = 1/(Lambda_b**4*x4**2)
+    x9 = k_f1**2*k_f2**2
+    return k_f1**5*x0*x5*y_ref**2*(k_f1**4*x0*x7 + 154.0*x1*x5*x9 + 294.0*x2 + 114.0*x3*x5 + x6*x7 + 46.0*x6*x8 + 40.0*x8*x9 + 180.0)/Lambda_b**10
+
+
+def _kernel_scale_465(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 1.0*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**2*k_f2**2
+    x6 = 2.0/(Lambda_b**4*x3**2)
+    return k_f1**4*k_f2**6*x4*y_ref**2*(k_f1**3*k_f2**3*x6 + 14.0*x0*x4*x5 + 42.0*x1 + 12.0*x2*x4 + x5*x6 + 30.0)/Lambda_b**10
+
+
+def _kernel_scale_466(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**4
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 1.0*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**3*k_f2**3
+    x7 = 6.0/(Lambda_b**6*x4**3)
+    x8 = 1/(Lambda_b**4*x4**2)
+    x9 = k_f1**2*k_f2**2
+    return k_f2**5*x0*x5*y_ref**2*(k_f2**4*x0*x7 + 154.0*x1*x5*x9 + 294.0*x2 + 114.0*x3*x5 + x6*x7 + 46.0*x6*x8 + 40.0*x8*x9 + 180.0)/Lambda_b**10
+
+
+def _kernel_scale_467(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 1.0*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**4*k_f2**4
+    x6 = 24.0/(Lambda_b**8*x3**4)
+    x7 = 1/(Lambda_b**6*x3**3)
+    x8 = k_f1**3*k_f2**3
+    x9 = 1/(Lambda_b**4*x3**2)
+    x10 = k_f1**2*k_f2**2
+    return x4*x5*y_ref**2*(k_f1**5*k_f2**5*x6 + 1372.0*x0*x10*x4 + 1764.0*x1 + 508.0*x10*x9 + 864.0*x2*x4 + x5*x6 + 192.0*x5*x7 + 168.0*x7*x8 + 676.0*x8*x9 + 900.0)/Lambda_b**10
+
+
+def _kernel_scale_468(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2/(Lambda_b**10*(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2))
+    return 0.198425131496025*k_f1**7*k_f2**7*x0 + 0.25*k_f1**6*k_f2**6*x0
+
+
+def _kernel_scale_469(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    x2 = x0/(Lambda_b**12*x1**2)
+    x3 = k_f1**7*k_f2**6
+    x4 = x0/(Lambda_b**10*x1)
+    return 0.157490131236859*k_f1**8*k_f2**7*x2 + 1.5*k_f1**6*k_f2**5*x4 + 0.198425131496025*x2*x3 + 1.38897592047217*x3*x4
+
+
+def _kernel_scale_470(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 0.7937005259841*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**2*k_f2**2
+    x6 = 1/(Lambda_b**4*x3**2)
+    return k_f1**6*k_f2**4*x4*y_ref**2*(0.25*k_f1**3*k_f2**3*x6 + 2.20486183731603*x0*x4*x5 + 8.33385552283304*x1 + 2.3811015779523*x2*x4 + 0.314980262473718*x5*x6 + 7.5)/Lambda_b**10
+
+
+def _kernel_scale_471(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    x2 = x0/(Lambda_b**12*x1**2)
+    x3 = k_f1**6*k_f2**7
+    x4 = x0/(Lambda_b**10*x1)
+    return 0.157490131236859*k_f1**7*k_f2**8*x2 + 1.5*k_f1**5*k_f2**6*x4 + 0.198425131496025*x2*x3 + 1.38897592047217*x3*x4
+
+
+def _kernel_scale_472(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 0.7937005259841*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**2*k_f2**2
+    x6 = 1/(Lambda_b**4*x3**2)
+    return k_f1**5*k_f2**5*x4*y_ref**2*(0.25*k_f1**3*k_f2**3*x6 + 2.36235196855289*x0*x4*x5 + 9.72283144330522*x1 + 2.57952670944832*x2*x4 + 0.314980262473718*x5*x6 + 9.0)/Lambda_b**10
+
+
+def _kernel_scale_473(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**4
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = 1/(Lambda_b**6*x4**3)
+    x7 = k_f1**3*k_f2**3
+    x8 = k_f1**2*k_f2**2
+    x9 = 1/(Lambda_b**4*x4**2)
+    return k_f1**5*x0*x5*y_ref**2*(0.595275394488074*k_f1**4*x0*x6 + 24.2534802104763*x1*x5*x8 + 58.3369886598313*x2 + 22.6204649905468*x3*x5 + 0.75*x6*x7 + 5.75*x7*x9 + 6.29960524947436*x8*x9 + 45.0)/Lambda_b**10
+
+
+def _kernel_scale_474(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 0.7937005259841*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**2*k_f2**2
+    x6 = 1/(Lambda_b**4*x3**2)
+    return k_f1**4*k_f2**6*x4*y_ref**2*(0.25*k_f1**3*k_f2**3*x6 + 2.20486183731603*x0*x4*x5 + 8.33385552283304*x1 + 2.3811015779523*x2*x4 + 0.314980262473718*x5*x6 + 7.5)/Lambda_b**10
+
+
+def _kernel_scale_475(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**4
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**3*k_f2**3
+    x7 = 1/(Lambda_b**6*x4**3)
+    x8 = 1/(Lambda_b**4*x4**2)
+    x9 = k_f1**2*k_f2**2
+    return k_f2**5*x0*x5*y_ref**2*(0.595275394488074*k_f2**4*x0*x7 + 24.2534802104763*x1*x5*x9 + 58.3369886598313*x2 + 22.6204649905468*x3*x5 + 0.75*x6*x7 + 5.75*x6*x8 + 6.29960524947436*x8*x9 + 45.0)/Lambda_b**10
+
+
+def _kernel_scale_476(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 0.7937005259841*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**4*k_f2**4
+    x6 = 1/(Lambda_b**8*x3**4)
+    x7 = k_f1**3*k_f2**3
+    x8 = 1/(Lambda_b**6*x3**3)
+    x9 = 1/(Lambda_b**4*x3**2)
+    x10 = k_f1**2*k_f2**2
+    return x4*x5*y_ref**2*(1.88988157484231*k_f1**5*k_f2**5*x6 + 216.076460056971*x0*x10*x4 + 350.021931958988*x1 + 80.0049866683244*x10*x9 + 171.439313612565*x2*x4 + 2.3811015779523*x5*x6 + 19.0488126236184*x5*x8 + 21.0*x7*x8 + 84.4999999999999*x7*x9 + 225.0)/Lambda_b**10
+
+
+def _kernel_scale_477(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2/(Lambda_b**10*(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2))
+    return 0.198425131496025*k_f1**7*k_f2**7*x0 + 0.25*k_f1**6*k_f2**6*x0
+
+
+def _kernel_scale_478(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    x2 = x0/(Lambda_b**12*x1**2)
+    x3 = k_f1**7*k_f2**6
+    x4 = x0/(Lambda_b**10*x1)
+    return 0.157490131236859*k_f1**8*k_f2**7*x2 + 1.5*k_f1**6*k_f2**5*x4 + 0.198425131496025*x2*x3 + 1.38897592047217*x3*x4
+
+
+def _kernel_scale_479(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 0.7937005259841*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**2*k_f2**2
+    x6 = 1/(Lambda_b**4*x3**2)
+    return k_f1**6*k_f2**4*x4*y_ref**2*(0.25*k_f1**3*k_f2**3*x6 + 2.20486183731603*x0*x4*x5 + 8.33385552283304*x1 + 2.3811015779523*x2*x4 + 0.314980262473718*x5*x6 + 7.5)/Lambda_b**10
+
+
+def _kernel_scale_480(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2
+    x2 = x0/(Lambda_b**12*x1**2)
+    x3 = k_f1**6*k_f2**7
+    x4 = x0/(Lambda_b**10*x1)
+    return 0.157490131236859*k_f1**7*k_f2**8*x2 + 1.5*k_f1**5*k_f2**6*x4 + 0.198425131496025*x2*x3 + 1.38897592047217*x3*x4
+
+
+def _kernel_scale_481(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 0.7937005259841*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**2*k_f2**2
+    x6 = 1/(Lambda_b**4*x3**2)
+    return k_f1**5*k_f2**5*x4*y_ref**2*(0.25*k_f1**3*k_f2**3*x6 + 2.36235196855289*x0*x4*x5 + 9.72283144330522*x1 + 2.57952670944832*x2*x4 + 0.314980262473718*x5*x6 + 9.0)/Lambda_b**10
+
+
+def _kernel_scale_482(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**4
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = 1/(Lambda_b**6*x4**3)
+    x7 = k_f1**3*k_f2**3
+    x8 = k_f1**2*k_f2**2
+    x9 = 1/(Lambda_b**4*x4**2)
+    return k_f1**5*x0*x5*y_ref**2*(0.595275394488074*k_f1**4*x0*x6 + 24.2534802104763*x1*x5*x8 + 58.3369886598313*x2 + 22.6204649905468*x3*x5 + 0.75*x6*x7 + 5.75*x7*x9 + 6.29960524947436*x8*x9 + 45.0)/Lambda_b**10
+
+
+def _kernel_scale_483(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 0.7937005259841*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**2*k_f2**2
+    x6 = 1/(Lambda_b**4*x3**2)
+    return k_f1**4*k_f2**6*x4*y_ref**2*(0.25*k_f1**3*k_f2**3*x6 + 2.20486183731603*x0*x4*x5 + 8.33385552283304*x1 + 2.3811015779523*x2*x4 + 0.314980262473718*x5*x6 + 7.5)/Lambda_b**10
+
+
+def _kernel_scale_484(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**4
+    x1 = Lambda_b**(-2.0)
+    x2 = k_f1*k_f2
+    x3 = x1*x2
+    x4 = 1 - 0.7937005259841*x3
+    x5 = x4**(-1.0)
+    x6 = k_f1**3*k_f2**3
+    x7 = 1/(Lambda_b**6*x4**3)
+    x8 = 1/(Lambda_b**4*x4**2)
+    x9 = k_f1**2*k_f2**2
+    return k_f2**5*x0*x5*y_ref**2*(0.595275394488074*k_f2**4*x0*x7 + 24.2534802104763*x1*x5*x9 + 58.3369886598313*x2 + 22.6204649905468*x3*x5 + 0.75*x6*x7 + 5.75*x6*x8 + 6.29960524947436*x8*x9 + 45.0)/Lambda_b**10
+
+
+def _kernel_scale_485(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = Lambda_b**(-2.0)
+    x1 = k_f1*k_f2
+    x2 = x0*x1
+    x3 = 1 - 0.7937005259841*x2
+    x4 = x3**(-1.0)
+    x5 = k_f1**4*k_f2**4
+    x6 = 1/(Lambda_b**8*x3**4)
+    x7 = k_f1**3*k_f2**3
+    x8 = 1/(Lambda_b**6*x3**3)
+    x9 = 1/(Lambda_b**4*x3**2)
+    x10 = k_f1**2*k_f2**2
+    return x4*x5*y_ref**2*(1.88988157484231*k_f1**5*k_f2**5*x6 + 216.076460056971*x0*x10*x4 + 350.021931958988*x1 + 80.0049866683244*x10*x9 + 171.439313612565*x2*x4 + 2.3811015779523*x5*x6 + 19.0488126236184*x5*x8 + 21.0*x7*x8 + 84.4999999999999*x7*x9 + 225.0)/Lambda_b**10
+
+
+def _kernel_scale_486(k_f1, k_f2, Lambda_b, y_ref):
+    return 1.0*k_f1**2*k_f2**2*y_ref**2/(1 - 1.0*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_487(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1.0/Lambda_b**2
+    x2 = -k_f1*k_f2*x1 + 1
+    return k_f1**3*k_f2**2*x0*x1/x2**2 + 2.0*k_f1**2*k_f2*x0/x2
+
+
+def _kernel_scale_488(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    return x0*x3*y_ref**2*(4.0*x1*x3 + 2.0 + 2.0*k_f2**2*x0/(Lambda_b**4*x2**2))
+
+
+def _kernel_scale_489(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1.0/Lambda_b**2
+    x2 = -k_f1*k_f2*x1 + 1
+    return k_f1**2*k_f2**3*x0*x1/x2**2 + 2.0*k_f1*k_f2**2*x0/x2
+
+
+def _kernel_scale_490(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    return x0*x3*y_ref**2*(5.0*x1*x3 + 4.0 + 2.0*k_f1**2*k_f2**2/(Lambda_b**4*x2**2))
+
+
+def _kernel_scale_491(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return k_f1*x2*y_ref**2*(14.0*x0*x2 + 4.0 + 16.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 6.0*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))
+
+
+def _kernel_scale_492(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    return x0*x3*y_ref**2*(4.0*x1*x3 + 2.0 + 2.0*k_f1**2*x0/(Lambda_b**4*x2**2))
+
+
+def _kernel_scale_493(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return k_f2*x2*y_ref**2*(14.0*x0*x2 + 4.0 + 16.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 6.0*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))
+
+
+def _kernel_scale_494(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    return x2*y_ref**2*(32.0*x0*x2 + 4.0 + 76.0*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 72.0*k_f1**3*k_f2**3/(Lambda_b**6*x1**3) + 24.0*k_f1**4*k_f2**4/(Lambda_b**8*x1**4))
+
+
+def _kernel_scale_495(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.629960524947436*k_f1**2*k_f2**2*y_ref**2/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_496(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = Lambda_b**(-2.0)
+    x2 = -0.7937005259841*k_f1*k_f2*x1 + 1
+    return 0.5*k_f1**3*k_f2**2*x0*x1/x2**2 + 1.25992104989487*k_f1**2*k_f2*x0/x2
+
+
+def _kernel_scale_497(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    return x0*x3*y_ref**2*(2.0*x1*x3 + 1.25992104989487 + 0.793700525984099*k_f2**2*x0/(Lambda_b**4*x2**2))
+
+
+def _kernel_scale_498(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = Lambda_b**(-2.0)
+    x2 = -0.7937005259841*k_f1*k_f2*x1 + 1
+    return 0.5*k_f1**2*k_f2**3*x0*x1/x2**2 + 1.25992104989487*k_f1*k_f2**2*x0/x2
+
+
+def _kernel_scale_499(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    return x0*x3*y_ref**2*(2.5*x1*x3 + 2.51984209978975 + 0.793700525984099*k_f1**2*k_f2**2/(Lambda_b**4*x2**2))
+
+
+def _kernel_scale_500(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1*x2*y_ref**2*(7.0*x0*x2 + 2.51984209978975 + 6.3496042078728*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 1.88988157484231*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))
+
+
+def _kernel_scale_501(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    return x0*x3*y_ref**2*(2.0*x1*x3 + 1.25992104989487 + 0.793700525984099*k_f1**2*x0/(Lambda_b**4*x2**2))
+
+
+def _kernel_scale_502(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f2*x2*y_ref**2*(7.0*x0*x2 + 2.51984209978975 + 6.3496042078728*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 1.88988157484231*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))
+
+
+def _kernel_scale_503(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return x2*y_ref**2*(16.0*x0*x2 + 2.51984209978975 + 30.1606199873958*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 22.6785788981077*k_f1**3*k_f2**3/(Lambda_b**6*x1**3) + 6.0*k_f1**4*k_f2**4/(Lambda_b**8*x1**4))
+
+
+def _kernel_scale_504(k_f1, k_f2, Lambda_b, y_ref):
+    return 0.629960524947436*k_f1**2*k_f2**2*y_ref**2/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+
+
+def _kernel_scale_505(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = Lambda_b**(-2.0)
+    x2 = -0.7937005259841*k_f1*k_f2*x1 + 1
+    return 0.5*k_f1**3*k_f2**2*x0*x1/x2**2 + 1.25992104989487*k_f1**2*k_f2*x0/x2
+
+
+def _kernel_scale_506(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    return x0*x3*y_ref**2*(2.0*x1*x3 + 1.25992104989487 + 0.793700525984099*k_f2**2*x0/(Lambda_b**4*x2**2))
+
+
+def _kernel_scale_507(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = Lambda_b**(-2.0)
+    x2 = -0.7937005259841*k_f1*k_f2*x1 + 1
+    return 0.5*k_f1**2*k_f2**3*x0*x1/x2**2 + 1.25992104989487*k_f1*k_f2**2*x0/x2
+
+
+def _kernel_scale_508(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    return x0*x3*y_ref**2*(2.5*x1*x3 + 2.51984209978975 + 0.793700525984099*k_f1**2*k_f2**2/(Lambda_b**4*x2**2))
+
+
+def _kernel_scale_509(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f1*x2*y_ref**2*(7.0*x0*x2 + 2.51984209978975 + 6.3496042078728*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 1.88988157484231*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))
+
+
+def _kernel_scale_510(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    return x0*x3*y_ref**2*(2.0*x1*x3 + 1.25992104989487 + 0.793700525984099*k_f1**2*x0/(Lambda_b**4*x2**2))
+
+
+def _kernel_scale_511(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return k_f2*x2*y_ref**2*(7.0*x0*x2 + 2.51984209978975 + 6.3496042078728*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 1.88988157484231*k_f1**3*k_f2**3/(Lambda_b**6*x1**3))
+
+
+def _kernel_scale_512(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    return x2*y_ref**2*(16.0*x0*x2 + 2.51984209978975 + 30.1606199873958*k_f1**2*k_f2**2/(Lambda_b**4*x1**2) + 22.6785788981077*k_f1**3*k_f2**3/(Lambda_b**6*x1**3) + 6.0*k_f1**4*k_f2**4/(Lambda_b**8*x1**4))
+
+
+def _kernel_scale_513(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = 1.0*y_ref**2/(1 - 1.0*k_f1*k_f2/Lambda_b**2)
+    return k_f1**2*k_f2**2*x0 + k_f1**4*k_f2**4*x0/Lambda_b**6
+
+
+def _kernel_scale_514(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1.0/Lambda_b**2
+    x2 = -k_f1*k_f2*x1 + 1
+    x3 = x0/x2
+    x4 = x0/x2**2
+    return k_f1**3*k_f2**2*x1*x4 + 2.0*k_f1**2*k_f2*x3 + 4.0*k_f1**4*k_f2**3*x3/Lambda_b**6 + 1.0*k_f1**5*k_f2**4*x4/Lambda_b**8
+
+
+def _kernel_scale_515(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f2**2*x0
+    x5 = 2.0/x2**2
+    return x0*x3*y_ref**2*(4.0*x1*x3 + 2.0 + x4*x5/Lambda_b**4 + 12.0*x4/Lambda_b**6 + 8.0*k_f1**3*k_f2**3*x3/Lambda_b**8 + k_f1**4*k_f2**4*x5/Lambda_b**10)
+
+
+def _kernel_scale_516(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = 1.0/Lambda_b**2
+    x2 = -k_f1*k_f2*x1 + 1
+    x3 = x0/x2
+    x4 = x0/x2**2
+    return k_f1**2*k_f2**3*x1*x4 + 2.0*k_f1*k_f2**2*x3 + 4.0*k_f1**3*k_f2**4*x3/Lambda_b**6 + 1.0*k_f1**4*k_f2**5*x4/Lambda_b**8
+
+
+def _kernel_scale_517(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*k_f2**2
+    x5 = 2.0/x2**2
+    return x0*x3*y_ref**2*(5.0*x1*x3 + 4.0 + x4*x5/Lambda_b**4 + 16.0*x4/Lambda_b**6 + 9.0*k_f1**3*k_f2**3*x3/Lambda_b**8 + k_f1**4*k_f2**4*x5/Lambda_b**10)
+
+
+def _kernel_scale_518(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-6.0)
+    x4 = k_f1**2*k_f2**2
+    x5 = 6.0/x1**3
+    x6 = x1**(-2.0)
+    x7 = k_f1**3*k_f2**3
+    return k_f1*x2*y_ref**2*(14.0*x0*x2 + 48.0*x3*x4 + x3*x5*x7 + 4.0 + 16.0*x4*x6/Lambda_b**4 + 52.0*x2*x7/Lambda_b**8 + 28.0*k_f1**4*k_f2**4*x6/Lambda_b**10 + k_f1**5*k_f2**5*x5/Lambda_b**12)
+
+
+def _kernel_scale_519(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 1.0*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*x0
+    x5 = 2.0/x2**2
+    return x0*x3*y_ref**2*(4.0*x1*x3 + 2.0 + x4*x5/Lambda_b**4 + 12.0*x4/Lambda_b**6 + 8.0*k_f1**3*k_f2**3*x3/Lambda_b**8 + k_f1**4*k_f2**4*x5/Lambda_b**10)
+
+
+def _kernel_scale_520(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-6.0)
+    x4 = k_f1**2*k_f2**2
+    x5 = 6.0/x1**3
+    x6 = x1**(-2.0)
+    x7 = k_f1**3*k_f2**3
+    return k_f2*x2*y_ref**2*(14.0*x0*x2 + 48.0*x3*x4 + x3*x5*x7 + 4.0 + 16.0*x4*x6/Lambda_b**4 + 52.0*x2*x7/Lambda_b**8 + 28.0*k_f1**4*k_f2**4*x6/Lambda_b**10 + k_f1**5*k_f2**5*x5/Lambda_b**12)
+
+
+def _kernel_scale_521(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 1.0*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-6.0)
+    x4 = k_f1**2*k_f2**2
+    x5 = 24.0/x1**4
+    x6 = x1**(-3.0)
+    x7 = x1**(-2.0)
+    x8 = k_f1**4*k_f2**4
+    x9 = Lambda_b**(-8.0)
+    x10 = k_f1**3*k_f2**3
+    return x2*y_ref**2*(32.0*x0*x2 + 256.0*x10*x2*x9 + 72.0*x10*x3*x6 + 144.0*x3*x4 + x5*x8*x9 + 4.0 + 76.0*x4*x7/Lambda_b**4 + 244.0*x7*x8/Lambda_b**10 + 120.0*k_f1**5*k_f2**5*x6/Lambda_b**12 + k_f1**6*k_f2**6*x5/Lambda_b**14)
+
+
+def _kernel_scale_522(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+    return 0.629960524947436*k_f1**2*k_f2**2*x0 + 0.39685026299205*k_f1**4*k_f2**4*x0/Lambda_b**6
+
+
+def _kernel_scale_523(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = Lambda_b**(-2.0)
+    x2 = -0.7937005259841*k_f1*k_f2*x1 + 1
+    x3 = x0/x2
+    x4 = x0/x2**2
+    return 0.5*k_f1**3*k_f2**2*x1*x4 + 1.25992104989487*k_f1**2*k_f2*x3 + 1.5874010519682*k_f1**4*k_f2**3*x3/Lambda_b**6 + 0.314980262473718*k_f1**5*k_f2**4*x4/Lambda_b**8
+
+
+def _kernel_scale_524(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f2**2*x0
+    x5 = x2**(-2.0)
+    return x0*x3*y_ref**2*(2.0*x1*x3 + 1.25992104989487 + 0.793700525984099*x4*x5/Lambda_b**4 + 4.7622031559046*x4/Lambda_b**6 + 2.51984209978975*k_f1**3*k_f2**3*x3/Lambda_b**8 + 0.5*k_f1**4*k_f2**4*x5/Lambda_b**10)
+
+
+def _kernel_scale_525(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = Lambda_b**(-2.0)
+    x2 = -0.7937005259841*k_f1*k_f2*x1 + 1
+    x3 = x0/x2
+    x4 = x0/x2**2
+    return 0.5*k_f1**2*k_f2**3*x1*x4 + 1.25992104989487*k_f1*k_f2**2*x3 + 1.5874010519682*k_f1**3*k_f2**4*x3/Lambda_b**6 + 0.314980262473718*k_f1**4*k_f2**5*x4/Lambda_b**8
+
+
+def _kernel_scale_526(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*k_f2**2
+    x5 = x2**(-2.0)
+    return x0*x3*y_ref**2*(2.5*x1*x3 + 2.51984209978975 + 0.793700525984099*x4*x5/Lambda_b**4 + 6.3496042078728*x4/Lambda_b**6 + 2.83482236226346*k_f1**3*k_f2**3*x3/Lambda_b**8 + 0.5*k_f1**4*k_f2**4*x5/Lambda_b**10)
+
+
+def _kernel_scale_527(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-6.0)
+    x4 = k_f1**2*k_f2**2
+    x5 = x1**(-3.0)
+    x6 = x1**(-2.0)
+    x7 = k_f1**3*k_f2**3
+    return k_f1*x2*y_ref**2*(7.0*x0*x2 + 19.0488126236184*x3*x4 + 1.88988157484231*x3*x5*x7 + 2.51984209978975 + 6.3496042078728*x4*x6/Lambda_b**4 + 16.3789736486333*x2*x7/Lambda_b**8 + 7.0*k_f1**4*k_f2**4*x6/Lambda_b**10 + 1.19055078897615*k_f1**5*k_f2**5*x5/Lambda_b**12)
+
+
+def _kernel_scale_528(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*x0
+    x5 = x2**(-2.0)
+    return x0*x3*y_ref**2*(2.0*x1*x3 + 1.25992104989487 + 0.793700525984099*x4*x5/Lambda_b**4 + 4.7622031559046*x4/Lambda_b**6 + 2.51984209978975*k_f1**3*k_f2**3*x3/Lambda_b**8 + 0.5*k_f1**4*k_f2**4*x5/Lambda_b**10)
+
+
+def _kernel_scale_529(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-6.0)
+    x4 = k_f1**2*k_f2**2
+    x5 = x1**(-3.0)
+    x6 = x1**(-2.0)
+    x7 = k_f1**3*k_f2**3
+    return k_f2*x2*y_ref**2*(7.0*x0*x2 + 19.0488126236184*x3*x4 + 1.88988157484231*x3*x5*x7 + 2.51984209978975 + 6.3496042078728*x4*x6/Lambda_b**4 + 16.3789736486333*x2*x7/Lambda_b**8 + 7.0*k_f1**4*k_f2**4*x6/Lambda_b**10 + 1.19055078897615*k_f1**5*k_f2**5*x5/Lambda_b**12)
+
+
+def _kernel_scale_530(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-6.0)
+    x4 = k_f1**2*k_f2**2
+    x5 = x1**(-4.0)
+    x6 = x1**(-3.0)
+    x7 = x1**(-2.0)
+    x8 = k_f1**4*k_f2**4
+    x9 = Lambda_b**(-8.0)
+    x10 = k_f1**3*k_f2**3
+    return x2*y_ref**2*(16.0*x0*x2 + 80.6349471932719*x10*x2*x9 + 22.6785788981077*x10*x3*x6 + 57.1464378708552*x3*x4 + 6.0*x5*x8*x9 + 2.51984209978975 + 30.1606199873958*x4*x7/Lambda_b**4 + 61.0*x7*x8/Lambda_b**10 + 23.811015779523*k_f1**5*k_f2**5*x6/Lambda_b**12 + 3.77976314968462*k_f1**6*k_f2**6*x5/Lambda_b**14)
+
+
+def _kernel_scale_531(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2/(1 - 0.7937005259841*k_f1*k_f2/Lambda_b**2)
+    return 0.629960524947436*k_f1**2*k_f2**2*x0 + 0.39685026299205*k_f1**4*k_f2**4*x0/Lambda_b**6
+
+
+def _kernel_scale_532(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = Lambda_b**(-2.0)
+    x2 = -0.7937005259841*k_f1*k_f2*x1 + 1
+    x3 = x0/x2
+    x4 = x0/x2**2
+    return 0.5*k_f1**3*k_f2**2*x1*x4 + 1.25992104989487*k_f1**2*k_f2*x3 + 1.5874010519682*k_f1**4*k_f2**3*x3/Lambda_b**6 + 0.314980262473718*k_f1**5*k_f2**4*x4/Lambda_b**8
+
+
+def _kernel_scale_533(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f2**2*x0
+    x5 = x2**(-2.0)
+    return x0*x3*y_ref**2*(2.0*x1*x3 + 1.25992104989487 + 0.793700525984099*x4*x5/Lambda_b**4 + 4.7622031559046*x4/Lambda_b**6 + 2.51984209978975*k_f1**3*k_f2**3*x3/Lambda_b**8 + 0.5*k_f1**4*k_f2**4*x5/Lambda_b**10)
+
+
+def _kernel_scale_534(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = y_ref**2
+    x1 = Lambda_b**(-2.0)
+    x2 = -0.7937005259841*k_f1*k_f2*x1 + 1
+    x3 = x0/x2
+    x4 = x0/x2**2
+    return 0.5*k_f1**2*k_f2**3*x1*x4 + 1.25992104989487*k_f1*k_f2**2*x3 + 1.5874010519682*k_f1**3*k_f2**4*x3/Lambda_b**6 + 0.314980262473718*k_f1**4*k_f2**5*x4/Lambda_b**8
+
+
+def _kernel_scale_535(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2
+    x1 = x0/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*k_f2**2
+    x5 = x2**(-2.0)
+    return x0*x3*y_ref**2*(2.5*x1*x3 + 2.51984209978975 + 0.793700525984099*x4*x5/Lambda_b**4 + 6.3496042078728*x4/Lambda_b**6 + 2.83482236226346*k_f1**3*k_f2**3*x3/Lambda_b**8 + 0.5*k_f1**4*k_f2**4*x5/Lambda_b**10)
+
+
+def _kernel_scale_536(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-6.0)
+    x4 = k_f1**2*k_f2**2
+    x5 = x1**(-3.0)
+    x6 = x1**(-2.0)
+    x7 = k_f1**3*k_f2**3
+    return k_f1*x2*y_ref**2*(7.0*x0*x2 + 19.0488126236184*x3*x4 + 1.88988157484231*x3*x5*x7 + 2.51984209978975 + 6.3496042078728*x4*x6/Lambda_b**4 + 16.3789736486333*x2*x7/Lambda_b**8 + 7.0*k_f1**4*k_f2**4*x6/Lambda_b**10 + 1.19055078897615*k_f1**5*k_f2**5*x5/Lambda_b**12)
+
+
+def _kernel_scale_537(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f2**2
+    x1 = k_f1*k_f2/Lambda_b**2
+    x2 = 1 - 0.7937005259841*x1
+    x3 = x2**(-1.0)
+    x4 = k_f1**2*x0
+    x5 = x2**(-2.0)
+    return x0*x3*y_ref**2*(2.0*x1*x3 + 1.25992104989487 + 0.793700525984099*x4*x5/Lambda_b**4 + 4.7622031559046*x4/Lambda_b**6 + 2.51984209978975*k_f1**3*k_f2**3*x3/Lambda_b**8 + 0.5*k_f1**4*k_f2**4*x5/Lambda_b**10)
+
+
+def _kernel_scale_538(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-6.0)
+    x4 = k_f1**2*k_f2**2
+    x5 = x1**(-3.0)
+    x6 = x1**(-2.0)
+    x7 = k_f1**3*k_f2**3
+    return k_f2*x2*y_ref**2*(7.0*x0*x2 + 19.0488126236184*x3*x4 + 1.88988157484231*x3*x5*x7 + 2.51984209978975 + 6.3496042078728*x4*x6/Lambda_b**4 + 16.3789736486333*x2*x7/Lambda_b**8 + 7.0*k_f1**4*k_f2**4*x6/Lambda_b**10 + 1.19055078897615*k_f1**5*k_f2**5*x5/Lambda_b**12)
+
+
+def _kernel_scale_539(k_f1, k_f2, Lambda_b, y_ref):
+    x0 = k_f1*k_f2/Lambda_b**2
+    x1 = 1 - 0.7937005259841*x0
+    x2 = x1**(-1.0)
+    x3 = Lambda_b**(-6.0)
+    x4 = k_f1**2*k_f2**2
+    x5 = x1**(-4.0)
+    x6 = x1**(-3.0)
+    x7 = x1**(-2.0)
+    x8 = k_f1**4*k_f2**4
+    x9 = Lambda_b**(-8.0)
+    x10 = k_f1**3*k_f2**3
+    return x2*y_ref**2*(16.0*x0*x2 + 80.6349471932719*x10*x2*x9 + 22.6785788981077*x10*x3*x6 + 57.1464378708552*x3*x4 + 6.0*x5*x8*x9 + 2.51984209978975 + 30.1606199873958*x4*x7/Lambda_b**4 + 61.0*x7*x8/Lambda_b**10 + 23.811015779523*k_f1**5*k_f2**5*x6/Lambda_b**12 + 3.77976314968462*k_f1**6*k_f2**6*x5/Lambda_b**14)
+
+
+#: Keyed by (lowest_order, highest_order, include_3bf, k_f1_scale, k_f2_scale, off_diag, ni, nj)
+KERNEL_SCALE_FUNCTIONS = {
+    (0, 0, False, 1.0, 1.0, False, 0, 0): _kernel_scale_0,
+    (0, 0, False, 1.0, 1.0, False, 0, 1): _kernel_scale_1,
+    (0, 0, False, 1.0, 1.0, False, 0, 2): _kernel_scale_2,
+    (0, 0, False, 1.0, 1.0, False, 1, 0): _kernel_scale_3,
+    (0, 0, False, 1.0, 1.0, False, 1, 1): _kernel_scale_4,
+    (0, 0, False, 1.0, 1.0, False, 1, 2): _kernel_scale_5,
+    (0, 0, False, 1.0, 1.0, False, 2, 0): _kernel_scale_6,
+    (0, 0, False, 1.0, 1.0, False, 2, 1): _kernel_scale_7,
+    (0, 0, False, 1.0, 1.0, False, 2, 2): _kernel_scale_8,
+    (0, 0, False, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_9,
+    (0, 0, False, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_10,
+    (0, 0, False, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_11,
+    (0, 0, False, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_12,
+    (0, 0, False, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_13,
+    (0, 0, False, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_14,
+    (0, 0, False, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_15,
+    (0, 0, False, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_16,
+    (0, 0, False, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_17,
+    (0, 0, False, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_18,
+    (0, 0, False, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_19,
+    (0, 0, False, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_20,
+    (0, 0, False, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_21,
+    (0, 0, False, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_22,
+    (0, 0, False, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_23,
+    (0, 0, False, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_24,
+    (0, 0, False, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_25,
+    (0, 0, False, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_26,
+    (0, 0, True, 1.0, 1.0, False, 0, 0): _kernel_scale_27,
+    (0, 0, True, 1.0, 1.0, False, 0, 1): _kernel_scale_28,
+    (0, 0, True, 1.0, 1.0, False, 0, 2): _kernel_scale_29,
+    (0, 0, True, 1.0, 1.0, False, 1, 0): _kernel_scale_30,
+    (0, 0, True, 1.0, 1.0, False, 1, 1): _kernel_scale_31,
+    (0, 0, True, 1.0, 1.0, False, 1, 2): _kernel_scale_32,
+    (0, 0, True, 1.0, 1.0, False, 2, 0): _kernel_scale_33,
+    (0, 0, True, 1.0, 1.0, False, 2, 1): _kernel_scale_34,
+    (0, 0, True, 1.0, 1.0, False, 2, 2): _kernel_scale_35,
+    (0, 0, True, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_36,
+    (0, 0, True, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_37,
+    (0, 0, True, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_38,
+    (0, 0, True, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_39,
+    (0, 0, True, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_40,
+    (0, 0, True, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_41,
+    (0, 0, True, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_42,
+    (0, 0, True, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_43,
+    (0, 0, True, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_44,
+    (0, 0, True, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_45,
+    (0, 0, True, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_46,
+    (0, 0, True, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_47,
+    (0, 0, True, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_48,
+    (0, 0, True, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_49,
+    (0, 0, True, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_50,
+    (0, 0, True, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_51,
+    (0, 0, True, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_52,
+    (0, 0, True, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_53,
+    (0, 1, False, 1.0, 1.0, False, 0, 0): _kernel_scale_54,
+    (0, 1, False, 1.0, 1.0, False, 0, 1): _kernel_scale_55,
+    (0, 1, False, 1.0, 1.0, False, 0, 2): _kernel_scale_56,
+    (0, 1, False, 1.0, 1.0, False, 1, 0): _kernel_scale_57,
+    (0, 1, False, 1.0, 1.0, False, 1, 1): _kernel_scale_58,
+    (0, 1, False, 1.0, 1.0, False, 1, 2): _kernel_scale_59,
+    (0, 1, False, 1.0, 1.0, False, 2, 0): _kernel_scale_60,
+    (0, 1, False, 1.0, 1.0, False, 2, 1): _kernel_scale_61,
+    (0, 1, False, 1.0, 1.0, False, 2, 2): _kernel_scale_62,
+    (0, 1, False, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_63,
+    (0, 1, False, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_64,
+    (0, 1, False, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_65,
+    (0, 1, False, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_66,
+    (0, 1, False, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_67,
+    (0, 1, False, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_68,
+    (0, 1, False, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_69,
+    (0, 1, False, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_70,
+    (0, 1, False, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_71,
+    (0, 1, False, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_72,
+    (0, 1, False, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_73,
+    (0, 1, False, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_74,
+    (0, 1, False, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_75,
+    (0, 1, False, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_76,
+    (0, 1, False, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_77,
+    (0, 1, False, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_78,
+    (0, 1, False, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_79,
+    (0, 1, False, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_80,
+    (0, 1, True, 1.0, 1.0, False, 0, 0): _kernel_scale_81,
+    (0, 1, True, 1.0, 1.0, False, 0, 1): _kernel_scale_82,
+    (0, 1, True, 1.0, 1.0, False, 0, 2): _kernel_scale_83,
+    (0, 1, True, 1.0, 1.0, False, 1, 0): _kernel_scale_84,
+    (0, 1, True, 1.0, 1.0, False, 1, 1): _kernel_scale_85,
+    (0, 1, True, 1.0, 1.0, False, 1, 2): _kernel_scale_86,
+    (0, 1, True, 1.0, 1.0, False, 2, 0): _kernel_scale_87,
+    (0, 1, True, 1.0, 1.0, False, 2, 1): _kernel_scale_88,
+    (0, 1, True, 1.0, 1.0, False, 2, 2): _kernel_scale_89,
+    (0, 1, True, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_90,
+    (0, 1, True, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_91,
+    (0, 1, True, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_92,
+    (0, 1, True, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_93,
+    (0, 1, True, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_94,
+    (0, 1, True, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_95,
+    (0, 1, True, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_96,
+    (0, 1, True, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_97,
+    (0, 1, True, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_98,
+    (0, 1, True, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_99,
+    (0, 1, True, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_100,
+    (0, 1, True, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_101,
+    (0, 1, True, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_102,
+    (0, 1, True, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_103,
+    (0, 1, True, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_104,
+    (0, 1, True, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_105,
+    (0, 1, True, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_106,
+    (0, 1, True, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_107,
+    (0, 2, False, 1.0, 1.0, False, 0, 0): _kernel_scale_108,
+    (0, 2, False, 1.0, 1.0, False, 0, 1): _kernel_scale_109,
+    (0, 2, False, 1.0, 1.0, False, 0, 2): _kernel_scale_110,
+    (0, 2, False, 1.0, 1.0, False, 1, 0): _kernel_scale_111,
+    (0, 2, False, 1.0, 1.0, False, 1, 1): _kernel_scale_112,
+    (0, 2, False, 1.0, 1.0, False, 1, 2): _kernel_scale_113,
+    (0, 2, False, 1.0, 1.0, False, 2, 0): _kernel_scale_114,
+    (0, 2, False, 1.0, 1.0, False, 2, 1): _kernel_scale_115,
+    (0, 2, False, 1.0, 1.0, False, 2, 2): _kernel_scale_116,
+    (0, 2, False, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_117,
+    (0, 2, False, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_118,
+    (0, 2, False, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_119,
+    (0, 2, False, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_120,
+    (0, 2, False, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_121,
+    (0, 2, False, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_122,
+    (0, 2, False, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_123,
+    (0, 2, False, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_124,
+    (0, 2, False, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_125,
+    (0, 2, False, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_126,
+    (0, 2, False, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_127,
+    (0, 2, False, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_128,
+    (0, 2, False, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_129,
+    (0, 2, False, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_130,
+    (0, 2, False, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_131,
+    (0, 2, False, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_132,
+    (0, 2, False, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_133,
+    (0, 2, False, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_134,
+    (0, 2, True, 1.0, 1.0, False, 0, 0): _kernel_scale_135,
+    (0, 2, True, 1.0, 1.0, False, 0, 1): _kernel_scale_136,
+    (0, 2, True, 1.0, 1.0, False, 0, 2): _kernel_scale_137,
+    (0, 2, True, 1.0, 1.0, False, 1, 0): _kernel_scale_138,
+    (0, 2, True, 1.0, 1.0, False, 1, 1): _kernel_scale_139,
+    (0, 2, True, 1.0, 1.0, False, 1, 2): _kernel_scale_140,
+    (0, 2, True, 1.0, 1.0, False, 2, 0): _kernel_scale_141,
+    (0, 2, True, 1.0, 1.0, False, 2, 1): _kernel_scale_142,
+    (0, 2, True, 1.0, 1.0, False, 2, 2): _kernel_scale_143,
+    (0, 2, True, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_144,
+    (0, 2, True, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_145,
+    (0, 2, True, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_146,
+    (0, 2, True, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_147,
+    (0, 2, True, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_148,
+    (0, 2, True, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_149,
+    (0, 2, True, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_150,
+    (0, 2, True, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_151,
+    (0, 2, True, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_152,
+    (0, 2, True, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_153,
+    (0, 2, True, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_154,
+    (0, 2, True, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_155,
+    (0, 2, True, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_156,
+    (0, 2, True, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_157,
+    (0, 2, True, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_158,
+    (0, 2, True, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_159,
+    (0, 2, True, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_160,
+    (0, 2, True, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_161,
+    (0, 3, False, 1.0, 1.0, False, 0, 0): _kernel_scale_162,
+    (0, 3, False, 1.0, 1.0, False, 0, 1): _kernel_scale_163,
+    (0, 3, False, 1.0, 1.0, False, 0, 2): _kernel_scale_164,
+    (0, 3, False, 1.0, 1.0, False, 1, 0): _kernel_scale_165,
+    (0, 3, False, 1.0, 1.0, False, 1, 1): _kernel_scale_166,
+    (0, 3, False, 1.0, 1.0, False, 1, 2): _kernel_scale_167,
+    (0, 3, False, 1.0, 1.0, False, 2, 0): _kernel_scale_168,
+    (0, 3, False, 1.0, 1.0, False, 2, 1): _kernel_scale_169,
+    (0, 3, False, 1.0, 1.0, False, 2, 2): _kernel_scale_170,
+    (0, 3, False, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_171,
+    (0, 3, False, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_172,
+    (0, 3, False, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_173,
+    (0, 3, False, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_174,
+    (0, 3, False, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_175,
+    (0, 3, False, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_176,
+    (0, 3, False, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_177,
+    (0, 3, False, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_178,
+    (0, 3, False, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_179,
+    (0, 3, False, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_180,
+    (0, 3, False, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_181,
+    (0, 3, False, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_182,
+    (0, 3, False, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_183,
+    (0, 3, False, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_184,
+    (0, 3, False, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_185,
+    (0, 3, False, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_186,
+    (0, 3, False, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_187,
+    (0, 3, False, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_188,
+    (0, 3, True, 1.0, 1.0, False, 0, 0): _kernel_scale_189,
+    (0, 3, True, 1.0, 1.0, False, 0, 1): _kernel_scale_190,
+    (0, 3, True, 1.0, 1.0, False, 0, 2): _kernel_scale_191,
+    (0, 3, True, 1.0, 1.0, False, 1, 0): _kernel_scale_192,
+    (0, 3, True, 1.0, 1.0, False, 1, 1): _kernel_scale_193,
+    (0, 3, True, 1.0, 1.0, False, 1, 2): _kernel_scale_194,
+    (0, 3, True, 1.0, 1.0, False, 2, 0): _kernel_scale_195,
+    (0, 3, True, 1.0, 1.0, False, 2, 1): _kernel_scale_196,
+    (0, 3, True, 1.0, 1.0, False, 2, 2): _kernel_scale_197,
+    (0, 3, True, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_198,
+    (0, 3, True, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_199,
+    (0, 3, True, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_200,
+    (0, 3, True, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_201,
+    (0, 3, True, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_202,
+    (0, 3, True, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_203,
+    (0, 3, True, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_204,
+    (0, 3, True, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_205,
+    (0, 3, True, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_206,
+    (0, 3, True, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_207,
+    (0, 3, True, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_208,
+    (0, 3, True, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_209,
+    (0, 3, True, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_210,
+    (0, 3, True, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_211,
+    (0, 3, True, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_212,
+    (0, 3, True, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_213,
+    (0, 3, True, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_214,
+    (0, 3, True, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_215,
+    (0, 4, False, 1.0, 1.0, False, 0, 0): _kernel_scale_216,
+    (0, 4, False, 1.0, 1.0, False, 0, 1): _kernel_scale_217,
+    (0, 4, False, 1.0, 1.0, False, 0, 2): _kernel_scale_218,
+    (0, 4, False, 1.0, 1.0, False, 1, 0): _kernel_scale_219,
+    (0, 4, False, 1.0, 1.0, False, 1, 1): _kernel_scale_220,
+    (0, 4, False, 1.0, 1.0, False, 1, 2): _kernel_scale_221,
+    (0, 4, False, 1.0, 1.0, False, 2, 0): _kernel_scale_222,
+    (0, 4, False, 1.0, 1.0, False, 2, 1): _kernel_scale_223,
+    (0, 4, False, 1.0, 1.0, False, 2, 2): _kernel_scale_224,
+    (0, 4, False, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_225,
+    (0, 4, False, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_226,
+    (0, 4, False, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_227,
+    (0, 4, False, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_228,
+    (0, 4, False, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_229,
+    (0, 4, False, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_230,
+    (0, 4, False, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_231,
+    (0, 4, False, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_232,
+    (0, 4, False, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_233,
+    (0, 4, False, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_234,
+    (0, 4, False, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_235,
+    (0, 4, False, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_236,
+    (0, 4, False, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_237,
+    (0, 4, False, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_238,
+    (0, 4, False, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_239,
+    (0, 4, False, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_240,
+    (0, 4, False, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_241,
+    (0, 4, False, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_242,
+    (0, 4, True, 1.0, 1.0, False, 0, 0): _kernel_scale_243,
+    (0, 4, True, 1.0, 1.0, False, 0, 1): _kernel_scale_244,
+    (0, 4, True, 1.0, 1.0, False, 0, 2): _kernel_scale_245,
+    (0, 4, True, 1.0, 1.0, False, 1, 0): _kernel_scale_246,
+    (0, 4, True, 1.0, 1.0, False, 1, 1): _kernel_scale_247,
+    (0, 4, True, 1.0, 1.0, False, 1, 2): _kernel_scale_248,
+    (0, 4, True, 1.0, 1.0, False, 2, 0): _kernel_scale_249,
+    (0, 4, True, 1.0, 1.0, False, 2, 1): _kernel_scale_250,
+    (0, 4, True, 1.0, 1.0, False, 2, 2): _kernel_scale_251,
+    (0, 4, True, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_252,
+    (0, 4, True, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_253,
+    (0, 4, True, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_254,
+    (0, 4, True, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_255,
+    (0, 4, True, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_256,
+    (0, 4, True, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_257,
+    (0, 4, True, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_258,
+    (0, 4, True, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_259,
+    (0, 4, True, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_260,
+    (0, 4, True, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_261,
+    (0, 4, True, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_262,
+    (0, 4, True, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_263,
+    (0, 4, True, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_264,
+    (0, 4, True, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_265,
+    (0, 4, True, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_266,
+    (0, 4, True, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_267,
+    (0, 4, True, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_268,
+    (0, 4, True, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_269,
+    (2, None, False, 1.0, 1.0, False, 0, 0): _kernel_scale_270,
+    (2, None, False, 1.0, 1.0, False, 0, 1): _kernel_scale_271,
+    (2, None, False, 1.0, 1.0, False, 0, 2): _kernel_scale_272,
+    (2, None, False, 1.0, 1.0, False, 1, 0): _kernel_scale_273,
+    (2, None, False, 1.0, 1.0, False, 1, 1): _kernel_scale_274,
+    (2, None, False, 1.0, 1.0, False, 1, 2): _kernel_scale_275,
+    (2, None, False, 1.0, 1.0, False, 2, 0): _kernel_scale_276,
+    (2, None, False, 1.0, 1.0, False, 2, 1): _kernel_scale_277,
+    (2, None, False, 1.0, 1.0, False, 2, 2): _kernel_scale_278,
+    (2, None, False, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_279,
+    (2, None, False, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_280,
+    (2, None, False, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_281,
+    (2, None, False, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_282,
+    (2, None, False, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_283,
+    (2, None, False, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_284,
+    (2, None, False, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_285,
+    (2, None, False, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_286,
+    (2, None, False, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_287,
+    (2, None, False, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_288,
+    (2, None, False, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_289,
+    (2, None, False, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_290,
+    (2, None, False, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_291,
+    (2, None, False, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_292,
+    (2, None, False, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_293,
+    (2, None, False, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_294,
+    (2, None, False, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_295,
+    (2, None, False, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_296,
+    (2, None, True, 1.0, 1.0, False, 0, 0): _kernel_scale_297,
+    (2, None, True, 1.0, 1.0, False, 0, 1): _kernel_scale_298,
+    (2, None, True, 1.0, 1.0, False, 0, 2): _kernel_scale_299,
+    (2, None, True, 1.0, 1.0, False, 1, 0): _kernel_scale_300,
+    (2, None, True, 1.0, 1.0, False, 1, 1): _kernel_scale_301,
+    (2, None, True, 1.0, 1.0, False, 1, 2): _kernel_scale_302,
+    (2, None, True, 1.0, 1.0, False, 2, 0): _kernel_scale_303,
+    (2, None, True, 1.0, 1.0, False, 2, 1): _kernel_scale_304,
+    (2, None, True, 1.0, 1.0, False, 2, 2): _kernel_scale_305,
+    (2, None, True, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_306,
+    (2, None, True, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_307,
+    (2, None, True, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_308,
+    (2, None, True, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_309,
+    (2, None, True, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_310,
+    (2, None, True, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_311,
+    (2, None, True, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_312,
+    (2, None, True, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_313,
+    (2, None, True, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_314,
+    (2, None, True, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_315,
+    (2, None, True, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_316,
+    (2, None, True, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_317,
+    (2, None, True, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_318,
+    (2, None, True, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_319,
+    (2, None, True, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_320,
+    (2, None, True, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_321,
+    (2, None, True, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_322,
+    (2, None, True, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_323,
+    (3, None, False, 1.0, 1.0, False, 0, 0): _kernel_scale_324,
+    (3, None, False, 1.0, 1.0, False, 0, 1): _kernel_scale_325,
+    (3, None, False, 1.0, 1.0, False, 0, 2): _kernel_scale_326,
+    (3, None, False, 1.0, 1.0, False, 1, 0): _kernel_scale_327,
+    (3, None, False, 1.0, 1.0, False, 1, 1): _kernel_scale_328,
+    (3, None, False, 1.0, 1.0, False, 1, 2): _kernel_scale_329,
+    (3, None, False, 1.0, 1.0, False, 2, 0): _kernel_scale_330,
+    (3, None, False, 1.0, 1.0, False, 2, 1): _kernel_scale_331,
+    (3, None, False, 1.0, 1.0, False, 2, 2): _kernel_scale_332,
+    (3, None, False, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_333,
+    (3, None, False, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_334,
+    (3, None, False, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_335,
+    (3, None, False, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_336,
+    (3, None, False, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_337,
+    (3, None, False, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_338,
+    (3, None, False, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_339,
+    (3, None, False, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_340,
+    (3, None, False, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_341,
+    (3, None, False, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_342,
+    (3, None, False, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_343,
+    (3, None, False, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_344,
+    (3, None, False, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_345,
+    (3, None, False, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_346,
+    (3, None, False, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_347,
+    (3, None, False, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_348,
+    (3, None, False, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_349,
+    (3, None, False, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_350,
+    (3, None, True, 1.0, 1.0, False, 0, 0): _kernel_scale_351,
+    (3, None, True, 1.0, 1.0, False, 0, 1): _kernel_scale_352,
+    (3, None, True, 1.0, 1.0, False, 0, 2): _kernel_scale_353,
+    (3, None, True, 1.0, 1.0, False, 1, 0): _kernel_scale_354,
+    (3, None, True, 1.0, 1.0, False, 1, 1): _kernel_scale_355,
+    (3, None, True, 1.0, 1.0, False, 1, 2): _kernel_scale_356,
+    (3, None, True, 1.0, 1.0, False, 2, 0): _kernel_scale_357,
+    (3, None, True, 1.0, 1.0, False, 2, 1): _kernel_scale_358,
+    (3, None, True, 1.0, 1.0, False, 2, 2): _kernel_scale_359,
+    (3, None, True, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_360,
+    (3, None, True, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_361,
+    (3, None, True, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_362,
+    (3, None, True, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_363,
+    (3, None, True, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_364,
+    (3, None, True, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_365,
+    (3, None, True, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_366,
+    (3, None, True, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_367,
+    (3, None, True, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_368,
+    (3, None, True, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_369,
+    (3, None, True, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_370,
+    (3, None, True, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_371,
+    (3, None, True, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_372,
+    (3, None, True, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_373,
+    (3, None, True, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_374,
+    (3, None, True, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_375,
+    (3, None, True, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_376,
+    (3, None, True, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_377,
+    (4, None, False, 1.0, 1.0, False, 0, 0): _kernel_scale_378,
+    (4, None, False, 1.0, 1.0, False, 0, 1): _kernel_scale_379,
+    (4, None, False, 1.0, 1.0, False, 0, 2): _kernel_scale_380,
+    (4, None, False, 1.0, 1.0, False, 1, 0): _kernel_scale_381,
+    (4, None, False, 1.0, 1.0, False, 1, 1): _kernel_scale_382,
+    (4, None, False, 1.0, 1.0, False, 1, 2): _kernel_scale_383,
+    (4, None, False, 1.0, 1.0, False, 2, 0): _kernel_scale_384,
+    (4, None, False, 1.0, 1.0, False, 2, 1): _kernel_scale_385,
+    (4, None, False, 1.0, 1.0, False, 2, 2): _kernel_scale_386,
+    (4, None, False, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_387,
+    (4, None, False, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_388,
+    (4, None, False, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_389,
+    (4, None, False, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_390,
+    (4, None, False, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_391,
+    (4, None, False, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_392,
+    (4, None, False, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_393,
+    (4, None, False, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_394,
+    (4, None, False, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_395,
+    (4, None, False, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_396,
+    (4, None, False, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_397,
+    (4, None, False, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_398,
+    (4, None, False, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_399,
+    (4, None, False, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_400,
+    (4, None, False, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_401,
+    (4, None, False, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_402,
+    (4, None, False, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_403,
+    (4, None, False, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_404,
+    (4, None, True, 1.0, 1.0, False, 0, 0): _kernel_scale_405,
+    (4, None, True, 1.0, 1.0, False, 0, 1): _kernel_scale_406,
+    (4, None, True, 1.0, 1.0, False, 0, 2): _kernel_scale_407,
+    (4, None, True, 1.0, 1.0, False, 1, 0): _kernel_scale_408,
+    (4, None, True, 1.0, 1.0, False, 1, 1): _kernel_scale_409,
+    (4, None, True, 1.0, 1.0, False, 1, 2): _kernel_scale_410,
+    (4, None, True, 1.0, 1.0, False, 2, 0): _kernel_scale_411,
+    (4, None, True, 1.0, 1.0, False, 2, 1): _kernel_scale_412,
+    (4, None, True, 1.0, 1.0, False, 2, 2): _kernel_scale_413,
+    (4, None, True, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_414,
+    (4, None, True, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_415,
+    (4, None, True, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_416,
+    (4, None, True, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_417,
+    (4, None, True, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_418,
+    (4, None, True, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_419,
+    (4, None, True, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_420,
+    (4, None, True, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_421,
+    (4, None, True, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_422,
+    (4, None, True, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_423,
+    (4, None, True, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_424,
+    (4, None, True, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_425,
+    (4, None, True, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_426,
+    (4, None, True, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_427,
+    (4, None, True, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_428,
+    (4, None, True, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_429,
+    (4, None, True, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_430,
+    (4, None, True, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_431,
+    (5, None, False, 1.0, 1.0, False, 0, 0): _kernel_scale_432,
+    (5, None, False, 1.0, 1.0, False, 0, 1): _kernel_scale_433,
+    (5, None, False, 1.0, 1.0, False, 0, 2): _kernel_scale_434,
+    (5, None, False, 1.0, 1.0, False, 1, 0): _kernel_scale_435,
+    (5, None, False, 1.0, 1.0, False, 1, 1): _kernel_scale_436,
+    (5, None, False, 1.0, 1.0, False, 1, 2): _kernel_scale_437,
+    (5, None, False, 1.0, 1.0, False, 2, 0): _kernel_scale_438,
+    (5, None, False, 1.0, 1.0, False, 2, 1): _kernel_scale_439,
+    (5, None, False, 1.0, 1.0, False, 2, 2): _kernel_scale_440,
+    (5, None, False, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_441,
+    (5, None, False, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_442,
+    (5, None, False, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_443,
+    (5, None, False, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_444,
+    (5, None, False, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_445,
+    (5, None, False, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_446,
+    (5, None, False, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_447,
+    (5, None, False, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_448,
+    (5, None, False, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_449,
+    (5, None, False, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_450,
+    (5, None, False, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_451,
+    (5, None, False, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_452,
+    (5, None, False, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_453,
+    (5, None, False, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_454,
+    (5, None, False, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_455,
+    (5, None, False, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_456,
+    (5, None, False, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_457,
+    (5, None, False, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_458,
+    (5, None, True, 1.0, 1.0, False, 0, 0): _kernel_scale_459,
+    (5, None, True, 1.0, 1.0, False, 0, 1): _kernel_scale_460,
+    (5, None, True, 1.0, 1.0, False, 0, 2): _kernel_scale_461,
+    (5, None, True, 1.0, 1.0, False, 1, 0): _kernel_scale_462,
+    (5, None, True, 1.0, 1.0, False, 1, 1): _kernel_scale_463,
+    (5, None, True, 1.0, 1.0, False, 1, 2): _kernel_scale_464,
+    (5, None, True, 1.0, 1.0, False, 2, 0): _kernel_scale_465,
+    (5, None, True, 1.0, 1.0, False, 2, 1): _kernel_scale_466,
+    (5, None, True, 1.0, 1.0, False, 2, 2): _kernel_scale_467,
+    (5, None, True, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_468,
+    (5, None, True, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_469,
+    (5, None, True, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_470,
+    (5, None, True, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_471,
+    (5, None, True, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_472,
+    (5, None, True, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_473,
+    (5, None, True, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_474,
+    (5, None, True, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_475,
+    (5, None, True, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_476,
+    (5, None, True, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_477,
+    (5, None, True, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_478,
+    (5, None, True, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_479,
+    (5, None, True, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_480,
+    (5, None, True, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_481,
+    (5, None, True, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_482,
+    (5, None, True, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_483,
+    (5, None, True, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_484,
+    (5, None, True, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_485,
+    (0, None, False, 1.0, 1.0, False, 0, 0): _kernel_scale_486,
+    (0, None, False, 1.0, 1.0, False, 0, 1): _kernel_scale_487,
+    (0, None, False, 1.0, 1.0, False, 0, 2): _kernel_scale_488,
+    (0, None, False, 1.0, 1.0, False, 1, 0): _kernel_scale_489,
+    (0, None, False, 1.0, 1.0, False, 1, 1): _kernel_scale_490,
+    (0, None, False, 1.0, 1.0, False, 1, 2): _kernel_scale_491,
+    (0, None, False, 1.0, 1.0, False, 2, 0): _kernel_scale_492,
+    (0, None, False, 1.0, 1.0, False, 2, 1): _kernel_scale_493,
+    (0, None, False, 1.0, 1.0, False, 2, 2): _kernel_scale_494,
+    (0, None, False, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_495,
+    (0, None, False, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_496,
+    (0, None, False, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_497,
+    (0, None, False, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_498,
+    (0, None, False, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_499,
+    (0, None, False, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_500,
+    (0, None, False, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_501,
+    (0, None, False, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_502,
+    (0, None, False, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_503,
+    (0, None, False, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_504,
+    (0, None, False, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_505,
+    (0, None, False, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_506,
+    (0, None, False, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_507,
+    (0, None, False, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_508,
+    (0, None, False, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_509,
+    (0, None, False, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_510,
+    (0, None, False, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_511,
+    (0, None, False, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_512,
+    (0, None, True, 1.0, 1.0, False, 0, 0): _kernel_scale_513,
+    (0, None, True, 1.0, 1.0, False, 0, 1): _kernel_scale_514,
+    (0, None, True, 1.0, 1.0, False, 0, 2): _kernel_scale_515,
+    (0, None, True, 1.0, 1.0, False, 1, 0): _kernel_scale_516,
+    (0, None, True, 1.0, 1.0, False, 1, 1): _kernel_scale_517,
+    (0, None, True, 1.0, 1.0, False, 1, 2): _kernel_scale_518,
+    (0, None, True, 1.0, 1.0, False, 2, 0): _kernel_scale_519,
+    (0, None, True, 1.0, 1.0, False, 2, 1): _kernel_scale_520,
+    (0, None, True, 1.0, 1.0, False, 2, 2): _kernel_scale_521,
+    (0, None, True, 1.0, 0.7937005259840997, False, 0, 0): _kernel_scale_522,
+    (0, None, True, 1.0, 0.7937005259840997, False, 0, 1): _kernel_scale_523,
+    (0, None, True, 1.0, 0.7937005259840997, False, 0, 2): _kernel_scale_524,
+    (0, None, True, 1.0, 0.7937005259840997, False, 1, 0): _kernel_scale_525,
+    (0, None, True, 1.0, 0.7937005259840997, False, 1, 1): _kernel_scale_526,
+    (0, None, True, 1.0, 0.7937005259840997, False, 1, 2): _kernel_scale_527,
+    (0, None, True, 1.0, 0.7937005259840997, False, 2, 0): _kernel_scale_528,
+    (0, None, True, 1.0, 0.7937005259840997, False, 2, 1): _kernel_scale_529,
+    (0, None, True, 1.0, 0.7937005259840997, False, 2, 2): _kernel_scale_530,
+    (0, None, True, 0.7937005259840997, 1.0, False, 0, 0): _kernel_scale_531,
+    (0, None, True, 0.7937005259840997, 1.0, False, 0, 1): _kernel_scale_532,
+    (0, None, True, 0.7937005259840997, 1.0, False, 0, 2): _kernel_scale_533,
+    (0, None, True, 0.7937005259840997, 1.0, False, 1, 0): _kernel_scale_534,
+    (0, None, True, 0.7937005259840997, 1.0, False, 1, 1): _kernel_scale_535,
+    (0, None, True, 0.7937005259840997, 1.0, False, 1, 2): _kernel_scale_536,
+    (0, None, True, 0.7937005259840997, 1.0, False, 2, 0): _kernel_scale_537,
+    (0, None, True, 0.7937005259840997, 1.0, False, 2, 1): _kernel_scale_538,
+    (0, None, True, 0.7937005259840997, 1.0, False, 2, 2): _kernel_scale_539,
+}
@@ -1,4 +1,5 @@
 import numpy as np
+from scipy import sparse
 
 hbar_c = 197.327  # MeV-fm
 mass_proton = 938.272
@@ -216,12 +217,52 @@ def compute_pressure_derivative_wrt_density(n, kf, dE, d2E, wrt_kf=True):
     dP/dn : array-like, shape = (N,)
         The derivative of the pressure with respect to density
     """
+    dE_coeff, d2E_coeff = _pressure_derivative_coefficients(n, kf, wrt_kf=wrt_kf)
+    return dE_coeff * dE + d2E_coeff * d2E
+
+
+def _pressure_derivative_coefficients(n, kf, wrt_kf=True):
+    """The coefficients of dE and d2E in the derivative of the pressure with respect to density"""
     if wrt_kf:
         dk_dn = kf_derivative_wrt_density(kf, n)
         d2k_dn2 = kf_2nd_derivative_wrt_density(kf, n)
-        return (2 * n * dk_dn + n**2 * d2k_dn2) * dE + (n * dk_dn)**2 * d2E
+        return 2 * n * dk_dn + n**2 * d2k_dn2, (n * dk_dn)**2
     else:
-        return 2 * n * dE + n**2 * d2E
+        return 2 * n, n**2
+
+
+def compute_pressure_derivative_wrt_density_cov(n, kf, dE_cov, d2E_cov, dE_d2E_cov, wrt_kf=True):
+    """Computes the covariance of the derivative of the pressure with respect to density
+
+    The derivative is linear in `dE` and `d2E`, so this is exact.
+
+    Parameters
+    ----------
+    n : array-like, shape = (N,)
+        The density in fm^-3
+    kf : array-like, shape = (N,)
+        The fermi momentum in fm^-1
+    dE_cov : array-like, shape = (N, N)
+        The covariance of the derivative of the energy per particle.
+        If `wrt_kf is True`, then this derivative is
+        assumed to be with respect to `kf`. Otherwise it is with respect to density.
+    d2E_cov : array-like, shape = (N, N)
+        The covariance of the 2nd derivative of the energy per particle.
+    dE_d2E_cov : array-like, shape = (N, N)
+        The covariance of the `dE` and `d2E`.
+    wrt_kf : bool
+        How to interpret the derivatives `dE` and `d2E`. Defaults to `True`, so the derivative of `E` is with
+        respect to `kf`.
+
+    Returns
+    -------
+    dP/dn_cov : array-like, shape = (N, N)
+        The covariance of the derivative of the pressure with respect to density
+    """
+    dE_coeff, d2E_coeff = _pressure_derivative_coefficients(n, kf, wrt_kf=wrt_kf)
+    mixed_cov = dE_coeff[:, None] * d2E_coeff * dE_d2E_cov
+    return dE_coeff[:, None] * dE_coeff * dE_cov + d2E_coeff[:, None] * d2E_coeff * d2E_cov + \
+        mixed_cov + mixed_cov.T
 
 
 def compute_slope(n, kf, dS2, wrt_kf=True):
@@ -400,3 +441,236 @@ def compute_speed_of_sound(n, kf, E, dE, d2E, mass, wrt_kf=True):
         deps_dn = E + mass + n * dE
     # return np.sqrt(dP_dn / deps_dn)
     return dP_dn / deps_dn
+
+
+def compute_speed_of_sound_cov(
+        n, kf, E, dE, d2E, mass, E_cov, dE_cov, d2E_cov, E_dE_cov, E_d2E_cov, dE_d2E_cov, wrt_kf=True
+):
+    R"""Computes the covariance of the speed of sound (squared) with the delta method
+
+    The speed of sound is linearized about the given `E`, `dE`, and `d2E`, which should be the means.
+    Its Jacobian with respect to each of them is diagonal, so the covariance is
+    :math:`\sum_{ab} (J_a J_b^T) \circ \Sigma_{ab}`.
+
+    Parameters
+    ----------
+    n : array-like, shape = (N,)
+        The density in fm^-3
+    kf : array-like, shape = (N,)
+        The fermi momentum in fm^-1
+    E : array-like, shape = (N,)
+        The energy per particle.
+    dE : array-like, shape = (N,)
+        The derivative of the energy per particle. If `wrt_kf is True`, then this derivative is
+        assumed to be with respect to `kf`. Otherwise it is with respect to density.
+    d2E : array-like, shape = (N,)
+        The 2nd derivative of the energy per particle.
+    mass : float
+        The mass of the particle
+    E_cov : array-like, shape = (N, N)
+        The covariance of `E`
+    dE_cov : array-like, shape = (N, N)
+        The covariance of `dE`
+    d2E_cov : array-like, shape = (N, N)
+        The covariance of `d2E`
+    E_dE_cov : array-like, shape = (N, N)
+        The covariance of `E` and `dE`
+    E_d2E_cov : array-like, shape = (N, N)
+        The covariance of `E` and `d2E`
+    dE_d2E_cov : array-like, shape = (N, N)
+        The covariance of `dE` and `d2E`
+    wrt_kf : bool
+        How to interpret the derivatives `dE` and `d2E`. Defaults to `True`,
+        so the derivative of `E` is with respect to `kf`.
+
+    Returns
+    -------
+    c2_cov : array-like, shape = (N, N)
+        The covariance of the speed of sound (squared)
+    """
+    dE_coeff, d2E_coeff = _pressure_derivative_coefficients(n, kf, wrt_kf=wrt_kf)
+    if wrt_kf:
+        deps_dE = n * kf_derivative_wrt_density(kf, n)
+    else:
+        deps_dE = n
+    deps_dn = E + mass + deps_dE * dE
+    c2 = (dE_coeff * dE + d2E_coeff * d2E) / deps_dn
+
+    jacobians = [-c2 / deps_dn, (dE_coeff - c2 * deps_dE) / deps_dn, d2E_coeff / deps_dn]
+    covs = [
+        [E_cov, E_dE_cov, E_d2E_cov],
+        [E_dE_cov.T, dE_cov, dE_d2E_cov],
+        [E_d2E_cov.T, dE_d2E_cov.T, d2E_cov],
+    ]
+    c2_cov = 0
+    for J_a, covs_a in zip(jacobians, covs):
+        for J_b, cov_ab in zip(jacobians, covs_a):
+            c2_cov = c2_cov + J_a[:, None] * J_b * cov_ab
+    return c2_cov
+
+
+#: The quantities that are linear in the energy per particle (or symmetry energy) and its derivatives
+LINEAR_EOS_QUANTITIES = ('E', 'P', 'dP/dn', 'K', 'L')
+
+
+class DensityGrid:
+    """Computes EOS quantities from stacked samples of the energy per particle on a fixed density grid
+
+    The kf chain-rule factors, and the coefficients that multiply E and its derivatives, are computed once for the
+    grid. The methods broadcast the coefficients against their inputs like any NumPy operation, so with `n` of
+    shape (N,) the density must be the last axis of the inputs, e.g., (n_orders, n_samples, N). With `n` of
+    shape (N, 1) it is instead the first axis, e.g., (N, n_samples). Each method accepts an `out` array in which
+    to store the result.
+
+    Parameters
+    ----------
+    n : array-like, shape = (N,) or (N, 1)
+        The density in fm^-3
+    kf : array-like, same shape as `n`, optional
+        The fermi momentum in fm^-1. Unused if `wrt_kf is False`.
+    wrt_kf : bool
+        How to interpret the derivatives of `E`. Defaults to `True`, so they are with respect to `kf`.
+    """
+
+    def __init__(self, n, kf=None, wrt_kf=True):
+        n = np.asarray(n, dtype=float)
+        self.n = n
+        self.kf = kf
+        self.wrt_kf = wrt_kf
+        if wrt_kf:
+            if kf is None:
+                raise ValueError('kf must be given if wrt_kf is True')
+            self.dk_dn = kf_derivative_wrt_density(kf, n)
+            self.d2k_dn2 = kf_2nd_derivative_wrt_density(kf, n)
+        else:
+            self.dk_dn = np.ones_like(n)
+            self.d2k_dn2 = np.zeros_like(n)
+        # The coefficients of dE and d2E in the derivatives with respect to density
+        self._dP_dn_coeffs = _pressure_derivative_coefficients(n, kf, wrt_kf=wrt_kf)
+        self._coefficients = {
+            'E': {0: np.ones_like(n)},
+            'P': {1: n**2 * self.dk_dn},
+            'dP/dn': dict(zip((1, 2), self._dP_dn_coeffs)),
+            'K': {1: 9 * n**2 * self.d2k_dn2, 2: 9 * n**2 * self.dk_dn**2} if wrt_kf else {2: 9 * n**2},
+            'L': {1: 3 * n * self.dk_dn},
+        }
+        # The derivative of the energy density, minus E + mass, per dE
+        self._deps_dn_coeff = n * self.dk_dn
+
+    def coefficients(self, quantity):
+        """The coefficients of E and its derivatives, keyed by derivative order, that give a linear EOS quantity
+
+        Parameters
+        ----------
+        quantity : str
+            One of `LINEAR_EOS_QUANTITIES`
+
+        Returns
+        -------
+        coefficients : dict
+        """
+        try:
+            return self._coefficients[quantity]
+        except KeyError:
+            raise ValueError(f'quantity must be one of {LINEAR_EOS_QUANTITIES}, not {quantity!r}')
+
+    def _linear(self, quantity, derivatives, out=None):
+        out_ = None
+        for d, coeff in self.coefficients(quantity).items():
+            if out_ is None:
+                out_ = np.multiply(coeff, derivatives[d], out=out)
+            else:
+                out_ += coeff * derivatives[d]
+        return out_
+
+    def pressure(self, dE, out=None):
+        """The pressure. See `compute_pressure`."""
+        return self._linear('P', {1: dE}, out=out)
+
+    def pressure_derivative_wrt_density(self, dE, d2E, out=None):
+        """The derivative of the pressure with respect to density. See `compute_pressure_derivative_wrt_density`."""
+        return self._linear('dP/dn', {1: dE, 2: d2E}, out=out)
+
+    def compressibility(self, dE, d2E, out=None):
+        """The compressibility. See `compute_compressibility`."""
+        return self._linear('K', {1: dE, 2: d2E}, out=out)
+
+    def slope(self, dS2, out=None):
+        """The slope of the symmetry energy. See `compute_slope`."""
+        return self._linear('L', {1: dS2}, out=out)
+
+    def speed_of_sound(self, E, dE, d2E, mass, out=None):
+        """The speed of sound (squared). See `compute_speed_of_sound`."""
+        out = self.pressure_derivative_wrt_density(dE, d2E, out=out)
+        out /= E + mass + self._deps_dn_coeff * dE
+        return out
+
+
+def compute_eos_jacobian(n, kf, quantities, derivs=(0, 1, 2), wrt_kf=True):
+    """Computes the sparse linear map from stacked derivatives of the energy per particle to EOS quantities
+
+    Each quantity at a given density only depends on the derivatives at that density, so every block of the map
+    is diagonal.
+
+    Parameters
+    ----------
+    n : array-like, shape = (N,)
+        The density in fm^-3
+    kf : array-like, shape = (N,)
+        The fermi momentum in fm^-1. Unused if `wrt_kf is False`.
+    quantities : Iterable[str]
+        Some of `LINEAR_EOS_QUANTITIES`. 'L' treats the derivatives as those of the symmetry energy.
+    derivs : Iterable[int]
+        The derivatives in the stacked vector, in order, as in `ObservableContainer`
+    wrt_kf : bool
+        How to interpret the derivatives of `E`. Defaults to `True`, so they are with respect to `kf`.
+
+    Returns
+    -------
+    J : scipy.sparse matrix, shape = (len(quantities) * N, len(derivs) * N)
+    """
+    grid = DensityGrid(n, kf, wrt_kf=wrt_kf)
+    N = len(grid.n)
+    blocks = []
+    for quantity in quantities:
+        coeffs = grid.coefficients(quantity)
+        missing = set(coeffs) - set(derivs)
+        if missing:
+            raise ValueError(f'{quantity} needs the derivatives {sorted(missing)}')
+        # Unused derivatives get explicit zero blocks, since bmat drops block columns that are all None
+        blocks.append([sparse.diags(coeffs[d]) if d in coeffs else sparse.csr_matrix((N, N)) for d in derivs])
+    return sparse.bmat(blocks, format='csr', dtype=float)
+
+
+def compute_eos_joint_mean_cov(n, kf, mean, cov, quantities, derivs=(0, 1, 2), wrt_kf=True):
+    """Computes the joint mean and covariance of several EOS quantities from those of the stacked derivatives
+
+    This includes the cross-covariances between the quantities, e.g., between P and K. Since the quantities are
+    linear in the derivatives, this is exact.
+
+    Parameters
+    ----------
+    n : array-like, shape = (N,)
+        The density in fm^-3
+    kf : array-like, shape = (N,)
+        The fermi momentum in fm^-1. Unused if `wrt_kf is False`.
+    mean : array-like, shape = (len(derivs) * N,)
+        The mean of E and its derivatives, stacked by derivative
+    cov : array-like, shape = (len(derivs) * N, len(derivs) * N)
+        The covariance of E and its derivatives, stacked by derivative
+    quantities : Iterable[str]
+        Some of `LINEAR_EOS_QUANTITIES`
+    derivs : Iterable[int]
+        The derivatives in `mean` and `cov`, in order
+    wrt_kf : bool
+        How to interpret the derivatives of `E`. Defaults to `True`, so they are with respect to `kf`.
+
+    Returns
+    -------
+    mean : array, shape = (len(quantities) * N,)
+    cov : array, shape = (len(quantities) * N, len(quantities) * N)
+        Stacked in the order of `quantities`
+    """
+    J = compute_eos_jacobian(n, kf, quantities, derivs=derivs, wrt_kf=wrt_kf)
+    # cov is symmetric, so J (J cov)^T = J cov J^T
+    return J @ mean, J @ np.asarray(J @ cov).T
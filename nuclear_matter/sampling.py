@@ -0,0 +1,201 @@
+import numpy as np
+
+from .matter import DensityGrid
+
+#: The quantities that `compute_eos_quantities` knows how to compute from (E, dE, d2E)
+EOS_QUANTITIES = ('E', 'P', 'dP/dn', 'K', 'c2', 'L')
+
+
+class StreamingStatistics:
+    R"""Accumulates the mean, covariance, and quantiles of samples of a vector without storing the samples
+
+    The mean and covariance are updated one chunk at a time with the pairwise version of Welford's algorithm.
+    The quantiles come from a histogram of each component, whose range is fixed by the first chunk to be
+    `width` standard deviations on either side of its mean. The quantiles are thus accurate to about
+    :math:`2 w / n_\mathrm{bins}` standard deviations. Samples outside of the range are counted in the edge bins.
+
+    Parameters
+    ----------
+    n_bins : int
+        The number of histogram bins for each component
+    width : float
+        The half-width of the histogram range, in standard deviations of the first chunk
+    """
+
+    def __init__(self, n_bins=2000, width=10.):
+        self.n_bins = n_bins
+        self.width = width
+        self.count = 0
+        self.mean = None
+        self._m2 = None
+        self._lower = None
+        self._bin_width = None
+        self._counts = None
+
+    def update(self, samples):
+        """Adds a chunk of samples
+
+        Parameters
+        ----------
+        samples : array, shape = (N, n_samples)
+        """
+        samples = np.asarray(samples, dtype=float)
+        n_new = samples.shape[1]
+        if n_new == 0:
+            return
+        new_mean = samples.mean(axis=1)
+        dev = samples - new_mean[:, None]
+        new_m2 = dev @ dev.T
+        if self.count == 0:
+            self.mean = new_mean
+            self._m2 = new_m2
+            std = np.sqrt(np.diag(new_m2) / max(n_new - 1, 1))
+            std = np.where(std > 0, std, 1.)
+            self._lower = new_mean - self.width * std
+            self._bin_width = 2 * self.width * std / self.n_bins
+            self._counts = np.zeros((len(new_mean), self.n_bins), dtype=np.int64)
+        else:
+            total = self.count + n_new
+            delta = new_mean - self.mean
+            self.mean = self.mean + delta * n_new / total
+            self._m2 += new_m2 + np.outer(delta, delta) * self.count * n_new / total
+        self.count += n_new
+
+        idx = np.floor((samples - self._lower[:, None]) / self._bin_width[:, None])
+        idx = np.clip(idx, 0, self.n_bins - 1).astype(np.int64)
+        idx += self.n_bins * np.arange(samples.shape[0])[:, None]
+        self._counts += np.bincount(idx.ravel(), minlength=self._counts.size).reshape(self._counts.shape)
+
+    @property
+    def cov(self):
+        return self._m2 / (self.count - 1)
+
+    @property
+    def std(self):
+        return np.sqrt(np.diag(self._m2) / (self.count - 1))
+
+    def quantile(self, q):
+        """Estimates quantiles of each component from the histograms
+
+        Parameters
+        ----------
+        q : float or array, shape = (M,)
+
+        Returns
+        -------
+        quantiles : array, shape = (N,) or (M, N)
+        """
+        q = np.asarray(q, dtype=float)
+        cum_counts = np.cumsum(self._counts, axis=1)
+        rows = np.arange(cum_counts.shape[0])
+        quantiles = []
+        for target in np.atleast_1d(q) * self.count:
+            # The bin in which the cumulative count passes the target, interpolating linearly inside of it
+            bins = np.minimum(np.sum(cum_counts < target, axis=1), self.n_bins - 1)
+            before = np.where(bins > 0, cum_counts[rows, bins - 1], 0)
+            frac = (target - before) / np.maximum(self._counts[rows, bins], 1)
+            quantiles.append(self._lower + (bins + np.clip(frac, 0, 1)) * self._bin_width)
+        quantiles = np.array(quantiles)
+        if q.ndim == 0:
+            return quantiles[0]
+        return quantiles
+
+    def interval(self, cred):
+        """The lower and upper bounds of the central `cred` credible interval of each component"""
+        return self.quantile([(1 - cred) / 2, (1 + cred) / 2])
+
+
+def compute_eos_quantities(n, kf, samples, quantities, wrt_kf=True, mass=None):
+    """Computes derived quantities from samples of the energy per particle and its derivatives
+
+    Parameters
+    ----------
+    n : array-like, shape = (N, 1), or DensityGrid
+        The density in fm^-3. A `DensityGrid` built from densities of shape (N, 1) can be given instead to reuse
+        it across calls, in which case `kf` and `wrt_kf` are ignored.
+    kf : array-like, shape = (N, 1)
+        The fermi momentum in fm^-1. Unused if `wrt_kf is False`.
+    samples : dict
+        The samples of E, dE, and d2E, of shape (N, n_samples), keyed by derivative order, as returned by
+        `ObservableContainer.iter_samples`. If the container holds the symmetry energy, then 'L' is its slope.
+    quantities : Iterable[str]
+        Some of `EOS_QUANTITIES`
+    wrt_kf : bool
+        Whether the derivatives are with respect to `kf` or density
+    mass : float, optional
+        The mass of the particle. Required for the speed of sound, 'c2'.
+
+    Returns
+    -------
+    values : dict
+        The samples of each quantity, of shape (N, n_samples)
+    """
+    grid = n if isinstance(n, DensityGrid) else DensityGrid(n, kf, wrt_kf=wrt_kf)
+    values = {}
+    for quantity in quantities:
+        if quantity == 'E':
+            values[quantity] = samples[0]
+        elif quantity == 'P':
+            values[quantity] = grid.pressure(samples[1])
+        elif quantity == 'dP/dn':
+            values[quantity] = grid.pressure_derivative_wrt_density(samples[1], samples[2])
+        elif quantity == 'K':
+            values[quantity] = grid.compressibility(samples[1], samples[2])
+        elif quantity == 'c2':
+            if mass is None:
+                raise ValueError('mass is required for the speed of sound')
+            values[quantity] = grid.speed_of_sound(samples[0], samples[1], samples[2], mass=mass)
+        elif quantity == 'L':
+            values[quantity] = grid.slope(samples[1])
+        else:
+            raise ValueError(f'quantity must be one of {EOS_QUANTITIES}, not {quantity!r}')
+    return values
+
+
+def sample_eos_statistics(
+        container, order, quantities=('P', 'K'), num_samp=100000, chunk_size=10000, mass=None, include_trunc=True,
+        random_state=None, n_bins=2000, width=10.
+):
+    """Propagates samples from a GP container through the nuclear matter functions in constant memory
+
+    Samples of the observable and its derivatives are drawn in chunks, converted to each quantity with
+    `compute_eos_quantities`, and accumulated in a `StreamingStatistics` before the next chunk is drawn.
+
+    Parameters
+    ----------
+    container : ObservableContainer or SymmetryEnergyContainer
+        Must include the derivatives needed by `quantities`
+    order
+        The EFT order
+    quantities : Iterable[str]
+        Some of `EOS_QUANTITIES`
+    num_samp : int
+    chunk_size : int
+    mass : float, optional
+        Required for the speed of sound, 'c2'
+    include_trunc : bool
+        Whether to include the truncation error
+    random_state : None, int, or np.random.Generator
+    n_bins : int
+        Passed to `StreamingStatistics`
+    width : float
+        Passed to `StreamingStatistics`
+
+    Returns
+    -------
+    statistics : dict
+        The `StreamingStatistics` of each quantity at the densities `container.density_interp`
+    """
+    # The symmetry energy container works directly with density
+    wrt_kf = container.kf_interp is not None
+    kf = container.kf_interp[:, None] if wrt_kf else None
+    # The density is the first axis of the samples
+    grid = DensityGrid(container.density_interp[:, None], kf, wrt_kf=wrt_kf)
+    statistics = {quantity: StreamingStatistics(n_bins=n_bins, width=width) for quantity in quantities}
+    for samples in container.iter_samples(
+            order, num_samp, chunk_size=chunk_size, include_trunc=include_trunc, random_state=random_state
+    ):
+        values = compute_eos_quantities(grid, None, samples, quantities, mass=mass)
+        for quantity, value in values.items():
+            statistics[quantity].update(value)
+    return statistics
@@ -9,7 +9,7 @@ from matplotlib.legend_handler import HandlerPatch
 from matplotlib.legend import Legend
 from matplotlib.ticker import MultipleLocator, AutoMinorLocator, MaxNLocator
 import docrep
-from sklearn.gaussian_process.kernels import RBF, ConstantKernel, Kernel
+from sklearn.gaussian_process.kernels import RBF, ConstantKernel, Kernel, Sum, WhiteKernel
 import seaborn as sns
 from seaborn import utils
 import pandas as pd
@@ -17,8 +17,18 @@ from .matter import nuclear_density, fermi_momentum, ratio_kf
 from .graphs import confidence_ellipse, confidence_ellipse_mean_cov
 from os.path import join
 from scipy import stats
+from scipy.linalg import solve_triangular
+from scipy.spatial.distance import cdist
+from scipy.special import gammaln, logsumexp
 from copy import deepcopy
 from os import path
+import functools
+import hashlib
+import inspect
+import os
+import tempfile
+import types
+import warnings
 
 docstrings = docrep.DocstringProcessor()
 docstrings.get_sections(str(gm.ConjugateGaussianProcess.__doc__), 'ConjugateGaussianProcess')
@@ -44,9 +54,13 @@ class HandlerEllipse(HandlerPatch):
 Legend.update_default_handler_map({Ellipse: HandlerEllipse()})
 
 
-def compute_breakdown_posterior(model, X, data, orders, max_idx, logprior, breakdowns, lengths=None):
+def compute_breakdown_posterior(model, X, data, orders, max_idx, logprior, breakdowns, lengths=None,
+                                closed_form=None, n_jobs=None, **kwargs):
     """Put this in the specific class?
 
+    The likelihood is computed on the whole (lengths, breakdowns) grid at once by `compute_2d_log_likelihood`
+    and the length scale is then marginalized.
+
     Parameters
     ----------
     model : gm.TruncationGP
@@ -57,27 +71,87 @@ def compute_breakdown_posterior(model, X, data, orders, max_idx, logprior, break
     logprior
     breakdowns
     lengths
+    closed_form : bool, optional
+        Whether to use `ConjugateTruncationLikelihood`, which needs one factorization per length scale, with the
+        kernel and conjugate hyperparameters of `model`. If `None`, the default, it is used whenever it can
+        express `model`, and the likelihood is otherwise evaluated at every grid point on a process pool.
+    n_jobs : int, optional
+        The number of worker processes if the closed form is not used
+    **kwargs
+        Overrides the kernel and conjugate hyperparameters of `model` that are passed to
+        `ConjugateTruncationLikelihood`
 
     Returns
     -------
     pdf : ndarray, shape = (N,)
     """
-    model.fit(X, data[:, :max_idx+1], orders=orders[:max_idx+1])
-    if lengths is None:
-        log_ell = model.coeffs_process.kernel_.theta
-        lengths = np.exp(log_ell)
-    else:
-        log_ell = np.log(lengths)
-    log_like = np.array([[model.log_marginal_likelihood([t], breakdown=lb) for lb in breakdowns] for t in log_ell])
-    log_like += logprior
-    posterior_2d = np.exp(log_like - np.max(log_like))
-
-    breakdown_pdf = np.trapz(posterior_2d, x=lengths, axis=0)
-    breakdown_pdf /= np.trapz(breakdown_pdf, x=breakdowns)  # Normalize
+    log_like, lengths = compute_2d_log_likelihood(
+        model, X, data, orders, breakdowns, ls=lengths, max_idx=max_idx, closed_form=closed_form, n_jobs=n_jobs,
+        **kwargs
+    )
+    _, breakdown_pdf, _ = compute_2d_posterior_from_log_like(log_like, lengths, breakdowns, logprior=logprior)
     return breakdown_pdf
 
 
-def compute_pdf_median_and_bounds(x, pdf, cred):
+def compute_pdf_medians_and_bounds(x, pdfs, cred, log_pdf=False):
+    R"""Computes the medians and highest posterior density intervals for a stack of 1d pdfs on a shared grid
+
+    All pdfs and credible levels are handled at once. The pdfs are normalized with the trapezoid rule. Each
+    interval spans the points at which the pdf exceeds the level that encloses a fraction `cred` of the
+    probability, so it assumes that the pdfs are unimodal.
+
+    Parameters
+    ----------
+    x : ndarray, shape = (n_x,)
+        The increasing input variable
+    pdfs : ndarray, shape = (..., n_x)
+        The pdfs, which need not be normalized
+    cred : Iterable
+        The credible intervals in the range (0, 1)
+    log_pdf : bool, optional
+        Whether `pdfs` are the log of the pdfs. Defaults to `False`.
+
+    Returns
+    -------
+    medians : ndarray, shape = (...)
+    bounds : ndarray, shape = (..., len(cred), 2)
+    """
+    x = np.asarray(x, dtype=float)
+    pdfs = np.asarray(pdfs, dtype=float)
+    cred = np.atleast_1d(cred)
+    if log_pdf:
+        pdfs = np.exp(pdfs - log_trapz(pdfs, x)[..., None])
+    else:
+        pdfs = pdfs / np.trapz(pdfs, x=x, axis=-1)[..., None]
+
+    # The cdf, from the trapezoid rule, and its linear interpolation at 0.5
+    dx = np.diff(x)
+    cdf = np.concatenate(
+        [np.zeros(pdfs.shape[:-1] + (1,)), np.cumsum(dx * (pdfs[..., 1:] + pdfs[..., :-1]) / 2., axis=-1)],
+        axis=-1
+    )
+    upper = np.clip(np.argmax(cdf >= 0.5, axis=-1), 1, len(x) - 1)[..., None]
+    cdf_lower, cdf_upper = [np.take_along_axis(cdf, upper - k, axis=-1)[..., 0] for k in (1, 0)]
+    x_lower, x_upper = x[upper[..., 0] - 1], x[upper[..., 0]]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        frac = np.nan_to_num((0.5 - cdf_lower) / (cdf_upper - cdf_lower))
+    medians = x_lower + frac * (x_upper - x_lower)
+
+    # Add points in order of decreasing density until the enclosed probability exceeds each level
+    weights = np.exp(trapezoid_log_weights(x))
+    order = np.argsort(-pdfs, axis=-1)
+    pdfs_sorted = np.take_along_axis(pdfs, order, axis=-1)
+    mass = np.cumsum(pdfs_sorted * weights[order], axis=-1)
+    last = np.argmax(mass[..., None, :] >= cred[:, None], axis=-1)  # shape = (..., n_cred)
+    thresholds = np.take_along_axis(pdfs_sorted, last, axis=-1)
+    inside = pdfs[..., None, :] >= thresholds[..., None]
+    lower = x[np.argmax(inside, axis=-1)]
+    upper = x[len(x) - 1 - np.argmax(inside[..., ::-1], axis=-1)]
+    bounds = np.stack([lower, upper], axis=-1)
+    return medians, bounds
+
+
+def compute_pdf_median_and_bounds(x, pdf, cred, log_pdf=False):
     R"""Computes the median and credible intervals for a 1d pdf
 
     Parameters
@@ -88,17 +162,21 @@ def compute_pdf_median_and_bounds(x, pdf, cred):
         The normalized pdf
     cred : Iterable
         The credible intervals in the range (0, 1)
+    log_pdf : bool, optional
+        Whether `pdf` is the log of the pdf, which need not be normalized, e.g., the output of
+        `compute_2d_log_posterior_from_log_like`. Defaults to `False`.
 
     Returns
     -------
     median : float
     bounds : ndarray, shape = (len(cred), 2)
+
+    See Also
+    --------
+    compute_pdf_medians_and_bounds : The same for many pdfs at once
     """
-    bounds = np.zeros((len(cred), 2))
-    for i, p in enumerate(cred):
-        bounds[i] = gm.hpd_pdf(pdf=pdf, alpha=p, x=x)
-    median = gm.median_pdf(pdf=pdf, x=x)
-    return median, bounds
+    median, bounds = compute_pdf_medians_and_bounds(x, pdf, cred, log_pdf=log_pdf)
+    return float(median), bounds
 
 
 def draw_summary_statistics(bounds68, bounds95, median, height=0., linewidth=1., ax=None):
@@ -157,8 +235,441 @@ def joint_plot(ratio=1, height=3.):
     return fig, ax_joint, ax_marg_x, ax_marg_y
 
 
-def compute_2d_posterior(model, X, data, orders, breakdown, ls=None, logprior=None, max_idx=None):
-    R"""
+_worker_model = None
+
+
+def _init_log_like_worker(model, blas_threads):
+    global _worker_model
+    from threadpoolctl import threadpool_limits
+    _worker_model = model
+    threadpool_limits(limits=blas_threads)
+
+
+def _log_like_row(log_ls, breakdown):
+    return [_worker_model.log_marginal_likelihood(theta=[log_ls, ], breakdown=lb) for lb in breakdown]
+
+
+def _map_log_like_rows(model, log_ls, breakdowns, n_jobs=None):
+    R"""Evaluates `model.log_marginal_likelihood` at each `log_ls[i]` and all breakdown scales in `breakdowns[i]`"""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    num_cores = multiprocessing.cpu_count()
+    if n_jobs is None:
+        n_jobs = num_cores
+    n_jobs = max(1, min(n_jobs, len(log_ls)))
+    if n_jobs == 1:
+        return [
+            np.array([model.log_marginal_likelihood(theta=[log_ls_i, ], breakdown=lb) for lb in breakdown_i])
+            for log_ls_i, breakdown_i in zip(log_ls, breakdowns)
+        ]
+
+    blas_threads = max(1, num_cores // n_jobs)
+    if 'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+    else:
+        context = multiprocessing.get_context()
+    chunksize = max(1, len(log_ls) // (4 * n_jobs))
+    with ProcessPoolExecutor(
+            max_workers=n_jobs, mp_context=context,
+            initializer=_init_log_like_worker, initargs=(model, blas_threads)
+    ) as executor:
+        rows = executor.map(_log_like_row, log_ls, breakdowns, chunksize=chunksize)
+        rows = [np.array(row) for row in rows]
+    return rows
+
+
+def compute_log_like_grid(model, ls, breakdown, n_jobs=None):
+    R"""Evaluates `model.log_marginal_likelihood` on a grid of length scales and breakdown scales in parallel
+
+    The fitted model is sent to each worker once, when the worker starts, rather than with every grid point.
+    On platforms that fork, the workers share the parent's copy of the model and its training data.
+    Each task is a whole row of breakdown scales at fixed length scale, and the BLAS threads of each worker
+    are limited so that the workers do not oversubscribe the cores.
+
+    Parameters
+    ----------
+    model : gm.TruncationGP
+        The fitted truncation model
+    ls : ndarray, shape = (n_ls,)
+    breakdown : ndarray, shape = (n_breakdown,)
+    n_jobs : int, optional
+        The number of worker processes. Defaults to the number of cores. If 1, runs in this process.
+
+    Returns
+    -------
+    log_like : ndarray, shape = (n_ls, n_breakdown)
+    """
+    ls = np.atleast_1d(ls)
+    breakdown = np.atleast_1d(breakdown)
+    rows = _map_log_like_rows(model, np.log(ls), [breakdown] * len(ls), n_jobs=n_jobs)
+    return np.array(rows).reshape(len(ls), len(breakdown))
+
+
+def compute_log_like_points(model, ls, breakdown, n_jobs=None):
+    R"""Like `compute_log_like_grid`, but evaluates the pairs `(ls[i], breakdown[i])` rather than a grid
+
+    Points that share a length scale are sent to the workers as one task.
+
+    Returns
+    -------
+    log_like : ndarray, shape = (n_points,)
+    """
+    ls = np.asarray(ls)
+    breakdown = np.asarray(breakdown)
+    ls_unique, inverse = np.unique(ls, return_inverse=True)
+    inverse = inverse.ravel()
+    groups = [np.flatnonzero(inverse == i) for i in range(len(ls_unique))]
+    rows = _map_log_like_rows(model, np.log(ls_unique), [breakdown[g] for g in groups], n_jobs=n_jobs)
+    log_like = np.empty(ls.shape)
+    for g, row in zip(groups, rows):
+        log_like[g] = row
+    return log_like
+
+
+def compute_adaptive_log_like(log_like_func, ls, breakdown, tol=1e-5, n_coarse=9, logprior=None, n_check=100,
+                              return_error=False):
+    R"""Evaluates a log likelihood on a grid by refining a coarse grid only where the pdf is non-negligible
+
+    The grid starts with about `n_coarse` points along each axis, which define rectangular cells. The pdf is
+    evaluated at the corners and the midpoint of each cell, and the cell is split in half along each axis if its
+    estimated peak, normalized to the largest pdf found so far, exceeds `tol`. The peak is estimated from the
+    largest of these values plus the amount by which the midpoint exceeds the bilinear interpolation of the
+    corners, so that a peak that lies between the corners of a cell is still found. This repeats until the cells
+    that remain to be split are single grid spacings wide, so the full resolution of `ls` and `breakdown` is only
+    used where the pdf is appreciable. All remaining points are filled in by bilinear interpolation of the log
+    likelihood within their cell.
+
+    The interpolation is then checked at up to `n_check` of the interpolated points. If the normalized pdf is
+    off by more than `tol` at any of them, the cells that contain them are split and the process is repeated.
+
+    Parameters
+    ----------
+    log_like_func : callable
+        Takes arrays of length scales and breakdown scales, with shape (n_points,), and returns the log
+        likelihood at each pair, e.g., `ConjugateTruncationLikelihood.log_likelihood_points`.
+    ls : ndarray, shape = (n_ls,)
+        The length scales at full resolution
+    breakdown : ndarray, shape = (n_breakdown,)
+        The breakdown scales at full resolution
+    tol : float
+        The normalized pdf below which a cell is not refined, and the largest error in the normalized pdf
+        allowed at the check points
+    n_coarse : int
+        The number of points along each axis of the starting grid
+    logprior : ndarray, shape = (n_ls, n_breakdown), optional
+        If given, the refinement is based on the posterior rather than the likelihood. It is not included in the
+        returned `log_like`.
+    n_check : int
+        The number of interpolated points, chosen at random with a fixed seed, at which the interpolation is
+        checked in each round. If zero, the interpolation is not checked.
+    return_error : bool
+        Whether to also return the largest error of the normalized pdf found at the check points
+
+    Returns
+    -------
+    log_like : ndarray, shape = (n_ls, n_breakdown)
+        The log likelihood, evaluated or interpolated at every grid point
+    evaluated : ndarray, shape = (n_ls, n_breakdown)
+        A boolean array that is `True` where the log likelihood was actually evaluated
+    error : float
+        Only returned if `return_error` is `True`. The largest absolute error of the normalized pdf at the check
+        points of the last round, which is at most `tol`. Zero if nothing was interpolated.
+    """
+    ls = np.atleast_1d(ls)
+    breakdown = np.atleast_1d(breakdown)
+    n_ls, n_b = len(ls), len(breakdown)
+    log_like = np.full((n_ls, n_b), np.nan)
+    evaluated = np.zeros((n_ls, n_b), dtype=bool)
+    if logprior is None:
+        logprior = np.zeros((n_ls, n_b))
+    logprior = np.broadcast_to(logprior, (n_ls, n_b))
+
+    def evaluate(i, j):
+        new = ~evaluated[i, j]
+        i, j = i[new], j[new]
+        if len(i) > 0:
+            i, j = np.unique(np.stack([i, j]), axis=1)
+            log_like[i, j] = log_like_func(ls[i], breakdown[j])
+            evaluated[i, j] = True
+
+    def split(cells):
+        # Split each cell at its midpoints. Cells that are one spacing wide along an axis are not split
+        # along it, which produces duplicate children that are removed.
+        i0, i1, j0, j1 = cells.T
+        im, jm = (i0 + i1) // 2, (j0 + j1) // 2
+        children = np.concatenate([
+            np.stack([i0, im, j0, jm], axis=-1), np.stack([i0, im, jm, j1], axis=-1),
+            np.stack([im, i1, j0, jm], axis=-1), np.stack([im, i1, jm, j1], axis=-1),
+        ])
+        children = children[(children[:, 0] < children[:, 1]) & (children[:, 2] < children[:, 3])]
+        return np.unique(children, axis=0)
+
+    def bilinear(i0, i1, j0, j1, values, i, j):
+        u = (ls[i] - ls[i0]) / (ls[i1] - ls[i0])
+        v = (breakdown[j] - breakdown[j0]) / (breakdown[j1] - breakdown[j0])
+        with np.errstate(invalid='ignore'):
+            return (1 - u) * (1 - v) * values[i0, j0] + (1 - u) * v * values[i0, j1] + \
+                u * (1 - v) * values[i1, j0] + u * v * values[i1, j1]
+
+    if n_ls < 2 or n_b < 2:
+        i, j = np.indices((n_ls, n_b)).reshape(2, -1)
+        evaluate(i, j)
+        return (log_like, evaluated, 0.) if return_error else (log_like, evaluated)
+
+    i_coarse = np.unique(np.round(np.linspace(0, n_ls - 1, min(n_coarse, n_ls))).astype(int))
+    j_coarse = np.unique(np.round(np.linspace(0, n_b - 1, min(n_coarse, n_b))).astype(int))
+    i0, j0 = [a.ravel() for a in np.meshgrid(i_coarse[:-1], j_coarse[:-1], indexing='ij')]
+    i1, j1 = [a.ravel() for a in np.meshgrid(i_coarse[1:], j_coarse[1:], indexing='ij')]
+    cells = np.stack([i0, i1, j0, j1], axis=-1)
+    leaves = np.zeros((0, 4), dtype=int)
+    rng = np.random.default_rng(0)
+    error = 0.
+    while len(cells) > 0:
+        while len(cells) > 0:
+            i0, i1, j0, j1 = cells.T
+            im, jm = (i0 + i1) // 2, (j0 + j1) // 2
+            evaluate(np.concatenate([i0, i0, i1, i1, im]), np.concatenate([j0, j1, j0, j1, jm]))
+            log_post = log_like + logprior
+            corners = np.stack([log_post[i0, j0], log_post[i0, j1], log_post[i1, j0], log_post[i1, j1]])
+            log_mid = log_post[im, jm]
+            with np.errstate(invalid='ignore'):
+                bump = np.nan_to_num(np.maximum(log_mid - bilinear(i0, i1, j0, j1, log_post, im, jm), 0))
+            log_peak = np.maximum(np.max(corners, axis=0), log_mid) + bump
+            is_important = np.exp(log_peak - np.nanmax(log_post)) > tol
+            is_divisible = (i1 - i0 > 1) | (j1 - j0 > 1)
+            refine = is_important & is_divisible
+            leaves = np.concatenate([leaves, cells[~refine]])
+            cells = split(cells[refine])
+
+        # Fill in the interior of each leaf cell
+        for i0, i1, j0, j1 in leaves:
+            block = np.s_[i0:i1 + 1, j0:j1 + 1]
+            if np.all(evaluated[block]):
+                continue
+            corners = log_like[[i0, i0, i1, i1], [j0, j1, j0, j1]]
+            if not np.all(np.isfinite(corners)):
+                filled = np.full((i1 - i0 + 1, j1 - j0 + 1), np.min(corners))
+            else:
+                i, j = np.ix_(np.arange(i0, i1 + 1), np.arange(j0, j1 + 1))
+                filled = bilinear(i0, i1, j0, j1, log_like, i, j)
+            log_like[block] = np.where(evaluated[block], log_like[block], filled)
+
+        # Check the interpolation against a random subset of the interpolated points
+        i, j = np.nonzero(~evaluated)
+        if len(i) == 0:
+            error = 0.
+        if n_check <= 0 or len(i) == 0:
+            break
+        check = rng.choice(len(i), size=min(n_check, len(i)), replace=False)
+        i, j = i[check], j[check]
+        interpolated = log_like[i, j] + logprior[i, j]
+        evaluate(i, j)
+        log_post = log_like + logprior
+        max_log_post = np.max(log_post)
+        with np.errstate(invalid='ignore'):
+            errors = np.abs(np.exp(log_post[i, j] - max_log_post) - np.exp(interpolated - max_log_post))
+        errors = np.nan_to_num(errors)
+        error = np.max(errors)
+        bad = errors > tol
+        # Split the leaves that hold the badly interpolated points and refine them again
+        is_bad_leaf = np.any(
+            (leaves[:, 0, None] <= i[bad]) & (i[bad] <= leaves[:, 1, None]) &
+            (leaves[:, 2, None] <= j[bad]) & (j[bad] <= leaves[:, 3, None]), axis=1
+        )
+        cells = split(leaves[is_bad_leaf])
+        leaves = leaves[~is_bad_leaf]
+    if return_error:
+        return log_like, evaluated, error
+    return log_like, evaluated
+
+
+_POSTERIOR_CACHE_VERSION = 2
+
+
+def _update_hash(h, obj, _active=()):
+    R"""Feeds a description of `obj` that is stable across sessions into the hash `h`
+
+    Functions are described by their name, source (or bytecode), defaults, and the contents of their closure, and
+    `functools.partial` objects by their function and bound arguments, so that nothing depends on memory addresses.
+    Objects that cannot be described this way raise a `TypeError`.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str, bytes, np.generic)):
+        h.update(f'{type(obj).__name__}:{obj!r};'.encode())
+    elif isinstance(obj, dict):
+        h.update(b'dict{')
+        for key in sorted(obj):
+            _update_hash(h, key, _active)
+            _update_hash(h, obj[key], _active)
+        h.update(b'}')
+    elif isinstance(obj, (list, tuple)):
+        h.update(f'{type(obj).__name__}['.encode())
+        for item in obj:
+            _update_hash(h, item, _active)
+        h.update(b']')
+    elif isinstance(obj, ndarray):
+        arr = np.ascontiguousarray(obj)
+        h.update(f'ndarray:{arr.dtype.str}:{arr.shape};'.encode())
+        h.update(arr.tobytes())
+    elif isinstance(obj, Kernel):
+        h.update(f'kernel:{type(obj).__module__}.{type(obj).__qualname__}'.encode())
+        _update_hash(h, obj.get_params(deep=False), _active)
+    elif isinstance(obj, functools.partial):
+        h.update(b'partial(')
+        _update_hash(h, obj.func, _active)
+        _update_hash(h, obj.args, _active)
+        _update_hash(h, obj.keywords, _active)
+        h.update(b')')
+    elif isinstance(obj, types.FunctionType):
+        h.update(f'function:{obj.__module__}.{obj.__qualname__}:'.encode())
+        if id(obj) in _active:
+            # A function that refers to itself through its closure
+            h.update(b'recursive;')
+            return
+        _active = _active + (id(obj),)
+        try:
+            h.update(inspect.getsource(obj).encode())
+        except (OSError, TypeError):
+            _update_hash_code(h, obj.__code__)
+        _update_hash(h, obj.__defaults__, _active)
+        _update_hash(h, obj.__kwdefaults__, _active)
+        for cell in obj.__closure__ or ():
+            try:
+                contents = cell.cell_contents
+            except ValueError:  # An empty cell
+                h.update(b'cell:empty;')
+                continue
+            _update_hash(h, contents, _active)
+    elif isinstance(obj, (type, types.BuiltinFunctionType, np.ufunc)):
+        # These are fully described by where they are defined
+        name = getattr(obj, '__qualname__', obj.__name__)
+        h.update(f'{type(obj).__name__}:{getattr(obj, "__module__", None)}.{name};'.encode())
+    else:
+        raise TypeError(
+            f'Cannot describe an object of type {type(obj).__name__} in a way that is stable across sessions'
+        )
+
+
+def _update_hash_code(h, code):
+    R"""Feeds the bytecode and constants of a code object into the hash `h`"""
+    h.update(b'code:')
+    h.update(code.co_code)
+    _update_hash(h, code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _update_hash_code(h, const)
+        else:
+            _update_hash(h, const)
+    h.update(b';')
+
+
+def posterior_cache_key(**inputs):
+    R"""A hash of everything that determines a grid of log likelihoods
+
+    Arrays are hashed by their contents, kernels by their hyperparameters, functions by their name, source,
+    defaults, and closure, and partial functions by their function and arguments, so the key changes whenever any
+    input changes but not between sessions.
+
+    Parameters
+    ----------
+    **inputs
+        The inputs, e.g., the training data, orders, reference scale, ratio, kernel, and grid
+
+    Returns
+    -------
+    key : str
+
+    Raises
+    ------
+    TypeError
+        If an input cannot be described in a way that is stable across sessions
+    """
+    h = hashlib.sha256()
+    _update_hash(h, _POSTERIOR_CACHE_VERSION)
+    _update_hash(h, inputs)
+    return h.hexdigest()
+
+
+def load_cached_log_like(cache_dir, key):
+    R"""Loads the log likelihood grid saved by `save_cached_log_like`, or returns `None` if there is none
+
+    The arrays are memory mapped rather than read into memory.
+
+    Returns
+    -------
+    arrays : dict or None
+        The arrays, keyed by the names they were saved with
+    """
+    entry = path.join(cache_dir, key)
+    if not path.isdir(entry):
+        return None
+    return {
+        path.splitext(name)[0]: np.load(path.join(entry, name), mmap_mode='r')
+        for name in os.listdir(entry) if name.endswith('.npy')
+    }
+
+
+def save_cached_log_like(cache_dir, key, **arrays):
+    R"""Saves arrays under `key` in `cache_dir` as .npy files that can be memory mapped
+
+    The entry is written to a temporary directory and then moved into place, so that interrupted writes never
+    leave a partial entry behind.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    entry = path.join(cache_dir, key)
+    tmp = tempfile.mkdtemp(dir=cache_dir, prefix=f'.{key}-')
+    for name, arr in arrays.items():
+        np.save(path.join(tmp, f'{name}.npy'), np.asarray(arr))
+    try:
+        os.rename(tmp, entry)
+    except OSError:
+        # Another process saved the same entry first
+        for name in os.listdir(tmp):
+            os.remove(path.join(tmp, name))
+        os.rmdir(tmp)
+
+
+def conjugate_likelihood_kwargs(model, X):
+    R"""The arguments of `ConjugateTruncationLikelihood` that reproduce the likelihood of a truncation model
+
+    The kernel and the conjugate hyperparameters are read from `model.coeffs_process`.
+
+    Parameters
+    ----------
+    model : gm.TruncationGP
+    X : ndarray, shape = (N, p)
+        The training inputs, used to check that the ratio is inversely proportional to the breakdown scale
+
+    Returns
+    -------
+    kwargs : dict or None
+        `None` if the model cannot be expressed by `ConjugateTruncationLikelihood`: if its kernel has other free
+        hyperparameters than the length scale, its coefficients have a mean basis, or its ratio needs other
+        arguments or is not inversely proportional to the breakdown scale.
+    """
+    process = getattr(model, 'coeffs_process', None)
+    kernel = getattr(process, 'kernel', None)
+    if kernel is None or kernel.n_dims != 1 or getattr(process, 'basis', None) is not None:
+        return None
+    if getattr(model, 'ratio_kws', None):
+        return None
+    try:
+        q = model.ratio(X, breakdown=1.)
+        if not np.allclose(model.ratio(X, breakdown=2.), q / 2.):
+            return None
+    except TypeError:
+        return None
+    kwargs = dict(kernel=kernel)
+    for name in ['center', 'disp', 'df', 'scale', 'sd', 'nugget', 'decomposition']:
+        if hasattr(process, name):
+            kwargs[name] = getattr(process, name)
+    return kwargs
+
+
+def compute_2d_log_likelihood(model, X, data, orders, breakdown, ls=None, max_idx=None, closed_form=None,
+                              n_jobs=None, adaptive_tol=None, logprior=None, return_evaluated=False, **kwargs):
+    R"""Computes the log likelihood of the truncation model on a grid of length scales and breakdown scales
+
+    No prior is included, so the result can be reweighted by any prior with `compute_2d_posterior_from_log_like`.
 
     Parameters
     ----------
@@ -166,54 +677,563 @@ def compute_2d_posterior(model, X, data, orders, breakdown, ls=None, logprior=No
     X : ndarray, shape = (N,None)
     data : ndarray, shape = (N,[n_curves])
     orders : ndarray, shape = (n_curves,)
-    max_idx : ndarray, shape = (n_orders,)
     breakdown : ndarray, shape = (n_breakdown,)
-    ls : ndarray, shape = (n_ls,)
+    ls : ndarray, shape = (n_ls,), optional
+        If `None`, the MAP value of the length scale is used.
+    max_idx : int or ndarray, shape = (n_max_idx,), optional
+        Only the curves `data[:, :max_idx+1]` are used. If an array, the likelihood is computed for each value.
+        With `closed_form` and a given `ls`, the per-order terms are then computed once and accumulated, so all
+        of them cost about as much as the largest.
+    closed_form : bool, optional
+        If `True`, the likelihood is computed by `ConjugateTruncationLikelihood`, which needs only one
+        factorization per length scale, rather than by `model.log_marginal_likelihood` at every grid point.
+        If `None`, the default, the closed form is used whenever `conjugate_likelihood_kwargs` can express
+        `model`, and `model.log_marginal_likelihood` otherwise.
+    n_jobs : int, optional
+        The number of worker processes used by `compute_log_like_grid` if the closed form is not used.
+    adaptive_tol : float, optional
+        If given, the grid is refined adaptively by `compute_adaptive_log_like`, starting from a coarse grid, and
+        the likelihood is only evaluated at full resolution where the normalized pdf exceeds `adaptive_tol`.
     logprior : ndarray, optional, shape = (n_ls, n_breakdown)
+        Only used to guide the refinement if `adaptive_tol` is given. It is not included in the result.
+    return_evaluated : bool, optional
+        Whether to also return where the log likelihood was evaluated rather than interpolated. Defaults to `False`.
+    **kwargs
+        The kernel and conjugate hyperparameters passed to `ConjugateTruncationLikelihood`, which override those
+        of `model`. Only used with the closed form.
 
     Returns
     -------
-    joint_pdf : ndarray
-    ratio_pdf : ndarray
-    ls_pdf : ndarray
+    log_like : ndarray, shape = ([n_max_idx,] n_ls, n_breakdown)
+    ls : ndarray, shape = ([n_max_idx,] n_ls)
+        The length scales used, which differs from the input if it was `None`. The leading axis is only present
+        if `ls` was `None` and `max_idx` is an array, in which case the length scale is fit for each `max_idx`.
+    evaluated : ndarray, shape = ([n_max_idx,] n_ls, n_breakdown)
+        Only returned if `return_evaluated` is `True`. It is `False` where `log_like` was interpolated by
+        `compute_adaptive_log_like`, and `True` everywhere if `adaptive_tol` is `None`.
     """
-    if max_idx is not None:
+    if closed_form is not False:
+        model_kwargs = conjugate_likelihood_kwargs(model, X)
+        if model_kwargs is not None:
+            kwargs = {**model_kwargs, **kwargs}
+        closed_form = closed_form or model_kwargs is not None
+    if np.ndim(max_idx) > 0 and (ls is None or not closed_form or adaptive_tol is not None):
+        results = [
+            compute_2d_log_likelihood(
+                model, X, data, orders, breakdown, ls=ls, max_idx=idx, closed_form=closed_form, n_jobs=n_jobs,
+                adaptive_tol=adaptive_tol, logprior=logprior, return_evaluated=True, **kwargs
+            ) for idx in max_idx
+        ]
+        log_like = np.array([log_like_i for log_like_i, _, _ in results])
+        if ls is None:
+            ls = np.array([ls_i for _, ls_i, _ in results])
+        if return_evaluated:
+            return log_like, ls, np.array([evaluated_i for _, _, evaluated_i in results])
+        return log_like, ls
+    if np.ndim(max_idx) > 0:
+        data = data[:, :np.max(max_idx) + 1]
+        orders = orders[:np.max(max_idx) + 1]
+    elif max_idx is not None:
         data = data[:, :max_idx + 1]
         orders = orders[:max_idx + 1]
-    model.fit(X, data, orders=orders)
+    if ls is None or not closed_form:
+        model.fit(X, data, orders=orders)
     if ls is None:
         ls = np.exp(model.coeffs_process.kernel_.theta)
         print('Setting ls to', ls)
     ls = np.atleast_1d(ls)
-    # log_like = np.array([
-    #     [model.log_marginal_likelihood(theta=[np.log(ls_), ], breakdown=lb) for lb in breakdown] for ls_ in ls
-    # ])
-    from joblib import Parallel, delayed
-    import multiprocessing
-    num_cores = multiprocessing.cpu_count()
-    log_like = np.array(
-        Parallel(n_jobs=num_cores, prefer='processes')(
-            delayed(model.log_marginal_likelihood)(theta=[np.log(ls_), ], breakdown=lb)
-            for ls_ in ls for lb in breakdown
+    if closed_form:
+        likelihood = ConjugateTruncationLikelihood(
+            X, data, orders, ref=model.ref, ratio=model.ratio, excluded=model.excluded, **kwargs
+        )
+        if np.ndim(max_idx) > 0:
+            log_like = likelihood.log_likelihood(ls, breakdown, max_idx=max_idx)
+            if return_evaluated:
+                return log_like, ls, np.ones(log_like.shape, dtype=bool)
+            return log_like, ls
+        log_like_grid = likelihood.log_likelihood
+        log_like_points = likelihood.log_likelihood_points
+    else:
+        def log_like_grid(ls_, breakdown_):
+            return compute_log_like_grid(model, ls_, breakdown_, n_jobs=n_jobs)
+
+        def log_like_points(ls_, breakdown_):
+            return compute_log_like_points(model, ls_, breakdown_, n_jobs=n_jobs)
+
+    if adaptive_tol is not None:
+        log_like, evaluated = compute_adaptive_log_like(
+            log_like_points, ls, breakdown, tol=adaptive_tol, logprior=logprior
         )
-    ).reshape(len(ls), len(breakdown))
+    else:
+        log_like = log_like_grid(ls, breakdown)
+        evaluated = np.ones(log_like.shape, dtype=bool)
+    if return_evaluated:
+        return log_like, ls, evaluated
+    return log_like, ls
+
+
+def trapezoid_log_weights(x):
+    R"""The log of the weights of the trapezoid rule at the increasing points `x`
+
+    Parameters
+    ----------
+    x : ndarray, shape = (n,)
+
+    Returns
+    -------
+    log_weights : ndarray, shape = (n,)
+    """
+    x = np.atleast_1d(x).astype(float)
+    dx = np.diff(x)
+    weights = np.zeros(len(x))
+    weights[:-1] += dx / 2.
+    weights[1:] += dx / 2.
+    with np.errstate(divide='ignore'):
+        return np.log(weights)
+
+
+def log_trapz(log_y, x, axis=-1):
+    R"""Computes `np.log(np.trapz(np.exp(log_y), x=x, axis=axis))` without underflow
+
+    Parameters
+    ----------
+    log_y : ndarray
+        The log of the integrand
+    x : ndarray, shape = (log_y.shape[axis],)
+        The increasing points at which the integrand is evaluated
+    axis : int
+        The axis to integrate over
+
+    Returns
+    -------
+    log_integral : ndarray
+    """
+    log_y = np.asarray(log_y)
+    shape = [1] * log_y.ndim
+    shape[axis] = -1
+    return logsumexp(log_y + trapezoid_log_weights(x).reshape(shape), axis=axis)
+
+
+def compute_2d_log_posterior_from_log_like(log_like, ls, breakdown, logprior=None):
+    R"""Computes the normalized joint and marginal log posteriors from a grid of log likelihoods
+
+    The integrals are computed with the trapezoid rule in log space, so that nothing underflows no matter how
+    peaked the posterior is.
+
+    Parameters
+    ----------
+    log_like : ndarray, shape = (n_ls, n_breakdown)
+    ls : ndarray, shape = (n_ls,)
+    breakdown : ndarray, shape = (n_breakdown,)
+    logprior : ndarray, optional, shape = (n_ls, n_breakdown)
+        If `None`, then a flat prior is used.
+
+    Returns
+    -------
+    log_joint_pdf : ndarray, shape = (n_ls, n_breakdown)
+    log_ratio_pdf : ndarray, shape = (n_breakdown,)
+    log_ls_pdf : ndarray, shape = (n_ls,)
+        This is not normalized if there is only one length scale.
+    log_norm : float
+        The log of the integral of the likelihood times the prior over the grid
+    """
+    ls = np.atleast_1d(ls)
+    log_post = log_like
     if logprior is not None:
-        log_like += logprior
-    joint_pdf = np.exp(log_like - np.max(log_like))
+        log_post = log_post + logprior
 
     if len(ls) > 1:
-        ratio_pdf = np.trapz(joint_pdf, x=ls, axis=0)
+        log_ratio_pdf = log_trapz(log_post, ls, axis=0)
     else:
-        ratio_pdf = np.squeeze(joint_pdf)
-    ls_pdf = np.trapz(joint_pdf, x=breakdown, axis=-1)
+        log_ratio_pdf = log_post[0]
+    log_ls_pdf = log_trapz(log_post, breakdown, axis=-1)
+    log_norm = log_trapz(log_ratio_pdf, breakdown)
+
+    log_ratio_pdf = log_ratio_pdf - log_norm
+    if len(ls) > 1:
+        log_ls_pdf = log_ls_pdf - log_norm
+    return log_post - log_norm, log_ratio_pdf, log_ls_pdf, log_norm
+
+
+def compute_2d_posterior_from_log_like(log_like, ls, breakdown, logprior=None):
+    R"""Computes the joint and marginal posteriors from a grid of log likelihoods
+
+    Parameters
+    ----------
+    log_like : ndarray, shape = (n_ls, n_breakdown)
+    ls : ndarray, shape = (n_ls,)
+    breakdown : ndarray, shape = (n_breakdown,)
+    logprior : ndarray, optional, shape = (n_ls, n_breakdown)
+        If `None`, then a flat prior is used.
 
-    # Normalize them
-    ratio_pdf /= np.trapz(ratio_pdf, x=breakdown, axis=0)
+    Returns
+    -------
+    joint_pdf : ndarray
+        Scaled so that its maximum is one
+    ratio_pdf : ndarray
+    ls_pdf : ndarray
+    """
+    ls = np.atleast_1d(ls)
+    log_joint_pdf, log_ratio_pdf, log_ls_pdf, log_norm = compute_2d_log_posterior_from_log_like(
+        log_like, ls, breakdown, logprior=logprior
+    )
+    max_log_joint_pdf = np.max(log_joint_pdf)
+    joint_pdf = np.exp(log_joint_pdf - max_log_joint_pdf)
+    ratio_pdf = np.exp(log_ratio_pdf)
     if len(ls) > 1:
-        ls_pdf /= np.trapz(ls_pdf, x=ls, axis=0)
+        ls_pdf = np.exp(log_ls_pdf)
+    else:
+        # Not normalized, but on the same scale as joint_pdf
+        ls_pdf = np.exp(log_ls_pdf - max_log_joint_pdf - log_norm)
     return joint_pdf, ratio_pdf, ls_pdf
 
 
+def compute_2d_posterior(model, X, data, orders, breakdown, ls=None, logprior=None, max_idx=None,
+                         closed_form=None, n_jobs=None, adaptive_tol=None, **kwargs):
+    R"""
+
+    Parameters
+    ----------
+    model : gm.TruncationGP
+    X : ndarray, shape = (N,None)
+    data : ndarray, shape = (N,[n_curves])
+    orders : ndarray, shape = (n_curves,)
+    max_idx : ndarray, shape = (n_orders,)
+    breakdown : ndarray, shape = (n_breakdown,)
+    ls : ndarray, shape = (n_ls,)
+    logprior : ndarray, optional, shape = (n_ls, n_breakdown)
+    closed_form : bool, optional
+        If `True`, the likelihood is computed by `ConjugateTruncationLikelihood`, which needs only one
+        factorization per length scale, rather than by `model.log_marginal_likelihood` at every grid point.
+        If `None`, the default, the closed form is used whenever it can express `model`.
+        See `compute_2d_log_likelihood`.
+    n_jobs : int, optional
+        The number of worker processes used by `compute_log_like_grid` if the closed form is not used.
+    adaptive_tol : float, optional
+        If given, the grid is refined adaptively by `compute_adaptive_log_like`, starting from a coarse grid, and
+        the likelihood is only evaluated at full resolution where the normalized pdf exceeds `adaptive_tol`.
+    **kwargs
+        Overrides the kernel and conjugate hyperparameters of `model` that are passed to
+        `ConjugateTruncationLikelihood`. Only used with the closed form.
+
+    Returns
+    -------
+    joint_pdf : ndarray
+    ratio_pdf : ndarray
+    ls_pdf : ndarray
+    """
+    log_like, ls = compute_2d_log_likelihood(
+        model, X, data, orders, breakdown, ls=ls, max_idx=max_idx, closed_form=closed_form, n_jobs=n_jobs,
+        adaptive_tol=adaptive_tol, logprior=logprior, **kwargs
+    )
+    return compute_2d_posterior_from_log_like(log_like, ls, breakdown, logprior=logprior)
+
+
+class ConjugateTruncationLikelihood:
+    R"""The log marginal likelihood of the truncation model, evaluated in closed form on a grid.
+
+    For a fixed grid of inputs, the coefficients extracted with a ratio :math:`Q = q / \Lambda_b` scale as
+    :math:`c_n = \Lambda_b^n a_n`, where :math:`a_n` does not depend on the breakdown scale. For each length
+    scale, the quadratic forms :math:`a_n^T R^{-1} a_n` and :math:`1^T R^{-1} a_n` and the log determinant of
+    the correlation matrix :math:`R` are therefore computed once, and the likelihood at every breakdown scale
+    follows as a polynomial in :math:`\Lambda_b`. This is the same conjugate model used by `gm.TruncationGP`,
+    including the Jacobian of the transformation from the observables to the coefficients.
+
+    Parameters
+    ----------
+    X : ndarray, shape = (N, p)
+        The training inputs
+    y : ndarray, shape = (N, n_curves)
+        The order-by-order predictions
+    orders : ndarray, shape = (n_curves,)
+        The powers of the ratio for each curve in `y`
+    ref : float or callable
+        The reference scale
+    ratio : callable
+        The ratio Q, as a function of `X` and the keyword argument `breakdown`.
+        Must be inversely proportional to `breakdown`, as is `ratio_kf`.
+    kernel : sklearn.gaussian_process.kernels.Kernel
+        The correlation kernel. Its only free hyperparameter must be the length scale.
+    excluded : ndarray, optional
+        The orders whose coefficients are not used in the likelihood
+    center : float
+        The prior mean of the coefficient mean
+    disp : float
+        The dispersion of the coefficient mean. If zero, the mean is fixed to `center`.
+    df : float
+        The degrees of freedom of the inverse chi squared prior on cbar squared
+    scale : float
+        The scale of the inverse chi squared prior on cbar squared
+    sd : float, optional
+        If given, cbar is fixed to this value rather than marginalized.
+    nugget : float
+        Added to the diagonal of the correlation matrix
+    decomposition : str
+        Either 'cholesky' or 'eig'. The factorization used for the correlation matrix.
+    **kwargs
+        Any other arguments to `gm.ConjugateGaussianProcess`, which are not needed here and are ignored.
+    """
+
+    def __init__(self, X, y, orders, ref, ratio, kernel, excluded=None, center=0, disp=0, df=1, scale=1,
+                 sd=None, nugget=1e-10, decomposition='cholesky', **kwargs):
+        if decomposition not in ['cholesky', 'eig']:
+            raise ValueError('decomposition must be cholesky or eig')
+        orders = np.atleast_1d(orders)
+        try:
+            ref = ref(X)
+        except TypeError:
+            pass
+        ref = np.broadcast_to(ref, X.shape[0])
+        # Q is q / breakdown, so store q and check that the breakdown dependence is as expected
+        q = ratio(X, breakdown=1.)
+        if not np.allclose(ratio(X, breakdown=2.), q / 2.):
+            raise ValueError('ratio must be inversely proportional to the breakdown scale')
+
+        if excluded is None:
+            mask = np.ones_like(orders, dtype=bool)
+        else:
+            mask = ~np.isin(orders, excluded)
+
+        # The coefficients at breakdown = 1
+        diffs = np.diff(y, axis=1, prepend=0)
+        scales = ref[:, None] * q[:, None] ** orders
+        self.a = (diffs / scales)[:, mask]
+        self.powers = orders[mask]
+        self.mask = mask
+        # The log Jacobian contributed by each curve
+        self.log_jacobians = - np.sum(np.log(np.abs(scales[:, mask])), axis=0)
+
+        self.X = X
+        self.sq_dists = cdist(X, X, 'sqeuclidean')
+        self.kernel = kernel
+        self.center = center
+        self.disp = disp
+        self.df = df
+        self.scale = scale
+        self.sd = sd
+        self.nugget = nugget
+        self.decomposition = decomposition
+
+    def correlation(self, ls):
+        R"""The correlation matrices of the training inputs for each length scale, including the nugget
+
+        An RBF kernel, optionally plus a `WhiteKernel`, is built directly from the cached squared distances.
+        Any other kernel is evaluated once per length scale.
+
+        Parameters
+        ----------
+        ls : ndarray, shape = (n_ls,)
+
+        Returns
+        -------
+        R : ndarray, shape = (n_ls, N, N)
+        """
+        ls = np.atleast_1d(ls)
+        kernel = self.kernel
+        noise = 0.
+        if isinstance(kernel, Sum) and isinstance(kernel.k2, WhiteKernel):
+            kernel, noise = kernel.k1, kernel.k2.noise_level
+        if type(kernel) is RBF and np.ndim(kernel.length_scale) == 0:  # Matern subclasses RBF
+            R = np.exp(-0.5 * self.sq_dists / ls[:, None, None] ** 2)
+        else:
+            R = np.stack([self.kernel.clone_with_theta(np.log([ls_i]))(self.X) for ls_i in ls])
+            noise = 0.  # Already included by the kernel
+        diag = np.arange(R.shape[-1])
+        R[:, diag, diag] += noise + self.nugget
+        return R
+
+    def whiten(self, R):
+        R"""Factors a stack of correlation matrices
+
+        Parameters
+        ----------
+        R : ndarray, shape = (n_ls, N, N)
+
+        Returns
+        -------
+        logdet : ndarray, shape = (n_ls,)
+            The log determinants of `R`
+        whiten : callable
+            Maps `v` with shape (N, k) to `W v` with shape (n_ls, N, k), where `W^T W = R^{-1}`
+        """
+        if self.decomposition == 'cholesky':
+            L = np.linalg.cholesky(R)
+            logdet = 2 * np.sum(np.log(np.diagonal(L, axis1=-2, axis2=-1)), axis=-1)
+
+            def whiten(v):
+                # Triangular solves, so that the Cholesky factorization is the only O(N^3) step
+                return np.stack([solve_triangular(L_i, v, lower=True, check_finite=False) for L_i in L])
+
+            return logdet, whiten
+        eig_vals, eig_vecs = np.linalg.eigh(R)
+        if np.any(eig_vals <= 0):
+            raise np.linalg.LinAlgError('The correlation matrix is not positive definite')
+        logdet = np.sum(np.log(eig_vals), axis=-1)
+        return logdet, lambda v: (np.swapaxes(eig_vecs, -1, -2) @ v) / np.sqrt(eig_vals)[..., None]
+
+    def quadratic_forms(self, ls):
+        R"""The pieces of the likelihood that depend on the length scale but not on the breakdown scale
+
+        All length scales are factored together.
+
+        Parameters
+        ----------
+        ls : ndarray, shape = (n_ls,)
+            The length scales
+
+        Returns
+        -------
+        A : ndarray, shape = (n_ls, n_curves)
+            The quadratic forms a_n^T R^{-1} a_n
+        B : ndarray, shape = (n_ls, n_curves)
+            The quadratic forms 1^T R^{-1} a_n
+        C : ndarray, shape = (n_ls,)
+            The quadratic form 1^T R^{-1} 1
+        logdet : ndarray, shape = (n_ls,)
+            The log determinant of R
+        """
+        logdet, whiten = self.whiten(self.correlation(ls))
+        # Whiten the coefficients and the constant basis together
+        w = whiten(np.concatenate((self.a, np.ones((self.a.shape[0], 1))), axis=1))
+        w_a, w_one = w[..., :-1], w[..., -1:]
+        A = np.sum(w_a ** 2, axis=-2)
+        B = np.sum(w_one * w_a, axis=-2)
+        C = np.sum(w_one[..., 0] ** 2, axis=-1)
+        return A, B, C, logdet
+
+    def num_curves(self, max_idx=None):
+        R"""The number of curves used in the likelihood if only the curves `y[:, :max_idx+1]` are kept
+
+        Parameters
+        ----------
+        max_idx : int or ndarray, optional
+            If `None`, all curves are kept.
+
+        Returns
+        -------
+        n_curves : int or ndarray
+        """
+        if max_idx is None:
+            return len(self.powers)
+        n_curves = np.cumsum(self.mask)[np.minimum(max_idx, len(self.mask) - 1)]
+        if np.any(n_curves == 0):
+            raise ValueError('max_idx must keep at least one curve that is not excluded')
+        return n_curves
+
+    def log_likelihood_from_forms(self, A, B, C, logdet, breakdown, max_idx=None):
+        R"""Computes the log likelihood for all breakdown scales given the output of `quadratic_forms`
+
+        The quadratic forms are sums of per-curve terms, so the likelihood for each truncation `max_idx` of the
+        curves is found from the cumulative sums of the same terms.
+
+        Parameters
+        ----------
+        A, B, C, logdet : ndarray
+            The output of `quadratic_forms`
+        breakdown : ndarray, shape = (n_breakdown,)
+        max_idx : int or ndarray, shape = (n_max_idx,), optional
+            If given, only the curves `y[:, :max_idx+1]` are used, as if the data were truncated.
+
+        Returns
+        -------
+        log_like : ndarray, shape = ([n_max_idx,] n_ls, n_breakdown)
+        """
+        breakdown = np.atleast_1d(breakdown)
+        C = np.asarray(C)[..., None]
+        logdet = np.asarray(logdet)[..., None]
+        N = self.a.shape[0]
+        n_curves = np.atleast_1d(self.num_curves(max_idx))
+        last = n_curves - 1
+        powers = breakdown[:, None] ** self.powers
+        quad = np.moveaxis(np.cumsum(A[..., None, :] * powers ** 2, axis=-1)[..., last], -1, 0)
+        lin = np.moveaxis(np.cumsum(B[..., None, :] * powers, axis=-1)[..., last], -1, 0)
+        log_jacobian = np.cumsum(self.log_jacobians)[last]
+        sum_powers = np.cumsum(self.powers)[last]
+        # Broadcast against the leading max_idx axis
+        n_curves, log_jacobian, sum_powers = [
+            np.reshape(arr, (-1,) + (1,) * (quad.ndim - 1)) for arr in (n_curves, log_jacobian, sum_powers)
+        ]
+        n = N * n_curves
+        center, disp = self.center, self.disp
+        if disp == 0:
+            quad = quad - 2 * center * lin + n_curves * center ** 2 * C
+            log_like = 0.
+        else:
+            # Marginalize the mean, which has variance disp * cbar^2
+            prec_mean = 1. / disp + n_curves * C
+            quad = quad + center ** 2 / disp - (center / disp + lin) ** 2 / prec_mean
+            log_like = - 0.5 * np.log(disp * prec_mean)
+        log_like = log_like - 0.5 * n_curves * logdet
+
+        if self.sd is not None or np.isinf(self.df):
+            var = self.sd ** 2 if self.sd is not None else self.scale ** 2
+            log_like = log_like - 0.5 * quad / var - 0.5 * n * np.log(2 * np.pi * var)
+        else:
+            df = self.df
+            df_post = df + n
+            prior_sum_sq = df * self.scale ** 2
+            log_like = log_like + gammaln(df_post / 2.) - 0.5 * n * np.log(np.pi) \
+                - 0.5 * df_post * np.log(prior_sum_sq + quad)
+            if df > 0:
+                log_like = log_like - gammaln(df / 2.) + 0.5 * df * np.log(prior_sum_sq)
+        # Jacobian of c_n = (y_n - y_{n-1}) / (ref * Q^n)
+        log_like = log_like + log_jacobian + N * sum_powers * np.log(breakdown)
+        if max_idx is None or np.ndim(max_idx) == 0:
+            log_like = log_like[0]
+        return log_like
+
+    def log_likelihood(self, ls, breakdown, max_idx=None):
+        R"""Computes the log likelihood on the grid of length scales and breakdown scales
+
+        Parameters
+        ----------
+        ls : ndarray, shape = (n_ls,)
+        breakdown : ndarray, shape = (n_breakdown,)
+        max_idx : int or ndarray, shape = (n_max_idx,), optional
+            If given, only the curves `y[:, :max_idx+1]` are used. An array of values gives the likelihood for
+            every truncation at little more than the cost of the largest one.
+
+        Returns
+        -------
+        log_like : ndarray, shape = ([n_max_idx,] n_ls, n_breakdown)
+        """
+        ls = np.atleast_1d(ls)
+        try:
+            return self.log_likelihood_from_forms(*self.quadratic_forms(ls), breakdown=breakdown, max_idx=max_idx)
+        except np.linalg.LinAlgError:
+            pass
+        # At least one matrix could not be factored, so find which ones one at a time
+        shape = np.shape(max_idx) + (len(ls), len(np.atleast_1d(breakdown)))
+        log_like = np.full(shape, -np.inf)
+        for i, ls_i in enumerate(ls):
+            try:
+                forms = self.quadratic_forms(ls_i)
+            except np.linalg.LinAlgError:
+                continue
+            log_like[..., i, :] = self.log_likelihood_from_forms(
+                *forms, breakdown=breakdown, max_idx=max_idx)[..., 0, :]
+        return log_like
+
+    def log_likelihood_points(self, ls, breakdown):
+        R"""Computes the log likelihood at the pairs `(ls[i], breakdown[i])`
+
+        Each unique length scale is factored once, and the breakdown scales are cheap to evaluate.
+
+        Parameters
+        ----------
+        ls : ndarray, shape = (n_points,)
+        breakdown : ndarray, shape = (n_points,)
+
+        Returns
+        -------
+        log_like : ndarray, shape = (n_points,)
+        """
+        ls_unique, ls_inverse = np.unique(ls, return_inverse=True)
+        breakdown_unique, breakdown_inverse = np.unique(breakdown, return_inverse=True)
+        log_like = self.log_likelihood(ls_unique, breakdown_unique)
+        return log_like[ls_inverse.ravel(), breakdown_inverse.ravel()]
+
+
 def plot_2d_joint(ls_vals, Lb_vals, like_2d, like_ls, like_Lb, data_str=r'\vec{\mathbf{y}}_k)',
                   xlabel=None, ylabel=None):
     if data_str is None:
@@ -258,7 +1278,7 @@ def plot_2d_joint(ls_vals, Lb_vals, like_2d, like_ls, like_Lb, data_str=r'\vec{\
 
 def pdfplot(
         x, y, pdf, data, hue=None, order=None, hue_order=None, cut=1e-2, linewidth=None,
-        palette=None, saturation=1., ax=None, margin=None, legend_title=None, loc='best'
+        palette=None, saturation=1., ax=None, margin=None, legend_title=None, loc='best', log_pdf=False
 ):
     R"""Like seaborn's violinplot, but takes PDF values rather than tabular data.
 
@@ -291,6 +1311,9 @@ def pdfplot(
         The axis on which to draw the plot
     margin : float, optional
         The vertical margin between each pdf.
+    log_pdf : bool, optional
+        Whether data[pdf] holds the log of the pdf values, such as the 'log pdf' column made by
+        `MatterConvergenceAnalysis.setup_posteriors`. Defaults to `False`.
     """
     if ax is None:
         fig, ax = plt.subplots(1, 1, figsize=(3.4, 3.4))
@@ -319,27 +1342,46 @@ def pdfplot(
     if margin is None:
         _, margin = plt.margins()
 
+    # Split the data once, then summarize all of the pdfs together
+    group_keys = [y] if hue is None else [y, hue]
+    groups = {
+        key if isinstance(key, tuple) else (key,): group for key, group in data.groupby(group_keys, sort=False)
+    }
+    cells = [
+        (y_val, hue_val) if hue is not None else (y_val,)
+        for y_val in y_vals for hue_val in hue_vals
+    ]
+    x_cells = [groups[cell][x].values for cell in cells]
+    pdf_cells = [groups[cell][pdf].values for cell in cells]
+    if all(len(x_vals) == len(x_cells[0]) and np.all(x_vals == x_cells[0]) for x_vals in x_cells):
+        medians, bounds_all = compute_pdf_medians_and_bounds(
+            x=x_cells[0], pdfs=np.array(pdf_cells), cred=[0.68, 0.95], log_pdf=log_pdf
+        )
+    else:
+        summaries = [
+            compute_pdf_medians_and_bounds(x=x_vals, pdfs=pdf_vals, cred=[0.68, 0.95], log_pdf=log_pdf)
+            for x_vals, pdf_vals in zip(x_cells, pdf_cells)
+        ]
+        medians = np.array([median for median, _ in summaries])
+        bounds_all = np.array([bounds for _, bounds in summaries])
+
     offset = 1.
     minor_ticks = []
     major_ticks = []
     for i, y_val in enumerate(y_vals):
         max_height_hue = offset - margin
         for j, hue_val in enumerate(hue_vals):
-            mask = data[y] == y_val
             if hue is not None:
-                mask = mask & (data[hue] == hue_val)
                 color = colors[j]
             else:
                 color = colors[i]
-            df = data[mask]
-            x_vals = df[x].values
-            pdf_vals = df[pdf].values.copy()
-            pdf_vals /= np.trapz(pdf_vals, x_vals)
-            # Assumes normalized
-            median, bounds = compute_pdf_median_and_bounds(
-                x=x_vals, pdf=pdf_vals, cred=[0.68, 0.95]
-            )
-            pdf_vals /= (1. * np.max(pdf_vals))  # Scale so they're all the same height
+            k = i * len(hue_vals) + j
+            x_vals = x_cells[k]
+            if log_pdf:
+                pdf_vals = np.exp(pdf_cells[k] - np.max(pdf_cells[k]))
+            else:
+                pdf_vals = pdf_cells[k] / (1. * np.max(pdf_cells[k]))  # Scale so they're all the same height
+            median, bounds = medians[k], bounds_all[k]
             # Make the lines taper off
             x_vals = x_vals[pdf_vals > cut]
             pdf_vals = pdf_vals[pdf_vals > cut]
@@ -1120,6 +2162,9 @@ class MatterConvergenceAnalysis(ConvergenceAnalysis):
         self.ls = None
         self.max_idx = None
         self.logprior = None
+        self.log_like = None
+        self.log_like_evaluated = None
+        self.adaptive_tol = None
 
     def compute_density(self, kf):
         degeneracy = None
@@ -1148,7 +2193,8 @@ class MatterConvergenceAnalysis(ConvergenceAnalysis):
         return fermi_momentum(density, degeneracy)
 
     def setup_posteriors(self, max_idx, breakdown_min, breakdown_max, breakdown_num, ls_min, ls_max, ls_num,
-                         logprior=None, max_idx_labels=None):
+                         logprior=None, max_idx_labels=None, closed_form=None, n_jobs=None,
+                         adaptive_tol=None, cache_dir=None):
         R"""Computes and stores the values for the breakdown and length scale posteriors.
 
         This must be run before running functions that depend on these posteriors.
@@ -1184,13 +2230,29 @@ class MatterConvergenceAnalysis(ConvergenceAnalysis):
             will be computed in this case.
         logprior : ndarray, optional, shape = (ls_num, breakdown_num)
             The prior pr(breakdown, ls). If `None`, then a flat prior is used.
+        max_idx_labels : List[int], optional
+            The labels used for the orders in the DataFrames. Defaults to `max_idx`.
+        closed_form : bool, optional
+            Whether to evaluate the likelihood in closed form with `ConjugateTruncationLikelihood`, which needs
+            one factorization per length scale rather than one per grid point. If `None`, the default, the closed
+            form is used whenever it can express the truncation model. See `compute_2d_log_likelihood`.
+        n_jobs : int, optional
+            The number of worker processes used if the closed form is not used. Defaults to the number of cores.
+        adaptive_tol : float, optional
+            If given, the likelihood is only evaluated at the full grid resolution where the normalized joint pdf
+            exceeds `adaptive_tol`, starting from a coarse grid. The rest is interpolated.
+            See `compute_adaptive_log_like`. The refinement depends on `logprior`, so `reweight` warns if a new
+            prior puts appreciable mass where the likelihood was interpolated.
+        cache_dir : str, optional
+            If given, the log likelihoods are stored in this directory, keyed by a hash of the training data,
+            orders, reference scale, ratio, kernel and its hyperparameters, and grid. Later calls with the same
+            inputs load them, memory mapped, instead of recomputing them. See `posterior_cache_key`. If an input
+            cannot be hashed stably, a warning is raised and nothing is cached.
+
         Returns
         -------
 
         """
-        dfs_breakdown = []
-        dfs_ls = []
-        dfs_joint = []
         self.breakdown_min, self.breakdown_max, self.breakdown_num = breakdown_min, breakdown_max, breakdown_num
         self.ls_min, self.ls_max, self.ls_num = ls_min, ls_max, ls_num
         breakdown = np.linspace(breakdown_min, breakdown_max, breakdown_num)
@@ -1198,16 +2260,90 @@ class MatterConvergenceAnalysis(ConvergenceAnalysis):
             ls = None
         else:
             ls = np.linspace(ls_min, ls_max, ls_num)
-        breakdown_maps = []
-        ls_maps = []
         max_idx = np.atleast_1d(max_idx)
         if max_idx_labels is None:
             max_idx_labels = max_idx
-        for idx, idx_label in zip(max_idx, max_idx_labels):
-            joint_pdf, breakdown_pdf, ls_pdf = self.compute_breakdown_ls_posterior(
-                breakdown, ls, max_idx=idx, logprior=logprior)
+        cached = key = None
+        if cache_dir is not None:
+            try:
+                key = posterior_cache_key(
+                    X=self.X_train, y=self.y_train, orders=self.orders, excluded=self.excluded, ref=self.ref,
+                    ratio=self.ratio, kwargs=self.kwargs, breakdown=breakdown, ls=ls, max_idx=max_idx,
+                    closed_form=closed_form, adaptive_tol=adaptive_tol,
+                    # The prior only affects the likelihood through the adaptive refinement
+                    logprior=logprior if adaptive_tol is not None else None,
+                )
+            except TypeError as e:
+                warnings.warn(f'Not caching the log likelihoods: {e}')
+                cache_dir = None
+            else:
+                cached = load_cached_log_like(cache_dir, key)
+        if cached is not None:
+            log_like = cached['log_like']
+            evaluated = cached['evaluated']
+        else:
+            log_like, _, evaluated = self.compute_breakdown_ls_log_likelihood(
+                breakdown, ls, max_idx=max_idx, closed_form=closed_form, n_jobs=n_jobs,
+                adaptive_tol=adaptive_tol, logprior=logprior, return_evaluated=True)
+            if cache_dir is not None:
+                save_cached_log_like(
+                    cache_dir, key, log_like=log_like, evaluated=evaluated, breakdown=breakdown, max_idx=max_idx
+                )
+        self.breakdown = breakdown
+        self.ls = ls
+        self.max_idx = max_idx
+        self.max_idx_labels = max_idx_labels
+        self.log_like = log_like
+        self.log_like_evaluated = evaluated
+        self.adaptive_tol = adaptive_tol
+        return self.reweight(logprior)
+
+    def reweight(self, logprior=None):
+        R"""Recomputes the breakdown and length scale posteriors for a new prior.
+
+        The log likelihoods stored by `setup_posteriors` are reused, so this is fast compared to
+        `setup_posteriors` and can be used to study the sensitivity to the prior.
+
+        If `setup_posteriors` was run with `adaptive_tol`, the likelihood was only evaluated where the pdf under
+        the original prior was appreciable and was interpolated elsewhere. A warning is raised if the normalized
+        joint pdf under `logprior` exceeds `adaptive_tol` anywhere the likelihood was interpolated, in which case
+        `setup_posteriors` should be rerun with the new prior or without `adaptive_tol`.
+
+        Parameters
+        ----------
+        logprior : ndarray, optional, shape = (ls_num, breakdown_num)
+            The prior pr(breakdown, ls). If `None`, then a flat prior is used.
+
+        Returns
+        -------
+        df_joint : pd.DataFrame
+        df_breakdown : pd.DataFrame
+        df_ls : pd.DataFrame
+        """
+        if self.log_like is None:
+            raise ValueError('setup_posteriors must be run before reweight')
+        dfs_breakdown = []
+        dfs_ls = []
+        dfs_joint = []
+        breakdown = self.breakdown
+        ls = self.ls
+        breakdown_maps = []
+        ls_maps = []
+        for idx, idx_label, log_like, evaluated in zip(
+                self.max_idx, self.max_idx_labels, self.log_like, self.log_like_evaluated):
+            log_joint_pdf, log_breakdown_pdf, log_ls_pdf, _ = compute_2d_log_posterior_from_log_like(
+                log_like, ls, breakdown, logprior=logprior)
+            joint_pdf = np.exp(log_joint_pdf - np.max(log_joint_pdf))
+            if self.adaptive_tol is not None and np.any(joint_pdf[~evaluated] > self.adaptive_tol):
+                warnings.warn(
+                    f'For max_idx = {idx}, the prior puts mass where the log likelihood was interpolated by the '
+                    f'adaptive refinement. Rerun setup_posteriors with this prior or without adaptive_tol.'
+                )
 
-            df_breakdown = pd.DataFrame(np.array([breakdown, breakdown_pdf]).T, columns=[r'$\Lambda_b$ [MeV]', 'pdf'])
+            df_breakdown = pd.DataFrame(
+                np.array([breakdown, np.exp(log_breakdown_pdf), log_breakdown_pdf]).T,
+                columns=[r'$\Lambda_b$ [MeV]', 'pdf', 'log pdf']
+            )
             df_breakdown['Order'] = fr'N$^{idx_label}$LO'
             df_breakdown['Order Index'] = idx
             df_breakdown['system'] = fr'${self.system_math_string}$'
@@ -1215,7 +2351,9 @@ class MatterConvergenceAnalysis(ConvergenceAnalysis):
             dfs_breakdown.append(df_breakdown)
 
             if ls is not None:
-                df_ls = pd.DataFrame(np.array([ls, ls_pdf]).T, columns=[r'$\ell$ [fm$^{-1}$]', 'pdf'])
+                df_ls = pd.DataFrame(
+                    np.array([ls, np.exp(log_ls_pdf), log_ls_pdf]).T, columns=[r'$\ell$ [fm$^{-1}$]', 'pdf', 'log pdf']
+                )
                 df_ls['Order'] = fr'N$^{idx_label}$LO'
                 df_ls['Order Index'] = idx
                 df_ls['system'] = fr'${self.system_math_string}$'
@@ -1241,11 +2379,7 @@ class MatterConvergenceAnalysis(ConvergenceAnalysis):
         if ls is not None:
             df_ls = pd.concat(dfs_ls, ignore_index=True)
         df_joint = pd.concat(dfs_joint, ignore_index=True)
-        self.breakdown = breakdown
-        self.ls = ls
         self.logprior = logprior
-        self.max_idx = max_idx
-        self.max_idx_labels = max_idx_labels
         self.df_joint = df_joint
         self.df_breakdown = df_breakdown
         self.df_ls = df_ls
@@ -1298,7 +2432,8 @@ class MatterConvergenceAnalysis(ConvergenceAnalysis):
         )
         return graph
 
-    def compute_breakdown_ls_posterior(self, breakdown, ls, max_idx=None, logprior=None):
+    def compute_breakdown_ls_posterior(self, breakdown, ls, max_idx=None, logprior=None, closed_form=None,
+                                       n_jobs=None, adaptive_tol=None):
         # orders = self.orders[:max_idx + 1]
         orders = self.orders
         model = gm.TruncationGP(ref=self.ref, ratio=self.ratio, excluded=self.excluded, **self.kwargs)
@@ -1306,9 +2441,21 @@ class MatterConvergenceAnalysis(ConvergenceAnalysis):
         data = self.y_train
         joint_pdf, Lb_pdf, ls_pdf = compute_2d_posterior(
             model, X, data, orders, breakdown, ls, logprior=logprior, max_idx=max_idx,
+            closed_form=closed_form, n_jobs=n_jobs, adaptive_tol=adaptive_tol, **self.kwargs
         )
         return joint_pdf, Lb_pdf, ls_pdf
 
+    def compute_breakdown_ls_log_likelihood(self, breakdown, ls, max_idx=None, closed_form=None, n_jobs=None,
+                                            adaptive_tol=None, logprior=None, return_evaluated=False):
+        orders = self.orders
+        model = gm.TruncationGP(ref=self.ref, ratio=self.ratio, excluded=self.excluded, **self.kwargs)
+        X = self.X_train
+        data = self.y_train
+        return compute_2d_log_likelihood(
+            model, X, data, orders, breakdown, ls, max_idx=max_idx, closed_form=closed_form, n_jobs=n_jobs,
+            adaptive_tol=adaptive_tol, logprior=logprior, return_evaluated=return_evaluated, **self.kwargs
+        )
+
     def compute_best_length_scale_for_breakdown(self, breakdown, max_idx):
         ord = rf'N$^{max_idx}$LO'
         df_best = self.df_joint[
@@ -13,5 +13,6 @@ setup(
         'gptools',
         'findiff',
         'sympy',
+        'threadpoolctl',
     ]
 )
\ No newline at end of file